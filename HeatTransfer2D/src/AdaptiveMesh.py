@@ -0,0 +1,531 @@
+# *****************************************************************************
+# *                  ADAPTIVE MESH - 2D HEAT TRANSFER                         *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: block-structured adaptive mesh refinement of the Robin      *
+# * problem. The mesh is split into blocks of blockSize x blockSize volumes  *
+# * and each block can be split into four children of half the spacing, up   *
+# * to refinementLevels times (a quadtree of blocks). The leaves are the      *
+# * active volumes. A block is refined when the temperature jump across one  *
+# * of its faces, the undivided gradient, is above refinementThreshold, and  *
+# * four leaf children are merged when all jumps are below                   *
+# * coarseningThreshold. Neighbour leaves differ by one level at most.       *
+# *                                                                           *
+# * Every face between two leaves has one flux, added to one volume and      *
+# * taken from the other, so the coarse/fine interfaces are conservative and *
+# * the heat content only changes through the walls. The operator of the      *
+# * leaves is assembled as a sparse matrix once per regrid, with the boundary *
+# * relations of the mesh written with the spacing of each level, and the     *
+# * explicit time step is limited by the finest level in getMeshParameters.   *
+# * The regrids move the temperature by volume averages, so they conserve the *
+# * heat content as well.                                                     *
+# *****************************************************************************
+import numpy as np
+import pandas as pd
+from scipy import sparse
+import Constants as ct
+from MeshGenerator import MeshGenerator
+from DiffusionOperator import DiffusionOperator
+
+
+class CompositeMesh:
+
+    def __init__(self, refined: list):
+
+        self.refined: list
+        self.level: np.array
+        self.cellX: np.array
+        self.cellY: np.array
+        self.finestLevel: int
+        self.ownerMap: np.array
+        self.temperature: np.array
+        self.faces: tuple
+        self.wallJumps: tuple
+        self.diffusionOperator: sparse.csr_matrix
+        self.ghostSource: np.array
+        self.factorization: object
+        self.restriction: sparse.csr_matrix
+        self.balanceWeights: np.array
+        self.balanceExternal: np.float64
+
+        # blocks with children, by level
+        self.refined = refined
+        self.factorization = None
+
+    def getCellNumber(self) -> int:
+        return self.level.size
+
+
+class AdaptiveMesh(MeshGenerator):
+
+    def __init__(self):
+
+        super().__init__()
+
+    # ======================================================================== #
+    # PRIVATE METHODS                                                          #
+    # ======================================================================== #
+    @staticmethod
+    def __upsample(values: np.array, factor: int) -> np.array:
+        return np.repeat(np.repeat(values, factor, axis=0), factor, axis=1)
+
+    @staticmethod
+    def __downsampleAny(mask: np.array) -> np.array:
+
+        rows, columns = mask.shape
+
+        return mask.reshape((rows // 2, 2, columns // 2, 2)).any(axis=(1, 3))
+
+    @staticmethod
+    def __dilate(mask: np.array) -> np.array:
+
+        rows: int
+        columns: int
+        padded: np.array
+        dilated: np.array
+
+        rows, columns = mask.shape
+        padded = np.pad(mask, 1)
+        dilated = np.zeros_like(mask)
+
+        # the block and its eight neighbours
+        for i in range(3):
+            for j in range(3):
+                dilated |= padded[i:i + rows, j:j + columns]
+
+        return dilated
+
+    def __getRootBlocks(self) -> tuple:
+        return self.nodeNumberY // self.blockSize, \
+            self.nodeNumberX // self.blockSize
+
+    def __getGhostRelation(self, spacing: np.array) -> tuple:
+
+        # ghost = center * interior + external, the relations of
+        # solve2DRobinProblem with the spacing normal to the wall
+        return \
+            (2 * self.conductivity - self.convection * spacing) / \
+            (2 * self.conductivity + self.convection * spacing), \
+            2 * self.conductivity * spacing / \
+            (2 * self.conductivity + self.convection * spacing) * \
+            self.environmentTemperature, \
+            self.heatSource * spacing / self.conductivity
+
+    def __getBottomSegments(self, columns: np.array) -> np.array:
+
+        he1 = self.nodeHeatSourceEnd1
+        he2 = self.nodeHeatSourceEnd2
+        hs1 = self.nodeHeatSourceStart1
+        hs2 = self.nodeHeatSourceStart2
+
+        # the five segments of getEnergyBalance, sources at 1 and 3
+        return np.select(
+            [columns < hs1, columns <= he1, columns < hs2, columns <= he2],
+            [0, 1, 2, 3], 4)
+
+    def __setLeaves(self, composite: CompositeMesh) -> None:
+
+        level: int
+        factor: int
+        offset: int
+        cellX: np.array
+        cellY: np.array
+        leaves: list
+        exists: list
+        owners: np.array
+
+        exists = [np.ones(self.__getRootBlocks(), dtype=bool)]
+
+        for level in range(self.refinementLevels):
+            exists.append(self.__upsample(composite.refined[level], 2))
+
+        leaves = [
+            exists[level] & ~composite.refined[level]
+            for level in range(self.refinementLevels)] + [exists[-1]]
+
+        composite.finestLevel = max(
+            level for level in range(len(leaves)) if leaves[level].any())
+
+        # Leaves numbered level by level, row by row. The owner map keeps,
+        # for each volume of the finest level, the leaf that covers it.
+        composite.ownerMap = np.empty(
+            (self.nodeNumberY << composite.finestLevel,
+             self.nodeNumberX << composite.finestLevel), dtype=np.int64)
+
+        composite.level, composite.cellX, composite.cellY = [], [], []
+        offset = 0
+
+        for level in range(composite.finestLevel + 1):
+            cellY, cellX = np.nonzero(
+                self.__upsample(leaves[level], self.blockSize))
+
+            owners = np.full(
+                (self.nodeNumberY << level, self.nodeNumberX << level), -1,
+                dtype=np.int64)
+            owners[cellY, cellX] = offset + np.arange(cellX.size)
+
+            factor = 1 << (composite.finestLevel - level)
+            owners = self.__upsample(owners, factor)
+            composite.ownerMap[owners >= 0] = owners[owners >= 0]
+
+            composite.level.append(np.full(cellX.shape, level))
+            composite.cellX.append(cellX)
+            composite.cellY.append(cellY)
+            offset += cellX.size
+
+        composite.level = np.concatenate(composite.level)
+        composite.cellX = np.concatenate(composite.cellX)
+        composite.cellY = np.concatenate(composite.cellY)
+
+    def __setOperator(self, composite: CompositeMesh) -> None:
+
+        n: int
+        rows: list
+        columns: list
+        values: list
+        jumps: list
+        area: np.array
+        owners: np.array
+        spacingX: np.array
+        spacingY: np.array
+        finestX: np.float64
+        finestY: np.float64
+        coefficient: np.array
+
+        n = composite.getCellNumber()
+        owners = composite.ownerMap
+
+        spacingX = self.deltaX / 2. ** composite.level
+        spacingY = self.deltaY / 2. ** composite.level
+        area = spacingX * spacingY
+        finestX = self.deltaX / 2. ** composite.finestLevel
+        finestY = self.deltaY / 2. ** composite.finestLevel
+
+        rows, columns, values = [], [], []
+        composite.faces = ([], [])
+
+        # Faces between two leaves: the pieces of the finest level with the
+        # same pair of leaves are summed up. The flux is over the distance
+        # between both centers, normal to the face.
+        for west, east, length, spacing in (
+                (owners[:, :-1], owners[:, 1:], finestY, spacingX),
+                (owners[:-1, :], owners[1:, :], finestX, spacingY)):
+
+            pairs, counts = np.unique(
+                west[west != east] * n + east[west != east],
+                return_counts=True)
+            west, east = pairs // n, pairs % n
+
+            coefficient = self.diffusivity * self.deltaT * counts * length / (
+                0.5 * (spacing[west] + spacing[east]))
+
+            rows += [west, west, east, east]
+            columns += [east, west, west, east]
+            values += [
+                coefficient / area[west], -coefficient / area[west],
+                coefficient / area[east], -coefficient / area[east]]
+
+            composite.faces[0].append(west)
+            composite.faces[1].append(east)
+
+        composite.faces = tuple(np.concatenate(side)
+                                for side in composite.faces)
+
+        composite.ghostSource = np.zeros((n,), dtype=np.float64)
+        composite.balanceWeights = np.zeros((n,), dtype=np.float64)
+        composite.balanceExternal = 0.
+        jumps = []
+
+        segments = self.__getBottomSegments(
+            (np.arange(owners.shape[1]) >> composite.finestLevel) + 1)
+
+        # Walls, with their ghost relations eliminated: TOP, LEFT, RIGHT and
+        # the five BOTTOM segments of getEnergyBalance.
+        walls = [
+            (owners[-1, :], finestX, spacingY, False),
+            (owners[:, 0], finestY, spacingX, False),
+            (owners[:, -1], finestY, spacingX, False)]
+
+        walls += [
+            (owners[0, segments == segment], finestX, spacingY,
+             segment in (1, 3))
+            for segment in range(5) if (segments == segment).any()]
+
+        for cells, length, spacing, isSource in walls:
+
+            length = np.bincount(cells, minlength=n) * length
+            cells = np.nonzero(length)[0]
+            length, spacing = length[cells], spacing[cells]
+
+            center, external, source = self.__getGhostRelation(spacing)
+
+            # flux = diffusivity * length * (ghost - interior) / spacing
+            coefficient = self.diffusivity * self.deltaT * length / (
+                spacing * area[cells])
+
+            if isSource:
+                composite.ghostSource[cells] += coefficient * source
+                composite.balanceExternal += (
+                    self.conductivity * source / spacing * length).sum() / \
+                    length.sum()
+                jumps.append((cells, np.zeros_like(source), source))
+                continue
+
+            rows.append(cells)
+            columns.append(cells)
+            values.append(coefficient * (center - 1.))
+            composite.ghostSource[cells] += coefficient * external
+
+            # mean wall flux, conductivity * (ghost - interior) / spacing
+            composite.balanceWeights[cells] += \
+                self.conductivity * (center - 1.) / spacing * length / \
+                length.sum()
+            composite.balanceExternal += (
+                self.conductivity * external / spacing * length).sum() / \
+                length.sum()
+            jumps.append((cells, center - 1., external))
+
+        composite.wallJumps = tuple(
+            np.concatenate(part) for part in zip(*jumps))
+
+        composite.diffusionOperator = sparse.csr_matrix(
+            (np.concatenate(values), (np.concatenate(rows),
+                                      np.concatenate(columns))),
+            shape=(n, n)).astype(self.floatType)
+        composite.ghostSource = composite.ghostSource.astype(self.floatType)
+
+        composite.factorization = None
+
+        if self.solutionMethod == ct.DIRECT:
+            composite.factorization = \
+                DiffusionOperator.getImplicitFactorization(
+                    composite.diffusionOperator)
+
+        # volume averages over the volumes of the mesh
+        composite.restriction = sparse.csr_matrix(
+            (0.25 ** composite.level, (
+                (composite.cellY >> composite.level) * self.nodeNumberX +
+                (composite.cellX >> composite.level), np.arange(n))),
+            shape=(self.nodeNumberX * self.nodeNumberY, n))
+
+    @staticmethod
+    def __getMaximum(index: np.array, values: np.array, size: int) -> \
+            np.array:
+
+        order: np.array
+        starts: np.array
+        maximum: np.array
+
+        # largest value of each index, zero for the missing ones
+        order = np.argsort(index, kind="stable")
+        index, values = index[order], values[order]
+        starts = np.flatnonzero(np.diff(index, prepend=-1))
+
+        maximum = np.zeros((size,), dtype=np.float64)
+        maximum[index[starts]] = np.maximum.reduceat(values, starts)
+
+        return maximum
+
+    def __getBlockIndicators(self, composite: CompositeMesh) -> list:
+
+        level: int
+        rows: np.array
+        columns: np.array
+        offsets: np.array
+        indicator: np.array
+        temperature: np.array
+
+        temperature = composite.temperature.astype(np.float64)
+        cells, center, external = composite.wallJumps
+
+        # largest temperature jump across the faces of each leaf
+        indicator = self.__getMaximum(
+            np.concatenate(composite.faces + (cells,)),
+            np.abs(np.concatenate((
+                temperature[composite.faces[0]] -
+                temperature[composite.faces[1]],
+                temperature[composite.faces[1]] -
+                temperature[composite.faces[0]],
+                center * temperature[cells] + external))),
+            composite.getCellNumber())
+
+        # and of each leaf block, the blocks of all levels in a row
+        rows, columns = self.__getRootBlocks()
+        offsets = np.cumsum([0] + [
+            (rows << level) * (columns << level)
+            for level in range(self.refinementLevels + 1)])
+
+        indicator = self.__getMaximum(
+            offsets[composite.level] +
+            (composite.cellY // self.blockSize) * (
+                columns << composite.level) +
+            composite.cellX // self.blockSize, indicator, offsets[-1])
+
+        return [
+            indicator[offsets[level]:offsets[level + 1]].reshape(
+                (rows << level, columns << level))
+            for level in range(self.refinementLevels + 1)]
+
+    def __getTransfer(
+            self, composite: CompositeMesh, previous: CompositeMesh) -> \
+            sparse.csr_matrix:
+
+        level: int
+        owners: np.array
+        previousOwners: np.array
+        transfer: sparse.csr_matrix
+
+        level = max(composite.finestLevel, previous.finestLevel)
+
+        owners = self.__upsample(
+            composite.ownerMap, 1 << (level - composite.finestLevel)).ravel()
+        previousOwners = self.__upsample(
+            previous.ownerMap, 1 << (level - previous.finestLevel)).ravel()
+
+        # the new leaves are the volume averages of the previous ones, which
+        # is a copy for a refined leaf
+        transfer = sparse.csr_matrix(
+            (np.ones(owners.shape), (owners, previousOwners)),
+            shape=(composite.getCellNumber(), previous.getCellNumber()))
+
+        return sparse.diags(
+            1. / np.asarray(transfer.sum(axis=1)).ravel()) @ transfer
+
+    # ======================================================================== #
+    #   PUBLIC METHODS
+    # ======================================================================== #
+    def getCompositeMesh(self, temperature: np.array) -> CompositeMesh:
+
+        mnx: int
+        mny: int
+        level: int
+        composite: CompositeMesh
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        # the leaves are the volumes of the mesh, then each regrid refines
+        # them by one level at most
+        composite = CompositeMesh([
+            np.zeros(tuple(np.array(self.__getRootBlocks()) << level),
+                     dtype=bool)
+            for level in range(self.refinementLevels)])
+
+        self.__setLeaves(composite)
+        composite.temperature = \
+            temperature[1:mny-1, 1:mnx-1].ravel().astype(self.floatType)
+        self.__setOperator(composite)
+
+        for level in range(self.refinementLevels):
+            composite = self.regridCompositeMesh(composite)
+
+        return composite
+
+    def regridCompositeMesh(self, composite: CompositeMesh) -> CompositeMesh:
+
+        level: int
+        refined: list
+        indicators: list
+        coarsened: np.array
+        childRefined: np.array
+        childIndicator: np.array
+        regridded: CompositeMesh
+
+        indicators = self.__getBlockIndicators(composite)
+        refined = [blocks.copy() for blocks in composite.refined]
+
+        for level in range(self.refinementLevels):
+
+            # blocks of leaf children with small jumps are merged
+            rows, columns = refined[level].shape
+            childIndicator = indicators[level + 1].reshape(
+                (rows, 2, columns, 2)).max(axis=(1, 3))
+            childRefined = np.zeros_like(refined[level])
+
+            if level + 1 < self.refinementLevels:
+                childRefined = self.__downsampleAny(
+                    composite.refined[level + 1])
+
+            coarsened = refined[level] & ~childRefined & (
+                childIndicator < self.coarseningThreshold)
+
+            # leaf blocks with large jumps are split
+            refined[level] = (refined[level] & ~coarsened) | (
+                indicators[level] > self.refinementThreshold)
+
+            if level > 0:
+                refined[level] &= self.__upsample(refined[level - 1], 2)
+
+        # neighbour leaves differ by one level at most
+        for level in range(self.refinementLevels - 1, 0, -1):
+            refined[level - 1] |= self.__downsampleAny(
+                self.__dilate(refined[level]))
+
+        if all(np.array_equal(blocks, previous)
+               for blocks, previous in zip(refined, composite.refined)):
+            return composite
+
+        regridded = CompositeMesh(refined)
+
+        self.__setLeaves(regridded)
+        regridded.temperature = (self.__getTransfer(regridded, composite) @
+                                 composite.temperature).astype(self.floatType)
+        self.__setOperator(regridded)
+
+        return regridded
+
+    @staticmethod
+    def solveEnergyEquationsAdaptive(composite: CompositeMesh) -> np.float64:
+
+        temperature: np.array
+        temperatureChange: np.array
+
+        if composite.factorization is None:
+            # explicit: T^{n+1} = T^{n} + D T^{n} + S
+            temperatureChange = \
+                composite.diffusionOperator @ composite.temperature + \
+                composite.ghostSource
+            composite.temperature += temperatureChange
+
+        else:
+            # backward Euler: (I - D) T^{n+1} = T^{n} + S
+            temperature = composite.factorization.solve(
+                composite.temperature + composite.ghostSource).astype(
+                composite.temperature.dtype)
+            temperatureChange = temperature - composite.temperature
+            composite.temperature = temperature
+
+        return np.abs(temperatureChange).max()
+
+    def getBaseTemperature(self, composite: CompositeMesh) -> np.array:
+
+        # volume averages of the leaves over the volumes of the mesh
+        return (composite.restriction @ composite.temperature).reshape(
+            (self.nodeNumberY, self.nodeNumberX))
+
+    @staticmethod
+    def getAdaptiveEnergyBalance(composite: CompositeMesh) -> np.float64:
+
+        # the wall fluxes of getEnergyBalance, along the leaves at the walls
+        return composite.balanceWeights @ \
+            composite.temperature.astype(np.float64) + \
+            composite.balanceExternal
+
+    def getCompositeOutput(self, composite: CompositeMesh) -> pd.DataFrame:
+
+        spacingX: np.array
+        spacingY: np.array
+
+        spacingX = self.deltaX / 2. ** composite.level
+        spacingY = self.deltaY / 2. ** composite.level
+
+        # centers of the leaves, the mesh nodes are the centers of level 0
+        return pd.DataFrame(data={
+            "x": self.initialPositionX - 0.5 * self.deltaX +
+            (composite.cellX + 0.5) * spacingX,
+            "y": self.initialPositionY - 0.5 * self.deltaY +
+            (composite.cellY + 0.5) * spacingY,
+            "level": composite.level,
+            "temperature": composite.temperature})
@@ -0,0 +1,169 @@
+# *****************************************************************************
+# *               ALTERNATING DIRECTION IMPLICIT - 2D HEAT TRANSFER           *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: Peaceman-Rachford alternating direction implicit (ADI)       *
+# * scheme. Each time step is split in two half steps, implicit along the     *
+# * rows and then along the columns:                                          *
+# *                                                                           *
+# *   (1 - rX/2 dXX) T*      = (1 + rY/2 dYY) T^{n}                           *
+# *   (1 - rY/2 dYY) T^{n+1} = (1 + rX/2 dXX) T*                              *
+# *                                                                           *
+# * All rows (or columns) are solved together by the Thomas algorithm, so the *
+# * scheme is unconditionally stable with O(N) cost per time step. The ghost  *
+# * nodes follow the relations ghost = center * interior + external.          *
+# *****************************************************************************
+import numpy as np
+from MeshGenerator import MeshGenerator
+
+
+class AlternatingDirection(MeshGenerator):
+
+    def __init__(self):
+
+        super().__init__()
+
+    @staticmethod
+    def getTridiagonalFactorization(
+            offDiagonal: np.float64, diagonal: np.array) -> tuple:
+
+        i: np.int64
+        invPivot: np.array
+        upperFactor: np.array
+
+        # Thomas algorithm over a batch of systems: the unknowns run along the
+        # first axis and each column is an independent system. The matrices
+        # do not change in time, so the elimination is done only once.
+        invPivot = np.zeros(diagonal.shape, dtype=np.float64)
+        upperFactor = np.zeros(diagonal.shape, dtype=np.float64)
+
+        invPivot[0] = 1. / diagonal[0]
+        upperFactor[0] = offDiagonal * invPivot[0]
+
+        for i in range(1, diagonal.shape[0]):
+            invPivot[i] = 1. / (diagonal[i] - offDiagonal * upperFactor[i - 1])
+            upperFactor[i] = offDiagonal * invPivot[i]
+
+        return offDiagonal, upperFactor, invPivot
+
+    @staticmethod
+    def solveTridiagonal(
+            factorization: tuple, rightHandSide: np.array) -> np.array:
+
+        i: np.int64
+        n: np.int64
+        solution: np.array
+
+        offDiagonal, upperFactor, invPivot = factorization
+
+        n = rightHandSide.shape[0]
+
+        solution = np.empty(rightHandSide.shape, dtype=np.float64)
+
+        # forward elimination
+        solution[0] = rightHandSide[0] * invPivot[0]
+
+        for i in range(1, n):
+            solution[i] = \
+                (rightHandSide[i] - offDiagonal * solution[i - 1]) * \
+                invPivot[i]
+
+        # back substitution
+        for i in range(n - 2, -1, -1):
+            solution[i] -= upperFactor[i] * solution[i + 1]
+
+        return solution
+
+    def getAlternatingFactorizations(
+            self, diffusionCoeffX: np.float64, diffusionCoeffY: np.float64,
+            ghostRelations: tuple) -> tuple:
+
+        nx: np.int64
+        ny: np.int64
+        diagonalX: np.array
+        diagonalY: np.array
+
+        nx = self.nodeNumberX
+        ny = self.nodeNumberY
+
+        centerSouth, _, centerNorth, _, centerWest, _, centerEast, _ = \
+            ghostRelations
+
+        # Rows: one system per row, shape (nx, ny). The center part of the
+        # ghost relations goes to the first and last diagonal terms.
+        diagonalX = (1. + diffusionCoeffX) * np.ones(
+            (nx, ny), dtype=np.float64)
+        diagonalX[0, :] -= 0.5 * diffusionCoeffX * centerWest
+        diagonalX[nx - 1, :] -= 0.5 * diffusionCoeffX * centerEast
+
+        # Columns: one system per column, shape (ny, nx).
+        diagonalY = (1. + diffusionCoeffY) * np.ones(
+            (ny, nx), dtype=np.float64)
+        diagonalY[0, :] -= 0.5 * diffusionCoeffY * centerSouth
+        diagonalY[ny - 1, :] -= 0.5 * diffusionCoeffY * centerNorth
+
+        return \
+            self.getTridiagonalFactorization(
+                - 0.5 * diffusionCoeffX, diagonalX), \
+            self.getTridiagonalFactorization(
+                - 0.5 * diffusionCoeffY, diagonalY)
+
+    def solveEnergyEquationsADI(
+            self, temperature: np.array, factorizations: tuple,
+            diffusionCoeffX: np.float64, diffusionCoeffY: np.float64,
+            ghostRelations: tuple) -> np.array:
+
+        mnx: np.int64
+        mny: np.int64
+        ghostWest: np.array
+        ghostEast: np.array
+        ghostSouth: np.array
+        ghostNorth: np.array
+        rightHandSide: np.array
+        halfTemperature: np.array
+        estimateTemperature: np.array
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        centerSouth, externalSouth, centerNorth, externalNorth, \
+            centerWest, externalWest, centerEast, externalEast = ghostRelations
+
+        factorizationX, factorizationY = factorizations
+
+        estimateTemperature = temperature.copy()
+
+        # FIRST HALF STEP: explicit along y and implicit along x
+        ghostSouth = centerSouth * temperature[1, 1:mnx-1] + externalSouth
+        ghostNorth = centerNorth * temperature[mny-2, 1:mnx-1] + externalNorth
+
+        rightHandSide = \
+            temperature[1:mny-1, 1:mnx-1] + 0.5 * diffusionCoeffY * (
+            np.vstack((temperature[2:mny-1, 1:mnx-1], ghostNorth)) -
+            2 * temperature[1:mny-1, 1:mnx-1] +
+            np.vstack((ghostSouth, temperature[1:mny-2, 1:mnx-1])))
+
+        rightHandSide[:, 0] += 0.5 * diffusionCoeffX * externalWest
+        rightHandSide[:, mnx-3] += 0.5 * diffusionCoeffX * externalEast
+
+        halfTemperature = self.solveTridiagonal(
+            factorizationX, rightHandSide.T).T
+
+        # SECOND HALF STEP: explicit along x and implicit along y
+        ghostWest = centerWest * halfTemperature[:, 0] + externalWest
+        ghostEast = centerEast * halfTemperature[:, mnx-3] + externalEast
+
+        rightHandSide = halfTemperature + 0.5 * diffusionCoeffX * (
+            np.column_stack((halfTemperature[:, 1:], ghostEast)) -
+            2 * halfTemperature +
+            np.column_stack((ghostWest, halfTemperature[:, :-1])))
+
+        rightHandSide[0, :] += 0.5 * diffusionCoeffY * externalSouth
+        rightHandSide[mny-3, :] += 0.5 * diffusionCoeffY * externalNorth
+
+        estimateTemperature[1:mny-1, 1:mnx-1] = self.solveTridiagonal(
+            factorizationY, rightHandSide)
+
+        return estimateTemperature
@@ -1,152 +1,289 @@
-# *****************************************************************************
-# *                          ANALYTICAL SOLUTION                              *
-# *****************************************************************************
-# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
-# * E-mail: almeriopamplona@gmail.com                                         *
-# *****************************************************************************
-# *                                 T_n                                       *
-# *                        + ------------------ +                             *
-# *                        |                    |                             *
-# *                        |                    |                             *
-# *                  T_w   |                    |  T_e                        *
-# *                        |                    |                             *
-# *                        |                    |                             *
-# *                        + ------------------ +                             *
-# *                                 T_s                                       *
-# *****************************************************************************
-import time
-import numpy as np
-import pandas as pd
-from Solid import Solid
-from PostProcess import PostProcess
-
-
-class AnalyticalSolver(PostProcess):
-
-    def solveDirichletPlate(self, solid: Solid):
-
-        i: int
-        j: int
-        k: int
-        Lx: float
-        Ly: float
-        mnx: int
-        mny: int
-        SUM: float
-        beta: float
-        maxIter: int
-        axisX: np.array
-        axisY: np.array
-        tempEast: float
-        tempWest: float
-        tempNorth: float
-        tempSouth: float
-        outputTemperature: pd.DataFrame
-        temperatureFieldSpace: np.array
-
-        solid.temperature = self.setBoundaryConditions(solid)
-        temperatureFieldSpace = np.zeros(solid.temperature.shape, dtype=float)
-        Lx = solid.length
-        Ly = solid.width
-        maxIter = 1000
-        mnx = solid.maxNodeNumberX
-        mny = solid.maxNodeNumberY
-
-        axisX = np.linspace(
-            self.initialPositionX - self.deltaX,
-            self.finalPositionX + self.deltaX, mnx)
-        axisY = np.linspace(
-            self.initialPositionY - self.deltaY,
-            self.finalPositionY + self.deltaY, mny)
-
-        start = time.time()
-
-        for i in range(1, mny - 1):
-            for j in range(1, mnx - 1):
-
-                tempSouth = 0.
-                for k in range(1, maxIter):
-                    beta = k * np.pi / Lx
-
-                    SUM = (2 * solid.tempSouth / np.pi) * \
-                        (((-1) ** (k + 1) + 1) / k) * (
-                        -np.sinh(beta * axisY[i]) / np.tanh(beta * Ly) +
-                        np.cosh(beta * axisY[i])) * np.sin(beta * axisX[j])
-
-                    if ~np.isnan(SUM) and ~np.isinf(SUM):
-                        tempSouth += SUM
-
-                tempEast = 0.
-                for k in range(1, maxIter):
-                    beta = k * np.pi / Ly
-
-                    SUM = (2 * solid.tempEast / np.pi) * \
-                        (((-1)**(k+1) + 1) / k) * np.sinh(beta * axisX[j]) * \
-                        np.sin(beta * axisY[i]) / np.sinh(beta * Lx)
-
-                    if ~np.isnan(SUM) and ~np.isinf(SUM):
-                        tempEast += SUM
-
-                tempNorth = 0.
-                for k in range(1, maxIter):
-                    beta = k * np.pi / Lx
-
-                    SUM = (2 * solid.tempNorth / np.pi) * \
-                        (((-1)**(k+1) + 1) / k) * np.sinh(beta * axisY[i]) * \
-                        np.sin(beta * axisX[j]) / np.sinh(beta * Ly)
-
-                    if ~np.isnan(SUM) and ~np.isinf(SUM):
-                        tempNorth += SUM
-
-                tempWest = 0.
-                for k in range(1, maxIter):
-                    beta = k * np.pi / Ly
-
-                    SUM = (2 * solid.tempWest / np.pi) * \
-                        (((-1)**(k+1) + 1) / k) * (
-                        -np.sinh(beta * axisX[j]) / np.tanh(beta * Lx) +
-                        np.cosh(beta * axisX[j])) * np.sin(beta * axisY[i])
-
-                    if ~np.isnan(SUM) and ~np.isinf(SUM):
-                        tempWest += SUM
-
-                temperatureFieldSpace[i, j] = tempSouth + tempEast + \
-                    tempNorth + tempWest
-
-        solid.temperature[1:mny-1, 1:mnx-1] = \
-            temperatureFieldSpace[1:mny-1, 1:mnx-1]
-
-        outputTemperature = pd.DataFrame(data={
-            "x": solid.coordinateX,
-            "y": solid.coordinateY,
-            "temperature": solid.temperature[1:mny - 1, 1:mnx - 1].reshape(
-                solid.coordinateX.shape)
-        })
-
-        self.saveOutputs(outputTemperature, self.getAnalyticalSolutionPath)
-
-        end = time.time()
-
-        print("Elapsed time: {}".format(end - start))
-
-    @staticmethod
-    def setBoundaryConditions(solid: Solid) -> np.array:
-
-        mnx: int
-        mny: int
-        temperatureFieldAux: np.array
-
-        mnx = solid.maxNodeNumberX
-        mny = solid.maxNodeNumberY
-        temperatureFieldAux = solid.temperature.copy()
-
-        # BOTTOM:
-        temperatureFieldAux[0, :] = solid.tempSouth
-        # EAST
-        temperatureFieldAux[:, mnx - 1] = solid.tempEast
-        # TOP
-        temperatureFieldAux[mny - 1, :] = solid.tempNorth
-        # WEST
-        temperatureFieldAux[:, 0] = solid.tempWest
-
-        return temperatureFieldAux
+# *****************************************************************************
+# *                          ANALYTICAL SOLUTION                              *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# *                                 T_n                                       *
+# *                        + ------------------ +                             *
+# *                        |                    |                             *
+# *                        |                    |                             *
+# *                  T_w   |                    |  T_e                        *
+# *                        |                    |                             *
+# *                        |                    |                             *
+# *                        + ------------------ +                             *
+# *                                 T_s                                       *
+# *****************************************************************************
+import os
+import re
+import time
+import hashlib
+import numpy as np
+import pandas as pd
+import Constants as ct
+from scipy import interpolate
+from Solid import Solid
+from PostProcess import PostProcess
+
+
+class AnalyticalSolver(PostProcess):
+
+    # series truncation, rows (or columns) evaluated together and smallest
+    # term kept
+    SERIES_TERMS = 1000
+    SERIES_BLOCK = 64
+    SERIES_TOLERANCE = 1.0E-15
+
+    # ======================================================================== #
+    # PRIVATE METHODS                                                          #
+    # ======================================================================== #
+    @staticmethod
+    def __getSinhRatio(numerator: np.array, denominator: np.array) -> \
+            np.array:
+
+        # sinh(a) / sinh(b), 0 <= a <= b, written with decaying exponentials
+        # so it does not overflow for the high frequency terms
+        return np.exp(numerator - denominator) * \
+            np.expm1(-2. * numerator) / np.expm1(-2. * denominator)
+
+    def __getSeries(self, decay: np.array, wave: np.array) -> np.array:
+
+        start: int
+        terms: int
+        block: np.array
+        series: np.array
+        significant: np.array
+
+        # Every series is separable, sum_k decay(node, k) * wave(k, node),
+        # i.e., a matrix product. Each block of nodes only takes the terms
+        # up to the last one above the tolerance.
+        series = np.zeros((decay.shape[0], wave.shape[1]), dtype=np.float64)
+
+        for start in range(0, decay.shape[0], self.SERIES_BLOCK):
+            block = decay[start:start + self.SERIES_BLOCK]
+
+            significant = np.flatnonzero(
+                np.abs(block).max(axis=0) > self.SERIES_TOLERANCE)
+
+            terms = significant[-1] + 1 if significant.size > 0 else 0
+
+            series[start:start + self.SERIES_BLOCK] = \
+                block[:, :terms] @ wave[:terms]
+
+        return series
+
+    def __getSeriesSolution(self, solid: Solid) -> np.array:
+
+        Lx: float
+        Ly: float
+        axisX: np.array
+        axisY: np.array
+        betaX: np.array
+        betaY: np.array
+        wavenumber: np.array
+        coefficient: np.array
+        tempEast: np.array
+        tempWest: np.array
+        tempNorth: np.array
+        tempSouth: np.array
+
+        Lx = solid.length
+        Ly = solid.width
+
+        # nodes of the mesh, uniform or stretched
+        axisX = self.axisX
+        axisY = self.axisY
+
+        # only the odd terms are not null: ((-1)^(k+1) + 1) / k = 2 / k
+        wavenumber = np.arange(1, self.SERIES_TERMS, 2, dtype=np.float64)
+        coefficient = 4. / (np.pi * wavenumber)
+
+        betaX = wavenumber * np.pi / Lx
+        betaY = wavenumber * np.pi / Ly
+
+        tempSouth = solid.tempSouth * self.__getSeries(
+            coefficient * self.__getSinhRatio(
+                np.outer(Ly - axisY, betaX), betaX * Ly),
+            np.sin(np.outer(betaX, axisX)))
+
+        tempNorth = solid.tempNorth * self.__getSeries(
+            coefficient * self.__getSinhRatio(
+                np.outer(axisY, betaX), betaX * Ly),
+            np.sin(np.outer(betaX, axisX)))
+
+        tempEast = solid.tempEast * self.__getSeries(
+            coefficient * self.__getSinhRatio(
+                np.outer(axisX, betaY), betaY * Lx),
+            np.sin(np.outer(betaY, axisY))).T
+
+        tempWest = solid.tempWest * self.__getSeries(
+            coefficient * self.__getSinhRatio(
+                np.outer(Lx - axisX, betaY), betaY * Lx),
+            np.sin(np.outer(betaY, axisY))).T
+
+        return tempSouth + tempEast + tempNorth + tempWest
+
+    # ------------------------------------------------------------------------ #
+    # CACHE OF THE ANALYTICAL SOLUTIONS                                        #
+    # ------------------------------------------------------------------------ #
+    def __getCacheKey(self, solid: Solid) -> str:
+
+        # everything the solution depends on, but the resolution, which goes
+        # in the file name so finer solutions of the same plate can be found
+        return hashlib.sha256(repr((
+            self.initialPositionX, self.finalPositionX,
+            self.initialPositionY, self.finalPositionY,
+            solid.length, solid.width, solid.tempSouth, solid.tempNorth,
+            solid.tempEast, solid.tempWest, self.SERIES_TERMS,
+            self.SERIES_TOLERANCE)).encode()).hexdigest()[:16]
+
+    def __getCachePath(self, key: str, ny: int, nx: int) -> str:
+
+        stretching: str
+
+        # the stretched meshes are not used as finer solutions
+        stretching = "" if self.meshStretching == ct.UNIFORM else \
+            "_{}{}".format(self.meshStretching, self.stretchingFactor)
+
+        return self.getDirCache + ct.OS_SEP + ct.ANALYTICAL_CACHE + \
+            "_{}_{}x{}{}.npy".format(key, ny, nx, stretching)
+
+    def __getFinerCachePath(self, key: str) -> tuple:
+
+        ny: int
+        nx: int
+        finerPaths: list
+
+        finerPaths = []
+
+        for filename in os.listdir(self.getDirCache):
+            match = re.fullmatch(
+                ct.ANALYTICAL_CACHE + r"_{}_(\d+)x(\d+)\.npy".format(key),
+                filename)
+
+            if match is None:
+                continue
+
+            ny, nx = int(match.group(1)), int(match.group(2))
+
+            if ny >= self.nodeNumberY and nx >= self.nodeNumberX:
+                finerPaths.append((
+                    (ny - 1) % (self.nodeNumberY - 1) == 0 and
+                    (nx - 1) % (self.nodeNumberX - 1) == 0, ny * nx,
+                    self.getDirCache + ct.OS_SEP + filename, ny, nx))
+
+        if len(finerPaths) == 0:
+            return None, 0, 0
+
+        # a mesh holding all the nodes of this one, else the finest
+        _, _, path, ny, nx = max(finerPaths)
+
+        return path, ny, nx
+
+    def __readCache(self, key: str) -> np.array:
+
+        ny: int
+        nx: int
+        path: str
+        axisX: np.array
+        axisY: np.array
+        finerSolution: np.array
+
+        path = self.__getCachePath(key, self.nodeNumberY, self.nodeNumberX)
+
+        if os.path.exists(path):
+            print("Analytical solution read from {}".format(path))
+            return np.load(path)
+
+        path, ny, nx = self.__getFinerCachePath(key)
+
+        if path is None:
+            return None
+
+        print("Analytical solution interpolated from {}".format(path))
+
+        finerSolution = interpolate.RegularGridInterpolator((
+            np.linspace(self.initialPositionY, self.finalPositionY, ny),
+            np.linspace(self.initialPositionX, self.finalPositionX, nx)),
+            np.load(path))
+
+        # the finer solutions are uniform, the mesh may be stretched
+        axisX = self.axisX
+        axisY = self.axisY
+
+        return finerSolution(tuple(np.meshgrid(axisY, axisX, indexing="ij")))
+
+    def __writeCache(self, key: str, solution: np.array) -> None:
+
+        path: str
+
+        path = self.__getCachePath(key, self.nodeNumberY, self.nodeNumberX)
+
+        # written aside and renamed, so a cut run never leaves a broken file
+        with open(path + ".tmp", "wb") as cacheFile:
+            np.save(cacheFile, solution)
+
+        os.replace(path + ".tmp", path)
+
+    # ======================================================================== #
+    #   PUBLIC METHODS
+    # ======================================================================== #
+    def solveDirichletPlate(self, solid: Solid):
+
+        mnx: int
+        mny: int
+        key: str
+        solution: np.array
+        outputTemperature: pd.DataFrame
+
+        solid.temperature = self.setBoundaryConditions(solid)
+        mnx = solid.maxNodeNumberX
+        mny = solid.maxNodeNumberY
+
+        start = time.time()
+
+        key = self.__getCacheKey(solid)
+        solution = self.__readCache(key) if self.analyticalCache else None
+
+        if solution is None:
+            solution = self.__getSeriesSolution(solid)
+
+            if self.analyticalCache:
+                self.__writeCache(key, solution)
+
+        solid.temperature[1:mny-1, 1:mnx-1] = solution
+
+        outputTemperature = pd.DataFrame(data={
+            "temperature": solid.temperature[1:mny - 1, 1:mnx - 1].reshape(
+                solid.coordinateX.shape)
+        })
+
+        self.saveOutputs(
+            outputTemperature, self.getAnalyticalSolutionPath,
+            self.saveMesh(solid.coordinateX, solid.coordinateY))
+
+        end = time.time()
+
+        print("Elapsed time: {}".format(end - start))
+
+    @staticmethod
+    def setBoundaryConditions(solid: Solid) -> np.array:
+
+        mnx: int
+        mny: int
+        temperatureFieldAux: np.array
+
+        mnx = solid.maxNodeNumberX
+        mny = solid.maxNodeNumberY
+        temperatureFieldAux = solid.temperature.copy()
+
+        # BOTTOM:
+        temperatureFieldAux[0, :] = solid.tempSouth
+        # EAST
+        temperatureFieldAux[:, mnx - 1] = solid.tempEast
+        # TOP
+        temperatureFieldAux[mny - 1, :] = solid.tempNorth
+        # WEST
+        temperatureFieldAux[:, 0] = solid.tempWest
+
+        return temperatureFieldAux
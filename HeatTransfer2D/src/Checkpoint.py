@@ -0,0 +1,153 @@
+# *****************************************************************************
+# *                       CHECKPOINT - 2D HEAT TRANSFER                       *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: checkpoints and restart of the Robin and Dirichlet runs.     *
+# * Every checkpointStride time steps, the ghost-celled field, the next time  *
+# * step, the probes sampled so far, the steady state monitor and a hash of   *
+# * the control parameters are written in a NumPy .npz file. The file is     *
+# * written aside and renamed, so a killed run never leaves a half written   *
+# * checkpoint. A run resumes from the latest checkpoint that can be read    *
+# * and has the hash of its own control parameters.                          *
+# *****************************************************************************
+import os
+import re
+import glob
+import hashlib
+import zipfile
+import numpy as np
+from DirectoryManager import DirectoryManager
+
+# control parameters that do not change the solution
+CHECKPOINT_NEUTRAL = (
+    "checkpointStride", "restart", "explicitBackend", "stripWorkers",
+    "threadWorkers", "analyticalCache", "snapshotStride", "outputFormat")
+
+# checkpoints kept on disk, the older ones are removed
+CHECKPOINT_KEEP = 2
+
+
+class Checkpoint(DirectoryManager):
+
+    def __init__(self):
+
+        super().__init__()
+
+    # ======================================================================== #
+    # PRIVATE METHODS                                                          #
+    # ======================================================================== #
+    @staticmethod
+    def __getConfigurationHash(solid) -> str:
+
+        parameters: list
+
+        parameters = sorted(
+            (name, value) for name, value in solid.runContext.parameters.items()
+            if name not in CHECKPOINT_NEUTRAL)
+
+        return hashlib.sha256(repr(parameters).encode()).hexdigest()
+
+    def __getCheckpoints(self) -> list:
+
+        steps: dict
+        pattern: re.Pattern
+
+        # only this case, the suffix of the other cases is not a time step
+        pattern = re.compile(
+            re.escape(self.getCheckpointPath) + r"_(\d+)\.npz")
+
+        steps = {
+            path: int(match.group(1))
+            for path, match in (
+                (path, pattern.fullmatch(path))
+                for path in glob.glob(self.getCheckpointPath + "_*.npz"))
+            if match}
+
+        # latest time step first
+        return sorted(steps, key=steps.get, reverse=True)
+
+    # ======================================================================== #
+    #   PUBLIC METHODS
+    # ======================================================================== #
+    def saveCheckpoint(self, solid, t: int, probes: np.array) -> None:
+
+        path: str
+        temporaryPath: str
+
+        if not self.checkpointStride or (t + 1) % self.checkpointStride != 0 \
+                or t + 1 >= solid.timeSize:
+            return
+
+        path = self.getCheckpointPath + "_{}.npz".format(t + 1)
+        temporaryPath = path + ".tmp"
+
+        with open(temporaryPath, "wb") as file:
+            np.savez(
+                file, step=t + 1, temperature=solid.temperature,
+                probes=probes[:t // self.probeSamplingStride + 1],
+                energyBalance=solid.energyBalance,
+                previousEnergyBalance=solid.previousEnergyBalance,
+                steadyStateCounter=solid.steadyStateCounter,
+                configuration=self.__getConfigurationHash(solid))
+            file.flush()
+            os.fsync(file.fileno())
+
+        # the rename is atomic, the previous checkpoints are still valid
+        os.replace(temporaryPath, path)
+
+        for path in self.__getCheckpoints()[CHECKPOINT_KEEP:]:
+            os.remove(path)
+
+    def loadCheckpoint(self, solid, probes: np.array) -> int:
+
+        step: int
+        path: str
+        checkpoint: dict
+
+        if not self.restart:
+            return 0
+
+        for path in self.__getCheckpoints():
+            try:
+                with np.load(path) as data:
+                    checkpoint = {name: data[name] for name in data.files}
+
+            except (OSError, ValueError, EOFError, zipfile.BadZipFile):
+                print("WARNING:: {} can not be read!".format(path))
+                continue
+
+            if checkpoint.get("configuration") != \
+                    self.__getConfigurationHash(solid) or \
+                    checkpoint["temperature"].shape != \
+                    solid.temperature.shape:
+                print("WARNING:: {} is a checkpoint of other control "
+                      "parameters!".format(path))
+                continue
+
+            step = int(checkpoint["step"])
+
+            solid.temperature = checkpoint["temperature"].astype(
+                solid.floatType)
+            probes[:checkpoint["probes"].shape[0]] = checkpoint["probes"]
+
+            # steady state monitor
+            solid.energyBalance = checkpoint["energyBalance"][()]
+            solid.previousEnergyBalance = \
+                checkpoint["previousEnergyBalance"][()]
+            solid.steadyStateCounter = int(checkpoint["steadyStateCounter"])
+
+            print("Restarting from the checkpoint at t = {} s".format(
+                solid.getTimeVector()[step - 1]))
+
+            return step
+
+        return 0
+
+    def clearCheckpoints(self) -> None:
+
+        path: str
+
+        for path in self.__getCheckpoints():
+            os.remove(path)
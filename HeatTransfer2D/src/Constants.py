@@ -1,52 +1,94 @@
-# *****************************************************************************
-# *                     CONSTANTS - 2D HEAT TRANSFER                          *
-# *****************************************************************************
-# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
-# * E-mail: almeriopamplona@gmail.com                                         *
-# *****************************************************************************
-# * Description: some hard coded variables that are used through the code and *
-# * kept here to maintain the code organized.                                 *
-# *****************************************************************************
-
-import os
-from pathlib import Path
-
-# =========================================================================== #
-# MASTER PATH
-# =========================================================================== #
-OS_SEP = os.sep
-PATH = Path(os.getcwd()).absolute().parent.__str__()
-
-# =========================================================================== #
-# DIRECTORIES
-# =========================================================================== #
-DIR_EXECUTABLES = "src"
-DIR_REPORTS = "Reports"
-DIR_FIGURE = "figure"
-DIR_TEMPERATURE = "temperature"
-DIR_WARNINGS = DIR_REPORTS + OS_SEP + "Warnings"
-
-# =========================================================================== #
-# OUTPUT FILES
-# =========================================================================== #
-TEMPERATURE_OUTPUT = "temperature"
-ANALYTICAL_TEMP_OUTPUT = "temperatureAnalytical"
-PROBE_PLOTS = "probePlots"
-PROBE1_OUTPUT = "probe1"
-PROBE2_OUTPUT = "probe2"
-PROBE3_OUTPUT = "probe3"
-
-FILE_SEP = ";"
-DECIMAL_SEP = "."
-
-# =========================================================================== #
-# CONSTANTS FOR THE MAIS CODE
-# =========================================================================== #
-EXPLICIT = "explicit"
-IMPLICIT = "implicit"
-ONE_DIMENSIONAL = "1D"
-TWO_DIMENSIONAL = "2D"
-THREE_DIMENSIONAL = "3D"
-ROBIN_PROBLEM = "ROBIN_PROBLEM"
-DIRICHLET_PROBLEM = "DIRICHLET_PROBLEM"
-
+# *****************************************************************************
+# *                     CONSTANTS - 2D HEAT TRANSFER                          *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: some hard coded variables that are used through the code and *
+# * kept here to maintain the code organized.                                 *
+# *****************************************************************************
+
+import os
+from pathlib import Path
+
+# =========================================================================== #
+# MASTER PATH
+# =========================================================================== #
+OS_SEP = os.sep
+PATH = Path(os.getcwd()).absolute().parent.__str__()
+
+# =========================================================================== #
+# DIRECTORIES
+# =========================================================================== #
+DIR_EXECUTABLES = "src"
+DIR_REPORTS = "Reports"
+DIR_FIGURE = "figure"
+DIR_TEMPERATURE = "temperature"
+DIR_CACHE = "cache"
+DIR_CHECKPOINT = "checkpoint"
+DIR_SNAPSHOTS = "snapshots"
+DIR_MESH = "mesh"
+DIR_WARNINGS = DIR_REPORTS + OS_SEP + "Warnings"
+
+# =========================================================================== #
+# OUTPUT FILES
+# =========================================================================== #
+TEMPERATURE_OUTPUT = "temperature"
+ANALYTICAL_TEMP_OUTPUT = "temperatureAnalytical"
+ANALYTICAL_CACHE = "analytical"
+PROBE_PLOTS = "probePlots"
+PROBES_OUTPUT = "probes"
+SWEEP_OUTPUT = "sweep"
+ENSEMBLE_OUTPUT = "ensemble"
+ENSEMBLE_PROBES_OUTPUT = "ensembleProbes"
+PRECISION_OUTPUT = "precision"
+CHECKPOINT_OUTPUT = "checkpoint"
+SNAPSHOT_OUTPUT = "snapshots"
+SNAPSHOT_TIME = "time"
+MESH_OUTPUT = "mesh"
+MESH_REFERENCE = "#mesh"
+ADAPTIVE_OUTPUT = "adaptiveMesh"
+
+FILE_SEP = ";"
+DECIMAL_SEP = "."
+
+# output formats, NPZ:: one binary array per column
+CSV = "csv"
+NPZ = "npz"
+NPZ_MAGIC = b"PK\x03\x04"
+
+# =========================================================================== #
+# CONSTANTS FOR THE MAIS CODE
+# =========================================================================== #
+# solution methods
+EXPLICIT = "explicit"
+IMPLICIT = "implicit"
+DIRECT = "direct"
+MULTIGRID = "multigrid"
+ADI = "adi"
+CRANK_NICOLSON = "crankNicolson"
+
+# explicit backends
+NUMPY = "numpy"
+NUMBA = "numba"
+SHARED_MEMORY = "sharedMemory"
+THREADS = "threads"
+
+# mesh stretchings, clustered at the walls
+UNIFORM = "uniform"
+TANH = "tanh"
+GEOMETRIC = "geometric"
+
+# multigrid cycles
+V_CYCLE = "V"
+F_CYCLE = "F"
+
+ONE_DIMENSIONAL = "1D"
+TWO_DIMENSIONAL = "2D"
+THREE_DIMENSIONAL = "3D"
+ROBIN_PROBLEM = "ROBIN_PROBLEM"
+DIRICHLET_PROBLEM = "DIRICHLET_PROBLEM"
+
+# precisions of the fields
+FLOAT32 = "float32"
+FLOAT64 = "float64"
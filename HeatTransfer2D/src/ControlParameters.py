@@ -1,150 +1,287 @@
-# *****************************************************************************
-# *                 CONTROL PARAMETERS - 2D HEAT TRANSFER                     *
-# *****************************************************************************
-# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
-# * E-mail: almeriopamplona@gmail.com                                         *
-# *****************************************************************************
-# * Description: parameters of the 2D heat transfer numerical solution,       *
-# using Finite Volume Method.                                                 *
-# *****************************************************************************
-import numpy as np
-import Constants as ct
-
-
-class ControlParameters:
-
-    def __init__(self):
-        self.maxIterations: np.int64
-        self.stabilityParamenter: np.int64
-
-        self.nodeNumber: np.int64
-        self.nodeNumberY: np.int64
-        self.maxNodeNumberX: np.int64
-        self.maxNodeNumberY: np.int64
-        self.ghostNodeNumberX: np.int64
-        self.ghostNodeNumberY: np.int64
-
-        self.problemType: str
-        self.solutionMethod: str
-        self.problemDimension: str
-                       
-        self.CFL: np.float64                     # -
-        self.PI: np.float64                      # -
-        self.width: np.float64                   # m
-        self.length: np.float64                  # m
-        self.convection: np.float64              # W / (m**2 * K)
-        self.diffusivity: np.float64             # m**2 / s
-        self.conductivity: np.float64            # W / (m * K)
-        self.maxDeltaT: np.float64               # s
-        self.iterTolerance: np.float64           # -
-        self.relaxationConstant: np.float64      # -
-
-        self.finalTime: np.float64               # s
-        self.initialTime: np.float64             # s
-
-        self.heatSource: np.float64              # W / m**2
-        self.tempTop: np.float64                 # ºC
-        self.tempWest: np.float64                # ºC
-        self.tempEast: np.float64                # ºC
-        self.tempNorth: np.float64               # ºC
-        self.tempSouth: np.float64               # ºC
-        self.tempbBottom: np.float64             # ºC
-        self.initialTemperature: np.float64      # ºC
-        self.environmentTemperature: np.float64  # ºC
-
-        self.finalPositionX: np.float64          # m
-        self.finalPositionY: np.float64          # m
-        self.initialPositionX: np.float64        # m
-        self.initialPositionY: np.float64        # m
-
-        self.heatSourcePositionEnd1: np.float64
-        self.heatSourcePositionStart1: np.float64
-
-        self.heatSourcePositionEnd2: np.float64
-        self.heatSourcePositionStart2: np.float64
-
-        self.solutionMethod: str
-
-        self.PI = np.pi
-
-        # Solution method:
-        # ---------------
-        self.problemType = ct.ROBIN_PROBLEM
-        self.solutionMethod = ct.EXPLICIT  # 1: explicit; 2: implicit
-        self.problemDimension = ct.TWO_DIMENSIONAL
-        # Physical properties:
-        # -------------------
-        self.width = 0.01
-        self.length = 0.02
-        self.convection = 20.0
-        self.diffusivity = 3.95E-6
-        self.conductivity = 14.9
-        self.heatSource = 5.0E4
-
-        if self.problemType == ct.DIRICHLET_PROBLEM:
-
-            self.initialTemperature = 0.0
-
-            if self.problemDimension == ct.ONE_DIMENSIONAL:
-                self.tempWest = 0.
-                self.tempEast = 0.
-            elif self.problemDimension == ct.TWO_DIMENSIONAL:
-                self.tempWest = 75.
-                self.tempEast = 50.
-                self.tempNorth = 100.
-                self.tempSouth = 25.
-            elif self.problemDimension == ct.THREE_DIMENSIONAL:
-                self.tempWest = 0.
-                self.tempEast = 30.
-                self.tempNorth = 0.
-                self.tempSouth = 0.
-                self.tempTop = 0
-                self.tempbBottom = 0.
-            else:
-                print("ERROR:: Choose the right dimension!")
-                exit()
-
-        else:
-            self.initialTemperature = 30.0 #+ 273.15
-            self.environmentTemperature = 30.0 #+ 273.15
-
-        # Convergence parameters:
-        # ---------------------
-        self.maxIterations = 100
-        self.iterTolerance = 1.0E-3
-        self.relaxationConstant = 1
-        self.heatBalanceTolerance = 1.0E-4
-
-        # Stability parameter:
-        # -------------------
-        self.CFL = 0.5
-        self.maxDeltaT = 1E-4
-        self.stabilityParamenter = 1  # 0:: uses CFL, 1:: uses maxDeltaT
-
-        # Time domain definitions:
-        # ----------------------
-        self.finalTime = 60.0
-        self.initialTime = 0.0
-
-        # Physical domain definitions:
-        # ---------------------------
-        self.finalPositionX = 0.02
-        self.initialPositionX = 0.0
-
-        self.finalPositionY = 0.01
-        self.initialPositionY = 0.0
-
-        self.heatSourcePositionEnd1 = 0.008
-        self.heatSourcePositionStart1 = 0.003
-
-        self.heatSourcePositionEnd2 = 0.017
-        self.heatSourcePositionStart2 = 0.012
-
-        # Mesh definitions(uniform and structured):
-        # -----------------------------------------
-        self.nodeNumberX = 256
-        self.nodeNumberY = 256
-        self.ghostNodeNumberX = 2
-        self.ghostNodeNumberY = 2
-        self.maxNodeNumberX = self.nodeNumberX + self.ghostNodeNumberX
-        self.maxNodeNumberY = self.nodeNumberY + self.ghostNodeNumberY
+# *****************************************************************************
+# *                 CONTROL PARAMETERS - 2D HEAT TRANSFER                     *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: parameters of the 2D heat transfer numerical solution,       *
+# using Finite Volume Method.                                                 *
+# *****************************************************************************
+import numpy as np
+import Constants as ct
+
+# parameters of a sweep case, set over the values below
+PARAMETER_OVERRIDES = {}
+
+
+class ControlParameters:
+
+    def __init__(self):
+        self.maxIterations: np.int64
+        self.stabilityParamenter: np.int64
+
+        self.nodeNumber: np.int64
+        self.nodeNumberY: np.int64
+        self.maxNodeNumberX: np.int64
+        self.maxNodeNumberY: np.int64
+        self.ghostNodeNumberX: np.int64
+        self.ghostNodeNumberY: np.int64
+
+        self.problemType: str
+        self.solutionMethod: str
+        self.problemDimension: str
+        self.analyticalCache: bool
+        self.caseName: str
+        self.precision: str
+        self.floatType: type
+        self.meshStretching: str
+        self.stretchingFactor: np.float64
+        self.adaptiveRefinement: bool
+        self.refinementLevels: np.int64
+        self.blockSize: np.int64
+        self.regridStride: np.int64
+        self.refinementThreshold: np.float64     # ºC
+        self.coarseningThreshold: np.float64     # ºC
+                       
+        self.CFL: np.float64                     # -
+        self.PI: np.float64                      # -
+        self.width: np.float64                   # m
+        self.length: np.float64                  # m
+        self.convection: np.float64              # W / (m**2 * K)
+        self.diffusivity: np.float64             # m**2 / s
+        self.conductivity: np.float64            # W / (m * K)
+        self.maxDeltaT: np.float64               # s
+        self.iterTolerance: np.float64           # -
+        self.relaxationConstant: np.float64      # -
+
+        self.finalTime: np.float64               # s
+        self.initialTime: np.float64             # s
+
+        self.heatSource: np.float64              # W / m**2
+        self.tempTop: np.float64                 # ºC
+        self.tempWest: np.float64                # ºC
+        self.tempEast: np.float64                # ºC
+        self.tempNorth: np.float64               # ºC
+        self.tempSouth: np.float64               # ºC
+        self.tempbBottom: np.float64             # ºC
+        self.initialTemperature: np.float64      # ºC
+        self.environmentTemperature: np.float64  # ºC
+
+        self.finalPositionX: np.float64          # m
+        self.finalPositionY: np.float64          # m
+        self.initialPositionX: np.float64        # m
+        self.initialPositionY: np.float64        # m
+
+        self.heatSourcePositionEnd1: np.float64
+        self.heatSourcePositionStart1: np.float64
+
+        self.heatSourcePositionEnd2: np.float64
+        self.heatSourcePositionStart2: np.float64
+
+        self.solutionMethod: str
+
+        self.PI = np.pi
+
+        # Solution method:
+        # ---------------
+        self.problemType = ct.ROBIN_PROBLEM
+        self.solutionMethod = ct.EXPLICIT  # see the methods in Constants.py
+        self.explicitBackend = ct.NUMPY  # see the backends in Constants.py
+        self.stripWorkers = None  # SHARED_MEMORY processes, None:: all cores
+        self.threadWorkers = None  # THREADS threads, None:: all cores
+        self.precision = ct.FLOAT64  # FLOAT64 or FLOAT32, of the fields
+        self.problemDimension = ct.TWO_DIMENSIONAL
+        self.analyticalCache = True  # reuse the cached analytical solutions
+        self.caseName = ""  # suffix of the output files, set by the sweeps
+        # Physical properties:
+        # -------------------
+        self.width = 0.01
+        self.length = 0.02
+        self.convection = 20.0
+        self.diffusivity = 3.95E-6
+        self.conductivity = 14.9
+        self.heatSource = 5.0E4
+
+        # Sweep case: the problem type and dimension select the values below
+        for name in ("problemType", "problemDimension"):
+            if name in PARAMETER_OVERRIDES:
+                setattr(self, name, PARAMETER_OVERRIDES[name])
+
+        # Wall temperatures (Dirichlet problem):
+        # -------------------------------------
+        if self.problemDimension == ct.ONE_DIMENSIONAL:
+            self.tempWest = 0.
+            self.tempEast = 0.
+        elif self.problemDimension == ct.TWO_DIMENSIONAL:
+            self.tempWest = 75.
+            self.tempEast = 50.
+            self.tempNorth = 100.
+            self.tempSouth = 25.
+        elif self.problemDimension == ct.THREE_DIMENSIONAL:
+            self.tempWest = 0.
+            self.tempEast = 30.
+            self.tempNorth = 0.
+            self.tempSouth = 0.
+            self.tempTop = 0
+            self.tempbBottom = 0.
+        else:
+            print("ERROR:: Choose the right dimension!")
+            exit()
+
+        if self.problemType == ct.DIRICHLET_PROBLEM:
+            self.initialTemperature = 0.0
+        else:
+            self.initialTemperature = 30.0 #+ 273.15
+            self.environmentTemperature = 30.0 #+ 273.15
+
+        # Convergence parameters:
+        # ---------------------
+        self.maxIterations = 100
+        self.iterTolerance = 1.0E-3
+        self.relaxationConstant = 1
+        self.heatBalanceTolerance = 1.0E-4  # 1 / s, energy balance change
+
+        # Steady state detection:
+        # ----------------------
+        self.steadyStateDetection = True
+        self.steadyStateTolerance = 1.0E-4  # K / s, temperature change
+        self.steadyStateWindow = 1.0  # s, time under both tolerances
+
+        # Multigrid parameters:
+        # --------------------
+        self.multigridCycle = ct.V_CYCLE  # V_CYCLE or F_CYCLE
+        self.preSmoothingSweeps = 2
+        self.postSmoothingSweeps = 2
+        self.coarsestSweeps = 20
+        self.coarsestNodeNumber = 4
+
+        # Probes: points (x, y) or regions (xStart, xEnd, yStart, yEnd):
+        # -------------------------------------------------------------
+        # None:: the mean of the nodes within one spacing of (0.01, 0.000),
+        # (0.01, 0.005) and (0.01, 0.010), the windows of the original probes
+        self.probes = None
+        self.probeSamplingStride = 1  # time steps between two samples
+
+        # Checkpoints:
+        # -----------
+        self.checkpointStride = None  # time steps between two, None:: off
+        self.restart = True  # resume from the latest valid checkpoint
+
+        # Snapshots:
+        # ---------
+        self.snapshotStride = None  # time steps between two, None:: off
+
+        # Outputs:
+        # -------
+        self.outputFormat = ct.NPZ  # NPZ (binary columns) or CSV
+
+        # Stability parameter:
+        # -------------------
+        self.CFL = 0.5
+        self.maxDeltaT = 1E-4
+        self.stabilityParamenter = 1  # 0:: uses CFL, 1:: uses maxDeltaT
+
+        # Time domain definitions:
+        # ----------------------
+        self.finalTime = 60.0
+        self.initialTime = 0.0
+
+        # Physical domain definitions:
+        # ---------------------------
+        self.finalPositionX = 0.02
+        self.initialPositionX = 0.0
+
+        self.finalPositionY = 0.01
+        self.initialPositionY = 0.0
+
+        self.heatSourcePositionEnd1 = 0.008
+        self.heatSourcePositionStart1 = 0.003
+
+        self.heatSourcePositionEnd2 = 0.017
+        self.heatSourcePositionStart2 = 0.012
+
+        # Mesh definitions(uniform and structured):
+        # -----------------------------------------
+        self.nodeNumberX = 256
+        self.nodeNumberY = 256
+        self.ghostNodeNumberX = 2
+        self.ghostNodeNumberY = 2
+        self.meshStretching = ct.UNIFORM  # UNIFORM, TANH or GEOMETRIC
+        self.stretchingFactor = 2.0  # TANH:: slope, GEOMETRIC:: growth ratio
+
+        # Adaptive mesh refinement (Robin problem):
+        # ----------------------------------------
+        self.adaptiveRefinement = False  # quadtree of blocks over the mesh
+        self.refinementLevels = 2  # spacing down to the mesh / 2**levels
+        self.blockSize = 8  # volumes of a block side, divides the nodes
+        self.regridStride = 100  # time steps between two regrids
+        self.refinementThreshold = 0.1  # temperature jump across a face
+        self.coarseningThreshold = 0.02  # temperature jump across a face
+
+        # Sweep case:
+        # ----------
+        for name, value in PARAMETER_OVERRIDES.items():
+            if not hasattr(self, name):
+                print("ERROR:: {} is not a control parameter!".format(name))
+                exit()
+
+            setattr(self, name, value)
+
+        self.maxNodeNumberX = self.nodeNumberX + self.ghostNodeNumberX
+        self.maxNodeNumberY = self.nodeNumberY + self.ghostNodeNumberY
+
+        if self.probes is None:
+            deltaX = (self.finalPositionX - self.initialPositionX) / \
+                (self.nodeNumberX - 1)
+            deltaY = (self.finalPositionY - self.initialPositionY) / \
+                (self.nodeNumberY - 1)
+
+            self.probes = [
+                (0.01 - deltaX, 0.01 + deltaX, positionY - deltaY,
+                 positionY + deltaY) for positionY in (0.000, 0.005, 0.010)]
+
+        if self.outputFormat not in (ct.NPZ, ct.CSV):
+            print("ERROR:: Choose the NPZ or CSV output format!")
+            exit()
+
+        if self.meshStretching not in (ct.UNIFORM, ct.TANH, ct.GEOMETRIC):
+            print("ERROR:: Choose the UNIFORM, TANH or GEOMETRIC mesh!")
+            exit()
+
+        if self.meshStretching != ct.UNIFORM and self.stretchingFactor <= (
+                0. if self.meshStretching == ct.TANH else 1.):
+            print("ERROR:: The stretching factor is too small!")
+            exit()
+
+        if self.meshStretching != ct.UNIFORM and (
+                self.solutionMethod in (ct.ADI, ct.MULTIGRID) or
+                self.explicitBackend == ct.NUMBA):
+            print("ERROR:: The stretched meshes do not run the ADI, the "
+                  "multigrid and the Numba backend!")
+            exit()
+
+        if self.adaptiveRefinement and (
+                self.problemType != ct.ROBIN_PROBLEM or
+                self.solutionMethod not in (ct.EXPLICIT, ct.DIRECT) or
+                self.solutionMethod == ct.EXPLICIT and
+                self.explicitBackend != ct.NUMPY or
+                self.meshStretching != ct.UNIFORM or self.checkpointStride):
+            print("ERROR:: The adaptive refinement only runs the Robin "
+                  "problem on uniform meshes, with the explicit (NumPy) or "
+                  "the direct method and without checkpoints!")
+            exit()
+
+        if self.adaptiveRefinement and (
+                self.nodeNumberX % self.blockSize or
+                self.nodeNumberY % self.blockSize or
+                self.coarseningThreshold >= self.refinementThreshold):
+            print("ERROR:: The block size must divide the node numbers and "
+                  "the coarsening threshold must be below the refinement "
+                  "one!")
+            exit()
+
+        if self.precision not in (ct.FLOAT32, ct.FLOAT64):
+            print("ERROR:: Choose the FLOAT32 or FLOAT64 precision!")
+            exit()
+
+        self.floatType = np.dtype(self.precision).type
@@ -0,0 +1,160 @@
+# *****************************************************************************
+# *                   DIFFUSION OPERATOR - 2D HEAT TRANSFER                   *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: assembles the discrete diffusion operator of the plate as a  *
+# * sparse matrix over the interior nodes. The ghost nodes are eliminated     *
+# * through their boundary relations, so the operator only depends on the     *
+# * time step, the mesh and the boundary coefficients. Hence, the implicit    *
+# * system is factorized once and each time step is a triangular solve.      *
+# *****************************************************************************
+import numpy as np
+from scipy import sparse
+from scipy.sparse import linalg
+from MeshGenerator import MeshGenerator
+
+
+class DiffusionOperator(MeshGenerator):
+
+    def __init__(self):
+
+        super().__init__()
+
+    @staticmethod
+    def __getSecondDifference(diffusionCoeff, nodeNumber: int) -> \
+            sparse.spmatrix:
+
+        forward: np.array
+        backward: np.array
+
+        # (forward, backward) coefficients on stretched meshes, one per node
+        if isinstance(diffusionCoeff, tuple):
+            forward, backward = (
+                np.ravel(coefficient) for coefficient in diffusionCoeff)
+        else:
+            forward = backward = np.full((nodeNumber,), diffusionCoeff)
+
+        return sparse.diags(
+            [backward[1:], -(forward + backward), forward[:-1]], [-1, 0, 1],
+            shape=(nodeNumber, nodeNumber))
+
+    def getDiffusionOperator(
+            self, diffusionCoeffX: np.float64, diffusionCoeffY: np.float64,
+            ghostRelations: tuple) -> tuple:
+
+        nx: np.int64
+        ny: np.int64
+        eastX: np.array
+        westX: np.array
+        northY: np.array
+        southY: np.array
+        ghostSource: np.array
+        ghostDiagonal: np.array
+        secondDifferenceX: sparse.spmatrix
+        secondDifferenceY: sparse.spmatrix
+        diffusionOperator: sparse.spmatrix
+
+        nx = self.nodeNumberX
+        ny = self.nodeNumberY
+
+        centerSouth, externalSouth, centerNorth, externalNorth, \
+            centerWest, externalWest, centerEast, externalEast = ghostRelations
+
+        # Interior nodes are numbered row by row, i.e., index = i * nx + j.
+        secondDifferenceX = self.__getSecondDifference(diffusionCoeffX, nx)
+        secondDifferenceY = self.__getSecondDifference(diffusionCoeffY, ny)
+
+        diffusionOperator = \
+            sparse.kron(sparse.identity(ny), secondDifferenceX) + \
+            sparse.kron(secondDifferenceY, sparse.identity(nx))
+
+        # coefficients of the ghost nodes, at the walls
+        eastX, westX, northY, southY = diffusionCoeffX, diffusionCoeffX, \
+            diffusionCoeffY, diffusionCoeffY
+
+        if isinstance(diffusionCoeffX, tuple):
+            eastX, westX = diffusionCoeffX[0][nx - 1], diffusionCoeffX[1][0]
+            northY, southY = \
+                diffusionCoeffY[0][ny - 1, 0], diffusionCoeffY[1][0, 0]
+
+        # Ghost nodes: the center part goes to the diagonal and the external
+        # part becomes a constant source term.
+        ghostDiagonal = np.zeros((ny, nx), dtype=np.float64)
+        ghostSource = np.zeros((ny, nx), dtype=np.float64)
+
+        # TOP SURFACE
+        ghostDiagonal[ny - 1, :] += northY * centerNorth
+        ghostSource[ny - 1, :] += northY * externalNorth
+        # LEFT SURFACE
+        ghostDiagonal[:, 0] += westX * centerWest
+        ghostSource[:, 0] += westX * externalWest
+        # RIGHT SURFACE
+        ghostDiagonal[:, nx - 1] += eastX * centerEast
+        ghostSource[:, nx - 1] += eastX * externalEast
+        # BOTTOM SURFACE
+        ghostDiagonal[0, :] += southY * centerSouth
+        ghostSource[0, :] += southY * externalSouth
+
+        diffusionOperator = \
+            diffusionOperator + sparse.diags(ghostDiagonal.ravel())
+
+        return diffusionOperator.tocsc(), ghostSource.ravel()
+
+    @staticmethod
+    def getImplicitFactorization(
+            diffusionOperator: sparse.spmatrix,
+            implicitWeight: np.float64 = 1.) -> linalg.SuperLU:
+
+        systemMatrix: sparse.spmatrix
+
+        # Backward Euler: (I - D) T^{n+1} = T^{n} + S
+        # Crank-Nicolson: (I - D/2) T^{n+1} = (I + D/2) T^{n} + S
+        systemMatrix = sparse.identity(
+            diffusionOperator.shape[0], format="csc") - \
+            implicitWeight * diffusionOperator
+
+        return linalg.splu(systemMatrix.tocsc())
+
+    def solveEnergyEquationsDirect(
+            self, temperature: np.array, factorization: linalg.SuperLU,
+            ghostSource: np.array) -> np.array:
+
+        mnx: np.int64
+        mny: np.int64
+        estimateTemperature: np.array
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        estimateTemperature = temperature.copy()
+
+        estimateTemperature[1:mny-1, 1:mnx-1] = factorization.solve(
+            temperature[1:mny-1, 1:mnx-1].ravel() + ghostSource).reshape(
+            (mny - 2, mnx - 2))
+
+        return estimateTemperature
+
+    def solveEnergyEquationsCrankNicolson(
+            self, temperature: np.array, factorization: linalg.SuperLU,
+            diffusionOperator: sparse.spmatrix, ghostSource: np.array) -> \
+            np.array:
+
+        mnx: np.int64
+        mny: np.int64
+        interiorTemperature: np.array
+        estimateTemperature: np.array
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        estimateTemperature = temperature.copy()
+        interiorTemperature = temperature[1:mny-1, 1:mnx-1].ravel()
+
+        estimateTemperature[1:mny-1, 1:mnx-1] = factorization.solve(
+            interiorTemperature + 0.5 * (
+                diffusionOperator @ interiorTemperature) +
+            ghostSource).reshape((mny - 2, mnx - 2))
+
+        return estimateTemperature
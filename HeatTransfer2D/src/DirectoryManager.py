@@ -1,193 +1,348 @@
-# *****************************************************************************
-# *                  DIRECTORY MANAGER  - 2D HEAT TRANSFER                    *
-# *****************************************************************************
-# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
-# * E-mail: almeriopamplona@gmail.com                                         *
-# *****************************************************************************
-# * Description: class responsible for creating directories, file paths and   *
-# * keep important paths.                                                     *
-# *****************************************************************************
-import os
-import Constants as ct
-from ControlParameters import ControlParameters
-
-
-class DirectoryManager(ControlParameters):
-
-    def __init__(self):
-
-        # Declarations:
-        # ----------
-        self.__path: str
-        self.__dirReports: str
-        self.__createdLog: bool
-        self.__dirWarnings: str
-        self.__dirFigure: str
-        self.__dirTemperature: str
-        self.__temperatureOutputPath: str
-        self.__analyticalSolutionPath: str
-        self.__temperatureOutputStreamline: str
-
-        self.__probe1Output: str
-        self.__probe2Output: str
-        self.__probe3Output: str
-        self.__probePlotsPath: str
-
-        # Instance:
-        # --------------
-        super().__init__()
-
-        self.__path = self.__getPath
-        self.__dirReports = self.__getDirReports
-        self.__dirWarnings = self.__getDirWarnings
-
-        self.__dirFigure = self.__getDirFigure
-        self.__dirTemperature = self.__getDirTemperature
-        self.__temperatureOutputPath = self.__getTemperatureOutputPath
-        self.__analyticalSolutionPath = self.__getAnalayticalPath
-        self.__temperatureOutputStreamline = \
-            self.__getTemperatureOutputStreamline
-
-        self.__probe1Output = self.__getProbe1OutputPath
-        self.__probe2Output = self.__getProbe2OutputPath
-        self.__probe3Output = self.__getProbe3OutputPath
-        self.__probePlotsPath = self.__getProbePlotsPath
-
-        self.__makeDirectories()
-
-    # ======================================================================== #
-    # PRIVATE METHODS                                                          #
-    # ======================================================================== #
-
-    # ------------------------------------------------------------------------ #
-    # CONDITIONALS                                                             #
-    # ------------------------------------------------------------------------ #
-    def __dirReportExists(self) -> bool:
-        return os.path.exists(self.__dirReports)
-
-    def __dirWarningsExists(self) -> bool:
-        return os.path.exists(self.__dirWarnings)
-
-    # ------------------------------------------------------------------------ #
-    # PRIVATE INTERNAL GETTERS                                                 #
-    # ------------------------------------------------------------------------ #
-    @property
-    def __getPath(self) -> str:
-        return ct.PATH
-
-    @property
-    def __getDirReports(self) -> str:
-        return self.__path + ct.OS_SEP + ct.DIR_REPORTS
-
-    @property
-    def __getDirWarnings(self) -> str:
-        return self.__path + ct.OS_SEP + ct.DIR_WARNINGS
-
-    @property
-    def __getDirFigure(self) -> str:
-        return self.__dirReports + ct.OS_SEP + ct.DIR_FIGURE
-
-    @property
-    def __getDirTemperature(self) -> str:
-        return self.__dirReports + ct.OS_SEP + ct.DIR_TEMPERATURE
-
-    @property
-    def __getTemperatureOutputPath(self) -> str:
-        return self.__dirTemperature + ct.OS_SEP + ct.TEMPERATURE_OUTPUT + \
-            "_{}_{}_{}x{}.csv".format(
-                self.problemType, self.solutionMethod,self.nodeNumberY,
-                self.nodeNumberX)
-
-    @property
-    def __getProbe1OutputPath(self) -> str:
-        return self.__dirTemperature + ct.OS_SEP + ct.PROBE1_OUTPUT + \
-            "_{}_{}_{}x{}.csv".format(
-                self.problemType, self.solutionMethod,self.nodeNumberY,
-                self.nodeNumberX)
-
-    @property
-    def __getProbe2OutputPath(self) -> str:
-        return self.__dirTemperature + ct.OS_SEP + ct.PROBE2_OUTPUT + \
-            "_{}_{}_{}x{}.csv".format(
-                self.problemType, self.solutionMethod,self.nodeNumberY,
-                self.nodeNumberX)
-
-    @property
-    def __getProbe3OutputPath(self) -> str:
-        return self.__dirTemperature + ct.OS_SEP + ct.PROBE3_OUTPUT + \
-            "_{}_{}_{}x{}.csv".format(
-                self.problemType, self.solutionMethod,self.nodeNumberY,
-                self.nodeNumberX)
-
-    @property
-    def __getTemperatureOutputStreamline(self) -> str:
-        return self.__dirFigure + ct.OS_SEP + ct.TEMPERATURE_OUTPUT + \
-            "_{}_{}_{}x{}".format(
-                self.problemType, self.solutionMethod,self.nodeNumberY,
-                self.nodeNumberX)
-
-    @property
-    def __getProbePlotsPath(self) -> str:
-        return self.__dirFigure + ct.OS_SEP + ct.PROBE_PLOTS + \
-            "_{}_{}_{}x{}".format(
-                self.problemType, self.solutionMethod,self.nodeNumberY,
-                self.nodeNumberX)
-
-    @property
-    def __getAnalayticalPath(self) -> str:
-        return self.__dirTemperature + ct.OS_SEP + ct.ANALYTICAL_TEMP_OUTPUT + \
-            "_{}x{}.csv".format(self.nodeNumberY, self.nodeNumberX)
-
-    # ------------------------------------------------------------------------ #
-    # MAKING DIRECTORIES                                                       #
-    # ------------------------------------------------------------------------ #
-    def __makeDirectories(self):
-        self.__makeReportDirectory()
-        self.__makeWarningDirectory()
-
-    def __makeReportDirectory(self):
-
-        if not self.__dirReportExists():
-            os.makedirs(self.__dirReports)
-            os.makedirs(self.__dirFigure)
-            os.makedirs(self.__dirTemperature)
-
-    def __makeWarningDirectory(self):
-
-        if not self.__dirWarningsExists():
-            os.makedirs(self.__dirWarnings)
-
-    # ======================================================================== #
-    #   PUBLIC METHODS
-    # ======================================================================== #
-    @property
-    def getTemperatureOutputPath(self) -> str:
-        return self.__temperatureOutputPath
-
-    @property
-    def getAnalyticalSolutionPath(self) -> str:
-        return self.__analyticalSolutionPath
-
-    @property
-    def getTemperatureOutputStreamline(self) -> str:
-        return self.__temperatureOutputStreamline
-
-    @property
-    def getProbe1OutputPath(self) -> str:
-        return self.__probe1Output
-
-    @property
-    def getProbe2OutputPath(self) -> str:
-        return self.__probe2Output
-
-    @property
-    def getProbe3OutputPath(self) -> str:
-        return self.__probe3Output
-
-    @property
-    def getProbesPlotPath(self) -> str:
-        return self.__probePlotsPath
-
-    @property
-    def getDirFigure(self) -> str:
+# *****************************************************************************
+# *                  DIRECTORY MANAGER  - 2D HEAT TRANSFER                    *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: class responsible for creating directories, file paths and   *
+# * keep important paths.                                                     *
+# *****************************************************************************
+import os
+import hashlib
+import Constants as ct
+from ControlParameters import ControlParameters
+
+# reports directories already created, the paths do not depend on the run
+CREATED_REPORTS = set()
+
+
+class DirectoryManager(ControlParameters):
+
+    def __init__(self):
+
+        # Declarations:
+        # ----------
+        self.__path: str
+        self.__dirReports: str
+        self.__createdLog: bool
+        self.__dirWarnings: str
+        self.__dirFigure: str
+        self.__dirTemperature: str
+        self.__dirCache: str
+        self.__dirCheckpoint: str
+        self.__dirSnapshots: str
+        self.__dirMesh: str
+        self.__temperatureOutputPath: str
+        self.__analyticalSolutionPath: str
+        self.__temperatureOutputStreamline: str
+
+        self.__probesOutput: str
+        self.__probePlotsPath: str
+        self.__ensembleOutputPath: str
+        self.__ensembleProbesOutputPath: str
+        self.__precisionOutputPath: str
+        self.__checkpointPath: str
+        self.__snapshotPath: str
+        self.__adaptiveOutputPath: str
+
+        # Instance:
+        # --------------
+        super().__init__()
+
+        self.__path = self.__getPath
+        self.__dirReports = self.__getDirReports
+        self.__dirWarnings = self.__getDirWarnings
+
+        self.__dirFigure = self.__getDirFigure
+        self.__dirTemperature = self.__getDirTemperature
+        self.__dirCache = self.__getDirCache
+        self.__dirCheckpoint = self.__getDirCheckpoint
+        self.__dirSnapshots = self.__getDirSnapshots
+        self.__dirMesh = self.__getDirMesh
+        self.__temperatureOutputPath = self.__getTemperatureOutputPath
+        self.__analyticalSolutionPath = self.__getAnalayticalPath
+        self.__temperatureOutputStreamline = \
+            self.__getTemperatureOutputStreamline
+
+        self.__probesOutput = self.__getProbesOutputPath
+        self.__probePlotsPath = self.__getProbePlotsPath
+        self.__ensembleOutputPath = self.__getEnsembleOutputPath
+        self.__ensembleProbesOutputPath = self.__getEnsembleProbesOutputPath
+        self.__precisionOutputPath = self.__getPrecisionOutputPath
+        self.__checkpointPath = self.__getCheckpointPath
+        self.__snapshotPath = self.__getSnapshotPath
+        self.__adaptiveOutputPath = self.__getAdaptiveOutputPath
+
+        # once per reports directory, not in every component of a run
+        if self.__dirReports not in CREATED_REPORTS:
+            self.__makeDirectories()
+            CREATED_REPORTS.add(self.__dirReports)
+
+    # ======================================================================== #
+    # PRIVATE METHODS                                                          #
+    # ======================================================================== #
+
+    # ------------------------------------------------------------------------ #
+    # CONDITIONALS                                                             #
+    # ------------------------------------------------------------------------ #
+    def __dirReportExists(self) -> bool:
+        return os.path.exists(self.__dirReports)
+
+    def __dirWarningsExists(self) -> bool:
+        return os.path.exists(self.__dirWarnings)
+
+    def __dirCacheExists(self) -> bool:
+        return os.path.exists(self.__dirCache)
+
+    def __dirCheckpointExists(self) -> bool:
+        return os.path.exists(self.__dirCheckpoint)
+
+    def __dirSnapshotsExists(self) -> bool:
+        return os.path.exists(self.__dirSnapshots)
+
+    def __dirMeshExists(self) -> bool:
+        return os.path.exists(self.__dirMesh)
+
+    # ------------------------------------------------------------------------ #
+    # PRIVATE INTERNAL GETTERS                                                 #
+    # ------------------------------------------------------------------------ #
+    @property
+    def __getPath(self) -> str:
+        return ct.PATH
+
+    @property
+    def __getDirReports(self) -> str:
+        return self.__path + ct.OS_SEP + ct.DIR_REPORTS
+
+    @property
+    def __getDirWarnings(self) -> str:
+        return self.__path + ct.OS_SEP + ct.DIR_WARNINGS
+
+    @property
+    def __getDirFigure(self) -> str:
+        return self.__dirReports + ct.OS_SEP + ct.DIR_FIGURE
+
+    @property
+    def __getDirTemperature(self) -> str:
+        return self.__dirReports + ct.OS_SEP + ct.DIR_TEMPERATURE
+
+    @property
+    def __getDirCache(self) -> str:
+        return self.__dirReports + ct.OS_SEP + ct.DIR_CACHE
+
+    @property
+    def __getDirCheckpoint(self) -> str:
+        return self.__dirReports + ct.OS_SEP + ct.DIR_CHECKPOINT
+
+    @property
+    def __getDirSnapshots(self) -> str:
+        return self.__dirReports + ct.OS_SEP + ct.DIR_SNAPSHOTS
+
+    @property
+    def __getDirMesh(self) -> str:
+        return self.__dirReports + ct.OS_SEP + ct.DIR_MESH
+
+    @property
+    def __getMeshSuffix(self) -> str:
+        return ("" if self.meshStretching == ct.UNIFORM else "_{}{}".format(
+            self.meshStretching, self.stretchingFactor)) + (
+            "_amr{}".format(self.refinementLevels)
+            if self.adaptiveRefinement else "")
+
+    @property
+    def __getCaseSuffix(self) -> str:
+        return self.__getMeshSuffix + (
+            "_" + self.caseName if self.caseName else "")
+
+    @property
+    def __getEnsembleOutputPath(self) -> str:
+        return self.__dirTemperature + ct.OS_SEP + ct.ENSEMBLE_OUTPUT + \
+            "_{}_{}_{}x{}{}.{}".format(
+                self.problemType, self.solutionMethod, self.nodeNumberY,
+                self.nodeNumberX, self.__getCaseSuffix, self.outputFormat)
+
+    @property
+    def __getEnsembleProbesOutputPath(self) -> str:
+        return self.__dirTemperature + ct.OS_SEP + \
+            ct.ENSEMBLE_PROBES_OUTPUT + "_{}_{}_{}x{}{}.{}".format(
+                self.problemType, self.solutionMethod, self.nodeNumberY,
+                self.nodeNumberX, self.__getCaseSuffix, self.outputFormat)
+
+    @property
+    def __getPrecisionOutputPath(self) -> str:
+        return self.__dirTemperature + ct.OS_SEP + ct.PRECISION_OUTPUT + \
+            "_{}_{}_{}x{}.{}".format(
+                self.problemType, self.solutionMethod, self.nodeNumberY,
+                self.nodeNumberX, self.outputFormat)
+
+    @property
+    def __getCheckpointPath(self) -> str:
+        return self.__dirCheckpoint + ct.OS_SEP + ct.CHECKPOINT_OUTPUT + \
+            "_{}_{}_{}x{}{}".format(
+                self.problemType, self.solutionMethod, self.nodeNumberY,
+                self.nodeNumberX, self.__getCaseSuffix)
+
+    @property
+    def __getSnapshotPath(self) -> str:
+        return self.__dirSnapshots + ct.OS_SEP + ct.SNAPSHOT_OUTPUT + \
+            "_{}_{}_{}x{}{}".format(
+                self.problemType, self.solutionMethod, self.nodeNumberY,
+                self.nodeNumberX, self.__getCaseSuffix)
+
+    @property
+    def __getAdaptiveOutputPath(self) -> str:
+        return self.__dirTemperature + ct.OS_SEP + ct.ADAPTIVE_OUTPUT + \
+            "_{}_{}_{}x{}{}.{}".format(
+                self.problemType, self.solutionMethod, self.nodeNumberY,
+                self.nodeNumberX, self.__getCaseSuffix, self.outputFormat)
+
+    @property
+    def __getTemperatureOutputPath(self) -> str:
+        return self.__dirTemperature + ct.OS_SEP + ct.TEMPERATURE_OUTPUT + \
+            "_{}_{}_{}x{}{}.{}".format(
+                self.problemType, self.solutionMethod,self.nodeNumberY,
+                self.nodeNumberX, self.__getCaseSuffix, self.outputFormat)
+
+    @property
+    def __getProbesOutputPath(self) -> str:
+        return self.__dirTemperature + ct.OS_SEP + ct.PROBES_OUTPUT + \
+            "_{}_{}_{}x{}{}.{}".format(
+                self.problemType, self.solutionMethod,self.nodeNumberY,
+                self.nodeNumberX, self.__getCaseSuffix, self.outputFormat)
+
+    @property
+    def __getTemperatureOutputStreamline(self) -> str:
+        return self.__dirFigure + ct.OS_SEP + ct.TEMPERATURE_OUTPUT + \
+            "_{}_{}_{}x{}{}".format(
+                self.problemType, self.solutionMethod,self.nodeNumberY,
+                self.nodeNumberX, self.__getCaseSuffix)
+
+    @property
+    def __getProbePlotsPath(self) -> str:
+        return self.__dirFigure + ct.OS_SEP + ct.PROBE_PLOTS + \
+            "_{}_{}_{}x{}{}".format(
+                self.problemType, self.solutionMethod,self.nodeNumberY,
+                self.nodeNumberX, self.__getCaseSuffix)
+
+    @property
+    def __getAnalayticalPath(self) -> str:
+        return self.__dirTemperature + ct.OS_SEP + ct.ANALYTICAL_TEMP_OUTPUT + \
+            "_{}x{}{}.{}".format(
+                self.nodeNumberY, self.nodeNumberX, self.__getMeshSuffix,
+                self.outputFormat)
+
+    # ------------------------------------------------------------------------ #
+    # MAKING DIRECTORIES                                                       #
+    # ------------------------------------------------------------------------ #
+    def __makeDirectories(self):
+        self.__makeReportDirectory()
+        self.__makeWarningDirectory()
+        self.__makeCacheDirectory()
+        self.__makeCheckpointDirectory()
+        self.__makeSnapshotsDirectory()
+        self.__makeMeshDirectory()
+
+    def __makeReportDirectory(self):
+
+        if not self.__dirReportExists():
+            os.makedirs(self.__dirReports)
+            os.makedirs(self.__dirFigure)
+            os.makedirs(self.__dirTemperature)
+
+    def __makeWarningDirectory(self):
+
+        if not self.__dirWarningsExists():
+            os.makedirs(self.__dirWarnings)
+
+    def __makeCacheDirectory(self):
+
+        if not self.__dirCacheExists():
+            os.makedirs(self.__dirCache)
+
+    def __makeCheckpointDirectory(self):
+
+        if not self.__dirCheckpointExists():
+            os.makedirs(self.__dirCheckpoint)
+
+    def __makeSnapshotsDirectory(self):
+
+        if not self.__dirSnapshotsExists():
+            os.makedirs(self.__dirSnapshots)
+
+    def __makeMeshDirectory(self):
+
+        if not self.__dirMeshExists():
+            os.makedirs(self.__dirMesh)
+
+    # ======================================================================== #
+    #   PUBLIC METHODS
+    # ======================================================================== #
+    @property
+    def getTemperatureOutputPath(self) -> str:
+        return self.__temperatureOutputPath
+
+    @property
+    def getAnalyticalSolutionPath(self) -> str:
+        return self.__analyticalSolutionPath
+
+    @property
+    def getTemperatureOutputStreamline(self) -> str:
+        return self.__temperatureOutputStreamline
+
+    @property
+    def getProbesOutputPath(self) -> str:
+        return self.__probesOutput
+
+    @property
+    def getProbesPlotPath(self) -> str:
+        return self.__probePlotsPath
+
+    def getSweepOutputPath(self, parameterGrid: dict) -> str:
+
+        # one table per grid, named after its parameters and keyed by their
+        # values, so two sweeps do not overwrite each other
+        return self.__dirTemperature + ct.OS_SEP + ct.SWEEP_OUTPUT + \
+            "_{}_{}.{}".format(
+                "_".join(parameterGrid), hashlib.sha256(repr(sorted(
+                    parameterGrid.items())).encode()).hexdigest()[:8],
+                self.outputFormat)
+
+    @property
+    def getEnsembleOutputPath(self) -> str:
+        return self.__ensembleOutputPath
+
+    @property
+    def getEnsembleProbesOutputPath(self) -> str:
+        return self.__ensembleProbesOutputPath
+
+    @property
+    def getPrecisionOutputPath(self) -> str:
+        return self.__precisionOutputPath
+
+    @property
+    def getCheckpointPath(self) -> str:
+        return self.__checkpointPath
+
+    @property
+    def getSnapshotPath(self) -> str:
+        return self.__snapshotPath
+
+    @property
+    def getAdaptiveOutputPath(self) -> str:
+        return self.__adaptiveOutputPath
+
+    @property
+    def getDirCache(self) -> str:
+        return self.__dirCache
+
+    @property
+    def getDirMesh(self) -> str:
+        return self.__dirMesh
+
+    @property
+    def getDirReports(self) -> str:
+        return self.__dirReports
+
+    @property
+    def getDirFigure(self) -> str:
         return  self.__dirFigure
\ No newline at end of file
@@ -0,0 +1,228 @@
+# *****************************************************************************
+# *                 DOMAIN DECOMPOSITION - 2D HEAT TRANSFER                   *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: shared memory backend of the explicit method. The two       *
+# * buffers of the field are held in shared memory and the interior rows are *
+# * split into horizontal strips, one worker process each. Every time step,  *
+# * a worker updates its strip and the ghost nodes next to it, then waits    *
+# * at a barrier. The halo rows of a strip are the neighbour rows of the     *
+# * previous buffer, read straight from the shared memory. The stencil has   *
+# * the same operations and order as the NumPy path, so the results are the *
+# * same for any number of strips.                                            *
+# *****************************************************************************
+import os
+import numpy as np
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from MeshGenerator import MeshGenerator
+from EnergyEquations import EnergyEquations
+
+
+def _solveStrips(
+        bufferNames: tuple, shape: tuple, dtype: np.dtype, rowStart: int,
+        rowEnd: int, diffusionCoeffX: float, diffusionCoeffY: float,
+        ghostRelations: tuple, steadyStateDetection: bool,
+        barrier: mp.Barrier, stop: mp.RawValue,
+        temperatureChange: mp.RawArray, strip: int) -> None:
+
+    mnx: int
+    mny: int
+    parity: int
+    buffers: list
+    temperature: np.array
+    estimateTemperature: np.array
+
+    mny, mnx = shape
+
+    centerSouth, externalSouth, centerNorth, externalNorth, \
+        centerWest, externalWest, centerEast, externalEast = ghostRelations
+
+    memories = [shared_memory.SharedMemory(name=name) for name in bufferNames]
+    buffers = [
+        np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+        for memory in memories]
+
+    diffusionX = np.zeros((rowEnd - rowStart, mnx - 2), dtype=dtype)
+    diffusionY = np.zeros((rowEnd - rowStart, mnx - 2), dtype=dtype)
+
+    parity = 0
+    temperature = estimateTemperature = None
+
+    try:
+        while True:
+            barrier.wait()
+
+            if stop.value:
+                break
+
+            temperature = buffers[parity]
+            estimateTemperature = buffers[1 - parity]
+
+            EnergyEquations.solveEnergyEquationsExplicitRows(
+                temperature, estimateTemperature, diffusionCoeffX,
+                diffusionCoeffY, rowStart, rowEnd, (diffusionX, diffusionY))
+
+            # ghost nodes of the strip: ghost = center * interior + external
+            # LEFT AND RIGHT SURFACES
+            np.multiply(
+                centerWest[rowStart-1:rowEnd-1],
+                estimateTemperature[rowStart:rowEnd, 1],
+                out=estimateTemperature[rowStart:rowEnd, 0])
+            estimateTemperature[rowStart:rowEnd, 0] += \
+                externalWest[rowStart-1:rowEnd-1]
+
+            np.multiply(
+                centerEast[rowStart-1:rowEnd-1],
+                estimateTemperature[rowStart:rowEnd, mnx-2],
+                out=estimateTemperature[rowStart:rowEnd, mnx-1])
+            estimateTemperature[rowStart:rowEnd, mnx-1] += \
+                externalEast[rowStart-1:rowEnd-1]
+
+            # BOTTOM SURFACE, by the owner of the first row
+            if rowStart == 1:
+                np.multiply(
+                    centerSouth, estimateTemperature[1, 1:mnx-1],
+                    out=estimateTemperature[0, 1:mnx-1])
+                estimateTemperature[0, 1:mnx-1] += externalSouth
+
+            # TOP SURFACE, by the owner of the last row
+            if rowEnd == mny - 1:
+                np.multiply(
+                    centerNorth, estimateTemperature[mny-2, 1:mnx-1],
+                    out=estimateTemperature[mny-1, 1:mnx-1])
+                estimateTemperature[mny-1, 1:mnx-1] += externalNorth
+
+            # largest temperature change of the strip, for isSteadyState
+            if steadyStateDetection:
+                np.subtract(
+                    estimateTemperature[rowStart:rowEnd, 1:mnx-1],
+                    temperature[rowStart:rowEnd, 1:mnx-1], out=diffusionX)
+                temperatureChange[strip] = np.abs(
+                    diffusionX, out=diffusionX).max()
+
+            parity = 1 - parity
+
+            barrier.wait()
+
+    except Exception:
+        # the other strips and the solver must not wait for this one
+        barrier.abort()
+        raise
+
+    finally:
+        del buffers, temperature, estimateTemperature
+        for memory in memories:
+            memory.close()
+
+
+class DomainDecomposition(MeshGenerator):
+
+    def __init__(self):
+
+        super().__init__()
+
+        self.__parity: int
+        self.__workers: list
+        self.__buffers: list
+        self.__memories: list
+        self.__barrier: mp.Barrier
+        self.__stop: mp.RawValue
+        self.__temperatureChange: mp.RawArray
+
+    # ======================================================================== #
+    # PRIVATE METHODS                                                          #
+    # ======================================================================== #
+    def __getStripRows(self) -> np.array:
+
+        stripNumber: int
+
+        stripNumber = min(
+            self.stripWorkers or os.cpu_count(), self.nodeNumberY)
+
+        if stripNumber < 1:
+            print("ERROR:: The shared memory backend needs one strip at "
+                  "least!")
+            exit()
+
+        # first interior row of each strip and the end of the last one
+        return np.linspace(
+            1, self.maxNodeNumberY - 1, stripNumber + 1).astype(np.int64)
+
+    # ======================================================================== #
+    #   PUBLIC METHODS
+    # ======================================================================== #
+    def startStripWorkers(
+            self, diffusionCoeffX: np.float64, diffusionCoeffY: np.float64,
+            ghostRelations: tuple) -> None:
+
+        stripRows: np.array
+
+        stripRows = self.__getStripRows()
+        context = mp.get_context()
+
+        self.__memories = [
+            shared_memory.SharedMemory(
+                create=True, size=self.temperature.nbytes)
+            for _ in range(2)]
+        self.__buffers = [
+            np.ndarray(
+                self.temperature.shape, dtype=self.temperature.dtype,
+                buffer=memory.buf)
+            for memory in self.__memories]
+
+        # two buffers swapped at each time step
+        self.__buffers[0][:] = self.temperature
+        self.__buffers[1][:] = self.temperature
+        self.__parity = 0
+
+        self.__barrier = context.Barrier(stripRows.size)
+        self.__stop = context.RawValue("b", 0)
+        self.__temperatureChange = context.RawArray("d", stripRows.size - 1)
+
+        self.__workers = [
+            context.Process(
+                target=_solveStrips, daemon=True, args=(
+                    tuple(memory.name for memory in self.__memories),
+                    self.temperature.shape, self.temperature.dtype,
+                    stripRows[k], stripRows[k + 1],
+                    diffusionCoeffX, diffusionCoeffY, ghostRelations,
+                    self.steadyStateDetection, self.__barrier, self.__stop,
+                    self.__temperatureChange, k))
+            for k in range(stripRows.size - 1)]
+
+        for worker in self.__workers:
+            worker.start()
+
+    def solveEnergyEquationsStrips(self) -> np.float64:
+
+        # one barrier starts the step and the other one waits for all strips
+        self.__barrier.wait()
+        self.__barrier.wait()
+
+        self.__parity = 1 - self.__parity
+
+        # the field is read in place, until the workers are stopped
+        self.temperature = self.__buffers[self.__parity]
+
+        return max(self.__temperatureChange)
+
+    def stopStripWorkers(self) -> None:
+
+        self.temperature = self.__buffers[self.__parity].copy()
+
+        self.__stop.value = 1
+
+        if not self.__barrier.broken:
+            self.__barrier.wait()
+
+        for worker in self.__workers:
+            worker.join()
+
+        del self.__buffers
+
+        for memory in self.__memories:
+            memory.close()
+            memory.unlink()
@@ -1,342 +1,746 @@
-# *****************************************************************************
-# *                    ENERGY EQUATIONS - 2D HEAT TRANSFER                    *
-# *****************************************************************************
-# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
-# * E-mail: almeriopamplona@gmail.com                                         *
-# *****************************************************************************
-# * Description: class responsible for solving the energy equations on a      *
-# * solid plate with two external heat sources. There is the explicit         *
-# * formulation of the finite volume method (FVM) and the implicit form. One  *
-# * solves the implicit form using the Newton-Raphson method with an under-   *
-# * relaxation constant.                                                      *
-# *****************************************************************************
-import numpy as np
-from MeshGenerator import MeshGenerator
-
-
-class EnergyEquations(MeshGenerator):
-
-    def __init__(self):
-
-        super().__init__()
-
-    def solveEnergyEquationsExplicit(
-            self, temperature: np.array, diffusionCoeffX: np.float64,
-            diffusionCoeffY: np.float64):
-
-        mnx: np.int64
-        mny: np.int64
-        diffusionX: np.array
-        diffusionY: np.array
-        estimateTemperature: np.array
-
-        mnx = self.maxNodeNumberX
-        mny = self.maxNodeNumberY
-
-        estimateTemperature = temperature.copy()
-
-        diffusionX = diffusionCoeffX * (
-            temperature[1:mny-1, 2:mnx] - 2 * temperature[1:mny-1, 1:mnx-1] +
-            temperature[1:mny-1, 0:mnx-2])
-
-        diffusionY = diffusionCoeffY * (
-            temperature[2:mny, 1:mnx-1] - 2 * temperature[1:mny-1, 1:mnx-1] +
-            temperature[0:mny-2, 1:mnx-1])
-
-        estimateTemperature[1:mny-1, 1:mnx-1] = \
-            temperature[1:mny-1, 1:mnx-1] + diffusionX + diffusionY
-
-        return estimateTemperature
-
-    def solveEnergyEquationsImplicitRobin(
-            self, solid, coefficientCenter: np.float64,
-            diffusionCoeffX: np.float64, diffusionCoeffY: np.float64,
-            boundSource: np.float64, boundCenterX: np.float64,
-            boundCenterY: np.float64, boundExternalX: np.float64,
-            boundExternalY: np.float64) -> np.array:
-
-        k: np.int64
-        mnx: np.int64
-        mny: np.int64
-        norm: np.float
-        centerDiffusion: np.array
-        partialDiffusionX: np.array
-        partialDiffusionY: np.array
-        estimateTemperature: np.array
-        temporaryTemperature: np.array
-
-        mnx = self.maxNodeNumberX
-        mny = self.maxNodeNumberY
-
-        estimateTemperature = solid.temperature.copy()
-        temporaryTemperature = solid.temperature.copy()
-
-        k = 0
-        norm = 0.0
-
-        for k in range(self.maxIterations + 1):
-
-            partialDiffusionX = diffusionCoeffX * (
-                    temporaryTemperature[1:mny-1, 2:mnx] +
-                    temporaryTemperature[1:mny-1, 0:mnx-2])
-
-            partialDiffusionY = diffusionCoeffY * (
-                    temporaryTemperature[2:mny, 1:mnx-1] +
-                    temporaryTemperature[0:mny-2, 1:mnx-1])
-
-            centerDiffusion = coefficientCenter * \
-                temporaryTemperature[1:mny-1, 1:mnx-1]
-
-            estimateTemperature[1:mny-1, 1:mnx-1] = \
-                temporaryTemperature[1:mny-1, 1:mnx-1] - \
-                self.relaxationConstant * (
-                    centerDiffusion - partialDiffusionX - partialDiffusionY -
-                    solid.temperature[1:mny-1, 1:mnx-1]) / coefficientCenter
-
-            norm = np.sqrt(
-                ((estimateTemperature - temporaryTemperature) ** 2).sum())
-
-            if 0 < norm <= self.iterTolerance:
-                # print(
-                #     "WARNING:: Temperature converged!, " +
-                #     "error = {} and num iter = {}".format(norm, k))
-                break
-
-            temporaryTemperature = estimateTemperature
-
-            temporaryTemperature = self.boundariesConditionsDirichlet(
-                temporaryTemperature, solid)
-
-            temporaryTemperature = self.boundariesConditions(
-                temporaryTemperature, boundSource, boundCenterX, boundCenterY,
-                boundExternalX, boundExternalY)
-
-        # if (k >= self.maxIterations) and (norm > 1.0):
-        #     print(
-        #         "WARNING:: Temperature did not converged!, "
-        #         "error = {}, num iter = {}".format(norm, k))
-
-        return estimateTemperature
-
-    def solveEnergyEquationsImplicitDirichlet(
-            self, solid, coefficientCenter: np.float64,
-            diffusionCoeffX: np.float64, diffusionCoeffY: np.float64) -> \
-            np.array:
-
-        k: np.int64
-        mnx: np.int64
-        mny: np.int64
-        norm: np.float
-        centerDiffusion: np.array
-        partialDiffusionX: np.array
-        partialDiffusionY: np.array
-        estimateTemperature: np.array
-        temporaryTemperature: np.array
-
-        mnx = self.maxNodeNumberX
-        mny = self.maxNodeNumberY
-
-        estimateTemperature = solid.temperature.copy()
-        temporaryTemperature = solid.temperature.copy()
-
-        k = 0
-        norm = 0.0
-
-        for k in range(self.maxIterations + 1):
-
-            partialDiffusionX = diffusionCoeffX * (
-                    temporaryTemperature[1:mny-1, 2:mnx] +
-                    temporaryTemperature[1:mny-1, 0:mnx-2])
-
-            partialDiffusionY = diffusionCoeffY * (
-                    temporaryTemperature[2:mny, 1:mnx-1] +
-                    temporaryTemperature[0:mny-2, 1:mnx-1])
-
-            centerDiffusion = coefficientCenter * \
-                temporaryTemperature[1:mny-1, 1:mnx-1]
-
-            estimateTemperature[1:mny-1, 1:mnx-1] = \
-                temporaryTemperature[1:mny-1, 1:mnx-1] - \
-                self.relaxationConstant * (
-                    centerDiffusion - partialDiffusionX - partialDiffusionY -
-                    solid.temperature[1:mny-1, 1:mnx-1]) / coefficientCenter
-
-            norm = np.sqrt(
-                ((estimateTemperature - temporaryTemperature) ** 2).sum())
-
-            if 0 < norm <= self.iterTolerance:
-                # print(
-                #     "WARNING:: Temperature converged!, " +
-                #     "error = {} and num iter = {}".format(norm, k))
-                break
-
-            temporaryTemperature = estimateTemperature
-
-            temporaryTemperature = self.boundariesConditionsDirichlet(
-                temporaryTemperature, solid)
-
-        # if (k >= self.maxIterations) and (norm > 1.0):
-        #     print(
-        #         "WARNING:: Temperature did not converged!, "
-        #         "error = {}, num iter = {}".format(norm, k))
-
-        return estimateTemperature
-
-    def boundariesConditions(
-            self, temperature: np.array, boundSource: np.float64,
-            boundCenterX: np.float64, boundCenterY: np.float64,
-            boundExternalX: np.float64, boundExternalY: np.float64) -> np.array:
-
-        mnx: np.int64
-        mny: np.int64
-        temperatureAux: np.ndarray
-
-        mnx = self.maxNodeNumberX
-        mny = self.maxNodeNumberY
-
-        he1 = self.nodeHeatSourceEnd1
-        he2 = self.nodeHeatSourceEnd2
-        hs1 = self.nodeHeatSourceStart1
-        hs2 = self.nodeHeatSourceStart2
-
-        temperatureAux = temperature.copy()
-
-        # TOP SURFACE
-        temperatureAux[mny - 1, 1:mnx-1] = \
-            boundCenterY * temperatureAux[mny - 2, 1:mnx-1] + \
-            boundExternalY * self.environmentTemperature
-        # LEFT SURFACE
-        temperatureAux[1:mny-1, 0] = \
-            boundCenterX * temperatureAux[1:mny-1, 1] + \
-            boundExternalX * self.environmentTemperature
-        # RIGHT SURFACE
-        temperatureAux[1:mny-1, mnx - 1] = \
-            boundCenterX * temperatureAux[1:mny-1, mnx - 2] + \
-            boundExternalX * self.environmentTemperature
-        # BOTTOM SURFACE
-        temperatureAux[0, 1:hs1] = \
-            boundCenterY * temperatureAux[1, 1:hs1] + \
-            boundExternalY * self.environmentTemperature
-
-        temperatureAux[0, hs1: he1 + 1] = \
-            boundSource + temperatureAux[1, hs1: he1 + 1]
-
-        temperatureAux[0, he1 + 1: hs2] = \
-            boundCenterY * temperatureAux[1, he1 + 1: hs2] + \
-            boundExternalY * self.environmentTemperature
-
-        temperatureAux[0, hs2: he2 + 1] = \
-            boundSource + temperatureAux[1, hs2: he2 + 1]
-
-        temperatureAux[0, he2 + 1:-1] = \
-            boundCenterY * temperatureAux[1, he2 + 1:-1] + \
-            boundExternalY * self.environmentTemperature
-
-        return temperatureAux
-
-    @staticmethod
-    def boundariesConditionsDirichlet(
-            temperatureField: np.array, solid) -> np.array:
-
-        mnx: int
-        mny: int
-        temperatureFieldAux: np.array
-
-        mnx = solid.maxNodeNumberX
-        mny = solid.maxNodeNumberY
-        temperatureFieldAux = temperatureField.copy()
-
-        # BOTTOM:
-        temperatureFieldAux[0, :] = solid.tempSouth
-        # EAST
-        temperatureFieldAux[:, mnx - 1] = solid.tempEast
-        # TOP
-        temperatureFieldAux[mny - 1, :] = solid.tempNorth
-        # WEST
-        temperatureFieldAux[:, 0] = solid.tempWest
-
-        return temperatureFieldAux
-
-    def setSourceConditions(
-            self, temperature: np.array, boundSource: np.float64,
-            boundCenterY: np.float64, boundExternalY: np.float64) -> np.array:
-
-        mnx: np.int64
-        mny: np.int64
-        temperatureAux: np.ndarray
-
-        he1 = self.nodeHeatSourceEnd1
-        he2 = self.nodeHeatSourceEnd2
-        hs1 = self.nodeHeatSourceStart1
-        hs2 = self.nodeHeatSourceStart2
-
-        temperatureAux = temperature.copy()
-
-        # BOTTOM SURFACE
-        temperatureAux[0, 1:hs1] = \
-            boundCenterY * temperatureAux[1, 1:hs1] + \
-            boundExternalY * self.environmentTemperature
-
-        temperatureAux[0, hs1:he1+1] = \
-            boundSource + temperatureAux[1, hs1:he1+1]
-
-        temperatureAux[0, he1+1:hs2] = \
-            boundCenterY * temperatureAux[1, he1+1: hs2] + \
-            boundExternalY * self.environmentTemperature
-
-        temperatureAux[0, hs2: he2+1] = \
-            boundSource + temperatureAux[1, hs2: he2 + 1]
-
-        temperatureAux[0, he2+1:-1] = \
-            boundCenterY * temperatureAux[1, he2+1:-1] + \
-            boundExternalY * self.environmentTemperature
-
-        return temperatureAux
-
-    def getEnergyBalance(
-            self, temperature: np.array, conductionCoeffX: np.float64,
-            conductionCoeffY: np.float64) -> np.float64:
-
-        mnx: int
-        mny: int
-        energyBalance: np.float64
-
-        mnx = self.maxNodeNumberX
-        mny = self.maxNodeNumberY
-        he1 = self.nodeHeatSourceEnd1
-        he2 = self.nodeHeatSourceEnd2
-        hs1 = self.nodeHeatSourceStart1
-        hs2 = self.nodeHeatSourceStart2
-
-        # TOP SURFACE
-        energyBalanceTop = conductionCoeffY * (
-            temperature[mny-1, 1:mnx-1] - temperature[mny-2, 1:mnx-1]).mean()
-
-        # LEFT SURFACE
-        energyBalanceLeft = conductionCoeffX * (
-            temperature[1:mny-1, 0] - temperature[1:mny-1, 1]).mean()
-
-        # RIGHT SURFACE
-        energyBalanceRight = conductionCoeffX * (
-            temperature[1:mny-1, mnx-1] - temperature[1:mny-1, mnx-2]).mean()
-
-        # BOTTOM SURFACE
-        energyBalanceBottom = conductionCoeffY * (
-            temperature[0, 1:hs1] - temperature[1, 1:hs1]).mean()
-
-        energyBalanceBottom += conductionCoeffY * (
-                temperature[0, hs1:he1+1] - temperature[1, hs1:he1+1]).mean()
-
-        energyBalanceBottom += conductionCoeffY * (
-                temperature[0, he1+1:hs2] - temperature[1, he1+1:hs2]).mean()
-
-        energyBalanceBottom += conductionCoeffY * (
-                temperature[0, hs2:he2+1] - temperature[1, hs2:he2+1]).mean()
-
-        energyBalanceBottom += conductionCoeffY * (
-                temperature[0, he2+1:-1] - temperature[1, he2+1:-1]).mean()
-
-        energyBalance = energyBalanceBottom + energyBalanceTop \
-            + energyBalanceRight + energyBalanceLeft
-
-        return energyBalance
+# *****************************************************************************
+# *                    ENERGY EQUATIONS - 2D HEAT TRANSFER                    *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: class responsible for solving the energy equations on a      *
+# * solid plate with two external heat sources. There is the explicit         *
+# * formulation of the finite volume method (FVM) and the implicit form. One  *
+# * solves the implicit form using the Newton-Raphson method with an under-   *
+# * relaxation constant.                                                      *
+# *****************************************************************************
+import numpy as np
+import Constants as ct
+from MeshGenerator import MeshGenerator
+
+
+class EnergyEquations(MeshGenerator):
+
+    def __init__(self):
+
+        super().__init__()
+
+    def getStretchedCoefficients(
+            self, diffusionCoeffX: np.float64, diffusionCoeffY: np.float64,
+            coefficientCenter: np.float64) -> tuple:
+
+        eastX: np.array
+        westX: np.array
+        northY: np.array
+        southY: np.array
+
+        if self.meshStretching == ct.UNIFORM:
+            return diffusionCoeffX, diffusionCoeffY, coefficientCenter
+
+        # Finite volumes of variable spacing: the flux through each face is
+        # over the distance to the neighbour and the balance over the width
+        # of the volume. The coefficients of the wall spacing are scaled, X
+        # along the columns and Y along the rows (a column vector).
+        eastX = diffusionCoeffX * self.deltaX ** 2 / (
+            self.spacingX[1:] * self.widthX)
+        westX = diffusionCoeffX * self.deltaX ** 2 / (
+            self.spacingX[:-1] * self.widthX)
+        northY = diffusionCoeffY * self.deltaY ** 2 / (
+            self.spacingY[1:] * self.widthY)[:, np.newaxis]
+        southY = diffusionCoeffY * self.deltaY ** 2 / (
+            self.spacingY[:-1] * self.widthY)[:, np.newaxis]
+
+        coefficientCenter = 1. + eastX + westX + northY + southY
+
+        return (eastX.astype(self.floatType), westX.astype(self.floatType)), \
+            (northY.astype(self.floatType), southY.astype(self.floatType)), \
+            coefficientCenter.astype(self.floatType)
+
+    @staticmethod
+    def getPartialDiffusion(
+            diffusionCoeff, temperatureForward: np.array,
+            temperatureBackward: np.array) -> np.array:
+
+        # (forward, backward) coefficients on stretched meshes
+        if isinstance(diffusionCoeff, tuple):
+            return diffusionCoeff[0] * temperatureForward + \
+                diffusionCoeff[1] * temperatureBackward
+
+        return diffusionCoeff * (temperatureForward + temperatureBackward)
+
+    def solveEnergyEquationsExplicit(
+            self, temperature: np.array, diffusionCoeffX: np.float64,
+            diffusionCoeffY: np.float64):
+
+        mnx: np.int64
+        mny: np.int64
+        diffusionX: np.array
+        diffusionY: np.array
+        estimateTemperature: np.array
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        estimateTemperature = temperature.copy()
+
+        diffusionX = diffusionCoeffX * (
+            temperature[1:mny-1, 2:mnx] - 2 * temperature[1:mny-1, 1:mnx-1] +
+            temperature[1:mny-1, 0:mnx-2])
+
+        diffusionY = diffusionCoeffY * (
+            temperature[2:mny, 1:mnx-1] - 2 * temperature[1:mny-1, 1:mnx-1] +
+            temperature[0:mny-2, 1:mnx-1])
+
+        estimateTemperature[1:mny-1, 1:mnx-1] = \
+            temperature[1:mny-1, 1:mnx-1] + diffusionX + diffusionY
+
+        return estimateTemperature
+
+    def getExplicitScratch(self) -> tuple:
+
+        nx: np.int64
+        ny: np.int64
+
+        nx = self.nodeNumberX
+        ny = self.nodeNumberY
+
+        return np.zeros((ny, nx), dtype=self.floatType), \
+            np.zeros((ny, nx), dtype=self.floatType)
+
+    def solveEnergyEquationsExplicitInPlace(
+            self, temperature: np.array, estimateTemperature: np.array,
+            diffusionCoeffX: np.float64, diffusionCoeffY: np.float64,
+            scratch: tuple) -> None:
+
+        # Same operations and order as solveEnergyEquationsExplicit, but the
+        # result goes straight to the interior of the second buffer and the
+        # temporaries are reused, so nothing is allocated per time step.
+        self.solveEnergyEquationsExplicitRows(
+            temperature, estimateTemperature, diffusionCoeffX,
+            diffusionCoeffY, 1, self.maxNodeNumberY - 1, scratch)
+
+    @staticmethod
+    def solveEnergyEquationsExplicitRows(
+            temperature: np.array, estimateTemperature: np.array,
+            diffusionCoeffX: np.float64, diffusionCoeffY: np.float64,
+            rowStart: int, rowEnd: int, scratch: tuple) -> None:
+
+        mnx: np.int64
+        diffusionX: np.array
+        diffusionY: np.array
+
+        mnx = temperature.shape[1]
+
+        # only the rows rowStart:rowEnd of the interior, the strips and the
+        # tiles of the parallel backends are updated with it
+        diffusionX, diffusionY = scratch
+
+        if isinstance(diffusionCoeffX, tuple):
+            EnergyEquations.__solveStretchedRows(
+                temperature, estimateTemperature, diffusionCoeffX,
+                diffusionCoeffY, rowStart, rowEnd, scratch)
+            return
+
+        np.multiply(2, temperature[rowStart:rowEnd, 1:mnx-1], out=diffusionX)
+        np.subtract(
+            temperature[rowStart:rowEnd, 2:mnx], diffusionX, out=diffusionX)
+        np.add(
+            diffusionX, temperature[rowStart:rowEnd, 0:mnx-2], out=diffusionX)
+        np.multiply(diffusionCoeffX, diffusionX, out=diffusionX)
+
+        np.multiply(2, temperature[rowStart:rowEnd, 1:mnx-1], out=diffusionY)
+        np.subtract(
+            temperature[rowStart+1:rowEnd+1, 1:mnx-1], diffusionY,
+            out=diffusionY)
+        np.add(
+            diffusionY, temperature[rowStart-1:rowEnd-1, 1:mnx-1],
+            out=diffusionY)
+        np.multiply(diffusionCoeffY, diffusionY, out=diffusionY)
+
+        np.add(
+            temperature[rowStart:rowEnd, 1:mnx-1], diffusionX,
+            out=estimateTemperature[rowStart:rowEnd, 1:mnx-1])
+        np.add(
+            estimateTemperature[rowStart:rowEnd, 1:mnx-1], diffusionY,
+            out=estimateTemperature[rowStart:rowEnd, 1:mnx-1])
+
+    @staticmethod
+    def __solveStretchedRows(
+            temperature: np.array, estimateTemperature: np.array,
+            diffusionCoeffX: tuple, diffusionCoeffY: tuple, rowStart: int,
+            rowEnd: int, scratch: tuple) -> None:
+
+        mnx: np.int64
+        eastX: np.array
+        westX: np.array
+        northY: np.array
+        southY: np.array
+        diffusionX: np.array
+        diffusionY: np.array
+
+        mnx = temperature.shape[1]
+
+        # east * (Te - Tc) + west * (Tw - Tc), the same along Y
+        diffusionX, diffusionY = scratch
+        eastX, westX = diffusionCoeffX
+        northY = diffusionCoeffY[0][rowStart-1:rowEnd-1]
+        southY = diffusionCoeffY[1][rowStart-1:rowEnd-1]
+
+        np.subtract(
+            temperature[rowStart:rowEnd, 2:mnx],
+            temperature[rowStart:rowEnd, 1:mnx-1], out=diffusionX)
+        np.multiply(eastX, diffusionX, out=diffusionX)
+        np.subtract(
+            temperature[rowStart:rowEnd, 0:mnx-2],
+            temperature[rowStart:rowEnd, 1:mnx-1], out=diffusionY)
+        np.multiply(westX, diffusionY, out=diffusionY)
+
+        np.add(
+            temperature[rowStart:rowEnd, 1:mnx-1], diffusionX,
+            out=estimateTemperature[rowStart:rowEnd, 1:mnx-1])
+        np.add(
+            estimateTemperature[rowStart:rowEnd, 1:mnx-1], diffusionY,
+            out=estimateTemperature[rowStart:rowEnd, 1:mnx-1])
+
+        np.subtract(
+            temperature[rowStart+1:rowEnd+1, 1:mnx-1],
+            temperature[rowStart:rowEnd, 1:mnx-1], out=diffusionX)
+        np.multiply(northY, diffusionX, out=diffusionX)
+        np.subtract(
+            temperature[rowStart-1:rowEnd-1, 1:mnx-1],
+            temperature[rowStart:rowEnd, 1:mnx-1], out=diffusionY)
+        np.multiply(southY, diffusionY, out=diffusionY)
+
+        np.add(
+            estimateTemperature[rowStart:rowEnd, 1:mnx-1], diffusionX,
+            out=estimateTemperature[rowStart:rowEnd, 1:mnx-1])
+        np.add(
+            estimateTemperature[rowStart:rowEnd, 1:mnx-1], diffusionY,
+            out=estimateTemperature[rowStart:rowEnd, 1:mnx-1])
+
+    def solveEnergyEquationsImplicitRobin(
+            self, solid, coefficientCenter: np.float64,
+            diffusionCoeffX: np.float64, diffusionCoeffY: np.float64,
+            boundSource: np.float64, boundCenterX: np.float64,
+            boundCenterY: np.float64, boundExternalX: np.float64,
+            boundExternalY: np.float64) -> np.array:
+
+        k: np.int64
+        mnx: np.int64
+        mny: np.int64
+        norm: np.float
+        centerDiffusion: np.array
+        partialDiffusionX: np.array
+        partialDiffusionY: np.array
+        estimateTemperature: np.array
+        temporaryTemperature: np.array
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        estimateTemperature = solid.temperature.copy()
+        temporaryTemperature = solid.temperature.copy()
+
+        k = 0
+        norm = 0.0
+
+        for k in range(self.maxIterations + 1):
+
+            partialDiffusionX = self.getPartialDiffusion(
+                diffusionCoeffX, temporaryTemperature[1:mny-1, 2:mnx],
+                temporaryTemperature[1:mny-1, 0:mnx-2])
+
+            partialDiffusionY = self.getPartialDiffusion(
+                diffusionCoeffY, temporaryTemperature[2:mny, 1:mnx-1],
+                temporaryTemperature[0:mny-2, 1:mnx-1])
+
+            centerDiffusion = coefficientCenter * \
+                temporaryTemperature[1:mny-1, 1:mnx-1]
+
+            estimateTemperature[1:mny-1, 1:mnx-1] = \
+                temporaryTemperature[1:mny-1, 1:mnx-1] - \
+                self.relaxationConstant * (
+                    centerDiffusion - partialDiffusionX - partialDiffusionY -
+                    solid.temperature[1:mny-1, 1:mnx-1]) / coefficientCenter
+
+            norm = np.sqrt(
+                ((estimateTemperature - temporaryTemperature) ** 2).sum(
+                dtype=np.float64))
+
+            if 0 < norm <= self.iterTolerance:
+                # print(
+                #     "WARNING:: Temperature converged!, " +
+                #     "error = {} and num iter = {}".format(norm, k))
+                break
+
+            temporaryTemperature = estimateTemperature
+
+            temporaryTemperature = self.boundariesConditionsDirichlet(
+                temporaryTemperature, solid)
+
+            temporaryTemperature = self.boundariesConditions(
+                temporaryTemperature, boundSource, boundCenterX, boundCenterY,
+                boundExternalX, boundExternalY)
+
+        # if (k >= self.maxIterations) and (norm > 1.0):
+        #     print(
+        #         "WARNING:: Temperature did not converged!, "
+        #         "error = {}, num iter = {}".format(norm, k))
+
+        return estimateTemperature
+
+    def solveEnergyEquationsImplicitDirichlet(
+            self, solid, coefficientCenter: np.float64,
+            diffusionCoeffX: np.float64, diffusionCoeffY: np.float64) -> \
+            np.array:
+
+        k: np.int64
+        mnx: np.int64
+        mny: np.int64
+        norm: np.float
+        centerDiffusion: np.array
+        partialDiffusionX: np.array
+        partialDiffusionY: np.array
+        estimateTemperature: np.array
+        temporaryTemperature: np.array
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        estimateTemperature = solid.temperature.copy()
+        temporaryTemperature = solid.temperature.copy()
+
+        k = 0
+        norm = 0.0
+
+        for k in range(self.maxIterations + 1):
+
+            partialDiffusionX = self.getPartialDiffusion(
+                diffusionCoeffX, temporaryTemperature[1:mny-1, 2:mnx],
+                temporaryTemperature[1:mny-1, 0:mnx-2])
+
+            partialDiffusionY = self.getPartialDiffusion(
+                diffusionCoeffY, temporaryTemperature[2:mny, 1:mnx-1],
+                temporaryTemperature[0:mny-2, 1:mnx-1])
+
+            centerDiffusion = coefficientCenter * \
+                temporaryTemperature[1:mny-1, 1:mnx-1]
+
+            estimateTemperature[1:mny-1, 1:mnx-1] = \
+                temporaryTemperature[1:mny-1, 1:mnx-1] - \
+                self.relaxationConstant * (
+                    centerDiffusion - partialDiffusionX - partialDiffusionY -
+                    solid.temperature[1:mny-1, 1:mnx-1]) / coefficientCenter
+
+            norm = np.sqrt(
+                ((estimateTemperature - temporaryTemperature) ** 2).sum(
+                dtype=np.float64))
+
+            if 0 < norm <= self.iterTolerance:
+                # print(
+                #     "WARNING:: Temperature converged!, " +
+                #     "error = {} and num iter = {}".format(norm, k))
+                break
+
+            temporaryTemperature = estimateTemperature
+
+            temporaryTemperature = self.boundariesConditionsDirichlet(
+                temporaryTemperature, solid)
+
+        # if (k >= self.maxIterations) and (norm > 1.0):
+        #     print(
+        #         "WARNING:: Temperature did not converged!, "
+        #         "error = {}, num iter = {}".format(norm, k))
+
+        return estimateTemperature
+
+    def boundariesConditions(
+            self, temperature: np.array, boundSource: np.float64,
+            boundCenterX: np.float64, boundCenterY: np.float64,
+            boundExternalX: np.float64, boundExternalY: np.float64) -> np.array:
+
+        mnx: np.int64
+        mny: np.int64
+        temperatureAux: np.ndarray
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        he1 = self.nodeHeatSourceEnd1
+        he2 = self.nodeHeatSourceEnd2
+        hs1 = self.nodeHeatSourceStart1
+        hs2 = self.nodeHeatSourceStart2
+
+        temperatureAux = temperature.copy()
+
+        # TOP SURFACE
+        temperatureAux[mny - 1, 1:mnx-1] = \
+            boundCenterY * temperatureAux[mny - 2, 1:mnx-1] + \
+            boundExternalY * self.environmentTemperature
+        # LEFT SURFACE
+        temperatureAux[1:mny-1, 0] = \
+            boundCenterX * temperatureAux[1:mny-1, 1] + \
+            boundExternalX * self.environmentTemperature
+        # RIGHT SURFACE
+        temperatureAux[1:mny-1, mnx - 1] = \
+            boundCenterX * temperatureAux[1:mny-1, mnx - 2] + \
+            boundExternalX * self.environmentTemperature
+        # BOTTOM SURFACE
+        temperatureAux[0, 1:hs1] = \
+            boundCenterY * temperatureAux[1, 1:hs1] + \
+            boundExternalY * self.environmentTemperature
+
+        temperatureAux[0, hs1: he1 + 1] = \
+            boundSource + temperatureAux[1, hs1: he1 + 1]
+
+        temperatureAux[0, he1 + 1: hs2] = \
+            boundCenterY * temperatureAux[1, he1 + 1: hs2] + \
+            boundExternalY * self.environmentTemperature
+
+        temperatureAux[0, hs2: he2 + 1] = \
+            boundSource + temperatureAux[1, hs2: he2 + 1]
+
+        temperatureAux[0, he2 + 1:-1] = \
+            boundCenterY * temperatureAux[1, he2 + 1:-1] + \
+            boundExternalY * self.environmentTemperature
+
+        return temperatureAux
+
+    def boundariesConditionsInPlace(
+            self, temperature: np.array, boundSource: np.float64,
+            boundCenterX: np.float64, boundCenterY: np.float64,
+            boundExternalX: np.float64, boundExternalY: np.float64) -> None:
+
+        mnx: np.int64
+        mny: np.int64
+        externalX: np.float64
+        externalY: np.float64
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        he1 = self.nodeHeatSourceEnd1
+        he2 = self.nodeHeatSourceEnd2
+        hs1 = self.nodeHeatSourceStart1
+        hs2 = self.nodeHeatSourceStart2
+
+        externalX = boundExternalX * self.environmentTemperature
+        externalY = boundExternalY * self.environmentTemperature
+
+        # Same relations as boundariesConditions, written on the ghost nodes
+        # of the given field instead of a copy.
+        # TOP SURFACE
+        np.multiply(
+            boundCenterY, temperature[mny - 2, 1:mnx-1],
+            out=temperature[mny - 1, 1:mnx-1])
+        temperature[mny - 1, 1:mnx-1] += externalY
+        # LEFT SURFACE
+        np.multiply(
+            boundCenterX, temperature[1:mny-1, 1],
+            out=temperature[1:mny-1, 0])
+        temperature[1:mny-1, 0] += externalX
+        # RIGHT SURFACE
+        np.multiply(
+            boundCenterX, temperature[1:mny-1, mnx - 2],
+            out=temperature[1:mny-1, mnx - 1])
+        temperature[1:mny-1, mnx - 1] += externalX
+        # BOTTOM SURFACE
+        np.multiply(
+            boundCenterY, temperature[1, 1:hs1], out=temperature[0, 1:hs1])
+        temperature[0, 1:hs1] += externalY
+
+        np.add(
+            boundSource, temperature[1, hs1: he1 + 1],
+            out=temperature[0, hs1: he1 + 1])
+
+        np.multiply(
+            boundCenterY, temperature[1, he1 + 1: hs2],
+            out=temperature[0, he1 + 1: hs2])
+        temperature[0, he1 + 1: hs2] += externalY
+
+        np.add(
+            boundSource, temperature[1, hs2: he2 + 1],
+            out=temperature[0, hs2: he2 + 1])
+
+        np.multiply(
+            boundCenterY, temperature[1, he2 + 1:-1],
+            out=temperature[0, he2 + 1:-1])
+        temperature[0, he2 + 1:-1] += externalY
+
+    @staticmethod
+    def boundariesConditionsDirichletInPlace(
+            temperatureField: np.array, solid) -> None:
+
+        mnx: int
+        mny: int
+
+        mnx = solid.maxNodeNumberX
+        mny = solid.maxNodeNumberY
+
+        # BOTTOM:
+        temperatureField[0, :] = solid.tempSouth
+        # EAST
+        temperatureField[:, mnx - 1] = solid.tempEast
+        # TOP
+        temperatureField[mny - 1, :] = solid.tempNorth
+        # WEST
+        temperatureField[:, 0] = solid.tempWest
+
+    @staticmethod
+    def boundariesConditionsDirichlet(
+            temperatureField: np.array, solid) -> np.array:
+
+        mnx: int
+        mny: int
+        temperatureFieldAux: np.array
+
+        mnx = solid.maxNodeNumberX
+        mny = solid.maxNodeNumberY
+        temperatureFieldAux = temperatureField.copy()
+
+        # BOTTOM:
+        temperatureFieldAux[0, :] = solid.tempSouth
+        # EAST
+        temperatureFieldAux[:, mnx - 1] = solid.tempEast
+        # TOP
+        temperatureFieldAux[mny - 1, :] = solid.tempNorth
+        # WEST
+        temperatureFieldAux[:, 0] = solid.tempWest
+
+        return temperatureFieldAux
+
+    def setSourceConditions(
+            self, temperature: np.array, boundSource: np.float64,
+            boundCenterY: np.float64, boundExternalY: np.float64) -> np.array:
+
+        mnx: np.int64
+        mny: np.int64
+        temperatureAux: np.ndarray
+
+        he1 = self.nodeHeatSourceEnd1
+        he2 = self.nodeHeatSourceEnd2
+        hs1 = self.nodeHeatSourceStart1
+        hs2 = self.nodeHeatSourceStart2
+
+        temperatureAux = temperature.copy()
+
+        # BOTTOM SURFACE
+        temperatureAux[0, 1:hs1] = \
+            boundCenterY * temperatureAux[1, 1:hs1] + \
+            boundExternalY * self.environmentTemperature
+
+        temperatureAux[0, hs1:he1+1] = \
+            boundSource + temperatureAux[1, hs1:he1+1]
+
+        temperatureAux[0, he1+1:hs2] = \
+            boundCenterY * temperatureAux[1, he1+1: hs2] + \
+            boundExternalY * self.environmentTemperature
+
+        temperatureAux[0, hs2: he2+1] = \
+            boundSource + temperatureAux[1, hs2: he2 + 1]
+
+        temperatureAux[0, he2+1:-1] = \
+            boundCenterY * temperatureAux[1, he2+1:-1] + \
+            boundExternalY * self.environmentTemperature
+
+        return temperatureAux
+
+    def getGhostRelations(
+            self, boundSource: np.float64, boundCenterX: np.float64,
+            boundCenterY: np.float64, boundExternalX: np.float64,
+            boundExternalY: np.float64) -> tuple:
+
+        nx: np.int64
+        ny: np.int64
+        centerSouth: np.array
+        centerNorth: np.array
+        centerWest: np.array
+        centerEast: np.array
+        externalSouth: np.array
+        externalNorth: np.array
+        externalWest: np.array
+        externalEast: np.array
+
+        # Every ghost node is written as: ghost = center * interior + external,
+        # where interior is its first neighbour inside the plate. These are the
+        # same relations applied by boundariesConditions.
+        nx = self.nodeNumberX
+        ny = self.nodeNumberY
+
+        he1 = self.nodeHeatSourceEnd1
+        he2 = self.nodeHeatSourceEnd2
+        hs1 = self.nodeHeatSourceStart1
+        hs2 = self.nodeHeatSourceStart2
+
+        # TOP SURFACE
+        centerNorth = boundCenterY * np.ones((nx,), dtype=self.floatType)
+        externalNorth = boundExternalY * self.environmentTemperature * \
+            np.ones((nx,), dtype=self.floatType)
+        # LEFT SURFACE
+        centerWest = boundCenterX * np.ones((ny,), dtype=self.floatType)
+        externalWest = boundExternalX * self.environmentTemperature * \
+            np.ones((ny,), dtype=self.floatType)
+        # RIGHT SURFACE
+        centerEast = boundCenterX * np.ones((ny,), dtype=self.floatType)
+        externalEast = boundExternalX * self.environmentTemperature * \
+            np.ones((ny,), dtype=self.floatType)
+        # BOTTOM SURFACE
+        centerSouth = boundCenterY * np.ones((nx,), dtype=self.floatType)
+        externalSouth = boundExternalY * self.environmentTemperature * \
+            np.ones((nx,), dtype=self.floatType)
+
+        centerSouth[hs1 - 1:he1] = 1.
+        externalSouth[hs1 - 1:he1] = boundSource
+
+        centerSouth[hs2 - 1:he2] = 1.
+        externalSouth[hs2 - 1:he2] = boundSource
+
+        return centerSouth, externalSouth, centerNorth, externalNorth, \
+            centerWest, externalWest, centerEast, externalEast
+
+    def getGhostRelationsDirichlet(self) -> tuple:
+
+        nx: np.int64
+        ny: np.int64
+
+        nx = self.nodeNumberX
+        ny = self.nodeNumberY
+
+        return np.zeros((nx,), dtype=self.floatType), \
+            self.tempSouth * np.ones((nx,), dtype=self.floatType), \
+            np.zeros((nx,), dtype=self.floatType), \
+            self.tempNorth * np.ones((nx,), dtype=self.floatType), \
+            np.zeros((ny,), dtype=self.floatType), \
+            self.tempWest * np.ones((ny,), dtype=self.floatType), \
+            np.zeros((ny,), dtype=self.floatType), \
+            self.tempEast * np.ones((ny,), dtype=self.floatType)
+
+    def __getWallMean(self, difference: np.array, width: np.array) -> \
+            np.float64:
+
+        if self.meshStretching == ct.UNIFORM:
+            return difference.mean(dtype=np.float64)
+
+        # stretched meshes: weighted by the widths of the wall volumes
+        return (difference * width).sum(dtype=np.float64) / width.sum()
+
+    def getEnergyBalance(
+            self, temperature: np.array, conductionCoeffX: np.float64,
+            conductionCoeffY: np.float64) -> np.float64:
+
+        mnx: int
+        mny: int
+        energyBalance: np.float64
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+        he1 = self.nodeHeatSourceEnd1
+        he2 = self.nodeHeatSourceEnd2
+        hs1 = self.nodeHeatSourceStart1
+        hs2 = self.nodeHeatSourceStart2
+
+        # the widths of the volumes have no ghost nodes, so they are shifted
+        # TOP SURFACE
+        energyBalanceTop = conductionCoeffY * self.__getWallMean(
+            temperature[mny-1, 1:mnx-1] - temperature[mny-2, 1:mnx-1],
+            self.widthX)
+
+        # LEFT SURFACE
+        energyBalanceLeft = conductionCoeffX * self.__getWallMean(
+            temperature[1:mny-1, 0] - temperature[1:mny-1, 1],
+            self.widthY)
+
+        # RIGHT SURFACE
+        energyBalanceRight = conductionCoeffX * self.__getWallMean(
+            temperature[1:mny-1, mnx-1] - temperature[1:mny-1, mnx-2],
+            self.widthY)
+
+        # BOTTOM SURFACE
+        energyBalanceBottom = conductionCoeffY * self.__getWallMean(
+            temperature[0, 1:hs1] - temperature[1, 1:hs1],
+            self.widthX[0:hs1-1])
+
+        energyBalanceBottom += conductionCoeffY * self.__getWallMean(
+            temperature[0, hs1:he1+1] - temperature[1, hs1:he1+1],
+            self.widthX[hs1-1:he1])
+
+        energyBalanceBottom += conductionCoeffY * self.__getWallMean(
+            temperature[0, he1+1:hs2] - temperature[1, he1+1:hs2],
+            self.widthX[he1:hs2-1])
+
+        energyBalanceBottom += conductionCoeffY * self.__getWallMean(
+            temperature[0, hs2:he2+1] - temperature[1, hs2:he2+1],
+            self.widthX[hs2-1:he2])
+
+        energyBalanceBottom += conductionCoeffY * self.__getWallMean(
+            temperature[0, he2+1:-1] - temperature[1, he2+1:-1],
+            self.widthX[he2:])
+
+        energyBalance = energyBalanceBottom + energyBalanceTop \
+            + energyBalanceRight + energyBalanceLeft
+
+        return energyBalance
+
+    def __getEnergyBalanceRate(self) -> np.float64:
+
+        return abs(self.energyBalance - self.previousEnergyBalance) / \
+            (self.deltaT * max(abs(self.energyBalance), 1.))
+
+    def isSteadyState(
+            self, temperature: np.array, previousTemperature: np.array,
+            time: np.float64) -> bool:
+
+        mnx: np.int64
+        mny: np.int64
+        temperatureRate: np.float64
+
+        if not self.steadyStateDetection:
+            return False
+
+        # the temperature change is a pass over the mesh, only needed once
+        # the energy balance criterion holds: the counter restarts otherwise
+        if self.__getEnergyBalanceRate() > self.heatBalanceTolerance:
+            return self.isSteadyStateRate(np.inf, time)
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        # Rates of change (1/s), so the criterion does not depend on deltaT:
+        # the largest temperature change and the energy balance change,
+        # relative to the energy balance itself. The change goes to the
+        # scratch of the solid, so nothing is allocated per time step.
+        np.subtract(
+            temperature[1:mny-1, 1:mnx-1],
+            previousTemperature[1:mny-1, 1:mnx-1],
+            out=self.steadyStateScratch)
+        temperatureRate = np.abs(
+            self.steadyStateScratch,
+            out=self.steadyStateScratch).max() / self.deltaT
+
+        return self.isSteadyStateRate(temperatureRate, time)
+
+    def isSteadyStateRate(
+            self, temperatureRate: np.float64, time: np.float64) -> bool:
+
+        windowSize: np.int64
+        energyBalanceRate: np.float64
+
+        if not self.steadyStateDetection:
+            return False
+
+        energyBalanceRate = self.__getEnergyBalanceRate()
+
+        self.previousEnergyBalance = self.energyBalance
+
+        if temperatureRate <= self.steadyStateTolerance and \
+                energyBalanceRate <= self.heatBalanceTolerance:
+            self.steadyStateCounter += 1
+        else:
+            self.steadyStateCounter = 0
+
+        windowSize = max(int(np.ceil(self.steadyStateWindow / self.deltaT)), 1)
+
+        if self.steadyStateCounter < windowSize:
+            return False
+
+        self.steadyStateTime = time
+
+        print("Steady state reached at t = {} s".format(time))
+
+        return True
@@ -0,0 +1,289 @@
+# *****************************************************************************
+# *                        ENSEMBLE - 2D HEAT TRANSFER                        *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: explicit method for a batch of cases on the same mesh, which *
+# * only differ by scalar coefficients. The cases are stacked along a leading *
+# * axis, so the field is (nCases, mny, mnx), and every coefficient is a      *
+# * (nCases, 1, 1) array. One time step updates all the cases, with the same  *
+# * operations and order as the explicit method of a single case.             *
+# *****************************************************************************
+import numpy as np
+from MeshGenerator import MeshGenerator
+
+# control parameters that may change from one case to another
+ENSEMBLE_PARAMETERS = (
+    "convection", "heatSource", "conductivity", "diffusivity",
+    "environmentTemperature", "initialTemperature")
+
+
+class Ensemble(MeshGenerator):
+
+    def __init__(self):
+
+        super().__init__()
+
+    def getEnsembleParameters(self, parameters: dict) -> tuple:
+
+        name: str
+        caseNumber: int
+        ensembleParameters: dict
+
+        for name in parameters:
+            if name not in ENSEMBLE_PARAMETERS:
+                print("ERROR:: {} can not change inside an ensemble, use one "
+                      "of {}!".format(name, ENSEMBLE_PARAMETERS))
+                exit()
+
+        caseNumber = max(
+            [np.size(value) for value in parameters.values()] + [1])
+
+        ensembleParameters = {}
+
+        # the parameters that are not given keep their control value
+        for name in ENSEMBLE_PARAMETERS:
+            value = np.asarray(
+                parameters.get(name, getattr(self, name)), dtype=np.float64)
+
+            if value.size not in (1, caseNumber):
+                print("ERROR:: Every ensemble parameter must have one value "
+                      "or {} values!".format(caseNumber))
+                exit()
+
+            ensembleParameters[name] = np.broadcast_to(
+                value.reshape((-1, 1, 1)), (caseNumber, 1, 1)).copy()
+
+        return caseNumber, ensembleParameters
+
+    def getEnsembleScratch(self, caseNumber: int) -> tuple:
+
+        nx: np.int64
+        ny: np.int64
+
+        nx = self.nodeNumberX
+        ny = self.nodeNumberY
+
+        return np.zeros((caseNumber, ny, nx), dtype=self.floatType), \
+            np.zeros((caseNumber, ny, nx), dtype=self.floatType)
+
+    def setSourceConditionsEnsemble(
+            self, temperature: np.array, boundSource: np.array,
+            boundCenterY: np.array, boundExternalY: np.array,
+            environmentTemperature: np.array) -> None:
+
+        he1 = self.nodeHeatSourceEnd1
+        he2 = self.nodeHeatSourceEnd2
+        hs1 = self.nodeHeatSourceStart1
+        hs2 = self.nodeHeatSourceStart2
+
+        # same relations as setSourceConditions, one per case
+        # BOTTOM SURFACE
+        temperature[:, 0:1, 1:hs1] = \
+            boundCenterY * temperature[:, 1:2, 1:hs1] + \
+            boundExternalY * environmentTemperature
+
+        temperature[:, 0:1, hs1:he1+1] = \
+            boundSource + temperature[:, 1:2, hs1:he1+1]
+
+        temperature[:, 0:1, he1+1:hs2] = \
+            boundCenterY * temperature[:, 1:2, he1+1:hs2] + \
+            boundExternalY * environmentTemperature
+
+        temperature[:, 0:1, hs2:he2+1] = \
+            boundSource + temperature[:, 1:2, hs2:he2+1]
+
+        temperature[:, 0:1, he2+1:-1] = \
+            boundCenterY * temperature[:, 1:2, he2+1:-1] + \
+            boundExternalY * environmentTemperature
+
+    def solveEnergyEquationsExplicitEnsemble(
+            self, temperature: np.array, estimateTemperature: np.array,
+            diffusionCoeffX: np.array, diffusionCoeffY: np.array,
+            scratch: tuple) -> None:
+
+        mnx: np.int64
+        mny: np.int64
+        diffusionX: np.array
+        diffusionY: np.array
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        diffusionX, diffusionY = scratch
+
+        # same operations and order as solveEnergyEquationsExplicitInPlace
+        np.multiply(2, temperature[:, 1:mny-1, 1:mnx-1], out=diffusionX)
+        np.subtract(
+            temperature[:, 1:mny-1, 2:mnx], diffusionX, out=diffusionX)
+        np.add(diffusionX, temperature[:, 1:mny-1, 0:mnx-2], out=diffusionX)
+        np.multiply(diffusionCoeffX, diffusionX, out=diffusionX)
+
+        np.multiply(2, temperature[:, 1:mny-1, 1:mnx-1], out=diffusionY)
+        np.subtract(
+            temperature[:, 2:mny, 1:mnx-1], diffusionY, out=diffusionY)
+        np.add(diffusionY, temperature[:, 0:mny-2, 1:mnx-1], out=diffusionY)
+        np.multiply(diffusionCoeffY, diffusionY, out=diffusionY)
+
+        np.add(
+            temperature[:, 1:mny-1, 1:mnx-1], diffusionX,
+            out=estimateTemperature[:, 1:mny-1, 1:mnx-1])
+        np.add(
+            estimateTemperature[:, 1:mny-1, 1:mnx-1], diffusionY,
+            out=estimateTemperature[:, 1:mny-1, 1:mnx-1])
+
+    def boundariesConditionsEnsemble(
+            self, temperature: np.array, boundSource: np.array,
+            boundCenterX: np.array, boundCenterY: np.array,
+            boundExternalX: np.array, boundExternalY: np.array,
+            environmentTemperature: np.array) -> None:
+
+        mnx: np.int64
+        mny: np.int64
+        externalX: np.array
+        externalY: np.array
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        he1 = self.nodeHeatSourceEnd1
+        he2 = self.nodeHeatSourceEnd2
+        hs1 = self.nodeHeatSourceStart1
+        hs2 = self.nodeHeatSourceStart2
+
+        externalX = boundExternalX * environmentTemperature
+        externalY = boundExternalY * environmentTemperature
+
+        # same relations as boundariesConditionsInPlace, one per case
+        # TOP SURFACE
+        np.multiply(
+            boundCenterY, temperature[:, mny-2:mny-1, 1:mnx-1],
+            out=temperature[:, mny-1:mny, 1:mnx-1])
+        temperature[:, mny-1:mny, 1:mnx-1] += externalY
+        # LEFT SURFACE
+        np.multiply(
+            boundCenterX, temperature[:, 1:mny-1, 1:2],
+            out=temperature[:, 1:mny-1, 0:1])
+        temperature[:, 1:mny-1, 0:1] += externalX
+        # RIGHT SURFACE
+        np.multiply(
+            boundCenterX, temperature[:, 1:mny-1, mnx-2:mnx-1],
+            out=temperature[:, 1:mny-1, mnx-1:mnx])
+        temperature[:, 1:mny-1, mnx-1:mnx] += externalX
+        # BOTTOM SURFACE
+        np.multiply(
+            boundCenterY, temperature[:, 1:2, 1:hs1],
+            out=temperature[:, 0:1, 1:hs1])
+        temperature[:, 0:1, 1:hs1] += externalY
+
+        np.add(
+            boundSource, temperature[:, 1:2, hs1:he1+1],
+            out=temperature[:, 0:1, hs1:he1+1])
+
+        np.multiply(
+            boundCenterY, temperature[:, 1:2, he1+1:hs2],
+            out=temperature[:, 0:1, he1+1:hs2])
+        temperature[:, 0:1, he1+1:hs2] += externalY
+
+        np.add(
+            boundSource, temperature[:, 1:2, hs2:he2+1],
+            out=temperature[:, 0:1, hs2:he2+1])
+
+        np.multiply(
+            boundCenterY, temperature[:, 1:2, he2+1:-1],
+            out=temperature[:, 0:1, he2+1:-1])
+        temperature[:, 0:1, he2+1:-1] += externalY
+
+    def getEnergyBalanceEnsemble(
+            self, temperature: np.array, conductionCoeffX: np.array,
+            conductionCoeffY: np.array) -> np.array:
+
+        mnx: int
+        mny: int
+        energyBalance: np.array
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+        he1 = self.nodeHeatSourceEnd1
+        he2 = self.nodeHeatSourceEnd2
+        hs1 = self.nodeHeatSourceStart1
+        hs2 = self.nodeHeatSourceStart2
+
+        conductionCoeffX = conductionCoeffX.ravel()
+        conductionCoeffY = conductionCoeffY.ravel()
+
+        # same terms as getEnergyBalance, one per case
+        # TOP SURFACE
+        energyBalanceTop = conductionCoeffY * (
+            temperature[:, mny-1, 1:mnx-1] -
+            temperature[:, mny-2, 1:mnx-1]).mean(axis=1, dtype=np.float64)
+
+        # LEFT SURFACE
+        energyBalanceLeft = conductionCoeffX * (
+            temperature[:, 1:mny-1, 0] - temperature[:, 1:mny-1, 1]).mean(
+            axis=1, dtype=np.float64)
+
+        # RIGHT SURFACE
+        energyBalanceRight = conductionCoeffX * (
+            temperature[:, 1:mny-1, mnx-1] -
+            temperature[:, 1:mny-1, mnx-2]).mean(axis=1, dtype=np.float64)
+
+        # BOTTOM SURFACE
+        energyBalanceBottom = conductionCoeffY * (
+            temperature[:, 0, 1:hs1] - temperature[:, 1, 1:hs1]).mean(
+            axis=1, dtype=np.float64)
+
+        energyBalanceBottom += conductionCoeffY * (
+            temperature[:, 0, hs1:he1+1] -
+            temperature[:, 1, hs1:he1+1]).mean(axis=1, dtype=np.float64)
+
+        energyBalanceBottom += conductionCoeffY * (
+            temperature[:, 0, he1+1:hs2] -
+            temperature[:, 1, he1+1:hs2]).mean(axis=1, dtype=np.float64)
+
+        energyBalanceBottom += conductionCoeffY * (
+            temperature[:, 0, hs2:he2+1] -
+            temperature[:, 1, hs2:he2+1]).mean(axis=1, dtype=np.float64)
+
+        energyBalanceBottom += conductionCoeffY * (
+            temperature[:, 0, he2+1:-1] -
+            temperature[:, 1, he2+1:-1]).mean(axis=1, dtype=np.float64)
+
+        energyBalance = energyBalanceBottom + energyBalanceTop \
+            + energyBalanceRight + energyBalanceLeft
+
+        return energyBalance
+
+    def getSteadyCasesEnsemble(
+            self, temperature: np.array, previousTemperature: np.array,
+            energyBalance: np.array, previousEnergyBalance: np.array,
+            steadyStateCounter: np.array) -> np.array:
+
+        mnx: np.int64
+        mny: np.int64
+        windowSize: np.int64
+        temperatureRate: np.array
+        energyBalanceRate: np.array
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        # same criterion as isSteadyState, one counter per case
+        temperatureRate = np.abs(
+            temperature[:, 1:mny-1, 1:mnx-1] -
+            previousTemperature[:, 1:mny-1, 1:mnx-1]).max(axis=(1, 2)) / \
+            self.deltaT
+
+        energyBalanceRate = \
+            np.abs(energyBalance - previousEnergyBalance) / \
+            (self.deltaT * np.maximum(np.abs(energyBalance), 1.))
+
+        steadyStateCounter[:] = np.where(
+            (temperatureRate <= self.steadyStateTolerance) &
+            (energyBalanceRate <= self.heatBalanceTolerance),
+            steadyStateCounter + 1, 0)
+
+        windowSize = max(int(np.ceil(self.steadyStateWindow / self.deltaT)), 1)
+
+        return steadyStateCounter >= windowSize
@@ -0,0 +1,229 @@
+# *****************************************************************************
+# *                     FUSED KERNEL - 2D HEAT TRANSFER                       *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: optional Numba backend of the explicit method. One compiled  *
+# * pass does the stencil update, the ghost nodes, the probes and the energy  *
+# * balance. The sums follow the order of the sparse sampling product and of  *
+# * the NumPy pairwise summation, so the probes and outputs are the same as   *
+# * the ones of the NumPy path. Without Numba the solver falls back to the    *
+# * NumPy path.                                                               *
+# *****************************************************************************
+import numpy as np
+from scipy import sparse
+import Constants as ct
+from MeshGenerator import MeshGenerator
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# block sizes of the NumPy pairwise summation and of the reduction buffer
+PAIRWISE_BLOCK = 128
+REDUCTION_BUFFER = 8192
+
+
+def _pairwiseSum(values: np.array, start: int, size: int) -> float:
+
+    i: int
+    result: float
+
+    if size < 8:
+        result = 0.
+        for i in range(start, start + size):
+            result += values[i]
+        return result
+
+    elif size <= PAIRWISE_BLOCK:
+        r0 = values[start]
+        r1 = values[start + 1]
+        r2 = values[start + 2]
+        r3 = values[start + 3]
+        r4 = values[start + 4]
+        r5 = values[start + 5]
+        r6 = values[start + 6]
+        r7 = values[start + 7]
+
+        i = 8
+        while i < size - size % 8:
+            r0 += values[start + i]
+            r1 += values[start + i + 1]
+            r2 += values[start + i + 2]
+            r3 += values[start + i + 3]
+            r4 += values[start + i + 4]
+            r5 += values[start + i + 5]
+            r6 += values[start + i + 6]
+            r7 += values[start + i + 7]
+            i += 8
+
+        result = ((r0 + r1) + (r2 + r3)) + ((r4 + r5) + (r6 + r7))
+
+        while i < size:
+            result += values[start + i]
+            i += 1
+
+        return result
+
+    half = size // 2
+    half -= half % 8
+
+    return _pairwiseSum(values, start, half) + \
+        _pairwiseSum(values, start + half, size - half)
+
+
+def _getMean(values: np.array, size: int) -> float:
+
+    k: int
+    result: float
+
+    result = 0.
+    for k in range(0, size, REDUCTION_BUFFER):
+        result += _pairwiseSum(values, k, min(REDUCTION_BUFFER, size - k))
+
+    return result / size
+
+
+def _solveFusedStep(
+        temperature: np.array, estimateTemperature: np.array,
+        diffusionCoeffX: float, diffusionCoeffY: float, ghostRelations: tuple,
+        heatSourceSegments: np.array, conductionCoeffX: float,
+        conductionCoeffY: float, probePointers: np.array,
+        probeIndices: np.array, probeWeights: np.array, sample: bool,
+        probeValues: np.array, scratch: np.array) -> float:
+
+    i: int
+    j: int
+    k: int
+    p: int
+    mnx: int
+    mny: int
+    energyBalance: float
+
+    mny, mnx = temperature.shape
+
+    centerSouth, externalSouth, centerNorth, externalNorth, \
+        centerWest, externalWest, centerEast, externalEast = ghostRelations
+
+    for i in range(1, mny - 1):
+
+        # stencil, same operations and order as the NumPy path
+        for j in range(1, mnx - 1):
+            estimateTemperature[i, j] = \
+                temperature[i, j] + diffusionCoeffX * (
+                    temperature[i, j + 1] - 2 * temperature[i, j] +
+                    temperature[i, j - 1]) + diffusionCoeffY * (
+                    temperature[i + 1, j] - 2 * temperature[i, j] +
+                    temperature[i - 1, j])
+
+        # LEFT AND RIGHT SURFACES
+        estimateTemperature[i, 0] = \
+            centerWest[i - 1] * estimateTemperature[i, 1] + \
+            externalWest[i - 1]
+        estimateTemperature[i, mnx - 1] = \
+            centerEast[i - 1] * estimateTemperature[i, mnx - 2] + \
+            externalEast[i - 1]
+
+        # BOTTOM SURFACE, once its first row is done
+        if i == 1:
+            for j in range(1, mnx - 1):
+                estimateTemperature[0, j] = \
+                    centerSouth[j - 1] * estimateTemperature[1, j] + \
+                    externalSouth[j - 1]
+
+    # TOP SURFACE
+    for j in range(1, mnx - 1):
+        estimateTemperature[mny - 1, j] = \
+            centerNorth[j - 1] * estimateTemperature[mny - 2, j] + \
+            externalNorth[j - 1]
+
+    # probes: same sums and order as the sparse sampling product
+    if sample:
+        for p in range(probePointers.shape[0] - 1):
+            probeValues[p] = 0.
+            for k in range(probePointers[p], probePointers[p + 1]):
+                probeValues[p] += probeWeights[k] * estimateTemperature[
+                    probeIndices[k] // mnx, probeIndices[k] % mnx]
+
+    # energy balance, same terms and order as getEnergyBalance
+    for j in range(1, mnx - 1):
+        scratch[j - 1] = \
+            estimateTemperature[mny - 1, j] - estimateTemperature[mny - 2, j]
+    energyBalanceTop = conductionCoeffY * _getMean(scratch, mnx - 2)
+
+    for i in range(1, mny - 1):
+        scratch[i - 1] = estimateTemperature[i, 0] - estimateTemperature[i, 1]
+    energyBalanceLeft = conductionCoeffX * _getMean(scratch, mny - 2)
+
+    for i in range(1, mny - 1):
+        scratch[i - 1] = \
+            estimateTemperature[i, mnx - 1] - estimateTemperature[i, mnx - 2]
+    energyBalanceRight = conductionCoeffX * _getMean(scratch, mny - 2)
+
+    energyBalanceBottom = 0.
+    for k in range(heatSourceSegments.shape[0] - 1):
+        for j in range(heatSourceSegments[k], heatSourceSegments[k + 1]):
+            scratch[j - heatSourceSegments[k]] = \
+                estimateTemperature[0, j] - estimateTemperature[1, j]
+        if k == 0:
+            energyBalanceBottom = conductionCoeffY * _getMean(
+                scratch, heatSourceSegments[k + 1] - heatSourceSegments[k])
+        else:
+            energyBalanceBottom += conductionCoeffY * _getMean(
+                scratch, heatSourceSegments[k + 1] - heatSourceSegments[k])
+
+    energyBalance = energyBalanceBottom + energyBalanceTop \
+        + energyBalanceRight + energyBalanceLeft
+
+    return energyBalance
+
+
+if numba is not None:
+    _pairwiseSum = numba.njit(cache=True)(_pairwiseSum)
+    _getMean = numba.njit(cache=True, error_model="numpy")(_getMean)
+    _solveFusedStep = numba.njit(cache=True)(_solveFusedStep)
+
+
+class FusedKernel(MeshGenerator):
+
+    def __init__(self):
+
+        super().__init__()
+
+        self.heatSourceSegments: np.array
+
+        # bottom segments of getEnergyBalance, split by the heat sources
+        self.heatSourceSegments = np.array([
+            1, self.nodeHeatSourceStart1, self.nodeHeatSourceEnd1 + 1,
+            self.nodeHeatSourceStart2, self.nodeHeatSourceEnd2 + 1,
+            self.maxNodeNumberX - 1], dtype=np.int64)
+
+    def getExplicitBackend(self) -> str:
+
+        if self.explicitBackend == ct.NUMBA and numba is None:
+            print("WARNING:: Numba is not installed, the NumPy path is used!")
+            return ct.NUMPY
+
+        return self.explicitBackend
+
+    def getFusedScratch(self) -> np.array:
+
+        return np.zeros(
+            (max(self.maxNodeNumberX, self.maxNodeNumberY),), dtype=np.float64)
+
+    def solveEnergyEquationsFused(
+            self, temperature: np.array, estimateTemperature: np.array,
+            diffusionCoeffX: np.float64, diffusionCoeffY: np.float64,
+            ghostRelations: tuple, conductionCoeffX: np.float64,
+            conductionCoeffY: np.float64, samplingMatrix: sparse.csr_matrix,
+            probeValues: np.array, sample: bool, scratch: np.array) -> \
+            np.float64:
+
+        return _solveFusedStep(
+            temperature, estimateTemperature, diffusionCoeffX,
+            diffusionCoeffY, ghostRelations, self.heatSourceSegments,
+            conductionCoeffX, conductionCoeffY, samplingMatrix.indptr,
+            samplingMatrix.indices, samplingMatrix.data, sample, probeValues,
+            scratch)
@@ -1,226 +1,275 @@
-# *****************************************************************************
-# *                    MESH GENERATOR - 2D HEAT TRANSFER                      *
-# *****************************************************************************
-# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
-# * E-mail: almeriopamplona@gmail.com                                         *
-# *****************************************************************************
-# * Description: generates the mesh parameters and coordinates.               *
-# *****************************************************************************
-import numpy as np
-from ControlParameters import ControlParameters
-
-
-class MeshGenerator(ControlParameters):
-
-    def __init__(self):
-
-        super().__init__()
-
-        self.time: np.array
-        self.deltaT: float
-        self.deltaX: float
-        self.deltaY: float
-        self.timeSize: int
-        self.invDeltaX: float
-        self.invDeltaY: float
-        self.spaceSizeX: int
-        self.spaceSizeY: int
-        self.coordinateX: np.array
-        self.coordinateY: np.array
-        self.nodeHeatSourceEnd1: float
-        self.nodeHeatSourceStart1: float
-        self.nodeHeatSourceEnd2: float
-        self.nodeHeatSourceStart2: float
-
-        self.deltaT, self.deltaX, self.deltaY, self.timeSize, \
-            self.spaceSizeX, self.spaceSizeY = self.getMeshParameters()
-
-        self.time = self.getTimeVector()
-        self.invDeltaX = 1. / self.deltaX
-        self.invDeltaY = 1. / self.deltaY
-        self.coordinateX, self.coordinateY = self.getCoordinates()
-
-        self.nodeHeatSourceEnd1, self.nodeHeatSourceStart1, \
-            self.nodeHeatSourceEnd2, self.nodeHeatSourceStart2 = \
-            self.getSourceNodes()
-
-    def getMeshParameters(self) -> tuple:
-
-        deltaT: float
-        deltaX: float
-        deltaY: float
-        timeSize: int
-        tempDeltaT: float
-        spaceSizeX: int
-        spaceSizeY: int
-
-        # space allocations
-        deltaX = \
-            (self.finalPositionX - self.initialPositionX) / \
-            (self.nodeNumberX - 1)
-        deltaY = \
-            (self.finalPositionY - self.initialPositionY) / \
-            (self.nodeNumberY - 1)
-
-        spaceSizeX = self.maxNodeNumberX * self.maxNodeNumberY
-        spaceSizeY = self.maxNodeNumberX * self.maxNodeNumberY
-
-        # time allocations
-        tempDeltaT = 1E-3
-
-        if self.stabilityParamenter == 0:
-
-            tempDeltaT = \
-                self.CFL * deltaX * deltaY / \
-                (self.diffusivity * deltaY + self.diffusivity * deltaX)
-
-        elif self.stabilityParamenter == 1:
-
-            tempDeltaT = self.maxDeltaT
-
-        else:
-            print("ERROR:: define a proper stability parameter!")
-            exit()
-
-        maxDeltaT = self.CFL * deltaX * deltaY / (
-                    self.diffusivity * deltaY + self.diffusivity * deltaX)
-
-        timeSize = int(np.ceil(
-            (self.finalTime - self.initialTime) / tempDeltaT))
-
-        deltaT = (self.finalTime - self.initialTime) / (timeSize - 1)
-
-        print("deltaT: {}, max deltaT: {}, Number of Time Steps: {}".format(
-            deltaT, maxDeltaT, timeSize))
-
-        return deltaT, deltaX, deltaY, timeSize, spaceSizeX, spaceSizeY
-
-    def getSourceNodes(self) -> tuple:
-
-        axis: np.array
-        nodeHeatSourceEnd2: int
-        nodeHeatSourceEnd1: int
-        nodeHeatSourceStart1: int
-        nodeHeatSourceStart2: int
-
-        nodeHeatSourceEnd2 = 0
-        nodeHeatSourceEnd1 = 0
-        nodeHeatSourceStart1 = 0
-        nodeHeatSourceStart2 = 0
-
-        axisX = np.linspace(
-            self.initialPositionX, self.finalPositionX, self.nodeNumberX)
-
-        for i in range(self.nodeNumberX):
-            if self.heatSourcePositionStart1 <= axisX[i] \
-                    <= self.heatSourcePositionEnd1:
-                nodeHeatSourceStart1 = i+1
-                break
-
-        for i in range(self.nodeNumberX):
-            if self.heatSourcePositionStart1 <= axisX[i] \
-                    <= self.heatSourcePositionEnd1:
-                nodeHeatSourceEnd1 = i+1
-
-        for i in range(self.nodeNumberX):
-            if self.heatSourcePositionStart2 <= axisX[i] \
-                    <= self.heatSourcePositionEnd2:
-                nodeHeatSourceStart2 = i+1
-                break
-
-        for i in range(self.nodeNumberX):
-            if self.heatSourcePositionStart2 <= axisX[i] \
-                    <= self.heatSourcePositionEnd2:
-                nodeHeatSourceEnd2 = i+1
-
-        return nodeHeatSourceEnd1, nodeHeatSourceStart1, nodeHeatSourceEnd2, \
-            nodeHeatSourceStart2
-
-    def getProbePosition(
-            self, positionX: np.float, positionY: np.float) -> tuple:
-
-        axisX = np.linspace(
-            self.initialPositionX, self.finalPositionX, self.nodeNumberX)
-        axisY = np.linspace(
-            self.initialPositionY, self.finalPositionY, self.nodeNumberY)
-
-        lowerBoundX = positionX - self.deltaX
-        upperBoundX = positionX + self.deltaX
-
-        lowerBoundY = positionY - self.deltaY
-        upperBoundY = positionY + self.deltaY
-
-        lowerPositionX = 0
-        lowerPositionY = 0
-        upperPositionX = 0
-        upperPositionY = 0
-
-        k = 0
-        for i in range(self.nodeNumberX):
-            if lowerBoundX <= axisX[i] <= upperBoundX and k == 0:
-                lowerPositionX = i
-                k += 1
-            elif lowerBoundX <= axisX[i] <= upperBoundX and k > 0:
-                upperPositionX = i
-
-        k = 0
-        for j in range(self.nodeNumberY):
-            if lowerBoundY <= axisY[j] <= upperBoundY and k == 0:
-                lowerPositionY = j
-                k += 1
-            elif lowerBoundY <= axisY[j] <= upperBoundY and k > 0:
-                upperPositionY = j
-
-        return lowerPositionX, upperPositionX, lowerPositionY, upperPositionY
-
-    def getTimeVector(self) -> np.array:
-
-        time: np.array
-
-        time = np.linspace(
-            self.initialTime, self.finalTime, self.timeSize)
-
-        return time
-
-    def getCoordinates(self) -> tuple:
-
-        j: int
-        i: int
-        nx: int
-        ny: int
-        rows: int
-        coordinatesX: np.array
-        coordinatesY: np.array
-
-        nx = self.nodeNumberX
-        ny = self.nodeNumberY
-
-        rows = ny * nx
-
-        coordinatesX = np.zeros((rows,), dtype=float)
-        coordinatesY = np.zeros((rows,), dtype=float)
-
-        for j in range(rows):
-            coordinatesX[j] = \
-                self.initialPositionX + self.deltaX * np.mod(j, nx)
-
-        k = 0
-        for i in range(rows):
-            coordinatesY[i] = \
-                self.initialPositionY + self.deltaY * k
-
-            if np.mod(i, nx) == 0:
-                k += 1
-
-        return coordinatesX, coordinatesY
-
-    def getMeshgrid(self):
-
-        mnx = self.maxNodeNumberX
-        mny = self.maxNodeNumberY
-        axisX = np.linspace(self.initialPositionX, self.finalPositionX, mnx)
-        axisY = np.linspace(self.initialPositionY, self.finalPositionY, mny)
-
-        coordinatesX, coordinatesY = np.meshgrid(axisX, axisY)
-
-        return coordinatesX, coordinatesY
+# *****************************************************************************
+# *                    MESH GENERATOR - 2D HEAT TRANSFER                      *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: generates the mesh parameters and coordinates.               *
+# *****************************************************************************
+import weakref
+import numpy as np
+import Constants as ct
+from TimeAxis import TimeAxis
+from RunContext import RunContext
+from ControlParameters import ControlParameters
+
+# mesh attributes kept in the run context
+MESH_ATTRIBUTES = (
+    "deltaT", "deltaX", "deltaY", "timeSize", "invDeltaX", "invDeltaY",
+    "spaceSizeX", "spaceSizeY", "coordinateX", "coordinateY", "axisX",
+    "axisY", "spacingX", "spacingY", "widthX", "widthY",
+    "nodeHeatSourceEnd1", "nodeHeatSourceStart1", "nodeHeatSourceEnd2",
+    "nodeHeatSourceStart2")
+
+# run contexts in use, by set of control parameters: the components hold
+# them, so a context is dropped with the last component of its run
+RUN_CONTEXTS = weakref.WeakValueDictionary()
+
+
+class MeshGenerator(ControlParameters):
+
+    def __init__(self):
+
+        super().__init__()
+
+        self.deltaT: float
+        self.deltaX: float
+        self.deltaY: float
+        self.timeSize: int
+        self.invDeltaX: float
+        self.invDeltaY: float
+        self.spaceSizeX: int
+        self.spaceSizeY: int
+        self.coordinateX: np.array
+        self.coordinateY: np.array
+        self.axisX: np.array
+        self.axisY: np.array
+        self.spacingX: np.array
+        self.spacingY: np.array
+        self.widthX: np.array
+        self.widthY: np.array
+        self.nodeHeatSourceEnd1: float
+        self.nodeHeatSourceStart1: float
+        self.nodeHeatSourceEnd2: float
+        self.nodeHeatSourceStart2: float
+        self.time: TimeAxis
+        self.runContext: RunContext
+
+        self.runContext = self.getRunContext()
+
+        # references to the shared mesh
+        for name in MESH_ATTRIBUTES:
+            setattr(self, name, getattr(self.runContext, name))
+
+        self.time = self.runContext.time
+
+    def getRunContext(self) -> RunContext:
+
+        key: str
+        parameters: dict
+        runContext: RunContext
+
+        # only the control parameters are set at this point
+        parameters = dict(vars(self))
+        key = repr(sorted(parameters.items()))
+        runContext = RUN_CONTEXTS.get(key)
+
+        if runContext is None:
+
+            self.axisX, self.spacingX, self.widthX = self.getAxis(
+                self.initialPositionX, self.finalPositionX, self.nodeNumberX)
+            self.axisY, self.spacingY, self.widthY = self.getAxis(
+                self.initialPositionY, self.finalPositionY, self.nodeNumberY)
+
+            self.deltaT, self.deltaX, self.deltaY, self.timeSize, \
+                self.spaceSizeX, self.spaceSizeY = self.getMeshParameters()
+
+            self.invDeltaX = 1. / self.deltaX
+            self.invDeltaY = 1. / self.deltaY
+            self.coordinateX, self.coordinateY = self.getCoordinates()
+
+            self.nodeHeatSourceEnd1, self.nodeHeatSourceStart1, \
+                self.nodeHeatSourceEnd2, self.nodeHeatSourceStart2 = \
+                self.getSourceNodes()
+
+            runContext = RunContext(parameters, {
+                name: getattr(self, name) for name in MESH_ATTRIBUTES})
+            RUN_CONTEXTS[key] = runContext
+
+        return runContext
+
+    def getMeshParameters(self) -> tuple:
+
+        deltaT: float
+        deltaX: float
+        deltaY: float
+        timeSize: int
+        tempDeltaT: float
+        spaceSizeX: int
+        spaceSizeY: int
+
+        # space allocations
+        deltaX = \
+            (self.finalPositionX - self.initialPositionX) / \
+            (self.nodeNumberX - 1)
+        deltaY = \
+            (self.finalPositionY - self.initialPositionY) / \
+            (self.nodeNumberY - 1)
+
+        # stretched meshes: the spacing at the walls, which is the smallest
+        # one, so the boundary relations and the time step stay the same
+        if self.meshStretching != ct.UNIFORM:
+            deltaX = self.spacingX[0]
+            deltaY = self.spacingY[0]
+
+        spaceSizeX = self.maxNodeNumberX * self.maxNodeNumberY
+        spaceSizeY = self.maxNodeNumberX * self.maxNodeNumberY
+
+        # time allocations
+        tempDeltaT = 1E-3
+
+        if self.stabilityParamenter == 0:
+
+            tempDeltaT = \
+                self.CFL * deltaX * deltaY / \
+                (self.diffusivity * deltaY + self.diffusivity * deltaX)
+
+        elif self.stabilityParamenter == 1:
+
+            tempDeltaT = self.maxDeltaT
+
+        else:
+            print("ERROR:: define a proper stability parameter!")
+            exit()
+
+        # Adaptive refinement: the explicit steps of the finest level are
+        # stable below 1 / (2 * diffusivity * (1 / hx**2 + 1 / hy**2)).
+        if self.adaptiveRefinement and self.solutionMethod == ct.EXPLICIT:
+            tempDeltaT = min(tempDeltaT, self.CFL / (
+                2 * self.diffusivity * 4 ** self.refinementLevels * (
+                    deltaX ** -2 + deltaY ** -2)))
+
+        maxDeltaT = self.CFL * deltaX * deltaY / (
+                    self.diffusivity * deltaY + self.diffusivity * deltaX)
+
+        timeSize = int(np.ceil(
+            (self.finalTime - self.initialTime) / tempDeltaT))
+
+        deltaT = (self.finalTime - self.initialTime) / (timeSize - 1)
+
+        print("deltaT: {}, max deltaT: {}, Number of Time Steps: {}".format(
+            deltaT, maxDeltaT, timeSize))
+
+        return deltaT, deltaX, deltaY, timeSize, spaceSizeX, spaceSizeY
+
+    def getAxis(
+            self, initialPosition: float, finalPosition: float,
+            nodeNumber: int) -> tuple:
+
+        axis: np.array
+        width: np.array
+        spacing: np.array
+        exponent: np.array
+        coordinate: np.array
+
+        if self.meshStretching == ct.UNIFORM:
+            axis = np.linspace(initialPosition, finalPosition, nodeNumber)
+
+        elif self.meshStretching == ct.TANH:
+            # two-sided hyperbolic tangent, clustered at both walls
+            coordinate = np.tanh(self.stretchingFactor * np.linspace(
+                -1., 1., nodeNumber)) / np.tanh(self.stretchingFactor)
+            axis = initialPosition + \
+                0.5 * (finalPosition - initialPosition) * (1. + coordinate)
+
+        else:
+            # spacing growing by stretchingFactor from both walls
+            exponent = np.arange(nodeNumber - 1)
+            spacing = self.stretchingFactor ** np.minimum(
+                exponent, nodeNumber - 2 - exponent)
+            axis = initialPosition + (finalPosition - initialPosition) * \
+                np.concatenate(([0.], np.cumsum(spacing))) / spacing.sum()
+
+        axis[0] = initialPosition
+        axis[-1] = finalPosition
+
+        # spacing between the neighbour nodes, ghost nodes included, which
+        # are at the spacing of the wall, and width of each control volume
+        spacing = np.diff(axis)
+        spacing = np.concatenate(([spacing[0]], spacing, [spacing[-1]]))
+        width = 0.5 * (spacing[:-1] + spacing[1:])
+
+        return axis, spacing, width
+
+    def getSourceNodes(self) -> tuple:
+
+        nodeHeatSourceEnd2: int
+        nodeHeatSourceEnd1: int
+        nodeHeatSourceStart1: int
+        nodeHeatSourceStart2: int
+
+        nodeHeatSourceStart1, nodeHeatSourceEnd1 = self.__getSourceRange(
+            self.axisX, self.heatSourcePositionStart1,
+            self.heatSourcePositionEnd1)
+        nodeHeatSourceStart2, nodeHeatSourceEnd2 = self.__getSourceRange(
+            self.axisX, self.heatSourcePositionStart2,
+            self.heatSourcePositionEnd2)
+
+        return nodeHeatSourceEnd1, nodeHeatSourceStart1, nodeHeatSourceEnd2, \
+            nodeHeatSourceStart2
+
+    @staticmethod
+    def __getSourceRange(
+            axisX: np.array, positionStart: float, positionEnd: float) -> \
+            tuple:
+
+        nodeStart: int
+        nodeEnd: int
+
+        # first and last nodes inside [positionStart, positionEnd], shifted
+        # by the ghost node, or (0, 0) if there is none
+        nodeStart = int(np.searchsorted(axisX, positionStart, side="left"))
+        nodeEnd = int(np.searchsorted(axisX, positionEnd, side="right")) - 1
+
+        if nodeStart > nodeEnd:
+            return 0, 0
+
+        return nodeStart + 1, nodeEnd + 1
+
+    def getTimeVector(self) -> TimeAxis:
+
+        return self.runContext.time
+
+    def getCoordinates(self) -> tuple:
+
+        nx: int
+        ny: int
+        nodes: np.array
+        coordinatesX: np.array
+        coordinatesY: np.array
+
+        nx = self.nodeNumberX
+        ny = self.nodeNumberY
+
+        nodes = np.arange(ny * nx)
+
+        # node k is at column k % nx and row k // nx, on the axes of the
+        # stretched meshes
+        if self.meshStretching != ct.UNIFORM:
+            return self.axisX[nodes % nx], self.axisY[nodes // nx]
+
+        coordinatesX = self.initialPositionX + self.deltaX * (nodes % nx)
+        coordinatesY = self.initialPositionY + self.deltaY * (nodes // nx)
+
+        return coordinatesX, coordinatesY
+
+    def getMeshgrid(self):
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+        axisX = np.linspace(self.initialPositionX, self.finalPositionX, mnx)
+        axisY = np.linspace(self.initialPositionY, self.finalPositionY, mny)
+
+        coordinatesX, coordinatesY = np.meshgrid(axisX, axisY)
+
+        return coordinatesX, coordinatesY
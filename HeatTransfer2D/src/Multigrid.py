@@ -0,0 +1,375 @@
+# *****************************************************************************
+# *                       MULTIGRID - 2D HEAT TRANSFER                        *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: geometric multigrid solver (V-cycle or F-cycle) for five-    *
+# * point systems written on the ghost-celled (mny, mnx) arrays:              *
+# *                                                                           *
+# *   cC * u_P + cX * (u_E + u_W) + cY * (u_N + u_S) = f_P                    *
+# *                                                                           *
+# * with cC = shift - 2 * cX - 2 * cY. The ghost nodes follow the relations   *
+# * ghost = center * interior + external, so Dirichlet, Robin and Neumann     *
+# * surfaces are handled the same way. The coarse levels are rediscretized by *
+# * doubling the spacing, the smoother is the red-black Gauss-Seidel and the  *
+# * transfers are the bilinear prolongation and its transpose, the full      *
+# * weighting restriction, both through the ghost relations of the walls.    *
+# *****************************************************************************
+import numpy as np
+import Constants as ct
+from MeshGenerator import MeshGenerator
+
+
+class Multigrid(MeshGenerator):
+
+    def __init__(self):
+
+        super().__init__()
+
+    # ======================================================================== #
+    # PRIVATE METHODS                                                          #
+    # ======================================================================== #
+    @staticmethod
+    def __applyGhostRelations(
+            solution: np.array, level: tuple, ghostRelations: tuple = None) \
+            -> None:
+
+        centerSouth, centerNorth, centerWest, centerEast = level[3:7]
+
+        if ghostRelations is None:
+            solution[0, 1:-1] = centerSouth * solution[1, 1:-1]
+            solution[-1, 1:-1] = centerNorth * solution[-2, 1:-1]
+            solution[1:-1, 0] = centerWest * solution[1:-1, 1]
+            solution[1:-1, -1] = centerEast * solution[1:-1, -2]
+        else:
+            externalSouth, externalNorth, externalWest, externalEast = \
+                ghostRelations[1::2]
+
+            solution[0, 1:-1] = \
+                centerSouth * solution[1, 1:-1] + externalSouth
+            solution[-1, 1:-1] = \
+                centerNorth * solution[-2, 1:-1] + externalNorth
+            solution[1:-1, 0] = \
+                centerWest * solution[1:-1, 1] + externalWest
+            solution[1:-1, -1] = \
+                centerEast * solution[1:-1, -2] + externalEast
+
+        # corners are only read by the bilinear prolongation
+        solution[0, 0] = 0.5 * (solution[0, 1] + solution[1, 0])
+        solution[0, -1] = 0.5 * (solution[0, -2] + solution[1, -1])
+        solution[-1, 0] = 0.5 * (solution[-1, 1] + solution[-2, 0])
+        solution[-1, -1] = 0.5 * (solution[-1, -2] + solution[-2, -1])
+
+    @staticmethod
+    def __getResidual(
+            solution: np.array, rightHandSide: np.array, level: tuple) -> \
+            np.array:
+
+        coefficientX, coefficientY, coefficientCenter = level[0:3]
+
+        return rightHandSide - (
+            coefficientCenter * solution[1:-1, 1:-1] +
+            coefficientX * (solution[1:-1, 2:] + solution[1:-1, :-2]) +
+            coefficientY * (solution[2:, 1:-1] + solution[:-2, 1:-1]))
+
+    def __smooth(
+            self, solution: np.array, rightHandSide: np.array, level: tuple,
+            sweeps: int, ghostRelations: tuple = None) -> None:
+
+        coefficientX, coefficientY, coefficientCenter = level[0:3]
+        redNodes = level[8]
+
+        for k in range(sweeps):
+            for colorNodes in (redNodes, ~redNodes):
+
+                self.__applyGhostRelations(solution, level, ghostRelations)
+
+                estimate = (rightHandSide - coefficientX * (
+                    solution[1:-1, 2:] + solution[1:-1, :-2]) -
+                    coefficientY * (
+                    solution[2:, 1:-1] + solution[:-2, 1:-1])) / \
+                    coefficientCenter
+
+                solution[1:-1, 1:-1][colorNodes] = estimate[colorNodes]
+
+        if level[7]:
+            solution[1:-1, 1:-1] -= solution[1:-1, 1:-1].mean()
+
+    @staticmethod
+    def __coarsenGhostCenter(center: np.array) -> np.array:
+
+        # ghost = c * interior is a Robin condition on the face between both
+        # nodes, (du/dn) = kappa * u with kappa * delta = 2 * (c - 1) / (c + 1).
+        # Doubling the spacing keeps kappa, so c becomes (3c - 1) / (3 - c).
+        center = 0.5 * (center[0::2] + center[1::2])
+
+        return (3. * center - 1.) / (3. - center)
+
+    def __solveCoarsest(
+            self, solution: np.array, rightHandSide: np.array, level: tuple,
+            ghostRelations: tuple = None) -> None:
+
+        coarsestInverse = level[9]
+
+        if coarsestInverse is None:
+            self.__smooth(
+                solution, rightHandSide, level, self.coarsestSweeps,
+                ghostRelations)
+            return
+
+        self.__applyGhostRelations(solution, level, ghostRelations)
+
+        solution[1:-1, 1:-1] += (coarsestInverse @ self.__getResidual(
+            solution, rightHandSide, level).ravel()).reshape(
+            rightHandSide.shape)
+
+        if level[7]:
+            solution[1:-1, 1:-1] -= solution[1:-1, 1:-1].mean()
+
+    def __getCoarsestInverse(self, level: tuple) -> np.array:
+
+        k: int
+        ny: int
+        nx: int
+        unitVector: np.array
+        coarsestMatrix: np.array
+
+        ny, nx = level[8].shape
+
+        # small levels are solved exactly, the others are only smoothed
+        if nx * ny > 1024:
+            return None
+
+        coarsestMatrix = np.zeros((nx * ny, nx * ny), dtype=np.float64)
+        unitVector = np.zeros((ny + 2, nx + 2), dtype=np.float64)
+
+        for k in range(nx * ny):
+            unitVector[:, :] = 0.
+            unitVector[1 + k // nx, 1 + k % nx] = 1.
+
+            self.__applyGhostRelations(unitVector, level)
+
+            coarsestMatrix[:, k] = - self.__getResidual(
+                unitVector, np.zeros((ny, nx), dtype=np.float64),
+                level).ravel()
+
+        if level[7]:
+            return np.linalg.pinv(coarsestMatrix)
+
+        return np.linalg.inv(coarsestMatrix)
+
+    @staticmethod
+    def __restrict(residual: np.array, coarseLevel: tuple) -> np.array:
+
+        ny: int
+        nx: int
+        coarseResidual: np.array
+
+        centerSouth, centerNorth, centerWest, centerEast = coarseLevel[3:7]
+
+        ny = residual.shape[0] // 2
+        nx = residual.shape[1] // 2
+
+        coarseResidual = np.zeros((ny + 2, nx + 2), dtype=residual.dtype)
+
+        # transpose of the prolongation: a fine residual goes back to the
+        # four coarse nodes it is interpolated from, with the same weights
+        for a, rows in ((0, slice(0, -2)), (1, slice(2, None))):
+            for b, columns in ((0, slice(0, -2)), (1, slice(2, None))):
+                coarseResidual[1:-1, 1:-1] += 0.5625 * residual[a::2, b::2]
+                coarseResidual[rows, 1:-1] += 0.1875 * residual[a::2, b::2]
+                coarseResidual[1:-1, columns] += 0.1875 * residual[a::2, b::2]
+                coarseResidual[rows, columns] += 0.0625 * residual[a::2, b::2]
+
+        # the coarse ghost nodes are c * interior, so their share goes back
+        # to the interior node times c (the corners average two ghosts)
+        coarseResidual[1, 1:-1] += centerSouth * coarseResidual[0, 1:-1]
+        coarseResidual[-2, 1:-1] += centerNorth * coarseResidual[-1, 1:-1]
+        coarseResidual[1:-1, 1] += centerWest * coarseResidual[1:-1, 0]
+        coarseResidual[1:-1, -2] += centerEast * coarseResidual[1:-1, -1]
+        coarseResidual[1, 1] += 0.5 * (
+            centerSouth[0] + centerWest[0]) * coarseResidual[0, 0]
+        coarseResidual[1, -2] += 0.5 * (
+            centerSouth[-1] + centerEast[0]) * coarseResidual[0, -1]
+        coarseResidual[-2, 1] += 0.5 * (
+            centerNorth[0] + centerWest[-1]) * coarseResidual[-1, 0]
+        coarseResidual[-2, -2] += 0.5 * (
+            centerNorth[-1] + centerEast[-1]) * coarseResidual[-1, -1]
+
+        # four fine volumes per coarse one
+        return 0.25 * coarseResidual[1:-1, 1:-1]
+
+    @staticmethod
+    def __prolongate(correction: np.array) -> np.array:
+
+        ny: int
+        nx: int
+        fineCorrection: np.array
+
+        ny = 2 * (correction.shape[0] - 2)
+        nx = 2 * (correction.shape[1] - 2)
+
+        fineCorrection = np.zeros((ny, nx), dtype=correction.dtype)
+
+        # a fine node takes 9/16 of its coarse node, 3/16 of the two closest
+        # coarse neighbours and 1/16 of the diagonal one
+        for a, rows in ((0, slice(0, -2)), (1, slice(2, None))):
+            for b, columns in ((0, slice(0, -2)), (1, slice(2, None))):
+                fineCorrection[a::2, b::2] = \
+                    0.5625 * correction[1:-1, 1:-1] + \
+                    0.1875 * correction[rows, 1:-1] + \
+                    0.1875 * correction[1:-1, columns] + \
+                    0.0625 * correction[rows, columns]
+
+        return fineCorrection
+
+    def __cycle(
+            self, levels: list, index: int, solution: np.array,
+            rightHandSide: np.array, cycleType: str,
+            ghostRelations: tuple = None) -> None:
+
+        level: tuple
+        coarseSolution: np.array
+        coarseRightHandSide: np.array
+
+        level = levels[index]
+
+        if index == len(levels) - 1:
+            self.__solveCoarsest(
+                solution, rightHandSide, level, ghostRelations)
+            return
+
+        self.__smooth(
+            solution, rightHandSide, level, self.preSmoothingSweeps,
+            ghostRelations)
+
+        self.__applyGhostRelations(solution, level, ghostRelations)
+
+        coarseRightHandSide = self.__restrict(
+            self.__getResidual(solution, rightHandSide, level),
+            levels[index + 1])
+        coarseSolution = np.zeros(
+            (coarseRightHandSide.shape[0] + 2,
+             coarseRightHandSide.shape[1] + 2), dtype=solution.dtype)
+
+        if cycleType == ct.F_CYCLE:
+            self.__cycle(
+                levels, index + 1, coarseSolution, coarseRightHandSide,
+                ct.F_CYCLE)
+
+        self.__cycle(
+            levels, index + 1, coarseSolution, coarseRightHandSide,
+            ct.V_CYCLE)
+
+        self.__applyGhostRelations(coarseSolution, levels[index + 1])
+
+        solution[1:-1, 1:-1] += self.__prolongate(coarseSolution)
+
+        self.__smooth(
+            solution, rightHandSide, level, self.postSmoothingSweeps,
+            ghostRelations)
+
+    # ======================================================================== #
+    #   PUBLIC METHODS
+    # ======================================================================== #
+    def getMultigridLevels(
+            self, coefficientShift: float, coefficientX: float,
+            coefficientY: float, ghostRelations: tuple) -> list:
+
+        nx: int
+        ny: int
+        level: tuple
+        levels: list
+        singular: bool
+        redNodes: np.array
+
+        nx = self.nodeNumberX
+        ny = self.nodeNumberY
+
+        centerSouth, centerNorth, centerWest, centerEast = ghostRelations[0::2]
+
+        # without the shift and with pure Neumann surfaces the solution is
+        # defined up to a constant, which is fixed by a zero mean
+        singular = coefficientShift == 0. and all(
+            np.all(center == 1.) for center in ghostRelations[0::2])
+
+        levels = []
+
+        while True:
+
+            redNodes = np.add.outer(np.arange(ny), np.arange(nx)) % 2 == 0
+
+            level = (
+                coefficientX, coefficientY,
+                coefficientShift - 2 * coefficientX - 2 * coefficientY,
+                centerSouth, centerNorth, centerWest, centerEast, singular,
+                redNodes)
+
+            if nx % 2 != 0 or ny % 2 != 0 or \
+                    min(nx, ny) // 2 < self.coarsestNodeNumber:
+                levels.append(level + (self.__getCoarsestInverse(level),))
+                break
+
+            levels.append(level + (None,))
+
+            nx = nx // 2
+            ny = ny // 2
+            coefficientX = 0.25 * coefficientX
+            coefficientY = 0.25 * coefficientY
+            centerSouth = self.__coarsenGhostCenter(centerSouth)
+            centerNorth = self.__coarsenGhostCenter(centerNorth)
+            centerWest = self.__coarsenGhostCenter(centerWest)
+            centerEast = self.__coarsenGhostCenter(centerEast)
+
+        return levels
+
+    def solveMultigrid(
+            self, solution: np.array, rightHandSide: np.array, levels: list,
+            ghostRelations: tuple, tolerance: float) -> np.array:
+
+        k: int
+        norm: float
+        mnx: int
+        mny: int
+        estimateSolution: np.array
+        temporarySolution: np.array
+        interiorRightHandSide: np.array
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        estimateSolution = solution.copy()
+        interiorRightHandSide = rightHandSide[1:mny-1, 1:mnx-1]
+
+        if levels[0][7]:
+            interiorRightHandSide = \
+                interiorRightHandSide - interiorRightHandSide.mean()
+
+        k = 0
+        norm = 0.
+
+        for k in range(self.maxIterations + 1):
+
+            temporarySolution = estimateSolution[1:mny-1, 1:mnx-1].copy()
+
+            self.__cycle(
+                levels, 0, estimateSolution, interiorRightHandSide,
+                self.multigridCycle, ghostRelations)
+
+            norm = np.sqrt(((
+                estimateSolution[1:mny-1, 1:mnx-1] - temporarySolution) ** 2
+                ).sum(dtype=np.float64))
+
+            if norm <= tolerance:
+                break
+
+        self.__applyGhostRelations(
+            estimateSolution, levels[0], ghostRelations)
+
+        # if (k >= self.maxIterations) and (norm > tolerance):
+        #     print(
+        #         "WARNING:: Multigrid did not converged!, "
+        #         "error = {}, num iter = {}".format(norm, k))
+
+        return estimateSolution
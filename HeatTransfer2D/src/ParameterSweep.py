@@ -0,0 +1,144 @@
+# *****************************************************************************
+# *                   PARAMETER SWEEP - 2D HEAT TRANSFER                      *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: runs the heat problem for every combination of a grid of     *
+# * control parameters. Each case is an independent Solid and Solver in a     *
+# * process pool, writes its outputs under its own case name and returns a    *
+# * summary of its probes and energy balance. The summaries are gathered in   *
+# * one results table. Command line usage:                                    *
+# *                                                                           *
+# *   python ParameterSweep.py convection=10,20,40 heatSource=5E4,1E5         *
+# *                                                                           *
+# *****************************************************************************
+import os
+import ast
+import argparse
+import itertools
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+import Constants as ct
+import ControlParameters
+from Solid import Solid
+from Solver import Solver
+from PostProcess import PostProcess
+
+
+class ParameterSweep(PostProcess):
+
+    def __init__(self):
+
+        super().__init__()
+
+    @staticmethod
+    def runCase(caseName: str, parameters: dict) -> dict:
+
+        solid: Solid
+        solver: Solver
+        summary: dict
+        probesDf: pd.DataFrame
+
+        # the components of this case read their parameters from the overrides
+        ControlParameters.PARAMETER_OVERRIDES.clear()
+        ControlParameters.PARAMETER_OVERRIDES.update(
+            parameters, caseName=caseName)
+
+        solid = Solid()
+        solver = Solver()
+
+        if solver.problemType == ct.DIRICHLET_PROBLEM:
+            solver.solve2DDirichletProblem(solid)
+        else:
+            solver.solve2DRobinProblem(solid)
+
+        probesDf = solver.readOutput(solver.getProbesOutputPath)
+
+        summary = {"case": caseName}
+        summary.update(parameters)
+        summary["energyBalance"] = solid.energyBalance
+        summary["steadyStateTime"] = solid.steadyStateTime
+        summary["maxTemperature"] = solid.temperature[
+            1:solid.maxNodeNumberY - 1, 1:solid.maxNodeNumberX - 1].max()
+
+        for name in solid.getProbeNames():
+            summary[name] = probesDf[name].iloc[-1]
+            summary[name + "Max"] = probesDf[name].max()
+
+        return summary
+
+    def getCases(self, parameterGrid: dict) -> list:
+
+        name: str
+        values: tuple
+        caseWidth: int
+
+        for name in parameterGrid:
+            if not hasattr(self, name):
+                print("ERROR:: {} is not a control parameter!".format(name))
+                exit()
+
+        values = tuple(itertools.product(*parameterGrid.values()))
+        caseWidth = len(str(len(values)))
+
+        return [
+            ("case{:0{}d}".format(k, caseWidth),
+             dict(zip(parameterGrid.keys(), caseValues)))
+            for k, caseValues in enumerate(values)]
+
+    def runSweep(
+            self, parameterGrid: dict, workers: int = None) -> pd.DataFrame:
+
+        cases: list
+        results: pd.DataFrame
+
+        cases = self.getCases(parameterGrid)
+
+        with ProcessPoolExecutor(
+                max_workers=workers or os.cpu_count()) as executor:
+            results = pd.DataFrame(list(executor.map(
+                self.runCase, *zip(*cases))))
+
+        self.saveOutputs(results, self.getSweepOutputPath(parameterGrid))
+
+        return results
+
+
+def parseParameterGrid(arguments: list) -> dict:
+
+    name: str
+    values: str
+    parameterGrid: dict
+
+    parameterGrid = {}
+
+    for argument in arguments:
+        if "=" not in argument:
+            print("ERROR:: Write the sweep parameters as name=v1,v2,...!")
+            exit()
+
+        name, values = argument.split("=", 1)
+        parameterGrid[name] = [
+            ast.literal_eval(value) for value in values.split(",")]
+
+    return parameterGrid
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(
+        description="Parameter sweep of the 2D heat transfer problem.")
+    parser.add_argument(
+        "parameters", nargs="+", help="control parameters, name=v1,v2,...")
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="processes of the pool (default: number of cores)")
+
+    arguments = parser.parse_args()
+
+    sweep = ParameterSweep()
+
+    with pd.option_context("display.max_columns", None):
+        print(sweep.runSweep(
+            parseParameterGrid(arguments.parameters), arguments.workers))
@@ -1,289 +1,454 @@
-import numpy as np
-import pandas as pd
-import Constants as ct
-from matplotlib import pyplot, cm
-from MeshGenerator import MeshGenerator
-from DirectoryManager import DirectoryManager
-
-
-class PostProcess(DirectoryManager, MeshGenerator):
-
-    def __init__(self):
-        super().__init__()
-
-    @staticmethod
-    def saveOutputs(dataframe: pd.DataFrame, filename: str) -> None:
-        dataframe.to_csv(
-            filename, sep=ct.FILE_SEP, header=True, index=False,
-            decimal=ct.DECIMAL_SEP, encoding='utf-8')
-
-    @staticmethod
-    def readOutput(filename: str) -> pd.DataFrame:
-        dataframe: pd.DataFrame
-
-        dataframe = pd.read_csv(
-            filename, sep=ct.FILE_SEP, decimal=ct.DECIMAL_SEP)
-
-        return dataframe
-
-    def plotTemperatureDistribution(
-            self, fileFormat: str = 'jpg', fileDpi: int = 1000) -> None:
-
-        filename: str
-
-        temperatureDf: pd.DataFrame
-
-        axisX: np.ndarray
-        axisY: np.ndarray
-        temperature: np.ndarray
-        coordinatesX: np.ndarray
-        coordinatesY: np.ndarray
-
-        temperatureDf = self.readOutput(self.getTemperatureOutputPath)
-        # temperatureDf = self.readOutput(self.getAnalyticalSolutionPath)
-
-        nx = self.nodeNumberX
-        ny = self.nodeNumberY
-        axisX = np.linspace(self.initialPositionX, self.finalPositionX, nx)
-        axisY = np.linspace(self.initialPositionY, self.finalPositionY, ny)
-        coordinatesX, coordinatesY = np.meshgrid(axisX, axisY)
-
-        temperature = temperatureDf["temperature"].to_numpy().reshape((ny, nx))
-
-        pyplot.figure(figsize=(20, 13), dpi=fileDpi)
-        pyplot.contourf(
-            coordinatesX, coordinatesY, temperature, alpha=0.5, cmap=cm.jet)
-        filename = self.getTemperatureOutputStreamline
-        cbar = pyplot.colorbar()
-        cbar.ax.tick_params(labelsize=40)
-        pyplot.contour(coordinatesX, coordinatesY, temperature, cmap=cm.jet)
-        pyplot.xlabel('x (m)', fontsize=40)
-        pyplot.ylabel('y (m)', fontsize=40)
-        pyplot.tick_params(axis='both', labelsize=40)
-        pyplot.savefig(
-            filename + "." + fileFormat, dpi=fileDpi, format=fileFormat)
-        pyplot.savefig(filename + "." + "pdf", dpi=fileDpi, format="pdf")
-        pyplot.show()
-
-    def plotProbesEvolution(self) -> None:
-
-        time: np.array
-        dpi_m: np.float
-        probe1: np.array
-        probe2: np.array
-        probe3: np.array
-        filename: str
-        probe1Df: pd.DataFrame
-        probe2Df: pd.DataFrame
-        probe3Df: pd.DataFrame
-
-        filename = self.getProbesPlotPath
-
-        probe1Df = self.readOutput(self.getProbe1OutputPath)
-        probe2Df = self.readOutput(self.getProbe2OutputPath)
-        probe3Df = self.readOutput(self.getProbe3OutputPath)
-
-        time = probe1Df["t"].to_numpy()
-        probe1 = probe1Df["probe"].to_numpy()
-        probe2 = probe2Df["probe"].to_numpy()
-        probe3 = probe3Df["probe"].to_numpy()
-
-        dpi_m = 1000
-        pyplot.figure(num=2, figsize=(14, 11), dpi=dpi_m)
-        pyplot.style.use('classic')
-        pyplot.plot(
-            time, probe1, color='black', linestyle='-', linewidth=2.5,
-            label="probe 1 (0.01, 0.000)")
-        pyplot.plot(
-            time, probe2, color='red', linestyle='-', linewidth=2.5,
-            label="probe 2 (0.01, 0.005)")
-        pyplot.plot(
-            time, probe3, color='magenta', linestyle='-', linewidth=2.5,
-            label="probe 3 (0.01, 0.010)")
-        pyplot.xlabel('t (s)', fontsize=35)
-        pyplot.ylabel(r'T ($^{\circ}$C)', fontsize=35)
-        # pyplot.axis([-0.1, 1.1, -0.1, 1.1])
-        pyplot.tick_params(axis='both', labelsize=35)
-        pyplot.tick_params(axis='both', labelsize=35)
-        pyplot.legend(loc="upper left", frameon=False, ncol=1, fontsize=30)
-        pyplot.grid()
-        pyplot.savefig(filename + ".pdf", dpi=dpi_m, format='pdf')
-        pyplot.show()
-        pyplot.close()
-
-    def plotDataComparison(self, fileFormat: str = 'pdf', fileDpi: int =
-            1000):
-
-        filename: str
-
-        pressureDf: pd.DataFrame
-        velocityXDf: pd.DataFrame
-        velocityYDf: pd.DataFrame
-
-        velocityX: np.ndarray
-        velocityY: np.ndarray
-        coordinatesX: np.ndarray
-        coordinatesY: np.ndarray
-
-        filenameCompY = self.getDirFigure + ct.OS_SEP + \
-            "ComparisonAxisY_{}x{}".format(
-                self.nodeNumberX, self.nodeNumberY)
-
-        filenameCompX= self.getDirFigure + ct.OS_SEP + \
-            "ComparisonAxisX_{}x{}".format(
-                self.nodeNumberX, self.nodeNumberY)
-
-        tempAnalyticalDf = self.readOutput(self.getAnalyticalSolutionPath)
-        tempNumericalDf = self.readOutput(self.getTemperatureOutputPath)
-
-        nx = self.nodeNumberX
-        ny = self.nodeNumberY
-        axisX = np.linspace(self.initialPositionX, self.finalPositionX, nx)
-        axisY = np.linspace(self.initialPositionY, self.finalPositionY, ny)
-        coordinatesX, coordinatesY = np.meshgrid(axisX, axisY)
-
-        tempAnalytical = tempAnalyticalDf['temperature'].to_numpy().reshape(
-            (ny, nx))
-        tempNumerical = tempNumericalDf['temperature'].to_numpy().reshape(
-            (ny, nx))
-
-        L2_error_norm = np.sum((tempAnalytical - tempNumerical)**2)
-        L2_norm = np.sum(tempAnalytical**2)
-
-        L2_error = np.sqrt(L2_error_norm/L2_norm)
-
-        relativeError = np.divide(
-            abs(tempAnalytical - tempNumerical), abs(tempAnalytical),
-            out=np.zeros(tempAnalytical.shape, dtype=float),
-            where=tempAnalytical!=0)
-
-        L1_error = np.mean(relativeError, where=relativeError<1)
-
-        print("L2-Error: {}".format(L2_error))
-        print("L1-Error: {}".format(L1_error))
-
-        positionX = \
-            (coordinatesX[0,:] > 0.01 - self.deltaX) & \
-            (coordinatesX[0,:] < 0.01 + self.deltaX)
-
-        positionY = \
-            (coordinatesY[:, 0] > 0.005 - self.deltaY) & \
-            (coordinatesY[:, 0] < 0.005 + self.deltaY)
-
-        axisY = coordinatesY[:, positionX].mean(axis=1)
-        axisX = coordinatesX[positionY, :].mean(axis=0)
-        tempNumericalX = tempNumerical[:, positionX].mean(axis=1)
-        tempNumericalY = tempNumerical[positionY, :].mean(axis=0)
-
-        tempAnalyticalX = tempAnalytical[:, positionX].mean(axis=1)
-        tempAnalyticalY = tempAnalytical[positionY, :].mean(axis=0)
-
-        indices = np.arange(0, 255, 4)
-
-        pyplot.figure(num=1, figsize=(18,14), dpi=fileDpi)
-        pyplot.style.use('classic')
-        pyplot.plot(tempNumericalX, axisY, color='black', linestyle='-',
-            linewidth=2, label='FVM')
-        pyplot.plot(np.take(tempAnalyticalX, indices),
-            np.take(axisY, indices), color='red', linestyle='',
-            marker="o", markersize=8, markeredgecolor='red',
-            label='Analytical')
-        pyplot.xlabel(r"$T$ ($^{\circ}$C)", fontsize=40)
-        pyplot.ylabel(r"$y$ (m)", fontsize=40)
-        pyplot.tick_params(axis='both', labelsize=40)
-        pyplot.legend(loc='lower right', frameon=False, ncol=1, fontsize=40)
-        pyplot.grid()
-        pyplot.savefig(filenameCompY + "." + fileFormat, dpi=fileDpi,
-            format=fileFormat)
-
-        pyplot.figure(num=2, figsize=(17, 14), dpi=fileDpi)
-        pyplot.style.use('classic')
-        pyplot.plot(axisX, tempNumericalY, color='black', linestyle='-', linewidth=2,
-                 label='FVM')
-        pyplot.plot(np.take(axisX, indices), np.take(tempAnalyticalY, indices),
-            color='red', linestyle='', marker="o", markersize=8,
-            markeredgecolor='red', label='Analytical')
-        pyplot.ylabel(r"$T$ ($^{\circ}$C)", fontsize=40)
-        pyplot.xlabel(r"$x$ (m)", fontsize=40)
-        pyplot.tick_params(axis='both', labelsize=40)
-        pyplot.legend(loc='lower left', frameon=False, ncol=1, fontsize=40)
-        pyplot.grid()
-        pyplot.savefig(filenameCompX + "." + fileFormat, dpi=fileDpi,
-            format=fileFormat)
-
-    def plotProfiles(self, fileFormat: str = 'pdf', fileDpi: int =1000):
-
-        filename: str
-
-        pressureDf: pd.DataFrame
-        velocityXDf: pd.DataFrame
-        velocityYDf: pd.DataFrame
-
-        velocityX: np.ndarray
-        velocityY: np.ndarray
-        coordinatesX: np.ndarray
-        coordinatesY: np.ndarray
-
-        filenameCompY = self.getDirFigure + ct.OS_SEP + \
-            "profileCenterAxisY_{}x{}".format(
-                self.nodeNumberX, self.nodeNumberY)
-
-        filenameCompX= self.getDirFigure + ct.OS_SEP + \
-            "profileCenterAxisX_{}x{}".format(
-                self.nodeNumberX, self.nodeNumberY)
-
-        tempNumericalDf = self.readOutput(self.getTemperatureOutputPath)
-
-        nx = self.nodeNumberX
-        ny = self.nodeNumberY
-        axisX = np.linspace(self.initialPositionX, self.finalPositionX, nx)
-        axisY = np.linspace(self.initialPositionY, self.finalPositionY, ny)
-        coordinatesX, coordinatesY = np.meshgrid(axisX, axisY)
-
-        tempNumerical = tempNumericalDf['temperature'].to_numpy().reshape(
-            (ny, nx))
-
-        positionCenterX = \
-            (coordinatesX[0,:] > 0.01 - self.deltaX) & \
-            (coordinatesX[0,:] < 0.01 + self.deltaX)
-
-        positionSourceX = \
-            (coordinatesX[0, :] > 0.0055 - self.deltaX) & (
-             coordinatesX[0, :] < 0.0055 + self.deltaX)
-
-        positionY = \
-            (coordinatesY[:, 0] > 0.005 - self.deltaY) & \
-            (coordinatesY[:, 0] < 0.005 + self.deltaY)
-
-        axisCenterY = coordinatesY[:, positionCenterX].mean(axis=1)
-        axisSourceY = coordinatesY[:, positionSourceX].mean(axis=1)
-        axisX = coordinatesX[positionY, :].mean(axis=0)
-        tempNumericalCenterX = tempNumerical[:, positionCenterX].mean(axis=1)
-        tempNumericalSourceX = tempNumerical[:, positionSourceX].mean(axis=1)
-        tempNumericalY = tempNumerical[positionY, :].mean(axis=0)
-
-        pyplot.figure(num=1, figsize=(18,14), dpi=fileDpi)
-        pyplot.style.use('classic')
-        pyplot.plot(tempNumericalCenterX, axisCenterY, color='black',
-            linestyle='-', linewidth=2, label='geometrical center')
-        pyplot.plot(tempNumericalSourceX, axisSourceY,
-            color='red', linestyle='', marker="o", markersize=8,
-            markeredgecolor='red', label='source center')
-        pyplot.xlabel(r"$T$ ($^{\circ}$C)", fontsize=40)
-        pyplot.ylabel(r"$y$ (m)", fontsize=40)
-        pyplot.tick_params(axis='both', labelsize=40)
-        pyplot.legend(loc='upper right', frameon=False, ncol=1, fontsize=40)
-        pyplot.grid()
-        pyplot.savefig(filenameCompY + "." + fileFormat, dpi=fileDpi,
-            format=fileFormat)
-
-        pyplot.figure(num=2, figsize=(17, 14), dpi=fileDpi)
-        pyplot.style.use('classic')
-        pyplot.plot(
-            axisX, tempNumericalY, color='black', linestyle='-', linewidth=2)
-        pyplot.ylabel(r"$T$ ($^{\circ}$C)", fontsize=40)
-        pyplot.xlabel(r"$x$ (m)", fontsize=40)
-        pyplot.tick_params(axis='both', labelsize=40)
-        pyplot.grid()
-        pyplot.savefig(filenameCompX + "." + fileFormat, dpi=fileDpi,
-            format=fileFormat)
+import os
+import glob
+import hashlib
+import argparse
+import numpy as np
+import pandas as pd
+import Constants as ct
+from matplotlib import pyplot, cm
+from MeshGenerator import MeshGenerator
+from DirectoryManager import DirectoryManager
+from SnapshotStore import SnapshotStore
+
+
+class PostProcess(DirectoryManager, MeshGenerator):
+
+    def __init__(self):
+        super().__init__()
+
+    @staticmethod
+    def __getMeshPath(filename: str, meshHash: str) -> str:
+
+        # the manifests are in the mesh directory of the same reports
+        return os.path.dirname(os.path.dirname(os.path.abspath(filename))) + \
+            ct.OS_SEP + ct.DIR_MESH + ct.OS_SEP + ct.MESH_OUTPUT + \
+            "_{}{}".format(meshHash, os.path.splitext(filename)[1])
+
+    @staticmethod
+    def saveOutputs(
+            dataframe: pd.DataFrame, filename: str, meshHash: str = None) -> \
+            None:
+
+        name: str
+        values: np.array
+        columns: dict
+
+        if not filename.endswith("." + ct.NPZ):
+            with open(filename, "w", encoding='utf-8') as file:
+                if meshHash:
+                    file.write(
+                        ct.MESH_REFERENCE + ct.FILE_SEP + meshHash + "\n")
+
+                dataframe.to_csv(
+                    file, sep=ct.FILE_SEP, header=True, index=False,
+                    decimal=ct.DECIMAL_SEP)
+            return
+
+        columns = {}
+
+        for name in dataframe.columns:
+            values = dataframe[name].to_numpy()
+
+            # text columns are stored without pickles
+            columns[str(name)] = \
+                values.astype(str) if values.dtype == object else values
+
+        if meshHash:
+            columns[ct.MESH_REFERENCE] = np.array(meshHash)
+
+        # one uncompressed array per column, read back without parsing
+        with open(filename, "wb") as file:
+            np.savez(file, **columns)
+
+    @staticmethod
+    def readOutput(filename: str, withMesh: bool = True) -> pd.DataFrame:
+
+        root: str
+        line: str
+        binary: bool
+        meshHash: str
+        extension: str
+        mesh: pd.DataFrame
+        dataframe: pd.DataFrame
+
+        # an output of the other format, e.g. the CSVs of an older run
+        if not os.path.exists(filename):
+            root = os.path.splitext(filename)[0]
+
+            for extension in (ct.NPZ, ct.CSV):
+                if os.path.exists(root + "." + extension):
+                    filename = root + "." + extension
+                    break
+
+        # the format is detected from the file, not from its extension
+        with open(filename, "rb") as file:
+            binary = file.read(len(ct.NPZ_MAGIC)) == ct.NPZ_MAGIC
+
+        meshHash = None
+
+        if binary:
+            with np.load(filename) as data:
+                if ct.MESH_REFERENCE in data.files:
+                    meshHash = str(data[ct.MESH_REFERENCE])
+
+                dataframe = pd.DataFrame({
+                    name: data[name] for name in data.files
+                    if name != ct.MESH_REFERENCE})
+        else:
+            with open(filename, "r", encoding='utf-8') as file:
+                line = file.readline()
+
+                if line.startswith(ct.MESH_REFERENCE + ct.FILE_SEP):
+                    meshHash = line.strip().split(ct.FILE_SEP)[1]
+                else:
+                    file.seek(0)
+
+                dataframe = pd.read_csv(
+                    file, sep=ct.FILE_SEP, decimal=ct.DECIMAL_SEP)
+
+        if meshHash is None:
+            return dataframe
+
+        dataframe.attrs[ct.MESH_REFERENCE] = meshHash
+
+        if not withMesh:
+            return dataframe
+
+        # the coordinates of the nodes come back from the manifest
+        mesh = PostProcess.readOutput(
+            PostProcess.__getMeshPath(filename, meshHash))
+
+        if mesh.shape[0] != dataframe.shape[0]:
+            print("ERROR:: The mesh {} does not match {}!".format(
+                meshHash, filename))
+            exit()
+
+        mesh = pd.concat((mesh, dataframe), axis=1)
+        mesh.attrs[ct.MESH_REFERENCE] = meshHash
+
+        return mesh
+
+    def saveMesh(
+            self, coordinatesX: np.array, coordinatesY: np.array) -> str:
+
+        path: str
+        meshHash: str
+        temporaryPath: str
+
+        meshHash = hashlib.sha256(
+            np.ascontiguousarray(coordinatesX, dtype=np.float64).tobytes() +
+            np.ascontiguousarray(coordinatesY, dtype=np.float64).tobytes()
+        ).hexdigest()[:16]
+
+        path = self.getDirMesh + ct.OS_SEP + ct.MESH_OUTPUT + "_{}.{}".format(
+            meshHash, self.outputFormat)
+
+        # once per mesh, the fields only keep its hash
+        if not os.path.exists(path):
+            temporaryPath = self.getDirMesh + ct.OS_SEP + ct.MESH_OUTPUT + \
+                "_{}_{}.{}".format(meshHash, os.getpid(), self.outputFormat)
+
+            self.saveOutputs(
+                pd.DataFrame(data={"x": coordinatesX, "y": coordinatesY}),
+                temporaryPath)
+            os.replace(temporaryPath, path)
+
+        return meshHash
+
+    def convertOutputs(self, removeCsv: bool = False) -> list:
+
+        path: str
+        paths: list
+        dataframe: pd.DataFrame
+
+        paths = sorted(glob.glob(
+            self.getDirReports + ct.OS_SEP + "**" + ct.OS_SEP + "*." + ct.CSV,
+            recursive=True))
+
+        # the binary copy is written next to each CSV of the reports
+        for path in paths:
+            dataframe = self.readOutput(path, withMesh=False)
+
+            self.saveOutputs(
+                dataframe, os.path.splitext(path)[0] + "." + ct.NPZ,
+                dataframe.attrs.get(ct.MESH_REFERENCE))
+
+            if removeCsv:
+                os.remove(path)
+
+        return paths
+
+    def readSnapshots(self) -> SnapshotStore:
+
+        snapshots: SnapshotStore
+
+        # the frames are read lazily, by getFrames or getTimeRange
+        snapshots = SnapshotStore(self.getSnapshotPath)
+        snapshots.open()
+
+        return snapshots
+
+    def plotTemperatureDistribution(
+            self, fileFormat: str = 'jpg', fileDpi: int = 1000) -> None:
+
+        filename: str
+
+        temperatureDf: pd.DataFrame
+
+        axisX: np.ndarray
+        axisY: np.ndarray
+        temperature: np.ndarray
+        coordinatesX: np.ndarray
+        coordinatesY: np.ndarray
+
+        temperatureDf = self.readOutput(self.getTemperatureOutputPath)
+        # temperatureDf = self.readOutput(self.getAnalyticalSolutionPath)
+
+        nx = self.nodeNumberX
+        ny = self.nodeNumberY
+        axisX = self.axisX
+        axisY = self.axisY
+        coordinatesX, coordinatesY = np.meshgrid(axisX, axisY)
+
+        temperature = temperatureDf["temperature"].to_numpy().reshape((ny, nx))
+
+        pyplot.figure(figsize=(20, 13), dpi=fileDpi)
+        pyplot.contourf(
+            coordinatesX, coordinatesY, temperature, alpha=0.5, cmap=cm.jet)
+        filename = self.getTemperatureOutputStreamline
+        cbar = pyplot.colorbar()
+        cbar.ax.tick_params(labelsize=40)
+        pyplot.contour(coordinatesX, coordinatesY, temperature, cmap=cm.jet)
+        pyplot.xlabel('x (m)', fontsize=40)
+        pyplot.ylabel('y (m)', fontsize=40)
+        pyplot.tick_params(axis='both', labelsize=40)
+        pyplot.savefig(
+            filename + "." + fileFormat, dpi=fileDpi, format=fileFormat)
+        pyplot.savefig(filename + "." + "pdf", dpi=fileDpi, format="pdf")
+        pyplot.show()
+
+    def plotProbesEvolution(self) -> None:
+
+        k: int
+        time: np.array
+        dpi_m: np.float
+        filename: str
+        probesDf: pd.DataFrame
+
+        filename = self.getProbesPlotPath
+
+        probesDf = self.readOutput(self.getProbesOutputPath)
+
+        time = probesDf["t"].to_numpy()
+
+        dpi_m = 1000
+        pyplot.figure(num=2, figsize=(14, 11), dpi=dpi_m)
+        pyplot.style.use('classic')
+        for k, probe in enumerate(self.probes):
+            pyplot.plot(
+                time, probesDf["probe{}".format(k + 1)].to_numpy(),
+                linestyle='-', linewidth=2.5,
+                label="probe {} {}".format(k + 1, probe))
+        pyplot.xlabel('t (s)', fontsize=35)
+        pyplot.ylabel(r'T ($^{\circ}$C)', fontsize=35)
+        # pyplot.axis([-0.1, 1.1, -0.1, 1.1])
+        pyplot.tick_params(axis='both', labelsize=35)
+        pyplot.tick_params(axis='both', labelsize=35)
+        pyplot.legend(loc="upper left", frameon=False, ncol=1, fontsize=30)
+        pyplot.grid()
+        pyplot.savefig(filename + ".pdf", dpi=dpi_m, format='pdf')
+        pyplot.show()
+        pyplot.close()
+
+    def plotDataComparison(self, fileFormat: str = 'pdf', fileDpi: int =
+            1000):
+
+        filename: str
+
+        pressureDf: pd.DataFrame
+        velocityXDf: pd.DataFrame
+        velocityYDf: pd.DataFrame
+
+        velocityX: np.ndarray
+        velocityY: np.ndarray
+        coordinatesX: np.ndarray
+        coordinatesY: np.ndarray
+
+        filenameCompY = self.getDirFigure + ct.OS_SEP + \
+            "ComparisonAxisY_{}x{}".format(
+                self.nodeNumberX, self.nodeNumberY)
+
+        filenameCompX= self.getDirFigure + ct.OS_SEP + \
+            "ComparisonAxisX_{}x{}".format(
+                self.nodeNumberX, self.nodeNumberY)
+
+        tempAnalyticalDf = self.readOutput(self.getAnalyticalSolutionPath)
+        tempNumericalDf = self.readOutput(self.getTemperatureOutputPath)
+
+        nx = self.nodeNumberX
+        ny = self.nodeNumberY
+        axisX = self.axisX
+        axisY = self.axisY
+        coordinatesX, coordinatesY = np.meshgrid(axisX, axisY)
+
+        tempAnalytical = tempAnalyticalDf['temperature'].to_numpy().reshape(
+            (ny, nx))
+        tempNumerical = tempNumericalDf['temperature'].to_numpy().reshape(
+            (ny, nx))
+
+        # weighted by the areas of the volumes, for the stretched meshes
+        area = np.outer(self.widthY, self.widthX)
+
+        L2_error_norm = np.sum(area * (tempAnalytical - tempNumerical)**2)
+        L2_norm = np.sum(area * tempAnalytical**2)
+
+        L2_error = np.sqrt(L2_error_norm/L2_norm)
+
+        relativeError = np.divide(
+            abs(tempAnalytical - tempNumerical), abs(tempAnalytical),
+            out=np.zeros(tempAnalytical.shape, dtype=float),
+            where=tempAnalytical!=0)
+
+        L1_error = np.mean(relativeError, where=relativeError<1)
+
+        print("L2-Error: {}".format(L2_error))
+        print("L1-Error: {}".format(L1_error))
+
+        positionX = \
+            (coordinatesX[0,:] > 0.01 - self.deltaX) & \
+            (coordinatesX[0,:] < 0.01 + self.deltaX)
+
+        positionY = \
+            (coordinatesY[:, 0] > 0.005 - self.deltaY) & \
+            (coordinatesY[:, 0] < 0.005 + self.deltaY)
+
+        axisY = coordinatesY[:, positionX].mean(axis=1)
+        axisX = coordinatesX[positionY, :].mean(axis=0)
+        tempNumericalX = tempNumerical[:, positionX].mean(axis=1)
+        tempNumericalY = tempNumerical[positionY, :].mean(axis=0)
+
+        tempAnalyticalX = tempAnalytical[:, positionX].mean(axis=1)
+        tempAnalyticalY = tempAnalytical[positionY, :].mean(axis=0)
+
+        indices = np.arange(0, 255, 4)
+
+        pyplot.figure(num=1, figsize=(18,14), dpi=fileDpi)
+        pyplot.style.use('classic')
+        pyplot.plot(tempNumericalX, axisY, color='black', linestyle='-',
+            linewidth=2, label='FVM')
+        pyplot.plot(np.take(tempAnalyticalX, indices),
+            np.take(axisY, indices), color='red', linestyle='',
+            marker="o", markersize=8, markeredgecolor='red',
+            label='Analytical')
+        pyplot.xlabel(r"$T$ ($^{\circ}$C)", fontsize=40)
+        pyplot.ylabel(r"$y$ (m)", fontsize=40)
+        pyplot.tick_params(axis='both', labelsize=40)
+        pyplot.legend(loc='lower right', frameon=False, ncol=1, fontsize=40)
+        pyplot.grid()
+        pyplot.savefig(filenameCompY + "." + fileFormat, dpi=fileDpi,
+            format=fileFormat)
+
+        pyplot.figure(num=2, figsize=(17, 14), dpi=fileDpi)
+        pyplot.style.use('classic')
+        pyplot.plot(axisX, tempNumericalY, color='black', linestyle='-', linewidth=2,
+                 label='FVM')
+        pyplot.plot(np.take(axisX, indices), np.take(tempAnalyticalY, indices),
+            color='red', linestyle='', marker="o", markersize=8,
+            markeredgecolor='red', label='Analytical')
+        pyplot.ylabel(r"$T$ ($^{\circ}$C)", fontsize=40)
+        pyplot.xlabel(r"$x$ (m)", fontsize=40)
+        pyplot.tick_params(axis='both', labelsize=40)
+        pyplot.legend(loc='lower left', frameon=False, ncol=1, fontsize=40)
+        pyplot.grid()
+        pyplot.savefig(filenameCompX + "." + fileFormat, dpi=fileDpi,
+            format=fileFormat)
+
+    def plotProfiles(self, fileFormat: str = 'pdf', fileDpi: int =1000):
+
+        filename: str
+
+        pressureDf: pd.DataFrame
+        velocityXDf: pd.DataFrame
+        velocityYDf: pd.DataFrame
+
+        velocityX: np.ndarray
+        velocityY: np.ndarray
+        coordinatesX: np.ndarray
+        coordinatesY: np.ndarray
+
+        filenameCompY = self.getDirFigure + ct.OS_SEP + \
+            "profileCenterAxisY_{}x{}".format(
+                self.nodeNumberX, self.nodeNumberY)
+
+        filenameCompX= self.getDirFigure + ct.OS_SEP + \
+            "profileCenterAxisX_{}x{}".format(
+                self.nodeNumberX, self.nodeNumberY)
+
+        tempNumericalDf = self.readOutput(self.getTemperatureOutputPath)
+
+        nx = self.nodeNumberX
+        ny = self.nodeNumberY
+        axisX = self.axisX
+        axisY = self.axisY
+        coordinatesX, coordinatesY = np.meshgrid(axisX, axisY)
+
+        tempNumerical = tempNumericalDf['temperature'].to_numpy().reshape(
+            (ny, nx))
+
+        positionCenterX = \
+            (coordinatesX[0,:] > 0.01 - self.deltaX) & \
+            (coordinatesX[0,:] < 0.01 + self.deltaX)
+
+        positionSourceX = \
+            (coordinatesX[0, :] > 0.0055 - self.deltaX) & (
+             coordinatesX[0, :] < 0.0055 + self.deltaX)
+
+        positionY = \
+            (coordinatesY[:, 0] > 0.005 - self.deltaY) & \
+            (coordinatesY[:, 0] < 0.005 + self.deltaY)
+
+        axisCenterY = coordinatesY[:, positionCenterX].mean(axis=1)
+        axisSourceY = coordinatesY[:, positionSourceX].mean(axis=1)
+        axisX = coordinatesX[positionY, :].mean(axis=0)
+        tempNumericalCenterX = tempNumerical[:, positionCenterX].mean(axis=1)
+        tempNumericalSourceX = tempNumerical[:, positionSourceX].mean(axis=1)
+        tempNumericalY = tempNumerical[positionY, :].mean(axis=0)
+
+        pyplot.figure(num=1, figsize=(18,14), dpi=fileDpi)
+        pyplot.style.use('classic')
+        pyplot.plot(tempNumericalCenterX, axisCenterY, color='black',
+            linestyle='-', linewidth=2, label='geometrical center')
+        pyplot.plot(tempNumericalSourceX, axisSourceY,
+            color='red', linestyle='', marker="o", markersize=8,
+            markeredgecolor='red', label='source center')
+        pyplot.xlabel(r"$T$ ($^{\circ}$C)", fontsize=40)
+        pyplot.ylabel(r"$y$ (m)", fontsize=40)
+        pyplot.tick_params(axis='both', labelsize=40)
+        pyplot.legend(loc='upper right', frameon=False, ncol=1, fontsize=40)
+        pyplot.grid()
+        pyplot.savefig(filenameCompY + "." + fileFormat, dpi=fileDpi,
+            format=fileFormat)
+
+        pyplot.figure(num=2, figsize=(17, 14), dpi=fileDpi)
+        pyplot.style.use('classic')
+        pyplot.plot(
+            axisX, tempNumericalY, color='black', linestyle='-', linewidth=2)
+        pyplot.ylabel(r"$T$ ($^{\circ}$C)", fontsize=40)
+        pyplot.xlabel(r"$x$ (m)", fontsize=40)
+        pyplot.tick_params(axis='both', labelsize=40)
+        pyplot.grid()
+        pyplot.savefig(filenameCompX + "." + fileFormat, dpi=fileDpi,
+            format=fileFormat)
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(
+        description="Converts the CSV outputs of the reports to NPZ.")
+    parser.add_argument(
+        "--remove", action="store_true", help="removes the converted CSVs")
+
+    arguments = parser.parse_args()
+
+    for path in PostProcess().convertOutputs(arguments.remove):
+        print("Converted {}".format(path))
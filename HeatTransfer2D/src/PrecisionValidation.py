@@ -0,0 +1,171 @@
+# *****************************************************************************
+# *                 PRECISION VALIDATION - 2D HEAT TRANSFER                   *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: runs the heat problem in single precision and a reference in *
+# * double precision, with the same control parameters, and reports the      *
+# * differences of the field, the probes and the energy balance. Each row of *
+# * the report has the largest value of both runs and the largest absolute   *
+# * and relative (to the largest reference value) differences over the nodes *
+# * or the samples. Command line usage:                                       *
+# *                                                                           *
+# *   python PrecisionValidation.py finalTime=10 convection=40                *
+# *                                                                           *
+# *****************************************************************************
+import ast
+import time
+import argparse
+import numpy as np
+import pandas as pd
+import Constants as ct
+import ControlParameters
+from Solid import Solid
+from Solver import Solver
+from PostProcess import PostProcess
+
+
+class PrecisionValidation(PostProcess):
+
+    def __init__(self):
+
+        super().__init__()
+
+    # ======================================================================== #
+    # PRIVATE METHODS                                                          #
+    # ======================================================================== #
+    @staticmethod
+    def __runPrecision(precision: str, parameters: dict) -> tuple:
+
+        solid: Solid
+        solver: Solver
+        elapsedTime: float
+
+        # both runs read their parameters from the overrides
+        ControlParameters.PARAMETER_OVERRIDES.clear()
+        ControlParameters.PARAMETER_OVERRIDES.update(
+            parameters, precision=precision, caseName=precision)
+
+        solid = Solid()
+        solver = Solver()
+
+        elapsedTime = time.time()
+
+        if solver.problemType == ct.DIRICHLET_PROBLEM:
+            solver.solve2DDirichletProblem(solid)
+        else:
+            solver.solve2DRobinProblem(solid)
+
+        elapsedTime = time.time() - elapsedTime
+
+        ControlParameters.PARAMETER_OVERRIDES.clear()
+
+        return solid, solver, elapsedTime
+
+    @staticmethod
+    def __getDifference(
+            name: str, single: np.array, double: np.array) -> dict:
+
+        difference: np.float64
+        magnitude: np.float64
+
+        single = np.asarray(single, dtype=np.float64)
+        double = np.asarray(double, dtype=np.float64)
+
+        difference = np.abs(single - double).max()
+        magnitude = np.abs(double).max()
+
+        return {
+            "quantity": name,
+            ct.FLOAT32: single.max(),
+            ct.FLOAT64: double.max(),
+            "maxAbsoluteError": difference,
+            "maxRelativeError":
+                difference / magnitude if magnitude > 0. else np.nan}
+
+    # ======================================================================== #
+    #   PUBLIC METHODS
+    # ======================================================================== #
+    def runValidation(self, parameters: dict = None) -> pd.DataFrame:
+
+        mnx: int
+        mny: int
+        name: str
+        report: pd.DataFrame
+        singleTime: float
+        doubleTime: float
+        singleSolid: Solid
+        doubleSolid: Solid
+        singleSolver: Solver
+        doubleSolver: Solver
+        singleProbes: pd.DataFrame
+        doubleProbes: pd.DataFrame
+
+        parameters = parameters or {}
+
+        for name in parameters:
+            if not hasattr(self, name) or name == "precision":
+                print("ERROR:: {} is not a control parameter of the "
+                      "validation!".format(name))
+                exit()
+
+        singleSolid, singleSolver, singleTime = self.__runPrecision(
+            ct.FLOAT32, parameters)
+        doubleSolid, doubleSolver, doubleTime = self.__runPrecision(
+            ct.FLOAT64, parameters)
+
+        singleProbes = self.readOutput(singleSolver.getProbesOutputPath)
+        doubleProbes = self.readOutput(doubleSolver.getProbesOutputPath)
+
+        mnx = doubleSolid.maxNodeNumberX
+        mny = doubleSolid.maxNodeNumberY
+
+        report = [self.__getDifference(
+            "temperature", singleSolid.temperature[1:mny-1, 1:mnx-1],
+            doubleSolid.temperature[1:mny-1, 1:mnx-1])]
+
+        report.append(self.__getDifference(
+            "energyBalance", singleSolid.energyBalance,
+            doubleSolid.energyBalance))
+
+        # every probe is compared along all its samples
+        for name in doubleSolid.getProbeNames():
+            report.append(self.__getDifference(
+                name, singleProbes[name].to_numpy(),
+                doubleProbes[name].to_numpy()))
+
+        report.append({
+            "quantity": "elapsedTime", ct.FLOAT32: singleTime,
+            ct.FLOAT64: doubleTime})
+
+        report = pd.DataFrame(report)
+
+        # named after the mesh and method of the runs
+        self.saveOutputs(report, doubleSolver.getPrecisionOutputPath)
+
+        return report
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(
+        description="Single against double precision of the 2D heat "
+                    "transfer problem.")
+    parser.add_argument(
+        "parameters", nargs="*", help="control parameters, name=value")
+
+    arguments = parser.parse_args()
+
+    for argument in arguments.parameters:
+        if "=" not in argument:
+            print("ERROR:: Write the validation parameters as name=value!")
+            exit()
+
+    validation = PrecisionValidation()
+
+    with pd.option_context("display.max_columns", None):
+        print(validation.runValidation({
+            name: ast.literal_eval(value) for name, value in (
+                argument.split("=", 1)
+                for argument in arguments.parameters)}))
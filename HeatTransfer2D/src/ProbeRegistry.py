@@ -0,0 +1,153 @@
+# *****************************************************************************
+# *                    PROBE REGISTRY - 2D HEAT TRANSFER                      *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: probes of the temperature field. A probe is a point (x, y),  *
+# * bilinearly interpolated between its four closest nodes, or a rectangular  *
+# * region (xStart, xEnd, yStart, yEnd), averaged over the nodes inside it.   *
+# * The flat indices and weights of every probe are kept in one sparse        *
+# * sampling matrix, so all probes are sampled with a single product.         *
+# *****************************************************************************
+import numpy as np
+import Constants as ct
+from scipy import sparse
+from MeshGenerator import MeshGenerator
+
+
+class ProbeRegistry(MeshGenerator):
+
+    def __init__(self):
+
+        super().__init__()
+
+    # ======================================================================== #
+    # PRIVATE METHODS                                                          #
+    # ======================================================================== #
+    def __getPointWeights(
+            self, positionX: np.float64, positionY: np.float64) -> tuple:
+
+        i: np.int64
+        j: np.int64
+        fractionX: np.float64
+        fractionY: np.float64
+
+        # nodes are at initialPosition + k * delta, stored at k + 1
+        fractionX = (positionX - self.initialPositionX) * self.invDeltaX
+        fractionY = (positionY - self.initialPositionY) * self.invDeltaY
+
+        j = int(np.clip(np.floor(fractionX), 0, self.nodeNumberX - 2))
+        i = int(np.clip(np.floor(fractionY), 0, self.nodeNumberY - 2))
+
+        fractionX -= j
+        fractionY -= i
+
+        # stretched meshes: the cell of the probe is searched on the axes
+        if self.meshStretching != ct.UNIFORM:
+            j = int(np.clip(np.searchsorted(
+                self.axisX, positionX, side="right") - 1, 0,
+                self.nodeNumberX - 2))
+            i = int(np.clip(np.searchsorted(
+                self.axisY, positionY, side="right") - 1, 0,
+                self.nodeNumberY - 2))
+
+            fractionX = (positionX - self.axisX[j]) / self.spacingX[j + 1]
+            fractionY = (positionY - self.axisY[i]) / self.spacingY[i + 1]
+
+        rows = np.array([i, i, i + 1, i + 1]) + 1
+        columns = np.array([j, j + 1, j, j + 1]) + 1
+        weights = np.array([
+            (1. - fractionX) * (1. - fractionY), fractionX * (1. - fractionY),
+            (1. - fractionX) * fractionY, fractionX * fractionY])
+
+        return rows, columns, weights
+
+    def __getRegionWeights(
+            self, positionStartX: np.float64, positionEndX: np.float64,
+            positionStartY: np.float64, positionEndY: np.float64) -> tuple:
+
+        axisX: np.array
+        axisY: np.array
+        nodesX: np.array
+        nodesY: np.array
+        weights: np.array
+
+        axisX = self.initialPositionX + self.deltaX * np.arange(
+            self.nodeNumberX)
+        axisY = self.initialPositionY + self.deltaY * np.arange(
+            self.nodeNumberY)
+
+        if self.meshStretching != ct.UNIFORM:
+            axisX, axisY = self.axisX, self.axisY
+
+        nodesX = np.flatnonzero(
+            (positionStartX <= axisX) & (axisX <= positionEndX)) + 1
+        nodesY = np.flatnonzero(
+            (positionStartY <= axisY) & (axisY <= positionEndY)) + 1
+
+        if nodesX.size == 0 or nodesY.size == 0:
+            print("ERROR:: There is no node inside the probe region "
+                  "{}!".format((positionStartX, positionEndX,
+                                positionStartY, positionEndY)))
+            exit()
+
+        rows, columns = np.meshgrid(nodesY, nodesX, indexing="ij")
+
+        # stretched meshes: weighted by the areas of the volumes
+        if self.meshStretching != ct.UNIFORM:
+            weights = np.outer(
+                self.widthY[nodesY - 1], self.widthX[nodesX - 1]).ravel()
+
+            return rows.ravel(), columns.ravel(), weights / weights.sum()
+
+        return rows.ravel(), columns.ravel(), \
+            np.full(rows.size, 1. / rows.size, dtype=np.float64)
+
+    # ======================================================================== #
+    #   PUBLIC METHODS
+    # ======================================================================== #
+    def getProbeNames(self) -> list:
+
+        return ["probe{}".format(k + 1) for k in range(len(self.probes))]
+
+    def getSamplingMatrix(self) -> sparse.csr_matrix:
+
+        weights: list
+        pointers: list
+        flatIndices: list
+
+        weights = []
+        flatIndices = []
+        pointers = [0]
+
+        for probe in self.probes:
+
+            if len(probe) == 2:
+                rows, columns, probeWeights = self.__getPointWeights(*probe)
+            elif len(probe) == 4:
+                rows, columns, probeWeights = self.__getRegionWeights(*probe)
+            else:
+                print("ERROR:: A probe is a point (x, y) or a region "
+                      "(xStart, xEnd, yStart, yEnd)!")
+                exit()
+
+            flatIndices.append(rows * self.maxNodeNumberX + columns)
+            weights.append(probeWeights)
+            pointers.append(pointers[-1] + probeWeights.size)
+
+        return sparse.csr_matrix(
+            (np.concatenate(weights), np.concatenate(flatIndices), pointers),
+            shape=(len(self.probes),
+                   self.maxNodeNumberX * self.maxNodeNumberY))
+
+    def getSampleSize(self) -> int:
+
+        return (self.timeSize - 1) // self.probeSamplingStride + 1
+
+    @staticmethod
+    def sampleProbes(
+            samplingMatrix: sparse.csr_matrix, temperature: np.array) -> \
+            np.array:
+
+        return samplingMatrix @ temperature.ravel()
@@ -0,0 +1,37 @@
+# *****************************************************************************
+# *                       RUN CONTEXT - 2D HEAT TRANSFER                      *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: parameters and mesh of a run. The mesh generator builds it   *
+# * once per set of control parameters and every component references it,    *
+# * instead of building its own copy. The arrays are read-only and the time   *
+# * axis computes its instants on demand.                                     *
+# *****************************************************************************
+import types
+import numpy as np
+from TimeAxis import TimeAxis
+
+
+class RunContext:
+
+    def __init__(self, parameters: dict, mesh: dict):
+
+        name: str
+
+        self.__dict__["parameters"] = types.MappingProxyType(dict(parameters))
+
+        for name, value in mesh.items():
+            if isinstance(value, np.ndarray):
+                value.setflags(write=False)
+
+            self.__dict__[name] = value
+
+        self.__dict__["time"] = TimeAxis(
+            parameters["initialTime"], self.deltaT, self.timeSize,
+            parameters["finalTime"])
+
+    def __setattr__(self, name: str, value) -> None:
+
+        raise AttributeError("The run context is read-only!")
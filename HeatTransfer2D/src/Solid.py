@@ -1,18 +1,42 @@
-import numpy as np
-from EnergyEquations import EnergyEquations
-
-class Solid(EnergyEquations):
-
-    def __init__(self):
-        super().__init__()
-
-        self.temperature: np.array
-        self.energyBalance: np.float64
-
-        mnx = self.maxNodeNumberX
-        mny = self.maxNodeNumberY
-
-        self.temperature = \
-            self.initialTemperature * np.ones((mny, mnx), dtype=np.float64)
-
-        self.energyBalance = 0.
+import numpy as np
+from EnergyEquations import EnergyEquations
+from DiffusionOperator import DiffusionOperator
+from Multigrid import Multigrid
+from AlternatingDirection import AlternatingDirection
+from FusedKernel import FusedKernel
+from ProbeRegistry import ProbeRegistry
+from Ensemble import Ensemble
+from DomainDecomposition import DomainDecomposition
+from TiledKernel import TiledKernel
+from AdaptiveMesh import AdaptiveMesh
+
+class Solid(
+        EnergyEquations, DiffusionOperator, Multigrid, AlternatingDirection,
+        FusedKernel, ProbeRegistry, Ensemble, DomainDecomposition,
+        TiledKernel, AdaptiveMesh):
+
+    def __init__(self):
+        super().__init__()
+
+        self.temperature: np.array
+        self.energyBalance: np.float64
+        self.steadyStateTime: np.float64
+        self.steadyStateCounter: np.int64
+        self.previousEnergyBalance: np.float64
+        self.steadyStateScratch: np.array
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        self.temperature = \
+            self.initialTemperature * np.ones((mny, mnx), dtype=self.floatType)
+
+        self.energyBalance = 0.
+
+        # steady state monitor
+        self.steadyStateTime = None
+        self.steadyStateCounter = 0
+        self.previousEnergyBalance = 0.
+        self.steadyStateScratch = np.zeros(
+            (mny - 2, mnx - 2), dtype=self.floatType) \
+            if self.steadyStateDetection else None
@@ -1,299 +1,1061 @@
-# *****************************************************************************
-# *                        SOLVER - 2D HEAT TRANSFER                          *
-# *****************************************************************************
-# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
-# * E-mail: almeriopamplona@gmail.com                                         *
-# *****************************************************************************
-# * Description: some hard coded variables that are used through the code and *
-# * kept here to maintain the code organized.                                 *
-# *****************************************************************************
-import time
-import numpy as np
-import pandas as pd
-import Constants as ct
-from Solid import Solid
-from PostProcess import PostProcess
-
-
-class Solver(PostProcess):
-
-    def __init__(self):
-
-        super().__init__()
-
-    def solve2DDirichletProblem(self, solid: Solid) -> None:
-
-        probe1: np.array
-        probe2: np.array
-        probe3: np.array
-        timeVector: np.array
-        diffusionCoeffX: np.float64
-        diffusionCoeffY: np.float64
-
-        start = time.time()
-
-        # Energy Equations' constants:
-        # ---------------------------
-        diffusionCoeffX = \
-            solid.diffusivity * solid.deltaT * solid.invDeltaX ** 2
-        diffusionCoeffY = \
-            solid.diffusivity * solid.deltaT * solid.invDeltaY ** 2
-
-        coefficientCenter = 1 + 2 * solid.diffusivity * solid.deltaT * (
-            solid.deltaX ** 2 + solid.deltaY ** 2) * solid.invDeltaX ** 2 * \
-            solid.invDeltaY ** 2
-
-        conductionCoeffX = solid.conductivity * solid.invDeltaX
-        conductionCoeffY = solid.conductivity * solid.invDeltaY
-
-        # ------------------------------------------------------------------- #
-        # INITIAL AND BOUNDARY CONDITIONS                                     #
-        # ------------------------------------------------------------------- #
-        solid.temperature = solid.boundariesConditionsDirichlet(
-            solid.temperature, solid)
-
-        # ------------------------------------------------------------------- #
-        # START PROBES                                                        #
-        # ------------------------------------------------------------------- #
-        probe1 = np.zeros((solid.timeSize,), dtype=np.float64)
-        probe2 = np.zeros((solid.timeSize,), dtype=np.float64)
-        probe3 = np.zeros((solid.timeSize,), dtype=np.float64)
-
-        timeVector = solid.getTimeVector()
-
-        positionsProbe1 = solid.getProbePosition(0.01, 0.000)
-        positionsProbe2 = solid.getProbePosition(0.01, 0.005)
-        positionsProbe3 = solid.getProbePosition(0.01, 0.010)
-
-        # ------------------------------------------------------------------- #
-        # SOLVE DE HEAT TRANSFER PROBLEMS                                     #
-        # ------------------------------------------------------------------- #
-
-        if self.solutionMethod == ct.EXPLICIT:
-
-            for t in range(solid.timeSize):
-
-                solid.temperature = solid.solveEnergyEquationsExplicit(
-                    solid.temperature, diffusionCoeffX, diffusionCoeffY)
-
-                solid.temperature = solid.boundariesConditionsDirichlet(
-                    solid.temperature, solid)
-
-                probe1[t] = solid.temperature[
-                            positionsProbe1[2]:positionsProbe1[3] + 1,
-                            positionsProbe1[0]:positionsProbe1[1] + 1].mean()
-                probe2[t] = solid.temperature[
-                            positionsProbe2[2]:positionsProbe2[3] + 1,
-                            positionsProbe2[0]:positionsProbe2[1] + 1].mean()
-                probe3[t] = solid.temperature[
-                            positionsProbe3[2]:positionsProbe3[3] + 1,
-                            positionsProbe3[0]:positionsProbe3[1] + 1].mean()
-
-                solid.energyBalance = solid.getEnergyBalance(
-                    solid.temperature, conductionCoeffX, conductionCoeffY)
-
-        elif self.solutionMethod == ct.IMPLICIT:
-
-            for t in range(solid.timeSize):
-                solid.temperature = solid.solveEnergyEquationsImplicitDirichlet(
-                    solid, coefficientCenter, diffusionCoeffX,
-                    diffusionCoeffY)
-
-                solid.temperature = solid.boundariesConditionsDirichlet(
-                    solid.temperature, solid)
-
-                probe1[t] = solid.temperature[
-                            positionsProbe1[2]:positionsProbe1[3] + 1,
-                            positionsProbe1[0]:positionsProbe1[1] + 1].mean()
-                probe2[t] = solid.temperature[
-                            positionsProbe2[2]:positionsProbe2[3] + 1,
-                            positionsProbe2[0]:positionsProbe2[1] + 1].mean()
-                probe3[t] = solid.temperature[
-                            positionsProbe3[2]:positionsProbe3[3] + 1,
-                            positionsProbe3[0]:positionsProbe3[1] + 1].mean()
-
-                solid.energyBalance = solid.getEnergyBalance(
-                    solid.temperature, conductionCoeffX, conductionCoeffY)
-
-        else:
-            print("ERROR:: Choose the right type of method!")
-            exit()
-
-        mnx = solid.maxNodeNumberX
-        mny = solid.maxNodeNumberY
-
-        outputTemperature = pd.DataFrame(data={
-            "x": solid.coordinateX,
-            "y": solid.coordinateY,
-            "temperature": solid.temperature[1:mny - 1, 1:mnx - 1].reshape(
-                solid.coordinateX.shape)})
-
-        outputProbe1 = pd.DataFrame(data={"t": timeVector, "probe": probe1})
-        outputProbe2 = pd.DataFrame(data={"t": timeVector, "probe": probe2})
-        outputProbe3 = pd.DataFrame(data={"t": timeVector, "probe": probe3})
-
-        self.saveOutputs(outputTemperature, self.getTemperatureOutputPath)
-        self.saveOutputs(outputProbe1, self.getProbe1OutputPath)
-        self.saveOutputs(outputProbe2, self.getProbe2OutputPath)
-        self.saveOutputs(outputProbe3, self.getProbe3OutputPath)
-
-        end = time.time()
-
-        print("Elapsed time: {}".format(end - start))
-
-    def solve2DRobinProblem(self, solid: Solid) -> None:
-
-        probe1: np.array
-        probe2: np.array
-        probe3: np.array
-        timeVector: np.array
-        boundSource: np.float64
-        boundCenterX: np.float64
-        boundCenterY: np.float64
-        boundExternalX: np.float64
-        boundExternalY: np.float64
-        diffusionCoeffX: np.float64
-        diffusionCoeffY: np.float64
-        coefficientCenter: np.float64
-        conductionCoeffX: np.float64
-        conductionCoeffY: np.float64
-
-        start = time.time()
-
-        # ------------------------------------------------------------------- #
-        # Numerical constants                                                 #
-        # ------------------------------------------------------------------- #
-
-        # Boundaries' constants:
-        # ---------------------
-        boundSource = solid.heatSource * solid.deltaY / solid.conductivity
-        boundCenterX = \
-            (2 * solid.conductivity - solid.convection * solid.deltaX) / \
-            (2 * solid.conductivity + solid.convection * solid.deltaX)
-        boundCenterY = \
-            (2 * solid.conductivity - solid.convection * solid.deltaY) / \
-            (2 * solid.conductivity + solid.convection * solid.deltaY)
-        boundExternalX = 2 * solid.conductivity * solid.deltaX / \
-            (2 * solid.conductivity + solid.convection * solid.deltaX)
-        boundExternalY = 2 * solid.conductivity * solid.deltaY / \
-            (2 * solid.conductivity + solid.convection * solid.deltaY)
-
-        # Energy Equations' constants:
-        # ---------------------------
-        diffusionCoeffX = solid.diffusivity * solid.deltaT * solid.invDeltaX**2
-        diffusionCoeffY = solid.diffusivity * solid.deltaT * solid.invDeltaY**2
-
-        coefficientCenter = 1 + 2 * solid.diffusivity * solid.deltaT * (
-            solid.deltaX**2 + solid.deltaY**2) * solid.invDeltaX**2 * \
-            solid.invDeltaY**2
-
-        conductionCoeffX = solid.conductivity * solid.invDeltaX
-        conductionCoeffY = solid.conductivity * solid.invDeltaY
-
-        # ------------------------------------------------------------------- #
-        # INITIAL AND BOUNDARY CONDITIONS                                     #
-        # ------------------------------------------------------------------- #
-        solid.temperature = solid.setSourceConditions(
-            solid.temperature, boundSource, boundCenterY, boundExternalY)
-
-        # ------------------------------------------------------------------- #
-        # START PROBES                                                        #
-        # ------------------------------------------------------------------- #
-        probe1 = np.zeros((solid.timeSize,), dtype=np.float64)
-        probe2 = np.zeros((solid.timeSize,), dtype=np.float64)
-        probe3 = np.zeros((solid.timeSize,), dtype=np.float64)
-
-        timeVector = solid.getTimeVector()
-
-        positionsProbe1 = solid.getProbePosition(0.01, 0.000)
-        positionsProbe2 = solid.getProbePosition(0.01, 0.005)
-        positionsProbe3 = solid.getProbePosition(0.01, 0.010)
-
-        # ------------------------------------------------------------------- #
-        # SOLVE DE HEAT TRANSFER PROBLEMS                                     #
-        # ------------------------------------------------------------------- #
-
-        if self.solutionMethod == ct.EXPLICIT:
-
-            for t in range(solid.timeSize):
-
-                solid.temperature = solid.solveEnergyEquationsExplicit(
-                    solid.temperature, diffusionCoeffX, diffusionCoeffY)
-
-                solid.temperature = solid.boundariesConditions(
-                    solid.temperature, boundSource, boundCenterX, boundCenterY,
-                    boundExternalX, boundExternalY)
-
-                probe1[t] = solid.temperature[
-                    positionsProbe1[2]:positionsProbe1[3] + 1,
-                    positionsProbe1[0]:positionsProbe1[1] + 1].mean()
-                probe2[t] = solid.temperature[
-                    positionsProbe2[2]:positionsProbe2[3] + 1,
-                    positionsProbe2[0]:positionsProbe2[1] + 1].mean()
-                probe3[t] = solid.temperature[
-                    positionsProbe3[2]:positionsProbe3[3] + 1,
-                    positionsProbe3[0]:positionsProbe3[1] + 1].mean()
-
-                solid.energyBalance = solid.getEnergyBalance(
-                    solid.temperature, conductionCoeffX, conductionCoeffY)
-
-                # if solid.energyBalance > solid.heatBalanceTolerance:
-                #     print(print("ERROR:: energy balance did not conserved! " +
-                #           "continuity = {}".format(solid.energyBalance)))
-                #     exit()
-
-        elif self.solutionMethod == ct.IMPLICIT:
-
-            for t in range(solid.timeSize):
-                solid.temperature = solid.solveEnergyEquationsImplicitRobin(
-                    solid, coefficientCenter, diffusionCoeffX,
-                    diffusionCoeffY, boundSource, boundCenterX, boundCenterY,
-                    boundExternalX, boundExternalY)
-
-                solid.temperature = solid.boundariesConditions(
-                    solid.temperature, boundSource, boundCenterX, boundCenterY,
-                    boundExternalX, boundExternalY)
-
-                probe1[t] = solid.temperature[
-                    positionsProbe1[2]:positionsProbe1[3] + 1,
-                    positionsProbe1[0]:positionsProbe1[1] + 1].mean()
-                probe2[t] = solid.temperature[
-                    positionsProbe2[2]:positionsProbe2[3] + 1,
-                    positionsProbe2[0]:positionsProbe2[1] + 1].mean()
-                probe3[t] = solid.temperature[
-                    positionsProbe3[2]:positionsProbe3[3] + 1,
-                    positionsProbe3[0]:positionsProbe3[1] + 1].mean()
-
-                solid.energyBalance = solid.getEnergyBalance(
-                    solid.temperature, conductionCoeffX, conductionCoeffY)
-
-                # if solid.energyBalance > solid.heatBalanceTolerance:
-                #     print(print("ERROR:: energy balance did not conserved! " +
-                #           "continuity = {}".format(solid.energyBalance)))
-                #     exit()
-        else:
-            print("ERROR:: Choose the right type of method!")
-            exit()
-
-        mnx = solid.maxNodeNumberX
-        mny = solid.maxNodeNumberY
-
-        outputTemperature = pd.DataFrame(
-            data={
-                "x": solid.coordinateX,
-                "y": solid.coordinateY,
-                "temperature": solid.temperature[1:mny - 1, 1:mnx - 1].reshape(
-                    solid.coordinateX.shape)})
-
-        outputProbe1 = pd.DataFrame(data={"t": timeVector, "probe": probe1})
-        outputProbe2 = pd.DataFrame(data={"t": timeVector, "probe": probe2})
-        outputProbe3 = pd.DataFrame(data={"t": timeVector, "probe": probe3})
-
-        self.saveOutputs(outputTemperature, self.getTemperatureOutputPath)
-        self.saveOutputs(outputProbe1, self.getProbe1OutputPath)
-        self.saveOutputs(outputProbe2, self.getProbe2OutputPath)
-        self.saveOutputs(outputProbe3, self.getProbe3OutputPath)
-
-        end = time.time()
-
-        print("Elapsed time: {}".format(end - start))
+# *****************************************************************************
+# *                        SOLVER - 2D HEAT TRANSFER                          *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: some hard coded variables that are used through the code and *
+# * kept here to maintain the code organized.                                 *
+# *****************************************************************************
+import time
+import numpy as np
+import pandas as pd
+from scipy import sparse
+import Constants as ct
+from Solid import Solid
+from TimeAxis import TimeAxis
+from PostProcess import PostProcess
+from Checkpoint import Checkpoint
+from SnapshotStore import SnapshotWriter
+
+
+class Solver(PostProcess, Checkpoint, SnapshotWriter):
+
+    def __init__(self):
+
+        super().__init__()
+
+    def solve2DDirichletProblem(self, solid: Solid) -> None:
+
+        probes: np.array
+        samplingMatrix: sparse.csr_matrix
+        timeVector: TimeAxis
+        startStep: int
+        diffusionCoeffX: np.float64
+        diffusionCoeffY: np.float64
+
+        start = time.time()
+
+        # Energy Equations' constants:
+        # ---------------------------
+        diffusionCoeffX = \
+            solid.diffusivity * solid.deltaT * solid.invDeltaX ** 2
+        diffusionCoeffY = \
+            solid.diffusivity * solid.deltaT * solid.invDeltaY ** 2
+
+        coefficientCenter = 1 + 2 * solid.diffusivity * solid.deltaT * (
+            solid.deltaX ** 2 + solid.deltaY ** 2) * solid.invDeltaX ** 2 * \
+            solid.invDeltaY ** 2
+
+        conductionCoeffX = solid.conductivity * solid.invDeltaX
+        conductionCoeffY = solid.conductivity * solid.invDeltaY
+
+        # coefficients of the field updates, in the precision of the field
+        diffusionCoeffX, diffusionCoeffY, coefficientCenter = \
+            solid.floatType(
+                (diffusionCoeffX, diffusionCoeffY, coefficientCenter))
+
+        # one coefficient per node on the stretched meshes
+        diffusionCoeffX, diffusionCoeffY, coefficientCenter = \
+            solid.getStretchedCoefficients(
+                diffusionCoeffX, diffusionCoeffY, coefficientCenter)
+
+        # ------------------------------------------------------------------- #
+        # INITIAL AND BOUNDARY CONDITIONS                                     #
+        # ------------------------------------------------------------------- #
+        solid.temperature = solid.boundariesConditionsDirichlet(
+            solid.temperature, solid)
+
+        # ------------------------------------------------------------------- #
+        # START PROBES                                                        #
+        # ------------------------------------------------------------------- #
+        samplingMatrix = solid.getSamplingMatrix()
+
+        probes = np.zeros(
+            (solid.getSampleSize(), samplingMatrix.shape[0]), dtype=np.float64)
+
+        timeVector = solid.getTimeVector()
+
+        # ------------------------------------------------------------------- #
+        # RESTART                                                             #
+        # ------------------------------------------------------------------- #
+        startStep = self.loadCheckpoint(solid, probes)
+        self.startSnapshots(solid, startStep)
+
+        # ------------------------------------------------------------------- #
+        # SOLVE DE HEAT TRANSFER PROBLEMS                                     #
+        # ------------------------------------------------------------------- #
+
+        if self.solutionMethod == ct.EXPLICIT and \
+                solid.getExplicitBackend() == ct.NUMBA:
+
+            ghostRelations = solid.getGhostRelationsDirichlet()
+
+            probeValues = np.zeros(
+                (samplingMatrix.shape[0],), dtype=np.float64)
+
+            # two buffers swapped at each time step
+            temperatureBuffer = solid.temperature.copy()
+            scratch = solid.getFusedScratch()
+
+            for t in range(startStep, solid.timeSize):
+
+                solid.energyBalance = solid.solveEnergyEquationsFused(
+                    solid.temperature, temperatureBuffer, diffusionCoeffX,
+                    diffusionCoeffY, ghostRelations, conductionCoeffX,
+                    conductionCoeffY, samplingMatrix, probeValues,
+                    t % self.probeSamplingStride == 0, scratch)
+
+                solid.temperature, temperatureBuffer = \
+                    temperatureBuffer, solid.temperature
+
+                if t % self.probeSamplingStride == 0:
+                    probes[t // self.probeSamplingStride] = probeValues
+
+                if solid.isSteadyState(
+                        solid.temperature, temperatureBuffer, timeVector[t]):
+                    break
+
+                self.saveSnapshot(solid, t)
+                self.saveCheckpoint(solid, t, probes)
+
+        elif self.solutionMethod == ct.EXPLICIT and \
+                solid.getExplicitBackend() == ct.SHARED_MEMORY:
+
+            solid.startStripWorkers(
+                diffusionCoeffX, diffusionCoeffY,
+                solid.getGhostRelationsDirichlet())
+
+            try:
+                for t in range(startStep, solid.timeSize):
+
+                    temperatureChange = solid.solveEnergyEquationsStrips()
+
+                    if t % self.probeSamplingStride == 0:
+                        probes[t // self.probeSamplingStride] = \
+                            solid.sampleProbes(
+                                samplingMatrix, solid.temperature)
+
+                    solid.energyBalance = solid.getEnergyBalance(
+                        solid.temperature, conductionCoeffX, conductionCoeffY)
+
+                    if solid.isSteadyStateRate(
+                            temperatureChange / solid.deltaT, timeVector[t]):
+                        break
+
+                    self.saveSnapshot(solid, t)
+                    self.saveCheckpoint(solid, t, probes)
+
+            finally:
+                solid.stopStripWorkers()
+
+        elif self.solutionMethod == ct.EXPLICIT and \
+                solid.getExplicitBackend() == ct.THREADS:
+
+            # two buffers swapped at each time step
+            temperatureBuffer = solid.temperature.copy()
+
+            for t in range(startStep, solid.timeSize):
+
+                temperatureChange = solid.solveEnergyEquationsTiled(
+                    solid.temperature, temperatureBuffer, diffusionCoeffX,
+                    diffusionCoeffY)
+
+                solid.temperature, temperatureBuffer = \
+                    temperatureBuffer, solid.temperature
+
+                solid.boundariesConditionsDirichletInPlace(
+                    solid.temperature, solid)
+
+                if t % self.probeSamplingStride == 0:
+                    probes[t // self.probeSamplingStride] = \
+                        solid.sampleProbes(samplingMatrix, solid.temperature)
+
+                solid.energyBalance = solid.getEnergyBalance(
+                    solid.temperature, conductionCoeffX, conductionCoeffY)
+
+                if solid.isSteadyStateRate(
+                        temperatureChange / solid.deltaT, timeVector[t]):
+                    break
+
+                self.saveSnapshot(solid, t)
+                self.saveCheckpoint(solid, t, probes)
+
+        elif self.solutionMethod == ct.EXPLICIT:
+
+            # two buffers swapped at each time step
+            temperatureBuffer = solid.temperature.copy()
+            scratch = solid.getExplicitScratch()
+
+            for t in range(startStep, solid.timeSize):
+
+                solid.solveEnergyEquationsExplicitInPlace(
+                    solid.temperature, temperatureBuffer, diffusionCoeffX,
+                    diffusionCoeffY, scratch)
+
+                solid.temperature, temperatureBuffer = \
+                    temperatureBuffer, solid.temperature
+
+                solid.boundariesConditionsDirichletInPlace(
+                    solid.temperature, solid)
+
+                if t % self.probeSamplingStride == 0:
+                    probes[t // self.probeSamplingStride] = \
+                        solid.sampleProbes(samplingMatrix, solid.temperature)
+
+                solid.energyBalance = solid.getEnergyBalance(
+                    solid.temperature, conductionCoeffX, conductionCoeffY)
+
+                if solid.isSteadyState(
+                        solid.temperature, temperatureBuffer, timeVector[t]):
+                    break
+
+                self.saveSnapshot(solid, t)
+                self.saveCheckpoint(solid, t, probes)
+
+        elif self.solutionMethod == ct.IMPLICIT:
+
+            for t in range(startStep, solid.timeSize):
+                previousTemperature = solid.temperature
+
+                solid.temperature = solid.solveEnergyEquationsImplicitDirichlet(
+                    solid, coefficientCenter, diffusionCoeffX,
+                    diffusionCoeffY)
+
+                solid.temperature = solid.boundariesConditionsDirichlet(
+                    solid.temperature, solid)
+
+                if t % self.probeSamplingStride == 0:
+                    probes[t // self.probeSamplingStride] = \
+                        solid.sampleProbes(samplingMatrix, solid.temperature)
+
+                solid.energyBalance = solid.getEnergyBalance(
+                    solid.temperature, conductionCoeffX, conductionCoeffY)
+
+                if solid.isSteadyState(
+                        solid.temperature, previousTemperature, timeVector[t]):
+                    break
+
+                self.saveSnapshot(solid, t)
+                self.saveCheckpoint(solid, t, probes)
+
+        elif self.solutionMethod == ct.DIRECT:
+
+            diffusionOperator, ghostSource = solid.getDiffusionOperator(
+                diffusionCoeffX, diffusionCoeffY,
+                solid.getGhostRelationsDirichlet())
+
+            factorization = solid.getImplicitFactorization(diffusionOperator)
+
+            for t in range(startStep, solid.timeSize):
+                previousTemperature = solid.temperature
+
+                solid.temperature = solid.solveEnergyEquationsDirect(
+                    solid.temperature, factorization, ghostSource)
+
+                solid.temperature = solid.boundariesConditionsDirichlet(
+                    solid.temperature, solid)
+
+                if t % self.probeSamplingStride == 0:
+                    probes[t // self.probeSamplingStride] = \
+                        solid.sampleProbes(samplingMatrix, solid.temperature)
+
+                solid.energyBalance = solid.getEnergyBalance(
+                    solid.temperature, conductionCoeffX, conductionCoeffY)
+
+                if solid.isSteadyState(
+                        solid.temperature, previousTemperature, timeVector[t]):
+                    break
+
+                self.saveSnapshot(solid, t)
+                self.saveCheckpoint(solid, t, probes)
+
+        elif self.solutionMethod == ct.CRANK_NICOLSON:
+
+            diffusionOperator, ghostSource = solid.getDiffusionOperator(
+                diffusionCoeffX, diffusionCoeffY,
+                solid.getGhostRelationsDirichlet())
+
+            factorization = solid.getImplicitFactorization(
+                diffusionOperator, 0.5)
+
+            for t in range(startStep, solid.timeSize):
+                previousTemperature = solid.temperature
+
+                solid.temperature = solid.solveEnergyEquationsCrankNicolson(
+                    solid.temperature, factorization, diffusionOperator,
+                    ghostSource)
+
+                solid.temperature = solid.boundariesConditionsDirichlet(
+                    solid.temperature, solid)
+
+                if t % self.probeSamplingStride == 0:
+                    probes[t // self.probeSamplingStride] = \
+                        solid.sampleProbes(samplingMatrix, solid.temperature)
+
+                solid.energyBalance = solid.getEnergyBalance(
+                    solid.temperature, conductionCoeffX, conductionCoeffY)
+
+                if solid.isSteadyState(
+                        solid.temperature, previousTemperature, timeVector[t]):
+                    break
+
+                self.saveSnapshot(solid, t)
+                self.saveCheckpoint(solid, t, probes)
+
+        elif self.solutionMethod == ct.ADI:
+
+            ghostRelations = solid.getGhostRelationsDirichlet()
+
+            factorizations = solid.getAlternatingFactorizations(
+                diffusionCoeffX, diffusionCoeffY, ghostRelations)
+
+            for t in range(startStep, solid.timeSize):
+                previousTemperature = solid.temperature
+
+                solid.temperature = solid.solveEnergyEquationsADI(
+                    solid.temperature, factorizations, diffusionCoeffX,
+                    diffusionCoeffY, ghostRelations)
+
+                solid.temperature = solid.boundariesConditionsDirichlet(
+                    solid.temperature, solid)
+
+                if t % self.probeSamplingStride == 0:
+                    probes[t // self.probeSamplingStride] = \
+                        solid.sampleProbes(samplingMatrix, solid.temperature)
+
+                solid.energyBalance = solid.getEnergyBalance(
+                    solid.temperature, conductionCoeffX, conductionCoeffY)
+
+                if solid.isSteadyState(
+                        solid.temperature, previousTemperature, timeVector[t]):
+                    break
+
+                self.saveSnapshot(solid, t)
+                self.saveCheckpoint(solid, t, probes)
+
+        elif self.solutionMethod == ct.MULTIGRID:
+
+            ghostRelations = solid.getGhostRelationsDirichlet()
+
+            levels = solid.getMultigridLevels(
+                1., -diffusionCoeffX, -diffusionCoeffY, ghostRelations)
+
+            for t in range(startStep, solid.timeSize):
+                previousTemperature = solid.temperature
+
+                solid.temperature = solid.solveMultigrid(
+                    solid.temperature, solid.temperature, levels,
+                    ghostRelations, solid.iterTolerance)
+
+                solid.temperature = solid.boundariesConditionsDirichlet(
+                    solid.temperature, solid)
+
+                if t % self.probeSamplingStride == 0:
+                    probes[t // self.probeSamplingStride] = \
+                        solid.sampleProbes(samplingMatrix, solid.temperature)
+
+                solid.energyBalance = solid.getEnergyBalance(
+                    solid.temperature, conductionCoeffX, conductionCoeffY)
+
+                if solid.isSteadyState(
+                        solid.temperature, previousTemperature, timeVector[t]):
+                    break
+
+                self.saveSnapshot(solid, t)
+                self.saveCheckpoint(solid, t, probes)
+
+        else:
+            print("ERROR:: Choose the right type of method!")
+            exit()
+
+        # after an early exit the probes keep their steady values
+        probes[t // self.probeSamplingStride + 1:] = solid.sampleProbes(
+            samplingMatrix, solid.temperature)
+
+        mnx = solid.maxNodeNumberX
+        mny = solid.maxNodeNumberY
+
+        outputTemperature = pd.DataFrame(data={
+            "temperature": solid.temperature[1:mny - 1, 1:mnx - 1].reshape(
+                solid.coordinateX.shape)})
+
+        outputProbes = pd.DataFrame(data=probes, columns=solid.getProbeNames())
+        outputProbes.insert(0, "t", timeVector[::self.probeSamplingStride])
+
+        self.saveOutputs(
+            outputTemperature, self.getTemperatureOutputPath,
+            self.saveMesh(solid.coordinateX, solid.coordinateY))
+        self.saveOutputs(outputProbes, self.getProbesOutputPath)
+
+        self.stopSnapshots()
+
+        # a finished run does not resume
+        self.clearCheckpoints()
+
+        end = time.time()
+
+        print("Elapsed time: {}".format(end - start))
+
+    def solve2DRobinProblem(self, solid: Solid) -> None:
+
+        probes: np.array
+        samplingMatrix: sparse.csr_matrix
+        timeVector: TimeAxis
+        startStep: int
+        boundSource: np.float64
+        boundCenterX: np.float64
+        boundCenterY: np.float64
+        boundExternalX: np.float64
+        boundExternalY: np.float64
+        diffusionCoeffX: np.float64
+        diffusionCoeffY: np.float64
+        coefficientCenter: np.float64
+        conductionCoeffX: np.float64
+        conductionCoeffY: np.float64
+
+        start = time.time()
+
+        # ------------------------------------------------------------------- #
+        # Numerical constants                                                 #
+        # ------------------------------------------------------------------- #
+
+        # Boundaries' constants:
+        # ---------------------
+        boundSource = solid.heatSource * solid.deltaY / solid.conductivity
+        boundCenterX = \
+            (2 * solid.conductivity - solid.convection * solid.deltaX) / \
+            (2 * solid.conductivity + solid.convection * solid.deltaX)
+        boundCenterY = \
+            (2 * solid.conductivity - solid.convection * solid.deltaY) / \
+            (2 * solid.conductivity + solid.convection * solid.deltaY)
+        boundExternalX = 2 * solid.conductivity * solid.deltaX / \
+            (2 * solid.conductivity + solid.convection * solid.deltaX)
+        boundExternalY = 2 * solid.conductivity * solid.deltaY / \
+            (2 * solid.conductivity + solid.convection * solid.deltaY)
+
+        # Energy Equations' constants:
+        # ---------------------------
+        diffusionCoeffX = solid.diffusivity * solid.deltaT * solid.invDeltaX**2
+        diffusionCoeffY = solid.diffusivity * solid.deltaT * solid.invDeltaY**2
+
+        coefficientCenter = 1 + 2 * solid.diffusivity * solid.deltaT * (
+            solid.deltaX**2 + solid.deltaY**2) * solid.invDeltaX**2 * \
+            solid.invDeltaY**2
+
+        conductionCoeffX = solid.conductivity * solid.invDeltaX
+        conductionCoeffY = solid.conductivity * solid.invDeltaY
+
+        # coefficients of the field updates, in the precision of the field
+        boundSource, boundCenterX, boundCenterY, boundExternalX, \
+            boundExternalY, diffusionCoeffX, diffusionCoeffY, \
+            coefficientCenter = solid.floatType((
+                boundSource, boundCenterX, boundCenterY, boundExternalX,
+                boundExternalY, diffusionCoeffX, diffusionCoeffY,
+                coefficientCenter))
+
+        # one coefficient per node on the stretched meshes
+        diffusionCoeffX, diffusionCoeffY, coefficientCenter = \
+            solid.getStretchedCoefficients(
+                diffusionCoeffX, diffusionCoeffY, coefficientCenter)
+
+        # ------------------------------------------------------------------- #
+        # INITIAL AND BOUNDARY CONDITIONS                                     #
+        # ------------------------------------------------------------------- #
+        solid.temperature = solid.setSourceConditions(
+            solid.temperature, boundSource, boundCenterY, boundExternalY)
+
+        # ------------------------------------------------------------------- #
+        # START PROBES                                                        #
+        # ------------------------------------------------------------------- #
+        samplingMatrix = solid.getSamplingMatrix()
+
+        probes = np.zeros(
+            (solid.getSampleSize(), samplingMatrix.shape[0]), dtype=np.float64)
+
+        timeVector = solid.getTimeVector()
+
+        # ------------------------------------------------------------------- #
+        # RESTART                                                             #
+        # ------------------------------------------------------------------- #
+        startStep = self.loadCheckpoint(solid, probes)
+        self.startSnapshots(solid, startStep)
+
+        # ------------------------------------------------------------------- #
+        # SOLVE DE HEAT TRANSFER PROBLEMS                                     #
+        # ------------------------------------------------------------------- #
+
+        if self.adaptiveRefinement:
+
+            composite = solid.getCompositeMesh(solid.temperature)
+            cellNumbers = []
+
+            mnx = solid.maxNodeNumberX
+            mny = solid.maxNodeNumberY
+
+            for t in range(startStep, solid.timeSize):
+
+                if t > startStep and t % self.regridStride == 0:
+                    composite = solid.regridCompositeMesh(composite)
+
+                temperatureChange = solid.solveEnergyEquationsAdaptive(
+                    composite)
+                cellNumbers.append(composite.getCellNumber())
+
+                # the probes and the snapshots read the volume averages
+                solid.temperature[1:mny-1, 1:mnx-1] = \
+                    solid.getBaseTemperature(composite)
+
+                solid.boundariesConditionsInPlace(
+                    solid.temperature, boundSource, boundCenterX, boundCenterY,
+                    boundExternalX, boundExternalY)
+
+                if t % self.probeSamplingStride == 0:
+                    probes[t // self.probeSamplingStride] = \
+                        solid.sampleProbes(samplingMatrix, solid.temperature)
+
+                solid.energyBalance = solid.getAdaptiveEnergyBalance(composite)
+
+                if solid.isSteadyStateRate(
+                        temperatureChange / solid.deltaT, timeVector[t]):
+                    break
+
+                self.saveSnapshot(solid, t)
+
+            self.saveOutputs(
+                solid.getCompositeOutput(composite),
+                self.getAdaptiveOutputPath)
+
+            print("Active volumes: {:.0f} on average, {} at the end, {} on "
+                  "the finest uniform mesh".format(
+                    np.mean(cellNumbers), composite.getCellNumber(),
+                    solid.nodeNumberX * solid.nodeNumberY *
+                    4 ** self.refinementLevels))
+
+        elif self.solutionMethod == ct.EXPLICIT and \
+                solid.getExplicitBackend() == ct.NUMBA:
+
+            ghostRelations = solid.getGhostRelations(
+                boundSource, boundCenterX, boundCenterY, boundExternalX,
+                boundExternalY)
+
+            probeValues = np.zeros(
+                (samplingMatrix.shape[0],), dtype=np.float64)
+
+            # two buffers swapped at each time step
+            temperatureBuffer = solid.temperature.copy()
+            scratch = solid.getFusedScratch()
+
+            for t in range(startStep, solid.timeSize):
+
+                solid.energyBalance = solid.solveEnergyEquationsFused(
+                    solid.temperature, temperatureBuffer, diffusionCoeffX,
+                    diffusionCoeffY, ghostRelations, conductionCoeffX,
+                    conductionCoeffY, samplingMatrix, probeValues,
+                    t % self.probeSamplingStride == 0, scratch)
+
+                solid.temperature, temperatureBuffer = \
+                    temperatureBuffer, solid.temperature
+
+                if t % self.probeSamplingStride == 0:
+                    probes[t // self.probeSamplingStride] = probeValues
+
+                if solid.isSteadyState(
+                        solid.temperature, temperatureBuffer, timeVector[t]):
+                    break
+
+                self.saveSnapshot(solid, t)
+                self.saveCheckpoint(solid, t, probes)
+
+        elif self.solutionMethod == ct.EXPLICIT and \
+                solid.getExplicitBackend() == ct.SHARED_MEMORY:
+
+            solid.startStripWorkers(
+                diffusionCoeffX, diffusionCoeffY, solid.getGhostRelations(
+                    boundSource, boundCenterX, boundCenterY, boundExternalX,
+                    boundExternalY))
+
+            try:
+                for t in range(startStep, solid.timeSize):
+
+                    temperatureChange = solid.solveEnergyEquationsStrips()
+
+                    if t % self.probeSamplingStride == 0:
+                        probes[t // self.probeSamplingStride] = \
+                            solid.sampleProbes(
+                                samplingMatrix, solid.temperature)
+
+                    solid.energyBalance = solid.getEnergyBalance(
+                        solid.temperature, conductionCoeffX, conductionCoeffY)
+
+                    if solid.isSteadyStateRate(
+                            temperatureChange / solid.deltaT, timeVector[t]):
+                        break
+
+                    self.saveSnapshot(solid, t)
+                    self.saveCheckpoint(solid, t, probes)
+
+            finally:
+                solid.stopStripWorkers()
+
+        elif self.solutionMethod == ct.EXPLICIT and \
+                solid.getExplicitBackend() == ct.THREADS:
+
+            # two buffers swapped at each time step
+            temperatureBuffer = solid.temperature.copy()
+
+            for t in range(startStep, solid.timeSize):
+
+                temperatureChange = solid.solveEnergyEquationsTiled(
+                    solid.temperature, temperatureBuffer, diffusionCoeffX,
+                    diffusionCoeffY)
+
+                solid.temperature, temperatureBuffer = \
+                    temperatureBuffer, solid.temperature
+
+                solid.boundariesConditionsInPlace(
+                    solid.temperature, boundSource, boundCenterX, boundCenterY,
+                    boundExternalX, boundExternalY)
+
+                if t % self.probeSamplingStride == 0:
+                    probes[t // self.probeSamplingStride] = \
+                        solid.sampleProbes(samplingMatrix, solid.temperature)
+
+                solid.energyBalance = solid.getEnergyBalance(
+                    solid.temperature, conductionCoeffX, conductionCoeffY)
+
+                if solid.isSteadyStateRate(
+                        temperatureChange / solid.deltaT, timeVector[t]):
+                    break
+
+                self.saveSnapshot(solid, t)
+                self.saveCheckpoint(solid, t, probes)
+
+        elif self.solutionMethod == ct.EXPLICIT:
+
+            # two buffers swapped at each time step
+            temperatureBuffer = solid.temperature.copy()
+            scratch = solid.getExplicitScratch()
+
+            for t in range(startStep, solid.timeSize):
+
+                solid.solveEnergyEquationsExplicitInPlace(
+                    solid.temperature, temperatureBuffer, diffusionCoeffX,
+                    diffusionCoeffY, scratch)
+
+                solid.temperature, temperatureBuffer = \
+                    temperatureBuffer, solid.temperature
+
+                solid.boundariesConditionsInPlace(
+                    solid.temperature, boundSource, boundCenterX, boundCenterY,
+                    boundExternalX, boundExternalY)
+
+                if t % self.probeSamplingStride == 0:
+                    probes[t // self.probeSamplingStride] = \
+                        solid.sampleProbes(samplingMatrix, solid.temperature)
+
+                solid.energyBalance = solid.getEnergyBalance(
+                    solid.temperature, conductionCoeffX, conductionCoeffY)
+
+                if solid.isSteadyState(
+                        solid.temperature, temperatureBuffer, timeVector[t]):
+                    break
+
+                self.saveSnapshot(solid, t)
+                self.saveCheckpoint(solid, t, probes)
+
+                # if solid.energyBalance > solid.heatBalanceTolerance:
+                #     print(print("ERROR:: energy balance did not conserved! " +
+                #           "continuity = {}".format(solid.energyBalance)))
+                #     exit()
+
+        elif self.solutionMethod == ct.IMPLICIT:
+
+            for t in range(startStep, solid.timeSize):
+                previousTemperature = solid.temperature
+
+                solid.temperature = solid.solveEnergyEquationsImplicitRobin(
+                    solid, coefficientCenter, diffusionCoeffX,
+                    diffusionCoeffY, boundSource, boundCenterX, boundCenterY,
+                    boundExternalX, boundExternalY)
+
+                solid.temperature = solid.boundariesConditions(
+                    solid.temperature, boundSource, boundCenterX, boundCenterY,
+                    boundExternalX, boundExternalY)
+
+                if t % self.probeSamplingStride == 0:
+                    probes[t // self.probeSamplingStride] = \
+                        solid.sampleProbes(samplingMatrix, solid.temperature)
+
+                solid.energyBalance = solid.getEnergyBalance(
+                    solid.temperature, conductionCoeffX, conductionCoeffY)
+
+                if solid.isSteadyState(
+                        solid.temperature, previousTemperature, timeVector[t]):
+                    break
+
+                self.saveSnapshot(solid, t)
+                self.saveCheckpoint(solid, t, probes)
+
+                # if solid.energyBalance > solid.heatBalanceTolerance:
+                #     print(print("ERROR:: energy balance did not conserved! " +
+                #           "continuity = {}".format(solid.energyBalance)))
+                #     exit()
+
+        elif self.solutionMethod == ct.DIRECT:
+
+            diffusionOperator, ghostSource = solid.getDiffusionOperator(
+                diffusionCoeffX, diffusionCoeffY, solid.getGhostRelations(
+                    boundSource, boundCenterX, boundCenterY, boundExternalX,
+                    boundExternalY))
+
+            factorization = solid.getImplicitFactorization(diffusionOperator)
+
+            for t in range(startStep, solid.timeSize):
+                previousTemperature = solid.temperature
+
+                solid.temperature = solid.solveEnergyEquationsDirect(
+                    solid.temperature, factorization, ghostSource)
+
+                solid.temperature = solid.boundariesConditions(
+                    solid.temperature, boundSource, boundCenterX, boundCenterY,
+                    boundExternalX, boundExternalY)
+
+                if t % self.probeSamplingStride == 0:
+                    probes[t // self.probeSamplingStride] = \
+                        solid.sampleProbes(samplingMatrix, solid.temperature)
+
+                solid.energyBalance = solid.getEnergyBalance(
+                    solid.temperature, conductionCoeffX, conductionCoeffY)
+
+                if solid.isSteadyState(
+                        solid.temperature, previousTemperature, timeVector[t]):
+                    break
+
+                self.saveSnapshot(solid, t)
+                self.saveCheckpoint(solid, t, probes)
+
+        elif self.solutionMethod == ct.CRANK_NICOLSON:
+
+            diffusionOperator, ghostSource = solid.getDiffusionOperator(
+                diffusionCoeffX, diffusionCoeffY, solid.getGhostRelations(
+                    boundSource, boundCenterX, boundCenterY, boundExternalX,
+                    boundExternalY))
+
+            factorization = solid.getImplicitFactorization(
+                diffusionOperator, 0.5)
+
+            for t in range(startStep, solid.timeSize):
+                previousTemperature = solid.temperature
+
+                solid.temperature = solid.solveEnergyEquationsCrankNicolson(
+                    solid.temperature, factorization, diffusionOperator,
+                    ghostSource)
+
+                solid.temperature = solid.boundariesConditions(
+                    solid.temperature, boundSource, boundCenterX, boundCenterY,
+                    boundExternalX, boundExternalY)
+
+                if t % self.probeSamplingStride == 0:
+                    probes[t // self.probeSamplingStride] = \
+                        solid.sampleProbes(samplingMatrix, solid.temperature)
+
+                solid.energyBalance = solid.getEnergyBalance(
+                    solid.temperature, conductionCoeffX, conductionCoeffY)
+
+                if solid.isSteadyState(
+                        solid.temperature, previousTemperature, timeVector[t]):
+                    break
+
+                self.saveSnapshot(solid, t)
+                self.saveCheckpoint(solid, t, probes)
+
+        elif self.solutionMethod == ct.ADI:
+
+            ghostRelations = solid.getGhostRelations(
+                boundSource, boundCenterX, boundCenterY, boundExternalX,
+                boundExternalY)
+
+            factorizations = solid.getAlternatingFactorizations(
+                diffusionCoeffX, diffusionCoeffY, ghostRelations)
+
+            for t in range(startStep, solid.timeSize):
+                previousTemperature = solid.temperature
+
+                solid.temperature = solid.solveEnergyEquationsADI(
+                    solid.temperature, factorizations, diffusionCoeffX,
+                    diffusionCoeffY, ghostRelations)
+
+                solid.temperature = solid.boundariesConditions(
+                    solid.temperature, boundSource, boundCenterX, boundCenterY,
+                    boundExternalX, boundExternalY)
+
+                if t % self.probeSamplingStride == 0:
+                    probes[t // self.probeSamplingStride] = \
+                        solid.sampleProbes(samplingMatrix, solid.temperature)
+
+                solid.energyBalance = solid.getEnergyBalance(
+                    solid.temperature, conductionCoeffX, conductionCoeffY)
+
+                if solid.isSteadyState(
+                        solid.temperature, previousTemperature, timeVector[t]):
+                    break
+
+                self.saveSnapshot(solid, t)
+                self.saveCheckpoint(solid, t, probes)
+
+        elif self.solutionMethod == ct.MULTIGRID:
+
+            ghostRelations = solid.getGhostRelations(
+                boundSource, boundCenterX, boundCenterY, boundExternalX,
+                boundExternalY)
+
+            levels = solid.getMultigridLevels(
+                1., -diffusionCoeffX, -diffusionCoeffY, ghostRelations)
+
+            for t in range(startStep, solid.timeSize):
+                previousTemperature = solid.temperature
+
+                solid.temperature = solid.solveMultigrid(
+                    solid.temperature, solid.temperature, levels,
+                    ghostRelations, solid.iterTolerance)
+
+                solid.temperature = solid.boundariesConditions(
+                    solid.temperature, boundSource, boundCenterX, boundCenterY,
+                    boundExternalX, boundExternalY)
+
+                if t % self.probeSamplingStride == 0:
+                    probes[t // self.probeSamplingStride] = \
+                        solid.sampleProbes(samplingMatrix, solid.temperature)
+
+                solid.energyBalance = solid.getEnergyBalance(
+                    solid.temperature, conductionCoeffX, conductionCoeffY)
+
+                if solid.isSteadyState(
+                        solid.temperature, previousTemperature, timeVector[t]):
+                    break
+
+                self.saveSnapshot(solid, t)
+                self.saveCheckpoint(solid, t, probes)
+
+        else:
+            print("ERROR:: Choose the right type of method!")
+            exit()
+
+        # after an early exit the probes keep their steady values
+        probes[t // self.probeSamplingStride + 1:] = solid.sampleProbes(
+            samplingMatrix, solid.temperature)
+
+        mnx = solid.maxNodeNumberX
+        mny = solid.maxNodeNumberY
+
+        outputTemperature = pd.DataFrame(
+            data={
+                "temperature": solid.temperature[1:mny - 1, 1:mnx - 1].reshape(
+                    solid.coordinateX.shape)})
+
+        outputProbes = pd.DataFrame(data=probes, columns=solid.getProbeNames())
+        outputProbes.insert(0, "t", timeVector[::self.probeSamplingStride])
+
+        self.saveOutputs(
+            outputTemperature, self.getTemperatureOutputPath,
+            self.saveMesh(solid.coordinateX, solid.coordinateY))
+        self.saveOutputs(outputProbes, self.getProbesOutputPath)
+
+        self.stopSnapshots()
+
+        # a finished run does not resume
+        self.clearCheckpoints()
+
+        end = time.time()
+
+        print("Elapsed time: {}".format(end - start))
+
+    def solve2DRobinEnsemble(
+            self, solid: Solid, parameters: dict) -> np.array:
+
+        t: int
+        caseNumber: int
+        probes: np.array
+        ensemble: dict
+        convection: np.array
+        conductivity: np.array
+        timeVector: TimeAxis
+        boundSource: np.array
+        boundCenterX: np.array
+        boundCenterY: np.array
+        boundExternalX: np.array
+        boundExternalY: np.array
+        diffusionCoeffX: np.array
+        diffusionCoeffY: np.array
+        conductionCoeffX: np.array
+        conductionCoeffY: np.array
+        energyBalance: np.array
+        steadyStateTime: np.array
+        steadyStateCounter: np.array
+        previousEnergyBalance: np.array
+        temperature: np.array
+        temperatureBuffer: np.array
+        samplingMatrix: sparse.csr_matrix
+        outputProbes: pd.DataFrame
+        outputEnsemble: pd.DataFrame
+
+        start = time.time()
+
+        if self.solutionMethod != ct.EXPLICIT:
+            print("ERROR:: The ensemble only runs the explicit method!")
+            exit()
+
+        if self.meshStretching != ct.UNIFORM or self.adaptiveRefinement:
+            print("ERROR:: The ensemble only runs the uniform meshes!")
+            exit()
+
+        caseNumber, ensemble = solid.getEnsembleParameters(parameters)
+
+        convection = ensemble["convection"]
+        conductivity = ensemble["conductivity"]
+
+        # ------------------------------------------------------------------- #
+        # Numerical constants, one per case                                   #
+        # ------------------------------------------------------------------- #
+
+        # Boundaries' constants:
+        # ---------------------
+        boundSource = ensemble["heatSource"] * solid.deltaY / conductivity
+        boundCenterX = \
+            (2 * conductivity - convection * solid.deltaX) / \
+            (2 * conductivity + convection * solid.deltaX)
+        boundCenterY = \
+            (2 * conductivity - convection * solid.deltaY) / \
+            (2 * conductivity + convection * solid.deltaY)
+        boundExternalX = 2 * conductivity * solid.deltaX / \
+            (2 * conductivity + convection * solid.deltaX)
+        boundExternalY = 2 * conductivity * solid.deltaY / \
+            (2 * conductivity + convection * solid.deltaY)
+
+        # Energy Equations' constants:
+        # ---------------------------
+        diffusionCoeffX = \
+            ensemble["diffusivity"] * solid.deltaT * solid.invDeltaX**2
+        diffusionCoeffY = \
+            ensemble["diffusivity"] * solid.deltaT * solid.invDeltaY**2
+
+        conductionCoeffX = conductivity * solid.invDeltaX
+        conductionCoeffY = conductivity * solid.invDeltaY
+
+        # coefficients of the field updates, in the precision of the field
+        boundSource, boundCenterX, boundCenterY, boundExternalX, \
+            boundExternalY, diffusionCoeffX, diffusionCoeffY = (
+                coefficient.astype(solid.floatType) for coefficient in (
+                    boundSource, boundCenterX, boundCenterY, boundExternalX,
+                    boundExternalY, diffusionCoeffX, diffusionCoeffY))
+
+        # ------------------------------------------------------------------- #
+        # INITIAL AND BOUNDARY CONDITIONS                                     #
+        # ------------------------------------------------------------------- #
+        temperature = np.broadcast_to(
+            ensemble["initialTemperature"],
+            (caseNumber, solid.maxNodeNumberY, solid.maxNodeNumberX)).astype(
+            solid.floatType)
+
+        solid.setSourceConditionsEnsemble(
+            temperature, boundSource, boundCenterY, boundExternalY,
+            ensemble["environmentTemperature"])
+
+        # ------------------------------------------------------------------- #
+        # START PROBES                                                        #
+        # ------------------------------------------------------------------- #
+        samplingMatrix = solid.getSamplingMatrix()
+
+        probes = np.zeros(
+            (solid.getSampleSize(), caseNumber, samplingMatrix.shape[0]),
+            dtype=np.float64)
+
+        timeVector = solid.getTimeVector()
+
+        energyBalance = np.zeros((caseNumber,), dtype=np.float64)
+        steadyStateTime = np.full((caseNumber,), np.nan, dtype=np.float64)
+        steadyStateCounter = np.zeros((caseNumber,), dtype=np.int64)
+
+        # ------------------------------------------------------------------- #
+        # SOLVE ALL THE CASES TOGETHER                                        #
+        # ------------------------------------------------------------------- #
+
+        # two buffers swapped at each time step
+        temperatureBuffer = temperature.copy()
+        scratch = solid.getEnsembleScratch(caseNumber)
+
+        t = 0
+        for t in range(solid.timeSize):
+
+            solid.solveEnergyEquationsExplicitEnsemble(
+                temperature, temperatureBuffer, diffusionCoeffX,
+                diffusionCoeffY, scratch)
+
+            temperature, temperatureBuffer = temperatureBuffer, temperature
+
+            solid.boundariesConditionsEnsemble(
+                temperature, boundSource, boundCenterX, boundCenterY,
+                boundExternalX, boundExternalY,
+                ensemble["environmentTemperature"])
+
+            if t % self.probeSamplingStride == 0:
+                probes[t // self.probeSamplingStride] = (
+                    samplingMatrix @ temperature.reshape((caseNumber, -1)).T).T
+
+            previousEnergyBalance = energyBalance
+            energyBalance = solid.getEnergyBalanceEnsemble(
+                temperature, conductionCoeffX, conductionCoeffY)
+
+            if not self.steadyStateDetection:
+                continue
+
+            # the steady cases go on with the others, until all are steady
+            steadyCases = solid.getSteadyCasesEnsemble(
+                temperature, temperatureBuffer, energyBalance,
+                previousEnergyBalance, steadyStateCounter)
+
+            steadyStateTime[steadyCases & np.isnan(steadyStateTime)] = \
+                timeVector[t]
+
+            if steadyCases.all():
+                print("Steady state of all cases reached at t = {} s".format(
+                    timeVector[t]))
+                break
+
+        # after an early exit the probes keep their steady values
+        probes[t // self.probeSamplingStride + 1:] = (
+            samplingMatrix @ temperature.reshape((caseNumber, -1)).T).T
+
+        # ------------------------------------------------------------------- #
+        # OUTPUTS: one summary row per case and the probes of every case      #
+        # ------------------------------------------------------------------- #
+        outputEnsemble = pd.DataFrame(data={"case": np.arange(caseNumber)})
+
+        for name, value in ensemble.items():
+            outputEnsemble[name] = value.ravel()
+
+        outputEnsemble["energyBalance"] = energyBalance
+        outputEnsemble["steadyStateTime"] = steadyStateTime
+        outputEnsemble["maxTemperature"] = temperature[
+            :, 1:solid.maxNodeNumberY - 1,
+            1:solid.maxNodeNumberX - 1].max(axis=(1, 2))
+
+        for k, name in enumerate(solid.getProbeNames()):
+            outputEnsemble[name] = probes[-1, :, k]
+
+        outputProbes = pd.DataFrame(
+            data=probes.reshape((probes.shape[0], -1)),
+            columns=["{}_case{}".format(name, case)
+                     for case in range(caseNumber)
+                     for name in solid.getProbeNames()])
+        outputProbes.insert(0, "t", timeVector[::self.probeSamplingStride])
+
+        self.saveOutputs(outputEnsemble, self.getEnsembleOutputPath)
+        self.saveOutputs(outputProbes, self.getEnsembleProbesOutputPath)
+
+        end = time.time()
+
+        print("Elapsed time: {}".format(end - start))
+
+        return temperature
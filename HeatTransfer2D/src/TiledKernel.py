@@ -0,0 +1,124 @@
+# *****************************************************************************
+# *                     TILED KERNEL - 2D HEAT TRANSFER                       *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: thread backend of the explicit method. The interior rows    *
+# * are split into tiles small enough for their temporaries to stay in the   *
+# * L2 cache, and each thread of a pool updates a block of tiles. The NumPy  *
+# * ufuncs release the GIL, so the threads run in parallel without the cost  *
+# * of processes. Each tile has the same operations and order as the NumPy   *
+# * path, so the results are the same.                                       *
+# *****************************************************************************
+import os
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from MeshGenerator import MeshGenerator
+from EnergyEquations import EnergyEquations
+
+# working set of one tile, about the size of a L2 cache
+TILE_BYTES = 1024 * 1024
+# arrays of the working set of a tile: field, estimate and two temporaries
+TILE_ROW_ARRAYS = 4
+
+
+class TiledKernel(MeshGenerator):
+
+    def __init__(self):
+
+        super().__init__()
+
+        self.__threadPool: ThreadPoolExecutor
+        self.__threadTiles: list
+        self.__threadNumber: int
+
+        self.__threadPool = None
+        self.__threadTiles = None
+        self.__threadNumber = self.threadWorkers or os.cpu_count()
+
+    # ======================================================================== #
+    # PRIVATE METHODS                                                          #
+    # ======================================================================== #
+    def __getThreadPool(self) -> ThreadPoolExecutor:
+
+        if self.__threadPool is None:
+            self.__threadPool = ThreadPoolExecutor(
+                max_workers=self.__threadNumber)
+
+        return self.__threadPool
+
+    def __getThreadTiles(self) -> list:
+
+        tileRows: int
+        itemSize: int
+        tiles: np.array
+
+        if self.__threadTiles is not None:
+            return self.__threadTiles
+
+        itemSize = np.dtype(self.floatType).itemsize
+        tileRows = max(TILE_BYTES // (
+            TILE_ROW_ARRAYS * itemSize * self.maxNodeNumberX), 1)
+
+        tiles = np.append(
+            np.arange(1, self.maxNodeNumberY - 1, tileRows),
+            self.maxNodeNumberY - 1)
+
+        # one block of consecutive tiles for each thread
+        self.__threadTiles = [
+            block for block in np.array_split(
+                np.stack((tiles[:-1], tiles[1:]), axis=1),
+                self.__threadNumber) if block.size > 0]
+
+        return self.__threadTiles
+
+    def __solveEnergyTiles(
+            self, tiles: np.array, temperature: np.array,
+            estimateTemperature: np.array, diffusionCoeffX: np.float64,
+            diffusionCoeffY: np.float64) -> np.float64:
+
+        mnx: np.int64
+        temperatureChange: np.float64
+
+        mnx = self.maxNodeNumberX
+
+        # temporaries of one tile, reused by all the tiles of the block
+        diffusionX = np.empty(
+            (tiles[0, 1] - tiles[0, 0], mnx - 2), dtype=temperature.dtype)
+        diffusionY = np.empty_like(diffusionX)
+
+        temperatureChange = 0.
+
+        for rowStart, rowEnd in tiles:
+            scratch = diffusionX[:rowEnd - rowStart], \
+                diffusionY[:rowEnd - rowStart]
+
+            EnergyEquations.solveEnergyEquationsExplicitRows(
+                temperature, estimateTemperature, diffusionCoeffX,
+                diffusionCoeffY, rowStart, rowEnd, scratch)
+
+            # largest temperature change of the tile, for isSteadyState
+            if self.steadyStateDetection:
+                np.subtract(
+                    estimateTemperature[rowStart:rowEnd, 1:mnx-1],
+                    temperature[rowStart:rowEnd, 1:mnx-1], out=scratch[0])
+                temperatureChange = max(
+                    temperatureChange,
+                    np.abs(scratch[0], out=scratch[0]).max())
+
+        return temperatureChange
+
+    # ======================================================================== #
+    #   PUBLIC METHODS
+    # ======================================================================== #
+    def solveEnergyEquationsTiled(
+            self, temperature: np.array, estimateTemperature: np.array,
+            diffusionCoeffX: np.float64, diffusionCoeffY: np.float64) -> \
+            np.float64:
+
+        return max(self.__getThreadPool().map(
+            lambda tiles: self.__solveEnergyTiles(
+                tiles, temperature, estimateTemperature, diffusionCoeffX,
+                diffusionCoeffY),
+            self.__getThreadTiles()))
@@ -0,0 +1,58 @@
+# *****************************************************************************
+# *                        TIME AXIS - 2D HEAT TRANSFER                       *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: time axis of a run. The instants are computed from their     *
+# * index when they are read, t_n = t_0 + n * dt, so no array of the whole    *
+# * run is kept. A slice gives only the instants it selects.                  *
+# *****************************************************************************
+import numpy as np
+
+
+class TimeAxis:
+
+    def __init__(
+            self, initialTime: float, deltaT: float, size: int,
+            finalTime: float = None):
+
+        self.initialTime: float
+        self.deltaT: float
+        self.size: int
+        self.finalTime: float
+
+        # with a final time, the last instant is exactly it (as linspace)
+        self.initialTime = initialTime
+        self.deltaT = deltaT
+        self.size = size
+        self.finalTime = finalTime
+
+    def __len__(self) -> int:
+
+        return self.size
+
+    def __getitem__(self, index):
+
+        indices: range
+        time: np.array
+
+        if isinstance(index, slice):
+            indices = range(self.size)[index]
+
+            time = np.arange(
+                indices.start, indices.stop, indices.step, dtype=float) * \
+                self.deltaT + self.initialTime
+
+            if self.finalTime is not None and len(indices) > 0 and \
+                    indices[-1] == self.size - 1:
+                time[-1] = self.finalTime
+
+            return time
+
+        index = range(self.size)[index]
+
+        if self.finalTime is not None and index == self.size - 1:
+            return self.finalTime
+
+        return self.initialTime + index * self.deltaT
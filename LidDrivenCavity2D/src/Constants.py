@@ -1,44 +1,79 @@
-# *****************************************************************************
-# *                          CONSTANTS - LID CAVITY                           *
-# *****************************************************************************
-# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
-# * E-mail: almeriopamplona@gmail.com                                         *
-# *****************************************************************************
-# * Description: contains constant variables.                                 *
-# *****************************************************************************
-
-import os
-from pathlib import Path
-
-# =========================================================================== #
-# MASTER PATH
-# =========================================================================== #
-OS_SEP = os.sep
-PATH = Path(os.getcwd()).absolute().parent.__str__()
-
-# =========================================================================== #
-# DIRECTORIES
-# =========================================================================== #
-DIR_EXECUTABLES = "src"
-DIR_REPORTS = "Reports"
-DIR_FIGURE = "figure"
-DIR_PRESSURE = "pressure"
-DIR_VELOCITYX = "velocityX"
-DIR_VELOCITYY = "velocityY"
-DIR_REFERENCES = "references"
-DIR_WARNINGS = DIR_REPORTS + OS_SEP + "Warnings"
-
-# =========================================================================== #
-#
-# =========================================================================== #
-PRESSURE_OUTPUT = "pressure"
-VELOCITY_OUTPUT = "velocity"
-VELOCITYX_OUTPUT = "velocityX"
-VELOCITYY_OUTPUT = "velocityY"
-GHIA_VELOCITY_VERTICAL = "ghiaVelocityVertical"
-GHIA_VELOCITY_HORIZONTAL = "ghiaVelocityHorizontal"
-AGARWAL_VELOCITY_VERTICAL = "AgarwalVelocityVertical"
-AGARWAL_VELOCITY_HORIZONTAL = "AgarwalVelocityHorizontal"
-
-FILE_SEP = ";"
-DECIMAL_SEP = "."
+# *****************************************************************************
+# *                          CONSTANTS - LID CAVITY                           *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: contains constant variables.                                 *
+# *****************************************************************************
+
+import os
+from pathlib import Path
+
+# =========================================================================== #
+# MASTER PATH
+# =========================================================================== #
+OS_SEP = os.sep
+PATH = Path(os.getcwd()).absolute().parent.__str__()
+
+# =========================================================================== #
+# DIRECTORIES
+# =========================================================================== #
+DIR_EXECUTABLES = "src"
+DIR_REPORTS = "Reports"
+DIR_FIGURE = "figure"
+DIR_PRESSURE = "pressure"
+DIR_VELOCITYX = "velocityX"
+DIR_VELOCITYY = "velocityY"
+DIR_REFERENCES = "references"
+DIR_SNAPSHOTS = "snapshots"
+DIR_MESH = "mesh"
+DIR_WARNINGS = DIR_REPORTS + OS_SEP + "Warnings"
+
+# =========================================================================== #
+#
+# =========================================================================== #
+PRESSURE_OUTPUT = "pressure"
+VELOCITY_OUTPUT = "velocity"
+VELOCITYX_OUTPUT = "velocityX"
+VELOCITYY_OUTPUT = "velocityY"
+SNAPSHOT_OUTPUT = "snapshots"
+SNAPSHOT_TIME = "time"
+MESH_OUTPUT = "mesh"
+MESH_REFERENCE = "#mesh"
+GHIA_VELOCITY_VERTICAL = "ghiaVelocityVertical"
+GHIA_VELOCITY_HORIZONTAL = "ghiaVelocityHorizontal"
+AGARWAL_VELOCITY_VERTICAL = "AgarwalVelocityVertical"
+AGARWAL_VELOCITY_HORIZONTAL = "AgarwalVelocityHorizontal"
+
+FILE_SEP = ";"
+DECIMAL_SEP = "."
+
+# output formats, NPZ:: one binary array per column
+CSV = "csv"
+NPZ = "npz"
+NPZ_MAGIC = b"PK\x03\x04"
+
+# =========================================================================== #
+# PRESSURE SOLVERS
+# =========================================================================== #
+JACOBI = "jacobi"
+MULTIGRID = "multigrid"
+DCT = "dct"
+
+# multigrid cycles
+V_CYCLE = "V"
+F_CYCLE = "F"
+
+# mesh stretchings, clustered at the walls
+UNIFORM = "uniform"
+TANH = "tanh"
+GEOMETRIC = "geometric"
+
+# stencil backends
+NUMPY = "numpy"
+THREADS = "threads"
+
+# precisions of the fields
+FLOAT32 = "float32"
+FLOAT64 = "float64"
@@ -1,131 +1,193 @@
-# *****************************************************************************
-# *                     CONTROL PARAMETERS - LID CAVITY                       *
-# *****************************************************************************
-# * Author: Almério José Venâncio Pains Soares Pamplona                       *
-# * E-mail: almeriopamplona@gmail.com                                         *
-# *****************************************************************************
-# * Description: parameters of the Lid Cavity numerical solution, using       *
-# * Finite Volume Method.                                                     *
-# *****************************************************************************
-import numpy as np
-
-
-class ControlParameters:
-
-    def __init__(self):
-
-        self.maxIterations: int
-        self.stabilityParamenter: int
-
-        self.nodeNumber: int
-        self.nodeNumberY: int
-        self.maxNodeNumberX: int
-        self.maxNodeNumberY: int
-        self.ghostNodeNumberX: int
-        self.ghostNodeNumberY: int
-
-        self.meshfilename: str
-        self.pressurefilename: str
-        self.velocityXfilename: str
-        self.velocityYfilename: str
-        self.estpressurefilename: str
-        self.estvelocityXfilename: str
-        self.estvelocityYfilename: str
-
-        self.CFL: float                           # -
-        self.PI: float                            # -
-        self.length: float                        # m
-        self.density: float                       # kg / m ** 3
-        self.maxDeltaT: float                     # s
-        self.toleranceMass: float                 # -
-        self.reynoldsNumber: float                # -
-        self.tolerancePressure: float             # -
-        self.relaxationConstant: float            # -
-        self.kinematicViscosity: float            # Pa * s
-
-        self.finalTime: float                     # s
-        self.initialTime: float                   # s
-
-        self.velocityTopX: float                  # m / s
-        self.velocityTopY: float                  # m / s
-        self.velocityLeftX: float                 # m / s
-        self.velocityLeftY: float                 # m / s
-        self.velocityRightX: float                # m / s
-        self.velocityRightY: float                # m / s
-        self.velocityBottomX: float               # m / s
-        self.velocityBottomY: float               # m / s
-
-        self.finalPositionX: float                # m
-        self.finalPositionY: float                # m
-        self.initialPositionX: float              # m
-        self.initialPositionY: float              # m
-
-        self.pressureGradientTop: float           # Pa / m
-        self.pressureGradientBottom: float        # Pa / m
-        self.pressureGradientLeft: float          # Pa / m
-        self.pressureGradientRight: float         # Pa / m
-            
-        PI = np.pi
-
-        # Walls initial conditions:
-        # ------------------------
-
-        # velocity:
-        self.velocityLeftX = 0.0
-        self.velocityLeftY = 0.0
-        self.velocityRightX = 0.0
-        self.velocityRightY = 0.0
-
-        self.velocityTopX = 1.0
-        self.velocityTopY = 0.0
-        self.velocityBottomX = 0.0
-        self.velocityBottomY = 0.0
-
-        # pressure gradient
-        self.pressureGradientLeft = 0.0
-        self.pressureGradientRight = 0.0
-        self.pressureGradientTop = 0.0
-        self.pressureGradientBottom = 0.0
-
-        # Physical properties:
-        # -------------------
-        self.length = 1.0 # height(y - axis) = length(x - axis)
-        self.density = 1.0 / 6.0
-        self.reynoldsNumber = 7500.0
-        self.kinematicViscosity = \
-            (self.velocityTopX * self.length) / self.reynoldsNumber
-
-        # Convergence parameters:
-        # ---------------------
-        self.maxIterations = 100
-        self.toleranceMass = 1.0E-8
-        self.tolerancePressure = 1.0E-3
-        self.relaxationConstant = 0.8
-
-        # Stability parameter:
-        # -------------------
-        self.CFL = 0.0054
-        self.maxDeltaT = 2E-4
-        self.stabilityParamenter = 1   # 0:: uses CFL, 1:: uses maxDeltaT
-
-        # Time domain definitions:
-        # ----------------------
-        self.finalTime = 660
-        self.initialTime = 200
-
-        # Physical domain definitions:
-        # ---------------------------
-        self.finalPositionX = 1.0
-        self.initialPositionX = 0.0
-
-        self.finalPositionY = 1.0
-        self.initialPositionY = 0.0
-
-        # Mesh definitions(uniform and structured):
-        # -----------------------------------------
-        self.nodeNumberX = 128
-        self.nodeNumberY = 128
-        self.ghostNodeNumberX = 2
-        self.ghostNodeNumberY = 2
-        self.maxNodeNumberX = self.nodeNumberX + self.ghostNodeNumberX
-        self.maxNodeNumberY = self.nodeNumberY + self.ghostNodeNumberY
+# *****************************************************************************
+# *                     CONTROL PARAMETERS - LID CAVITY                       *
+# *****************************************************************************
+# * Author: Almério José Venâncio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: parameters of the Lid Cavity numerical solution, using       *
+# * Finite Volume Method.                                                     *
+# *****************************************************************************
+import numpy as np
+import Constants as ct
+
+
+class ControlParameters:
+
+    def __init__(self):
+
+        self.maxIterations: int
+        self.stabilityParamenter: int
+
+        self.nodeNumber: int
+        self.nodeNumberY: int
+        self.maxNodeNumberX: int
+        self.maxNodeNumberY: int
+        self.ghostNodeNumberX: int
+        self.ghostNodeNumberY: int
+
+        self.meshfilename: str
+        self.pressurefilename: str
+        self.velocityXfilename: str
+        self.velocityYfilename: str
+        self.estpressurefilename: str
+        self.estvelocityXfilename: str
+        self.estvelocityYfilename: str
+        self.precision: str
+        self.floatType: type
+        self.meshStretching: str
+        self.stretchingFactor: float
+
+        self.CFL: float                           # -
+        self.PI: float                            # -
+        self.length: float                        # m
+        self.density: float                       # kg / m ** 3
+        self.maxDeltaT: float                     # s
+        self.toleranceMass: float                 # -
+        self.reynoldsNumber: float                # -
+        self.tolerancePressure: float             # -
+        self.relaxationConstant: float            # -
+        self.kinematicViscosity: float            # Pa * s
+
+        self.finalTime: float                     # s
+        self.initialTime: float                   # s
+
+        self.velocityTopX: float                  # m / s
+        self.velocityTopY: float                  # m / s
+        self.velocityLeftX: float                 # m / s
+        self.velocityLeftY: float                 # m / s
+        self.velocityRightX: float                # m / s
+        self.velocityRightY: float                # m / s
+        self.velocityBottomX: float               # m / s
+        self.velocityBottomY: float               # m / s
+
+        self.finalPositionX: float                # m
+        self.finalPositionY: float                # m
+        self.initialPositionX: float              # m
+        self.initialPositionY: float              # m
+
+        self.pressureGradientTop: float           # Pa / m
+        self.pressureGradientBottom: float        # Pa / m
+        self.pressureGradientLeft: float          # Pa / m
+        self.pressureGradientRight: float         # Pa / m
+            
+        PI = np.pi
+
+        # Walls initial conditions:
+        # ------------------------
+
+        # velocity:
+        self.velocityLeftX = 0.0
+        self.velocityLeftY = 0.0
+        self.velocityRightX = 0.0
+        self.velocityRightY = 0.0
+
+        self.velocityTopX = 1.0
+        self.velocityTopY = 0.0
+        self.velocityBottomX = 0.0
+        self.velocityBottomY = 0.0
+
+        # pressure gradient
+        self.pressureGradientLeft = 0.0
+        self.pressureGradientRight = 0.0
+        self.pressureGradientTop = 0.0
+        self.pressureGradientBottom = 0.0
+
+        # Physical properties:
+        # -------------------
+        self.length = 1.0 # height(y - axis) = length(x - axis)
+        self.density = 1.0 / 6.0
+        self.reynoldsNumber = 7500.0
+        self.kinematicViscosity = \
+            (self.velocityTopX * self.length) / self.reynoldsNumber
+
+        # Convergence parameters:
+        # ---------------------
+        self.maxIterations = 100
+        self.toleranceMass = 1.0E-8
+        self.tolerancePressure = 1.0E-3
+        self.relaxationConstant = 0.8
+
+        # Pressure solver:
+        # ---------------
+        self.pressureSolver = ct.JACOBI  # JACOBI, MULTIGRID or DCT
+        self.multigridCycle = ct.V_CYCLE  # V_CYCLE or F_CYCLE
+        self.preSmoothingSweeps = 2
+        self.postSmoothingSweeps = 2
+        self.coarsestSweeps = 20
+        self.coarsestNodeNumber = 4
+
+        # Stencil backend:
+        # ---------------
+        self.stencilBackend = ct.NUMPY  # NUMPY or THREADS (tiled stencils)
+        self.threadWorkers = None  # THREADS threads, None:: all cores
+
+        # Precision:
+        # ---------
+        self.precision = ct.FLOAT64  # FLOAT64 or FLOAT32, of the fields
+
+        # Snapshots:
+        # ---------
+        self.snapshotStride = None  # time steps between two, None:: off
+
+        # Outputs:
+        # -------
+        self.outputFormat = ct.NPZ  # NPZ (binary columns) or CSV
+
+        # Stability parameter:
+        # -------------------
+        self.CFL = 0.0054
+        self.maxDeltaT = 2E-4
+        self.stabilityParamenter = 1   # 0:: uses CFL, 1:: uses maxDeltaT
+
+        # Time domain definitions:
+        # ----------------------
+        self.finalTime = 660
+        self.initialTime = 200
+
+        # Physical domain definitions:
+        # ---------------------------
+        self.finalPositionX = 1.0
+        self.initialPositionX = 0.0
+
+        self.finalPositionY = 1.0
+        self.initialPositionY = 0.0
+
+        # Mesh definitions(uniform and structured):
+        # -----------------------------------------
+        self.nodeNumberX = 128
+        self.nodeNumberY = 128
+        self.ghostNodeNumberX = 2
+        self.ghostNodeNumberY = 2
+        self.meshStretching = ct.UNIFORM  # UNIFORM, TANH or GEOMETRIC
+        self.stretchingFactor = 1.0  # TANH:: slope, GEOMETRIC:: growth ratio
+        self.maxNodeNumberX = self.nodeNumberX + self.ghostNodeNumberX
+        self.maxNodeNumberY = self.nodeNumberY + self.ghostNodeNumberY
+
+        if self.outputFormat not in (ct.NPZ, ct.CSV):
+            print("ERROR:: Choose the NPZ or CSV output format!")
+            exit()
+
+        if self.meshStretching not in (ct.UNIFORM, ct.TANH, ct.GEOMETRIC):
+            print("ERROR:: Choose the UNIFORM, TANH or GEOMETRIC mesh!")
+            exit()
+
+        if self.meshStretching != ct.UNIFORM and self.stretchingFactor <= (
+                0. if self.meshStretching == ct.TANH else 1.):
+            print("ERROR:: The stretching factor is too small!")
+            exit()
+
+        # the explicit central convection is unstable on the thin wall cells
+        if self.meshStretching == ct.TANH and self.stretchingFactor > 1.:
+            print("WARNING:: Tanh stretchings above 1.0 may diverge!")
+
+        if self.meshStretching != ct.UNIFORM and \
+                self.pressureSolver != ct.JACOBI:
+            print("ERROR:: The stretched meshes only run the JACOBI pressure "
+                  "solver!")
+            exit()
+
+        if self.precision not in (ct.FLOAT32, ct.FLOAT64):
+            print("ERROR:: Choose the FLOAT32 or FLOAT64 precision!")
+            exit()
+
+        self.floatType = np.dtype(self.precision).type
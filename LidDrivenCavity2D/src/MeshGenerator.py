@@ -1,121 +1,249 @@
-# *****************************************************************************
-# *                       MESH GENERATOR - LID CAVITY                         *
-# *****************************************************************************
-# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
-# * E-mail: almeriopamplona@gmail.com                                         *
-# *****************************************************************************
-# * Description: generates the mesh parameters and coordinates.               *
-# *****************************************************************************
-
-import numpy as np
-from ControlParameters import ControlParameters
-
-
-class MeshGenerator(ControlParameters):
-
-    def __init__(self):
-
-        super().__init__()
-
-        self.time: np.array
-        self.deltaT: float
-        self.deltaX: float
-        self.deltaY: float
-        self.timeSize: int
-        self.invDeltaX: float
-        self.invDeltaY: float
-        self.spaceSizeX: int
-        self.spaceSizeY: int
-        self.coordinateX: np.array
-        self.coordinateY: np.array
-
-        self.deltaT, self.deltaX, self.deltaY, self.timeSize, \
-            self.spaceSizeX, self.spaceSizeY = self.getMeshParameters()
-
-        self.time = self.getTimeVector()
-        self.invDeltaX = 1. / self.deltaX
-        self.invDeltaY = 1. / self.deltaY
-        self.coordinateX, self.coordinateY = self.getCoordinates()
-
-    def getMeshParameters(self) -> tuple:
-
-        deltaT: float
-        deltaX: float
-        deltaY: float
-        timeSize: int
-        spaceSizeX: int
-        spaceSizeY: int
-
-        # space allocations
-        deltaX = \
-            (self.finalPositionX - self.initialPositionX) / \
-            (self.nodeNumberX - 1)
-        deltaY = \
-            (self.finalPositionY - self.initialPositionY) / \
-            (self.nodeNumberY - 1)
-
-        spaceSizeX = self.maxNodeNumberX * self.maxNodeNumberY
-        spaceSizeY = self.maxNodeNumberX * self.maxNodeNumberY
-
-        # time allocations
-        if self.stabilityParamenter == 0:
-
-            tempDeltaT = \
-                self.CFL * deltaX * deltaY / \
-                (self.velocityTopX * deltaY + self.velocityTopX * deltaX)
-
-        elif self.stabilityParamenter == 1:
-
-            tempDeltaT = self.maxDeltaT
-
-        else:
-            print("ERROR:: define a proper stability parameter!")
-            exit()
-
-        timeSize = int(np.ceil(
-            (self.finalTime - self.initialTime) / tempDeltaT))
-
-        deltaT = (self.finalTime - self.initialTime) / (timeSize - 1)
-
-        return deltaT, deltaX, deltaY, timeSize, spaceSizeX, spaceSizeY
-
-    def getTimeVector(self) -> np.array:
-
-        time: np.array
-
-        time = np.arange(
-            self.initialTime, self.finalTime, self.deltaT, dtype=float)
-
-        return time
-
-    def getCoordinates(self) -> tuple:
-
-        j: int
-        i: int
-        nx: int
-        ny: int
-        rows: int
-        coordinatesX: np.array
-        coordinatesY: np.array
-
-        nx = self.nodeNumberX
-        ny = self.nodeNumberY
-
-        rows = ny * nx
-
-        coordinatesX = np.zeros((rows,), dtype=float)
-        coordinatesY = np.zeros((rows,), dtype=float)
-
-        for j in range(rows):
-            coordinatesX[j] = \
-                self.initialPositionX + self.deltaX * np.mod(j, nx)
-
-        k = 0
-        for i in range(rows):
-            coordinatesY[i] = \
-                self.initialPositionY + self.deltaY * k
-
-            if np.mod(i, nx) == 0:
-                k += 1
-
-        return coordinatesX, coordinatesY
+# *****************************************************************************
+# *                       MESH GENERATOR - LID CAVITY                         *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: generates the mesh parameters and coordinates.               *
+# *****************************************************************************
+
+import weakref
+import numpy as np
+import Constants as ct
+from TimeAxis import TimeAxis
+from RunContext import RunContext
+from ControlParameters import ControlParameters
+
+# mesh attributes kept in the run context
+MESH_ATTRIBUTES = (
+    "deltaT", "deltaX", "deltaY", "timeSize", "invDeltaX", "invDeltaY",
+    "spaceSizeX", "spaceSizeY", "coordinateX", "coordinateY",
+    "laplacianEigenvalues", "axisX", "axisY", "spacingX", "spacingY",
+    "widthX", "widthY", "invWidthX", "invWidthY")
+
+# run contexts in use, by set of control parameters: the components hold
+# them, so a context is dropped with the last component of its run
+RUN_CONTEXTS = weakref.WeakValueDictionary()
+
+
+class MeshGenerator(ControlParameters):
+
+    def __init__(self):
+
+        super().__init__()
+
+        self.deltaT: float
+        self.deltaX: float
+        self.deltaY: float
+        self.timeSize: int
+        self.invDeltaX: float
+        self.invDeltaY: float
+        self.spaceSizeX: int
+        self.spaceSizeY: int
+        self.coordinateX: np.array
+        self.coordinateY: np.array
+        self.laplacianEigenvalues: np.array
+        self.axisX: np.array
+        self.axisY: np.array
+        self.spacingX: np.array
+        self.spacingY: np.array
+        self.widthX: np.array
+        self.widthY: np.array
+        self.invWidthX: np.array
+        self.invWidthY: np.array
+        self.time: TimeAxis
+        self.runContext: RunContext
+
+        self.runContext = self.getRunContext()
+
+        # references to the shared mesh
+        for name in MESH_ATTRIBUTES:
+            setattr(self, name, getattr(self.runContext, name))
+
+        self.time = self.runContext.time
+
+    def getRunContext(self) -> RunContext:
+
+        key: str
+        parameters: dict
+        runContext: RunContext
+
+        # only the control parameters are set at this point
+        parameters = dict(vars(self))
+        key = repr(sorted(parameters.items()))
+        runContext = RUN_CONTEXTS.get(key)
+
+        if runContext is None:
+
+            self.axisX, self.spacingX, self.widthX = self.getAxis(
+                self.initialPositionX, self.finalPositionX, self.nodeNumberX)
+            self.axisY, self.spacingY, self.widthY = self.getAxis(
+                self.initialPositionY, self.finalPositionY, self.nodeNumberY)
+
+            self.deltaT, self.deltaX, self.deltaY, self.timeSize, \
+                self.spaceSizeX, self.spaceSizeY = self.getMeshParameters()
+
+            self.invDeltaX = 1. / self.deltaX
+            self.invDeltaY = 1. / self.deltaY
+            self.coordinateX, self.coordinateY = self.getCoordinates()
+            self.laplacianEigenvalues = self.getLaplacianEigenvalues()
+
+            # divergence of the volumes, a scalar on the uniform meshes and
+            # along the columns (X) and the rows (Y) on the stretched ones
+            self.invWidthX, self.invWidthY = self.invDeltaX, self.invDeltaY
+
+            if self.meshStretching != ct.UNIFORM:
+                self.invWidthX = 1. / self.widthX
+                self.invWidthY = 1. / self.widthY[:, np.newaxis]
+
+            runContext = RunContext(parameters, {
+                name: getattr(self, name) for name in MESH_ATTRIBUTES})
+            RUN_CONTEXTS[key] = runContext
+
+        return runContext
+
+    def getMeshParameters(self) -> tuple:
+
+        deltaT: float
+        deltaX: float
+        deltaY: float
+        timeSize: int
+        spaceSizeX: int
+        spaceSizeY: int
+
+        # space allocations
+        deltaX = \
+            (self.finalPositionX - self.initialPositionX) / \
+            (self.nodeNumberX - 1)
+        deltaY = \
+            (self.finalPositionY - self.initialPositionY) / \
+            (self.nodeNumberY - 1)
+
+        # stretched meshes: the spacing at the walls, which is the smallest
+        # one, so the wall relations and the time step stay the same
+        if self.meshStretching != ct.UNIFORM:
+            deltaX = self.spacingX[0]
+            deltaY = self.spacingY[0]
+
+        spaceSizeX = self.maxNodeNumberX * self.maxNodeNumberY
+        spaceSizeY = self.maxNodeNumberX * self.maxNodeNumberY
+
+        # time allocations
+        if self.stabilityParamenter == 0:
+
+            tempDeltaT = \
+                self.CFL * deltaX * deltaY / \
+                (self.velocityTopX * deltaY + self.velocityTopX * deltaX)
+
+        elif self.stabilityParamenter == 1:
+
+            tempDeltaT = self.maxDeltaT
+
+        else:
+            print("ERROR:: define a proper stability parameter!")
+            exit()
+
+        timeSize = int(np.ceil(
+            (self.finalTime - self.initialTime) / tempDeltaT))
+
+        deltaT = (self.finalTime - self.initialTime) / (timeSize - 1)
+
+        return deltaT, deltaX, deltaY, timeSize, spaceSizeX, spaceSizeY
+
+    def getAxis(
+            self, initialPosition: float, finalPosition: float,
+            nodeNumber: int) -> tuple:
+
+        axis: np.array
+        width: np.array
+        spacing: np.array
+        exponent: np.array
+        coordinate: np.array
+
+        if self.meshStretching == ct.UNIFORM:
+            axis = np.linspace(initialPosition, finalPosition, nodeNumber)
+
+        elif self.meshStretching == ct.TANH:
+            # two-sided hyperbolic tangent, clustered at both walls
+            coordinate = np.tanh(self.stretchingFactor * np.linspace(
+                -1., 1., nodeNumber)) / np.tanh(self.stretchingFactor)
+            axis = initialPosition + \
+                0.5 * (finalPosition - initialPosition) * (1. + coordinate)
+
+        else:
+            # spacing growing by stretchingFactor from both walls
+            exponent = np.arange(nodeNumber - 1)
+            spacing = self.stretchingFactor ** np.minimum(
+                exponent, nodeNumber - 2 - exponent)
+            axis = initialPosition + (finalPosition - initialPosition) * \
+                np.concatenate(([0.], np.cumsum(spacing))) / spacing.sum()
+
+        axis[0] = initialPosition
+        axis[-1] = finalPosition
+
+        # centers of the pressure volumes: the distance between neighbour
+        # centers, ghost volumes included, which are as wide as the wall ones,
+        # and the width of each volume, whose faces are halfway
+        spacing = np.diff(axis)
+        spacing = np.concatenate(([spacing[0]], spacing, [spacing[-1]]))
+        width = 0.5 * (spacing[:-1] + spacing[1:])
+
+        return axis, spacing, width
+
+    @staticmethod
+    def getRowCoefficient(coefficient, rowStart: int, rowEnd: int):
+
+        # coefficients along the rows (stretched meshes) are sliced as the
+        # interior rows rowStart:rowEnd, the other ones are broadcast
+        if np.ndim(coefficient) == 2:
+            return coefficient[rowStart - 1:rowEnd - 1]
+
+        return coefficient
+
+    def getTimeVector(self) -> TimeAxis:
+
+        return self.runContext.time
+
+    def getCoordinates(self) -> tuple:
+
+        nx: int
+        ny: int
+        nodes: np.array
+        coordinatesX: np.array
+        coordinatesY: np.array
+
+        nx = self.nodeNumberX
+        ny = self.nodeNumberY
+
+        nodes = np.arange(ny * nx)
+
+        # node k is at column k % nx and row k // nx, on the axes of the
+        # stretched meshes
+        if self.meshStretching != ct.UNIFORM:
+            return self.axisX[nodes % nx], self.axisY[nodes // nx]
+
+        coordinatesX = self.initialPositionX + self.deltaX * (nodes % nx)
+        coordinatesY = self.initialPositionY + self.deltaY * (nodes // nx)
+
+        return coordinatesX, coordinatesY
+
+    def getLaplacianEigenvalues(self) -> np.array:
+
+        nx: int
+        ny: int
+        eigenvaluesX: np.array
+        eigenvaluesY: np.array
+
+        nx = self.nodeNumberX
+        ny = self.nodeNumberY
+
+        # Five-point Laplacian with the pressure correction conditions: zero
+        # gradient on the walls (cosine modes along x) and zero ghost on the
+        # lid. Along y the columns are extended to an even and odd sequence
+        # of period 4 * ny + 2, whose Fourier modes diagonalize the operator.
+        eigenvaluesX = self.invDeltaX ** 2 * (
+            2. * np.cos(np.pi * np.arange(nx) / nx) - 2.)
+        eigenvaluesY = self.invDeltaY ** 2 * (
+            2. * np.cos(np.pi * np.arange(2 * ny + 2) / (2 * ny + 1)) - 2.)
+
+        return eigenvaluesY[:, np.newaxis] + eigenvaluesX[np.newaxis, :]
@@ -1,259 +1,389 @@
-# *****************************************************************************
-# *                     MOMENTUM EQUATIONS - LID CAVITY                       *
-# *****************************************************************************
-# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
-# * E-mail: almeriopamplona@gmail.com                                         *
-# *****************************************************************************
-# * Description: contains the discrete form of the Navier-Stokes equations    * 
-# * and the velocity field treatment on the boundaries.                       *
-# *****************************************************************************
-import numpy as np
-from MeshGenerator import MeshGenerator
-
-
-class MomentumEquations(MeshGenerator):
-
-    def __init__(self):
-        super().__init__()
-
-    def boundaryConditionVelocityX(self, velocityX: np.array) -> np.array:
-        mnx: int
-        mny: int
-        velocityTempX: np.array
-
-        mnx = self.maxNodeNumberX - 1
-        mny = self.maxNodeNumberY - 1
-        velocityTempX = velocityX.copy()
-
-        # TOP
-        velocityTempX[mny, :] = \
-            2 * self.velocityTopX - velocityTempX[mny - 1, :]
-        # BOTTOM
-        velocityTempX[0, :] = - velocityTempX[1, :]
-        # LEFT WALL
-        velocityTempX[:, 0] = self.velocityLeftX
-        # RIGHT WALL
-        velocityTempX[:, mnx - 1] = self.velocityRightX
-
-        return velocityTempX
-
-    def boundaryConditionEstVelocityX(
-            self, estimateVelocityX: np.array) -> np.array:
-        mnx: int
-        velocityTempX: np.array
-
-        mnx = self.maxNodeNumberX - 1
-        velocityTempX = estimateVelocityX.copy()
-
-        # LEFT WALL
-        velocityTempX[:, 0] = self.velocityLeftX
-        # RIGHT WALL
-        velocityTempX[:, mnx - 1] = self.velocityRightX
-
-        return velocityTempX
-
-    def boundaryConditionVelocityY(self, velocityY: np.array) -> np.array:
-        mnx: int
-        mny: int
-        velocityTempX: np.array
-
-        mnx = self.maxNodeNumberX - 1
-        mny = self.maxNodeNumberY - 1
-        velocityTempY = velocityY.copy()
-
-        # LEFT WALL
-        velocityTempY[:, 0] = - velocityY[:, 1]
-        # RIGHT WALL
-        velocityTempY[:, mnx] = - velocityY[:, mnx - 1]
-        # TOP WALL
-        velocityTempY[mny - 1, :] = self.velocityTopY
-        # BOTTOM WALL
-        velocityTempY[0, :] = self.velocityBottomY
-
-        return velocityTempY
-
-    def boundaryConditionEstVelocityY(
-            self, estimateVelocityY: np.array) -> np.array:
-        mny: int
-        velocityTempX: np.array
-
-        mny = self.maxNodeNumberY
-        velocityTempY = estimateVelocityY.copy()
-
-        # TOP WALL
-        velocityTempY[mny - 1, :] = self.velocityTopY
-        # BOTTOM WALL
-        velocityTempY[0, :] = self.velocityBottomY
-
-        return velocityTempY
-
-    def solveMomentumAxisX(
-            self, pressure: np.array, velocityX: np.array, velocityY: np.array,
-            estimateVelocityX: np.array, coefficientPressureX: float,
-            coefficientDiffusionX: float, coefficientDiffusionY: float,
-            coefficientConvectionX: float, coefficientConvectionY: float) -> \
-            np.array:
-        mnx: int
-        mny: int
-        velocityTempX: np.array
-
-        diffusionX: np.array
-        diffusionY: np.array
-        convectionX: np.array
-        convectionY: np.array
-        pressureGradient: np.array
-        velocitySurfaceEastX: np.array
-        velocitySurfaceWestX: np.array
-        velocitySurfaceNorthX: np.array
-        velocitySurfaceSouthX: np.array
-        velocitySurfaceNorthY: np.array
-        velocitySurfaceSouthY: np.array
-
-        mnx = self.maxNodeNumberX
-        mny = self.maxNodeNumberY
-        velocityTempX = estimateVelocityX.copy()
-
-        pressureGradient = coefficientPressureX * (
-                pressure[1:mny - 1, 2:mnx] - pressure[1:mny - 1, 1:mnx - 1])
-
-        velocitySurfaceEastX = \
-            velocityX[1:mny - 1, 2:mnx] + \
-            velocityX[1:mny - 1, 1:mnx - 1]
-        velocitySurfaceWestX = \
-            velocityX[1:mny - 1, 0:mnx - 2] + \
-            velocityX[1:mny - 1, 1:mnx - 1]
-        velocitySurfaceNorthX = \
-            velocityX[2:mny, 1:mnx - 1] + \
-            velocityX[1:mny - 1, 1:mnx - 1]
-        velocitySurfaceSouthX = \
-            velocityX[0:mny - 2, 1:mnx - 1] + \
-            velocityX[1:mny - 1, 1:mnx - 1]
-
-        velocitySurfaceNorthY = \
-            velocityY[1:mny - 1, 2:mnx] + \
-            velocityY[1:mny - 1, 1:mnx - 1]
-        velocitySurfaceSouthY = \
-            velocityY[0:mny - 2, 2:mnx] + \
-            velocityY[0:mny - 2, 1:mnx - 1]
-
-        convectionX = coefficientConvectionX * (
-                velocitySurfaceEastX * velocitySurfaceEastX -
-                velocitySurfaceWestX * velocitySurfaceWestX)
-
-        convectionY = coefficientConvectionY * (
-                velocitySurfaceNorthX * velocitySurfaceNorthY -
-                velocitySurfaceSouthX * velocitySurfaceSouthY)
-
-        diffusionX = coefficientDiffusionX * (
-                velocityX[1:mny - 1, 2:mnx] - 2 *
-                velocityX[1:mny - 1, 1:mnx - 1] +
-                velocityX[1:mny - 1, 0:mnx - 2])
-
-        diffusionY = coefficientDiffusionY * (
-                velocityX[2:mny, 1:mnx - 1] - 2 *
-                velocityX[1:mny - 1, 1:mnx - 1] +
-                velocityX[0: mny - 2, 1:mnx - 1])
-
-        velocityTempX[1:mny - 1, 1:mnx - 1] = \
-            velocityX[1:mny - 1, 1:mnx - 1] - pressureGradient - \
-            convectionX - convectionY + diffusionX + diffusionY
-
-        return velocityTempX
-
-    def solveMomentumAxisY(
-            self, pressure: np.array, velocityX: np.array, velocityY: np.array,
-            estimateVelocityY: np.array, coefficientPressureY: float,
-            coefficientDiffusionX: float, coefficientDiffusionY: float,
-            coefficientConvectionX: float, coefficientConvectionY: float) -> \
-            np.array:
-        mnx: int
-        mny: int
-        velocityTempX: np.array
-
-        diffusionX: np.array
-        diffusionY: np.array
-        convectionX: np.array
-        convectionY: np.array
-        pressureGradient: np.array
-        velocitySurfaceEastX: np.array
-        velocitySurfaceWestX: np.array
-        velocitySurfaceEastY: np.array
-        velocitySurfaceWestY: np.array
-        velocitySurfaceNorthY: np.array
-        velocitySurfaceSouthY: np.array
-
-        mnx = self.maxNodeNumberX
-        mny = self.maxNodeNumberY
-        velocityTempY = estimateVelocityY.copy()
-
-        pressureGradient = coefficientPressureY * (
-                pressure[2:mny, 1:mnx - 1] - pressure[1:mny - 1, 1: mnx - 1])
-
-        velocitySurfaceEastY = \
-            velocityY[1:mnx - 1, 2:mnx] + \
-            velocityY[1:mny - 1, 1:mnx - 1]
-        velocitySurfaceWestY = \
-            velocityY[1:mny - 1, 0:mnx - 2] + \
-            velocityY[1:mny - 1, 1:mnx - 1]
-        velocitySurfaceNorthY = \
-            velocityY[2:mny, 1:mnx - 1] + \
-            velocityY[1:mny - 1, 1:mnx - 1]
-        velocitySurfaceSouthY = \
-            velocityY[0:mny - 2, 1:mnx - 1] + \
-            velocityY[1:mny - 1, 1:mnx - 1]
-
-        velocitySurfaceEastX = \
-            velocityX[2:mny, 1:mnx - 1] + velocityX[1:mny - 1, 1:mnx - 1]
-        velocitySurfaceWestX = \
-            velocityX[2:mny, 0:mnx - 2] + velocityX[1:mny - 1, 0:mnx - 2]
-
-        convectionX = coefficientConvectionX * (
-                velocitySurfaceEastY * velocitySurfaceEastX -
-                velocitySurfaceWestY * velocitySurfaceWestX)
-
-        convectionY = coefficientConvectionY * (
-                velocitySurfaceNorthY * velocitySurfaceNorthY -
-                velocitySurfaceSouthY * velocitySurfaceSouthY)
-
-        diffusionX = coefficientDiffusionX * (
-                velocityY[1:mny - 1, 2:mnx] - 2 *
-                velocityY[1:mny - 1, 1:mnx - 1] +
-                velocityY[1:mny - 1, 0:mnx - 2])
-
-        diffusionY = coefficientDiffusionY * (
-                velocityY[2:mny, 1:mnx - 1] - 2 *
-                velocityY[1:mny - 1, 1:mnx - 1] +
-                velocityY[0:mny - 2, 1:mnx - 1])
-
-        velocityTempY[1:mny - 1, 1:mnx - 1] = \
-            velocityY[1:mny - 1, 1:mnx - 1] - pressureGradient - \
-            convectionX - convectionY + diffusionX + diffusionY
-
-        return velocityTempY
-
-    def getCollocatedVelocities(
-            self, velocityX: np.array, velocityY: np.array) -> tuple:
-        mnx: int
-        mny: int
-        collocatedVelocityX: np.array
-        collocatedVelocityY: np.array
-
-        mnx = self.maxNodeNumberX
-        mny = self.maxNodeNumberY
-
-        collocatedVelocityX = np.zeros((mny, mny), dtype=np.float)
-        collocatedVelocityY = np.zeros((mny, mny), dtype=np.float)
-
-        collocatedVelocityX[:, 1:mnx - 1] = \
-            .5 * (velocityX[:, 1:mnx - 1] + velocityX[:, 0:mnx - 2])
-
-        collocatedVelocityY[1:mny - 1, :] = \
-            .5 * (velocityY[1:mny - 1, :] + velocityY[0:mny - 2, :])
-
-        collocatedVelocityX = \
-            self.boundaryConditionVelocityX(collocatedVelocityX)
-
-        collocatedVelocityY = \
-            self.boundaryConditionVelocityY(collocatedVelocityY)
-
-        return collocatedVelocityX, collocatedVelocityY
+# *****************************************************************************
+# *                     MOMENTUM EQUATIONS - LID CAVITY                       *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: contains the discrete form of the Navier-Stokes equations    * 
+# * and the velocity field treatment on the boundaries.                       *
+# *****************************************************************************
+import numpy as np
+import Constants as ct
+from MeshGenerator import MeshGenerator
+
+
+class MomentumEquations(MeshGenerator):
+
+    def __init__(self):
+        super().__init__()
+
+    def __getDiffusion(
+            self, coefficientDiffusion, velocityForward: np.array,
+            velocity: np.array, velocityBackward: np.array, rowStart: int,
+            rowEnd: int) -> np.array:
+
+        # (forward, backward) coefficients on the stretched meshes
+        if isinstance(coefficientDiffusion, tuple):
+            return self.getRowCoefficient(
+                coefficientDiffusion[0], rowStart, rowEnd) * (
+                velocityForward - velocity) + self.getRowCoefficient(
+                coefficientDiffusion[1], rowStart, rowEnd) * (
+                velocityBackward - velocity)
+
+        return coefficientDiffusion * (
+                velocityForward - 2 * velocity + velocityBackward)
+
+    def __getFloatType(self, coefficient):
+
+        if isinstance(coefficient, tuple):
+            return tuple(
+                value.astype(self.floatType) for value in coefficient)
+
+        return coefficient.astype(self.floatType)
+
+    def getStretchedMomentumCoefficients(
+            self, coefficientsX: tuple, coefficientsY: tuple) -> tuple:
+
+        deltaT: float
+        viscosity: float
+        spacingX: np.array
+        spacingY: np.array
+        widthX: np.array
+        widthY: np.array
+        ghostWidthX: np.array
+        ghostWidthY: np.array
+
+        if self.meshStretching == ct.UNIFORM:
+            return coefficientsX, coefficientsY
+
+        deltaT = self.deltaT
+        viscosity = 1. / self.reynoldsNumber
+
+        # The volume of velocityX is centered on the east face of a pressure
+        # volume: it is as wide as the distance between the centers and as
+        # high as the pressure volume, and the other way round for
+        # velocityY. Y coefficients are along the rows (a column vector).
+        spacingX = self.spacingX
+        spacingY = self.spacingY[:, np.newaxis]
+        widthX = self.widthX
+        widthY = self.widthY[:, np.newaxis]
+        ghostWidthX = np.concatenate(
+            (spacingX[:1], widthX, spacingX[-1:]))
+        ghostWidthY = np.concatenate(
+            (spacingY[:1], widthY, spacingY[-1:]))
+
+        coefficientsX = (
+            deltaT / spacingX[1:],
+            (viscosity * deltaT / (ghostWidthX[2:] * spacingX[1:]),
+             viscosity * deltaT / (ghostWidthX[1:-1] * spacingX[1:])),
+            (viscosity * deltaT / (spacingY[1:] * widthY),
+             viscosity * deltaT / (spacingY[:-1] * widthY)),
+            0.25 * deltaT / spacingX[1:],
+            0.25 * deltaT / widthY)
+
+        coefficientsY = (
+            deltaT / spacingY[1:],
+            (viscosity * deltaT / (spacingX[1:] * widthX),
+             viscosity * deltaT / (spacingX[:-1] * widthX)),
+            (viscosity * deltaT / (ghostWidthY[2:] * spacingY[1:]),
+             viscosity * deltaT / (ghostWidthY[1:-1] * spacingY[1:])),
+            0.25 * deltaT / widthX,
+            0.25 * deltaT / spacingY[1:])
+
+        return tuple(self.__getFloatType(coefficient)
+                     for coefficient in coefficientsX), \
+            tuple(self.__getFloatType(coefficient)
+                  for coefficient in coefficientsY)
+
+    def boundaryConditionVelocityX(self, velocityX: np.array) -> np.array:
+        mnx: int
+        mny: int
+        velocityTempX: np.array
+
+        mnx = self.maxNodeNumberX - 1
+        mny = self.maxNodeNumberY - 1
+        velocityTempX = velocityX.copy()
+
+        # TOP
+        velocityTempX[mny, :] = \
+            2 * self.velocityTopX - velocityTempX[mny - 1, :]
+        # BOTTOM
+        velocityTempX[0, :] = - velocityTempX[1, :]
+        # LEFT WALL
+        velocityTempX[:, 0] = self.velocityLeftX
+        # RIGHT WALL
+        velocityTempX[:, mnx - 1] = self.velocityRightX
+
+        return velocityTempX
+
+    def boundaryConditionEstVelocityX(
+            self, estimateVelocityX: np.array) -> np.array:
+        mnx: int
+        velocityTempX: np.array
+
+        mnx = self.maxNodeNumberX - 1
+        velocityTempX = estimateVelocityX.copy()
+
+        # LEFT WALL
+        velocityTempX[:, 0] = self.velocityLeftX
+        # RIGHT WALL
+        velocityTempX[:, mnx - 1] = self.velocityRightX
+
+        return velocityTempX
+
+    def boundaryConditionVelocityY(self, velocityY: np.array) -> np.array:
+        mnx: int
+        mny: int
+        velocityTempX: np.array
+
+        mnx = self.maxNodeNumberX - 1
+        mny = self.maxNodeNumberY - 1
+        velocityTempY = velocityY.copy()
+
+        # LEFT WALL
+        velocityTempY[:, 0] = - velocityY[:, 1]
+        # RIGHT WALL
+        velocityTempY[:, mnx] = - velocityY[:, mnx - 1]
+        # TOP WALL
+        velocityTempY[mny - 1, :] = self.velocityTopY
+        # BOTTOM WALL
+        velocityTempY[0, :] = self.velocityBottomY
+
+        return velocityTempY
+
+    def boundaryConditionEstVelocityY(
+            self, estimateVelocityY: np.array) -> np.array:
+        mny: int
+        velocityTempX: np.array
+
+        mny = self.maxNodeNumberY
+        velocityTempY = estimateVelocityY.copy()
+
+        # TOP WALL
+        velocityTempY[mny - 1, :] = self.velocityTopY
+        # BOTTOM WALL
+        velocityTempY[0, :] = self.velocityBottomY
+
+        return velocityTempY
+
+    def solveMomentumAxisX(
+            self, pressure: np.array, velocityX: np.array, velocityY: np.array,
+            estimateVelocityX: np.array, coefficientPressureX: float,
+            coefficientDiffusionX: float, coefficientDiffusionY: float,
+            coefficientConvectionX: float, coefficientConvectionY: float) -> \
+            np.array:
+        mnx: int
+        mny: int
+        velocityTempX: np.array
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+        velocityTempX = estimateVelocityX.copy()
+
+        velocityTempX[1:mny - 1, 1:mnx - 1] = self.solveMomentumAxisXRows(
+            pressure, velocityX, velocityY, coefficientPressureX,
+            coefficientDiffusionX, coefficientDiffusionY,
+            coefficientConvectionX, coefficientConvectionY, 1, mny - 1)
+
+        return velocityTempX
+
+    def solveMomentumAxisXRows(
+            self, pressure: np.array, velocityX: np.array, velocityY: np.array,
+            coefficientPressureX: float, coefficientDiffusionX: float,
+            coefficientDiffusionY: float, coefficientConvectionX: float,
+            coefficientConvectionY: float, rowStart: int, rowEnd: int) -> \
+            np.array:
+        mnx: int
+        r0: int
+        r1: int
+
+        diffusionX: np.array
+        diffusionY: np.array
+        convectionX: np.array
+        convectionY: np.array
+        pressureGradient: np.array
+        velocitySurfaceEastX: np.array
+        velocitySurfaceWestX: np.array
+        velocitySurfaceNorthX: np.array
+        velocitySurfaceSouthX: np.array
+        velocitySurfaceNorthY: np.array
+        velocitySurfaceSouthY: np.array
+
+        # interior rows rowStart:rowEnd, with their south and north neighbours
+        mnx = self.maxNodeNumberX
+        r0 = rowStart
+        r1 = rowEnd
+
+        coefficientPressureX = self.getRowCoefficient(
+            coefficientPressureX, r0, r1)
+        coefficientConvectionX = self.getRowCoefficient(
+            coefficientConvectionX, r0, r1)
+        coefficientConvectionY = self.getRowCoefficient(
+            coefficientConvectionY, r0, r1)
+
+        pressureGradient = coefficientPressureX * (
+                pressure[r0:r1, 2:mnx] - pressure[r0:r1, 1:mnx - 1])
+
+        velocitySurfaceEastX = \
+            velocityX[r0:r1, 2:mnx] + \
+            velocityX[r0:r1, 1:mnx - 1]
+        velocitySurfaceWestX = \
+            velocityX[r0:r1, 0:mnx - 2] + \
+            velocityX[r0:r1, 1:mnx - 1]
+        velocitySurfaceNorthX = \
+            velocityX[r0 + 1:r1 + 1, 1:mnx - 1] + \
+            velocityX[r0:r1, 1:mnx - 1]
+        velocitySurfaceSouthX = \
+            velocityX[r0 - 1:r1 - 1, 1:mnx - 1] + \
+            velocityX[r0:r1, 1:mnx - 1]
+
+        velocitySurfaceNorthY = \
+            velocityY[r0:r1, 2:mnx] + \
+            velocityY[r0:r1, 1:mnx - 1]
+        velocitySurfaceSouthY = \
+            velocityY[r0 - 1:r1 - 1, 2:mnx] + \
+            velocityY[r0 - 1:r1 - 1, 1:mnx - 1]
+
+        convectionX = coefficientConvectionX * (
+                velocitySurfaceEastX * velocitySurfaceEastX -
+                velocitySurfaceWestX * velocitySurfaceWestX)
+
+        convectionY = coefficientConvectionY * (
+                velocitySurfaceNorthX * velocitySurfaceNorthY -
+                velocitySurfaceSouthX * velocitySurfaceSouthY)
+
+        diffusionX = self.__getDiffusion(
+            coefficientDiffusionX, velocityX[r0:r1, 2:mnx],
+            velocityX[r0:r1, 1:mnx - 1], velocityX[r0:r1, 0:mnx - 2], r0, r1)
+
+        diffusionY = self.__getDiffusion(
+            coefficientDiffusionY, velocityX[r0 + 1:r1 + 1, 1:mnx - 1],
+            velocityX[r0:r1, 1:mnx - 1],
+            velocityX[r0 - 1:r1 - 1, 1:mnx - 1], r0, r1)
+
+        return velocityX[r0:r1, 1:mnx - 1] - pressureGradient - \
+            convectionX - convectionY + diffusionX + diffusionY
+
+    def solveMomentumAxisY(
+            self, pressure: np.array, velocityX: np.array, velocityY: np.array,
+            estimateVelocityY: np.array, coefficientPressureY: float,
+            coefficientDiffusionX: float, coefficientDiffusionY: float,
+            coefficientConvectionX: float, coefficientConvectionY: float) -> \
+            np.array:
+        mnx: int
+        mny: int
+        velocityTempY: np.array
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+        velocityTempY = estimateVelocityY.copy()
+
+        velocityTempY[1:mny - 1, 1:mnx - 1] = self.solveMomentumAxisYRows(
+            pressure, velocityX, velocityY, coefficientPressureY,
+            coefficientDiffusionX, coefficientDiffusionY,
+            coefficientConvectionX, coefficientConvectionY, 1, mny - 1)
+
+        return velocityTempY
+
+    def solveMomentumAxisYRows(
+            self, pressure: np.array, velocityX: np.array, velocityY: np.array,
+            coefficientPressureY: float, coefficientDiffusionX: float,
+            coefficientDiffusionY: float, coefficientConvectionX: float,
+            coefficientConvectionY: float, rowStart: int, rowEnd: int) -> \
+            np.array:
+        mnx: int
+        r0: int
+        r1: int
+
+        diffusionX: np.array
+        diffusionY: np.array
+        convectionX: np.array
+        convectionY: np.array
+        pressureGradient: np.array
+        velocitySurfaceEastX: np.array
+        velocitySurfaceWestX: np.array
+        velocitySurfaceEastY: np.array
+        velocitySurfaceWestY: np.array
+        velocitySurfaceNorthY: np.array
+        velocitySurfaceSouthY: np.array
+
+        # interior rows rowStart:rowEnd, with their south and north neighbours
+        mnx = self.maxNodeNumberX
+        r0 = rowStart
+        r1 = rowEnd
+
+        coefficientPressureY = self.getRowCoefficient(
+            coefficientPressureY, r0, r1)
+        coefficientConvectionX = self.getRowCoefficient(
+            coefficientConvectionX, r0, r1)
+        coefficientConvectionY = self.getRowCoefficient(
+            coefficientConvectionY, r0, r1)
+
+        pressureGradient = coefficientPressureY * (
+                pressure[r0 + 1:r1 + 1, 1:mnx - 1] -
+                pressure[r0:r1, 1: mnx - 1])
+
+        velocitySurfaceEastY = \
+            velocityY[r0:r1, 2:mnx] + \
+            velocityY[r0:r1, 1:mnx - 1]
+        velocitySurfaceWestY = \
+            velocityY[r0:r1, 0:mnx - 2] + \
+            velocityY[r0:r1, 1:mnx - 1]
+        velocitySurfaceNorthY = \
+            velocityY[r0 + 1:r1 + 1, 1:mnx - 1] + \
+            velocityY[r0:r1, 1:mnx - 1]
+        velocitySurfaceSouthY = \
+            velocityY[r0 - 1:r1 - 1, 1:mnx - 1] + \
+            velocityY[r0:r1, 1:mnx - 1]
+
+        velocitySurfaceEastX = \
+            velocityX[r0 + 1:r1 + 1, 1:mnx - 1] + velocityX[r0:r1, 1:mnx - 1]
+        velocitySurfaceWestX = \
+            velocityX[r0 + 1:r1 + 1, 0:mnx - 2] + velocityX[r0:r1, 0:mnx - 2]
+
+        convectionX = coefficientConvectionX * (
+                velocitySurfaceEastY * velocitySurfaceEastX -
+                velocitySurfaceWestY * velocitySurfaceWestX)
+
+        convectionY = coefficientConvectionY * (
+                velocitySurfaceNorthY * velocitySurfaceNorthY -
+                velocitySurfaceSouthY * velocitySurfaceSouthY)
+
+        diffusionX = self.__getDiffusion(
+            coefficientDiffusionX, velocityY[r0:r1, 2:mnx],
+            velocityY[r0:r1, 1:mnx - 1], velocityY[r0:r1, 0:mnx - 2], r0, r1)
+
+        diffusionY = self.__getDiffusion(
+            coefficientDiffusionY, velocityY[r0 + 1:r1 + 1, 1:mnx - 1],
+            velocityY[r0:r1, 1:mnx - 1],
+            velocityY[r0 - 1:r1 - 1, 1:mnx - 1], r0, r1)
+
+        return velocityY[r0:r1, 1:mnx - 1] - pressureGradient - \
+            convectionX - convectionY + diffusionX + diffusionY
+
+    def getCollocatedVelocities(
+            self, velocityX: np.array, velocityY: np.array) -> tuple:
+        mnx: int
+        mny: int
+        collocatedVelocityX: np.array
+        collocatedVelocityY: np.array
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        collocatedVelocityX = np.zeros((mny, mny), dtype=self.floatType)
+        collocatedVelocityY = np.zeros((mny, mny), dtype=self.floatType)
+
+        collocatedVelocityX[:, 1:mnx - 1] = \
+            .5 * (velocityX[:, 1:mnx - 1] + velocityX[:, 0:mnx - 2])
+
+        collocatedVelocityY[1:mny - 1, :] = \
+            .5 * (velocityY[1:mny - 1, :] + velocityY[0:mny - 2, :])
+
+        collocatedVelocityX = \
+            self.boundaryConditionVelocityX(collocatedVelocityX)
+
+        collocatedVelocityY = \
+            self.boundaryConditionVelocityY(collocatedVelocityY)
+
+        return collocatedVelocityX, collocatedVelocityY
@@ -1,147 +1,294 @@
-# *****************************************************************************
-# *                     POISSON EQUATION - LID CAVITY                         *
-# *****************************************************************************
-# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
-# * E-mail: almeriopamplona@gmail.com                                         *
-# *****************************************************************************
-# * Description: contains the Poisson Equation discrete form and the pressure *
-# * treatment on the boundaries.                                              *
-# *****************************************************************************
-import numpy as np
-from MeshGenerator import MeshGenerator
-
-
-class PoissonEquation(MeshGenerator):
-
-    def __init__(self):
-
-        super().__init__()
-
-    def getPoissonSolution(
-            self, estimateVelocityX: np.array, estimateVelocityY: np.array) -> \
-            np.array:
-
-        mnx: int
-        mny: int
-        poissonSolution: np.array
-        verticalDivergent: np.array
-        horizontalDivergent: np.array
-
-        mnx = self.maxNodeNumberX
-        mny = self.maxNodeNumberY
-
-        poissonSolution = np.zeros((mny, mnx), dtype=np.float)
-
-        horizontalDivergent = self.invDeltaX * (
-                estimateVelocityX[1:mny - 1, 1:mnx - 1] -
-                estimateVelocityX[1:mny - 1, 0:mnx - 2])
-
-        verticalDivergent = self.invDeltaY * (
-                estimateVelocityY[1:mny - 1, 1:mnx - 1] -
-                estimateVelocityY[0:mny - 2, 1:mnx - 1])
-
-        stressTerm = \
-            horizontalDivergent ** 2 + \
-            2 * horizontalDivergent * verticalDivergent + \
-            verticalDivergent ** 2
-
-        poissonSolution[1: mny - 1, 1:mnx - 1] = \
-            horizontalDivergent + verticalDivergent - stressTerm
-
-        return poissonSolution
-
-    def boundaryConditionsPressure(self, pressure: np.array) -> np.array:
-
-        mnx: int
-        mny: int
-        pressureTemp: np.array
-
-        mnx = self.maxNodeNumberX - 1
-        mny = self.maxNodeNumberY - 1
-        pressureTemp = pressure.copy()
-
-        # LEFt WALL
-        pressureTemp[:, 0] = pressure[:, 1]
-        # BOTTOM WALL
-        pressureTemp[0, :] = pressure[1, :]
-        # RIGHT WALL
-        pressureTemp[:, mnx] = pressure[:, mnx - 1]
-        # TOP WALL
-        pressureTemp[mny, :] = self.pressureGradientTop
-
-        return pressureTemp
-
-    def solvePoissonEquation(
-            self, poissonSolution: np.array, coefficientCenter: float,
-            coefficientEast: float, coefficientWest: float,
-            coefficientNorth: float, coefficientSouth: float) -> np.array:
-
-        k: int
-        mnx: int 
-        mny: int  
-        maxItera: int
-
-        mnx = self.maxNodeNumberX
-        mny = self.maxNodeNumberY
-
-        maxItera = 100
-
-        estimatePressure = np.zeros((mny, mnx), dtype=np.float)
-        temporaryPressure = estimatePressure.copy()
-
-        k = 0
-        norm = 0.
-        # Newton - Raphson method with under - relaxation:
-        for k in range(maxItera + 1):
-
-            estimatePressure[1: mny - 1, 1: mnx - 1] = \
-                temporaryPressure[1: mny - 1, 1: mnx - 1] - \
-                self.relaxationConstant * (
-                    coefficientCenter *
-                    temporaryPressure[1:mny - 1, 1:mnx - 1] +
-                    coefficientEast * temporaryPressure[1:mny - 1, 2:mnx] +
-                    coefficientWest * temporaryPressure[1:mny - 1, 0:mnx - 2] +
-                    coefficientNorth * temporaryPressure[2:mny, 1:mnx - 1] +
-                    coefficientSouth * temporaryPressure[0:mny - 2, 1:mnx - 1] -
-                    poissonSolution[1:mny - 1, 1:mnx - 1]) / coefficientCenter
-
-            norm = np.sqrt(np.sum((estimatePressure - temporaryPressure) ** 2))
-
-            if norm <= self.tolerancePressure:
-                # print(
-                #     "WARNING:: Pressure converged!, " +
-                #     "error = {} and num iter = {}".format(norm, k))
-                break
-
-            temporaryPressure = estimatePressure
-
-        # if (k >= maxItera) and (norm > 1.0):
-        #     print("WARNING:: Pressure did not converged!, "
-        #           "error = {}, num iter = {}".format(norm, k))
-
-        return estimatePressure
-
-    def getMassConservation(
-            self, velocityX: np.array, velocityY: np.array) -> float:
-
-        mnx: int
-        mny: int
-        continuity: float
-        massConservation: np.array
-        verticalDivergent: np.array
-        horizontalDivergent: np.array
-
-        mnx = self.maxNodeNumberX
-        mny = self.maxNodeNumberY
-
-        horizontalDivergent = self.invDeltaX * (
-            velocityX[1:mny - 1, 1:mnx - 1] - velocityX[1:mny - 1, 0:mnx - 2])
-
-        verticalDivergent = self.invDeltaY * (
-            velocityY[1:mny - 1, 1:mnx - 1] - velocityY[0:mny - 2, 1:mnx - 1])
-
-        massConservation = horizontalDivergent + verticalDivergent
-
-        continuity = massConservation.sum()
-
-        return continuity
+# *****************************************************************************
+# *                     POISSON EQUATION - LID CAVITY                         *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: contains the Poisson Equation discrete form and the pressure *
+# * treatment on the boundaries.                                              *
+# *****************************************************************************
+import numpy as np
+from scipy import fft
+import Constants as ct
+from MeshGenerator import MeshGenerator
+
+
+class PoissonEquation(MeshGenerator):
+
+    def __init__(self):
+
+        super().__init__()
+
+    def getStretchedPressureCoefficients(
+            self, coefficientsPressure: tuple) -> tuple:
+
+        deltaT: float
+        spacingX: np.array
+        spacingY: np.array
+        widthX: np.array
+        widthY: np.array
+        coefficientEast: np.array
+        coefficientWest: np.array
+        coefficientNorth: np.array
+        coefficientSouth: np.array
+
+        if self.meshStretching == ct.UNIFORM:
+            return coefficientsPressure
+
+        deltaT = self.deltaT
+
+        # the gradient through each face is over the distance between the
+        # centers and the divergence over the width of the volume, Y along
+        # the rows (a column vector)
+        spacingX = self.spacingX
+        spacingY = self.spacingY[:, np.newaxis]
+        widthX = self.widthX
+        widthY = self.widthY[:, np.newaxis]
+
+        coefficientEast = deltaT / (spacingX[1:] * widthX)
+        coefficientWest = deltaT / (spacingX[:-1] * widthX)
+        coefficientNorth = deltaT / (spacingY[1:] * widthY)
+        coefficientSouth = deltaT / (spacingY[:-1] * widthY)
+
+        return tuple(coefficient.astype(self.floatType) for coefficient in (
+            - (coefficientEast + coefficientWest + coefficientNorth +
+               coefficientSouth), coefficientEast, coefficientWest,
+            coefficientNorth, coefficientSouth))
+
+    def getPoissonSolution(
+            self, estimateVelocityX: np.array, estimateVelocityY: np.array) -> \
+            np.array:
+
+        mnx: int
+        mny: int
+        poissonSolution: np.array
+        verticalDivergent: np.array
+        horizontalDivergent: np.array
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        poissonSolution = np.zeros((mny, mnx), dtype=self.floatType)
+
+        horizontalDivergent = self.invWidthX * (
+                estimateVelocityX[1:mny - 1, 1:mnx - 1] -
+                estimateVelocityX[1:mny - 1, 0:mnx - 2])
+
+        verticalDivergent = self.invWidthY * (
+                estimateVelocityY[1:mny - 1, 1:mnx - 1] -
+                estimateVelocityY[0:mny - 2, 1:mnx - 1])
+
+        stressTerm = \
+            horizontalDivergent ** 2 + \
+            2 * horizontalDivergent * verticalDivergent + \
+            verticalDivergent ** 2
+
+        poissonSolution[1: mny - 1, 1:mnx - 1] = \
+            horizontalDivergent + verticalDivergent - stressTerm
+
+        return poissonSolution
+
+    def boundaryConditionsPressure(self, pressure: np.array) -> np.array:
+
+        mnx: int
+        mny: int
+        pressureTemp: np.array
+
+        mnx = self.maxNodeNumberX - 1
+        mny = self.maxNodeNumberY - 1
+        pressureTemp = pressure.copy()
+
+        # LEFt WALL
+        pressureTemp[:, 0] = pressure[:, 1]
+        # BOTTOM WALL
+        pressureTemp[0, :] = pressure[1, :]
+        # RIGHT WALL
+        pressureTemp[:, mnx] = pressure[:, mnx - 1]
+        # TOP WALL
+        pressureTemp[mny, :] = self.pressureGradientTop
+
+        return pressureTemp
+
+    def getPressureGhostRelations(self) -> tuple:
+
+        nx: int
+        ny: int
+
+        nx = self.nodeNumberX
+        ny = self.nodeNumberY
+
+        # ghost = center * interior + external for the pressure correction:
+        # zero gradient on the walls and a fixed value on the lid, the same
+        # relations applied by boundaryConditionsPressure.
+        return np.ones((nx,), dtype=self.floatType), \
+            np.zeros((nx,), dtype=self.floatType), \
+            np.zeros((nx,), dtype=self.floatType), \
+            np.zeros((nx,), dtype=self.floatType), \
+            np.ones((ny,), dtype=self.floatType), \
+            np.zeros((ny,), dtype=self.floatType), \
+            np.ones((ny,), dtype=self.floatType), \
+            np.zeros((ny,), dtype=self.floatType)
+
+    def solvePoissonEquation(
+            self, poissonSolution: np.array, coefficientCenter: float,
+            coefficientEast: float, coefficientWest: float,
+            coefficientNorth: float, coefficientSouth: float) -> np.array:
+
+        k: int
+        mnx: int 
+        mny: int  
+        maxItera: int
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        maxItera = 100
+
+        estimatePressure = np.zeros((mny, mnx), dtype=self.floatType)
+        temporaryPressure = estimatePressure.copy()
+
+        k = 0
+        norm = 0.
+        # Newton - Raphson method with under - relaxation:
+        for k in range(maxItera + 1):
+
+            if self.stencilBackend == ct.THREADS:
+                estimatePressure[1: mny - 1, 1: mnx - 1] = \
+                    self.getPressureSweepTiled(
+                        temporaryPressure, poissonSolution, coefficientCenter,
+                        coefficientEast, coefficientWest, coefficientNorth,
+                        coefficientSouth)
+            else:
+                estimatePressure[1: mny - 1, 1: mnx - 1] = \
+                    self.getPressureSweepRows(
+                        temporaryPressure, poissonSolution, coefficientCenter,
+                        coefficientEast, coefficientWest, coefficientNorth,
+                        coefficientSouth, 1, mny - 1)
+
+            norm = np.sqrt(np.sum(
+                (estimatePressure - temporaryPressure) ** 2, dtype=np.float64))
+
+            if norm <= self.tolerancePressure:
+                # print(
+                #     "WARNING:: Pressure converged!, " +
+                #     "error = {} and num iter = {}".format(norm, k))
+                break
+
+            temporaryPressure = estimatePressure
+
+        # if (k >= maxItera) and (norm > 1.0):
+        #     print("WARNING:: Pressure did not converged!, "
+        #           "error = {}, num iter = {}".format(norm, k))
+
+        return estimatePressure
+
+    def getPressureSweepRows(
+            self, temporaryPressure: np.array, poissonSolution: np.array,
+            coefficientCenter: float, coefficientEast: float,
+            coefficientWest: float, coefficientNorth: float,
+            coefficientSouth: float, rowStart: int, rowEnd: int) -> np.array:
+
+        mnx: int
+        r0: int
+        r1: int
+
+        # interior rows rowStart:rowEnd, with their south and north neighbours
+        mnx = self.maxNodeNumberX
+        r0 = rowStart
+        r1 = rowEnd
+
+        coefficientCenter, coefficientEast, coefficientWest, \
+            coefficientNorth, coefficientSouth = (
+                self.getRowCoefficient(coefficient, r0, r1)
+                for coefficient in (
+                    coefficientCenter, coefficientEast, coefficientWest,
+                    coefficientNorth, coefficientSouth))
+
+        return temporaryPressure[r0:r1, 1: mnx - 1] - \
+            self.relaxationConstant * (
+                coefficientCenter *
+                temporaryPressure[r0:r1, 1:mnx - 1] +
+                coefficientEast * temporaryPressure[r0:r1, 2:mnx] +
+                coefficientWest * temporaryPressure[r0:r1, 0:mnx - 2] +
+                coefficientNorth *
+                temporaryPressure[r0 + 1:r1 + 1, 1:mnx - 1] +
+                coefficientSouth *
+                temporaryPressure[r0 - 1:r1 - 1, 1:mnx - 1] -
+                poissonSolution[r0:r1, 1:mnx - 1]) / coefficientCenter
+
+    def solvePoissonEquationDCT(
+            self, poissonSolution: np.array, poissonEigenvalues: np.array) -> \
+            np.array:
+
+        nx: int
+        ny: int
+        mnx: int
+        mny: int
+        transform: np.array
+        extension: np.array
+        estimatePressure: np.array
+
+        nx = self.nodeNumberX
+        ny = self.nodeNumberY
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        estimatePressure = np.zeros((mny, mnx), dtype=self.floatType)
+
+        # zero gradient on the left and right walls
+        transform = fft.dct(
+            poissonSolution[1:mny - 1, 1:mnx - 1], type=2, norm="ortho",
+            axis=1)
+
+        # zero gradient on the bottom wall and zero ghost on the lid
+        extension = np.zeros((1, nx), dtype=transform.dtype)
+        transform = fft.rfft(np.concatenate((
+            transform, extension, - transform[::-1],
+            - transform, extension, transform[::-1])), axis=0)
+
+        transform = np.divide(
+            transform, poissonEigenvalues,
+            out=np.zeros(transform.shape, dtype=transform.dtype),
+            where=poissonEigenvalues != 0.)
+
+        transform = fft.irfft(transform, n=4 * ny + 2, axis=0)[0:ny]
+
+        estimatePressure[1:mny - 1, 1:mnx - 1] = fft.idct(
+            transform, type=2, norm="ortho", axis=1)
+
+        # LEFT, RIGHT AND BOTTOM WALLS
+        estimatePressure[:, 0] = estimatePressure[:, 1]
+        estimatePressure[:, mnx - 1] = estimatePressure[:, mnx - 2]
+        estimatePressure[0, :] = estimatePressure[1, :]
+
+        return estimatePressure
+
+    def getMassConservation(
+            self, velocityX: np.array, velocityY: np.array) -> float:
+
+        mnx: int
+        mny: int
+        continuity: float
+        massConservation: np.array
+        verticalDivergent: np.array
+        horizontalDivergent: np.array
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        horizontalDivergent = self.invWidthX * (
+            velocityX[1:mny - 1, 1:mnx - 1] - velocityX[1:mny - 1, 0:mnx - 2])
+
+        verticalDivergent = self.invWidthY * (
+            velocityY[1:mny - 1, 1:mnx - 1] - velocityY[0:mny - 2, 1:mnx - 1])
+
+        massConservation = horizontalDivergent + verticalDivergent
+
+        # weighted by the cell areas, the fluxes cancel as on uniform meshes
+        if self.meshStretching != ct.UNIFORM:
+            massConservation *= np.outer(self.widthY, self.widthX) / (
+                self.deltaX * self.deltaY)
+
+        continuity = massConservation.sum(dtype=np.float64)
+
+        return continuity
@@ -1,259 +1,448 @@
-import matplotlib.pyplot as plt
-import numpy as np
-import pandas as pd
-import Constants as ct
-from matplotlib import pyplot, cm
-from MeshGenerator import MeshGenerator
-from DirectoryManager import DirectoryManager
-from matplotlib.animation import PillowWriter
-# from mpl_toolkits.mplot3d import Axes3D
-
-
-class PostProcess(DirectoryManager, MeshGenerator):
-
-    def __init__(self):
-
-        super().__init__()
-
-    @staticmethod
-    def saveOutputs(dataframe: pd.DataFrame, filename: str) -> None:
-
-        dataframe.to_csv(
-            filename, sep=ct.FILE_SEP, header=True, index=False,
-            decimal=ct.DECIMAL_SEP, encoding='utf-8')
-
-    @staticmethod
-    def readOutput(filename: str) -> pd.DataFrame:
-
-        dataframe: pd.DataFrame
-
-        dataframe = pd.read_csv(
-            filename, sep=ct.FILE_SEP, decimal=ct.DECIMAL_SEP)
-
-        return dataframe
-
-    def plotStreamlines(
-            self, background: str, fileFormat: str = 'jpg', fileDpi: int =
-            1000) -> None:
-
-        filename: str
-
-        pressureDf: pd.DataFrame
-        velocityXDf: pd.DataFrame
-        velocityYDf: pd.DataFrame
-
-        axisX: np.ndarray
-        axisY: np.ndarray
-        pressure: np.ndarray
-        velocityX: np.ndarray
-        velocityY: np.ndarray
-        coordinatesX: np.ndarray
-        coordinatesY: np.ndarray
-
-        filename = "DummyFile"
-
-        pressureDf = self.readOutput(self.getPressureOutputPath)
-        velocityXDf = self.readOutput(self.getVelocityXOutputPath)
-        velocityYDf = self.readOutput(self.getVelocityYOutputPath)
-
-        nx = self.nodeNumberX
-        ny = self.nodeNumberY
-        axisX = np.linspace(self.initialPositionX, self.finalPositionX, nx)
-        axisY = np.linspace(self.initialPositionY, self.finalPositionY, ny)
-        coordinatesX, coordinatesY = np.meshgrid(axisX, axisY)
-
-        pressure = pressureDf["pressure"].to_numpy().reshape((ny, nx))
-        velocityX = velocityXDf['velocityX'].to_numpy().reshape((ny, nx))
-        velocityY = velocityYDf['velocityY'].to_numpy().reshape((ny, nx))
-
-        pyplot.figure(figsize=(7, 6.5), dpi=fileDpi)
-
-        if background == "pressure":
-            pyplot.contourf(coordinatesX, coordinatesY, pressure, alpha=0.5,
-                            cmap=cm.jet)
-            filename = self.getPressureOutputStreamline
-
-        elif background == "velocityX":
-            pyplot.contourf(coordinatesX, coordinatesY, velocityX, alpha=0.5,
-                            cmap=cm.jet)
-            filename = self.getVelocityXOutputStreamline
-
-        elif background == "velocityY":
-            pyplot.contourf(coordinatesX, coordinatesY, velocityY, alpha=0.5,
-                            cmap=cm.jet)
-            filename = self.getVelocityYOutputStreamline
-        
-        elif background == "velocity":
-            velocity = np.sqrt(velocityX**2 + velocityY**2)
-            pyplot.contourf(coordinatesX, coordinatesY, velocity, alpha=0.5,
-                            cmap=cm.jet)
-            filename = self.getVelocityOutputStreamline
-        else:
-            print(
-                "ERROR:: your background choice must be: 'pressure', "
-                + "'velocityX' or 'velocityY'")
-            exit()
-
-        pyplot.colorbar()
-        # pyplot.contour(X, Y, velocityX, cmap=cm.jet)
-        pyplot.streamplot(
-            coordinatesX, coordinatesY, velocityX, velocityY, color='k')
-        pyplot.xlabel('X', fontsize=24)
-        pyplot.ylabel('Y', fontsize=24)
-        plt.tick_params(axis='both', labelsize=18)
-        pyplot.axis([-0.05, 1.05,-0.05, 1.05])
-        pyplot.savefig(
-            filename + "." + fileFormat, dpi=fileDpi, format=fileFormat)
-
-    def plotDataComparison(self, fileFormat: str = 'pdf', fileDpi: int =
-            1000):
-
-        filenameCompY: str
-        filenameCompX: str
-
-        pressureDf: pd.DataFrame
-        velocityXDf: pd.DataFrame
-        velocityYDf: pd.DataFrame
-
-        velocityX: np.ndarray
-        velocityY: np.ndarray
-        coordinatesX: np.ndarray
-        coordinatesY: np.ndarray
-
-        filenameCompY = self.getDirFigure + ct.OS_SEP + \
-            "ComparisonVelocityYRe{}_{}x{}".format(
-                self.reynoldsNumber, self.nodeNumberX, self.nodeNumberY)
-
-        filenameCompX= self.getDirFigure + ct.OS_SEP + \
-            "ComparisonVelocityXRe{}_{}x{}".format(
-                self.reynoldsNumber, self.nodeNumberX, self.nodeNumberY)
-
-        velocityXDf = self.readOutput(self.getVelocityXOutputPath)
-        velocityYDf = self.readOutput(self.getVelocityYOutputPath)
-        ghiaVelocityXDf = self.readOutput(self.getGhiaVelocityVertPath)
-        ghiaVelocityYDf = self.readOutput(self.getGhiaVelocityHoritPath)
-        # agarwalVelocityXDf = self.readOutput(self.getAgarwalVelocityVertPath)
-        # agarwalVelocityYDf = self.readOutput(self.getAgarwalVelocityHoritPath)
-
-        nx = self.nodeNumberX
-        ny = self.nodeNumberY
-        axisX = np.linspace(self.initialPositionX, self.finalPositionX, nx)
-        axisY = np.linspace(self.initialPositionY, self.finalPositionY, ny)
-        coordinatesX, coordinatesY = np.meshgrid(axisX, axisY)
-
-        velocityX = velocityXDf['velocityX'].to_numpy().reshape((ny, nx))
-        velocityY = velocityYDf['velocityY'].to_numpy().reshape((ny, nx))
-
-        positionX = \
-            (coordinatesX[0,:] > 0.5 - self.deltaX) & \
-            (coordinatesX[0,:] < 0.5 + self.deltaX)
-
-        positionY = \
-            (coordinatesY[:, 0] > 0.5 - self.deltaY) & \
-            (coordinatesY[:, 0] < 0.5 + self.deltaY)
-
-        axisY = coordinatesY[:, positionX].mean(axis=1)
-        axisX = coordinatesX[positionY, :].mean(axis=0)
-        velocityX= velocityX[:, positionX].mean(axis=1)
-        velocityY = velocityY[positionY, :].mean(axis=0)
-
-        ghiaAxisY = ghiaVelocityXDf['y'].to_numpy()
-        ghiaAxisX = ghiaVelocityYDf['x'].to_numpy()
-        # agarwalAxisY = agarwalVelocityXDf['y'].to_numpy()
-        # agarwalAxisX = agarwalVelocityYDf['x'].to_numpy()
-
-        ghiaVelocityY = ghiaVelocityYDf['velocity'].to_numpy()
-        ghiaVelocityX = ghiaVelocityXDf['velocity'].to_numpy()
-        # agarwalVelocityY = agarwalVelocityYDf['velocity'].to_numpy()
-        # agarwalVelocityX = agarwalVelocityXDf['velocity'].to_numpy()
-
-        Agarwal = 'Agarwal(1981)'
-        NallasamyPrasad = "Nallasamy & Prasad (1977)"
-
-        plt.figure(num=1, figsize=(14,14))
-        pyplot.style.use('classic')
-        plt.plot(velocityX, axisY, color='black', linestyle='-',
-            linewidth=2, label='FVM')
-        plt.plot(ghiaVelocityX, ghiaAxisY, color='red', linestyle='',
-            marker="o", markersize=8, markeredgecolor='red',
-            label='Ghia (1982)')
-        # plt.plot(agarwalVelocityX, agarwalAxisY, color='magenta', linestyle='',
-        #          marker="s", linewidth=2, markersize=8,
-        #          markeredgecolor='magenta', label=Agarwal)
-        plt.xlabel(r"$u$ / $U_{lid}$ (-)", fontsize=40)
-        plt.ylabel(r"$y$ / $L$ (-)", fontsize=40)
-        plt.tick_params(axis='both', labelsize=40)
-        plt.legend(loc='lower right', frameon=False, ncol=1, fontsize=40)
-        plt.grid()
-        pyplot.savefig(filenameCompY + "." + fileFormat, dpi=fileDpi,
-            format=fileFormat)
-        # plt.show()
-
-        plt.figure(num=2, figsize=(17, 14))
-        pyplot.style.use('classic')
-        plt.plot(axisX, velocityY, color='black', linestyle='-', linewidth=2,
-                 label='FVM')
-        plt.plot(ghiaAxisX, ghiaVelocityY, color='red', linestyle='',
-                 marker="o", markersize=8, markeredgecolor='red',
-                 label='Ghia (1982)')
-        # plt.plot(agarwalAxisX, agarwalVelocityY, color='magenta',
-        #            linestyle='',
-        #          marker="s", linewidth=2, markersize=8,
-        #          markeredgecolor='magenta', label=NallasamyPrasad)
-        plt.ylabel(r"$v$ / $U_{lid}$ (-)", fontsize=40)
-        plt.xlabel(r"$x$ / $L$ (-)", fontsize=40)
-        plt.tick_params(axis='both', labelsize=40)
-        plt.legend(loc='lower left', frameon=False, ncol=1, fontsize=40)
-        plt.grid()
-        pyplot.savefig(filenameCompX + "." + fileFormat, dpi=fileDpi,
-            format=fileFormat)
-        #plt.show()
-
-    def makeVideo(self):
-
-        filename: str
-        nx: int
-        ny: int
-        axisX: np.array
-        axisY: np.array
-        velocity: np.array
-        velocityX: np.array
-        velocityY: np.array
-        coordinatesX: np.array
-        coordinatesY: np.array
-        pressureDf: pd.DataFrame
-        velocityXDf: pd.DataFrame
-        velocityYDf: pd.DataFrame
-
-        # pressureDf = self.readOutput(self.getPressureOutputPath)
-        velocityXDf = self.readOutput(self.getVelocityXOutputPath)
-        velocityYDf = self.readOutput(self.getVelocityYOutputPath)
-
-        nx = self.nodeNumberX
-        ny = self.nodeNumberY
-        axisX = np.linspace(self.initialPositionX, self.finalPositionX, nx)
-        axisY = np.linspace(self.initialPositionY, self.finalPositionY, ny)
-        coordinatesX, coordinatesY = np.meshgrid(axisX, axisY)
-
-        fig = pyplot.figure(6, (10, 10))
-        metadata = dict(title="Cavity", artist="Almerio")
-        writer = PillowWriter(fps=60, metadata=metadata)
-
-        with writer.saving(fig, "video.gif", 100):
-            for j in range(0, self.timeSize, 10):
-                time = "t{}".format(j)
-                pyplot.style.use('classic')
-                velocityX = velocityXDf[time].to_numpy().reshape((ny, nx))
-                velocityY = velocityYDf[time].to_numpy().reshape((ny, nx))
-                velocity = np.sqrt(velocityX**2 + velocityY**2)
-                pyplot.contourf(
-                    coordinatesX, coordinatesY, velocity, alpha=0.5,
-                    cmap=cm.jet)
-                pyplot.streamplot(
-                    coordinatesX, coordinatesY, velocityX, velocityY, color='k')
-                pyplot.xlabel('X')
-                pyplot.ylabel('Y')
-                pyplot.tick_params(axis='both', labelsize=24)
-                pyplot.axis([0.0, 1, 0.0, 1.0])
-                writer.grab_frame()
-                pyplot.cla()
+import matplotlib.pyplot as plt
+import os
+import glob
+import hashlib
+import argparse
+import numpy as np
+import pandas as pd
+import Constants as ct
+from matplotlib import pyplot, cm
+from MeshGenerator import MeshGenerator
+from DirectoryManager import DirectoryManager
+from matplotlib.animation import PillowWriter
+from SnapshotStore import SnapshotStore
+# from mpl_toolkits.mplot3d import Axes3D
+
+
+class PostProcess(DirectoryManager, MeshGenerator):
+
+    def __init__(self):
+
+        super().__init__()
+
+    @staticmethod
+    def __getMeshPath(filename: str, meshHash: str) -> str:
+
+        # the manifests are in the mesh directory of the same reports
+        return os.path.dirname(os.path.dirname(os.path.abspath(filename))) + \
+            ct.OS_SEP + ct.DIR_MESH + ct.OS_SEP + ct.MESH_OUTPUT + \
+            "_{}{}".format(meshHash, os.path.splitext(filename)[1])
+
+    @staticmethod
+    def saveOutputs(
+            dataframe: pd.DataFrame, filename: str, meshHash: str = None) -> \
+            None:
+
+        name: str
+        values: np.array
+        columns: dict
+
+        if not filename.endswith("." + ct.NPZ):
+            with open(filename, "w", encoding='utf-8') as file:
+                if meshHash:
+                    file.write(
+                        ct.MESH_REFERENCE + ct.FILE_SEP + meshHash + "\n")
+
+                dataframe.to_csv(
+                    file, sep=ct.FILE_SEP, header=True, index=False,
+                    decimal=ct.DECIMAL_SEP)
+            return
+
+        columns = {}
+
+        for name in dataframe.columns:
+            values = dataframe[name].to_numpy()
+
+            # text columns are stored without pickles
+            columns[str(name)] = \
+                values.astype(str) if values.dtype == object else values
+
+        if meshHash:
+            columns[ct.MESH_REFERENCE] = np.array(meshHash)
+
+        # one uncompressed array per column, read back without parsing
+        with open(filename, "wb") as file:
+            np.savez(file, **columns)
+
+    @staticmethod
+    def readOutput(filename: str, withMesh: bool = True) -> pd.DataFrame:
+
+        root: str
+        line: str
+        binary: bool
+        meshHash: str
+        extension: str
+        mesh: pd.DataFrame
+        dataframe: pd.DataFrame
+
+        # an output of the other format, e.g. the CSVs of an older run
+        if not os.path.exists(filename):
+            root = os.path.splitext(filename)[0]
+
+            for extension in (ct.NPZ, ct.CSV):
+                if os.path.exists(root + "." + extension):
+                    filename = root + "." + extension
+                    break
+
+        # the format is detected from the file, not from its extension
+        with open(filename, "rb") as file:
+            binary = file.read(len(ct.NPZ_MAGIC)) == ct.NPZ_MAGIC
+
+        meshHash = None
+
+        if binary:
+            with np.load(filename) as data:
+                if ct.MESH_REFERENCE in data.files:
+                    meshHash = str(data[ct.MESH_REFERENCE])
+
+                dataframe = pd.DataFrame({
+                    name: data[name] for name in data.files
+                    if name != ct.MESH_REFERENCE})
+        else:
+            with open(filename, "r", encoding='utf-8') as file:
+                line = file.readline()
+
+                if line.startswith(ct.MESH_REFERENCE + ct.FILE_SEP):
+                    meshHash = line.strip().split(ct.FILE_SEP)[1]
+                else:
+                    file.seek(0)
+
+                dataframe = pd.read_csv(
+                    file, sep=ct.FILE_SEP, decimal=ct.DECIMAL_SEP)
+
+        if meshHash is None:
+            return dataframe
+
+        dataframe.attrs[ct.MESH_REFERENCE] = meshHash
+
+        if not withMesh:
+            return dataframe
+
+        # the coordinates of the nodes come back from the manifest
+        mesh = PostProcess.readOutput(
+            PostProcess.__getMeshPath(filename, meshHash))
+
+        if mesh.shape[0] != dataframe.shape[0]:
+            print("ERROR:: The mesh {} does not match {}!".format(
+                meshHash, filename))
+            exit()
+
+        mesh = pd.concat((mesh, dataframe), axis=1)
+        mesh.attrs[ct.MESH_REFERENCE] = meshHash
+
+        return mesh
+
+    def saveMesh(
+            self, coordinatesX: np.array, coordinatesY: np.array) -> str:
+
+        path: str
+        meshHash: str
+        temporaryPath: str
+
+        meshHash = hashlib.sha256(
+            np.ascontiguousarray(coordinatesX, dtype=np.float64).tobytes() +
+            np.ascontiguousarray(coordinatesY, dtype=np.float64).tobytes()
+        ).hexdigest()[:16]
+
+        path = self.getDirMesh + ct.OS_SEP + ct.MESH_OUTPUT + "_{}.{}".format(
+            meshHash, self.outputFormat)
+
+        # once per mesh, the fields only keep its hash
+        if not os.path.exists(path):
+            temporaryPath = self.getDirMesh + ct.OS_SEP + ct.MESH_OUTPUT + \
+                "_{}_{}.{}".format(meshHash, os.getpid(), self.outputFormat)
+
+            self.saveOutputs(
+                pd.DataFrame(data={"x": coordinatesX, "y": coordinatesY}),
+                temporaryPath)
+            os.replace(temporaryPath, path)
+
+        return meshHash
+
+    def convertOutputs(self, removeCsv: bool = False) -> list:
+
+        path: str
+        paths: list
+        dataframe: pd.DataFrame
+
+        paths = sorted(glob.glob(
+            self.getDirReports + ct.OS_SEP + "**" + ct.OS_SEP + "*." + ct.CSV,
+            recursive=True))
+
+        # the binary copy is written next to each CSV of the reports
+        for path in paths:
+            dataframe = self.readOutput(path, withMesh=False)
+
+            self.saveOutputs(
+                dataframe, os.path.splitext(path)[0] + "." + ct.NPZ,
+                dataframe.attrs.get(ct.MESH_REFERENCE))
+
+            if removeCsv:
+                os.remove(path)
+
+        return paths
+
+    def plotStreamlines(
+            self, background: str, fileFormat: str = 'jpg', fileDpi: int =
+            1000) -> None:
+
+        filename: str
+
+        pressureDf: pd.DataFrame
+        velocityXDf: pd.DataFrame
+        velocityYDf: pd.DataFrame
+
+        axisX: np.ndarray
+        axisY: np.ndarray
+        pressure: np.ndarray
+        velocityX: np.ndarray
+        velocityY: np.ndarray
+        coordinatesX: np.ndarray
+        coordinatesY: np.ndarray
+
+        filename = "DummyFile"
+
+        pressureDf = self.readOutput(self.getPressureOutputPath)
+        velocityXDf = self.readOutput(self.getVelocityXOutputPath)
+        velocityYDf = self.readOutput(self.getVelocityYOutputPath)
+
+        nx = self.nodeNumberX
+        ny = self.nodeNumberY
+        axisX = self.axisX
+        axisY = self.axisY
+        coordinatesX, coordinatesY = np.meshgrid(axisX, axisY)
+
+        pressure = pressureDf["pressure"].to_numpy().reshape((ny, nx))
+        velocityX = velocityXDf['velocityX'].to_numpy().reshape((ny, nx))
+        velocityY = velocityYDf['velocityY'].to_numpy().reshape((ny, nx))
+
+        pyplot.figure(figsize=(7, 6.5), dpi=fileDpi)
+
+        if background == "pressure":
+            pyplot.contourf(coordinatesX, coordinatesY, pressure, alpha=0.5,
+                            cmap=cm.jet)
+            filename = self.getPressureOutputStreamline
+
+        elif background == "velocityX":
+            pyplot.contourf(coordinatesX, coordinatesY, velocityX, alpha=0.5,
+                            cmap=cm.jet)
+            filename = self.getVelocityXOutputStreamline
+
+        elif background == "velocityY":
+            pyplot.contourf(coordinatesX, coordinatesY, velocityY, alpha=0.5,
+                            cmap=cm.jet)
+            filename = self.getVelocityYOutputStreamline
+        
+        elif background == "velocity":
+            velocity = np.sqrt(velocityX**2 + velocityY**2)
+            pyplot.contourf(coordinatesX, coordinatesY, velocity, alpha=0.5,
+                            cmap=cm.jet)
+            filename = self.getVelocityOutputStreamline
+        else:
+            print(
+                "ERROR:: your background choice must be: 'pressure', "
+                + "'velocityX' or 'velocityY'")
+            exit()
+
+        pyplot.colorbar()
+        # pyplot.contour(X, Y, velocityX, cmap=cm.jet)
+        pyplot.streamplot(
+            coordinatesX, coordinatesY, velocityX, velocityY, color='k')
+        pyplot.xlabel('X', fontsize=24)
+        pyplot.ylabel('Y', fontsize=24)
+        plt.tick_params(axis='both', labelsize=18)
+        pyplot.axis([-0.05, 1.05,-0.05, 1.05])
+        pyplot.savefig(
+            filename + "." + fileFormat, dpi=fileDpi, format=fileFormat)
+
+    def plotDataComparison(self, fileFormat: str = 'pdf', fileDpi: int =
+            1000):
+
+        filenameCompY: str
+        filenameCompX: str
+
+        pressureDf: pd.DataFrame
+        velocityXDf: pd.DataFrame
+        velocityYDf: pd.DataFrame
+
+        velocityX: np.ndarray
+        velocityY: np.ndarray
+        coordinatesX: np.ndarray
+        coordinatesY: np.ndarray
+
+        filenameCompY = self.getDirFigure + ct.OS_SEP + \
+            "ComparisonVelocityYRe{}_{}x{}".format(
+                self.reynoldsNumber, self.nodeNumberX, self.nodeNumberY)
+
+        filenameCompX= self.getDirFigure + ct.OS_SEP + \
+            "ComparisonVelocityXRe{}_{}x{}".format(
+                self.reynoldsNumber, self.nodeNumberX, self.nodeNumberY)
+
+        velocityXDf = self.readOutput(self.getVelocityXOutputPath)
+        velocityYDf = self.readOutput(self.getVelocityYOutputPath)
+        ghiaVelocityXDf = self.readOutput(self.getGhiaVelocityVertPath)
+        ghiaVelocityYDf = self.readOutput(self.getGhiaVelocityHoritPath)
+        # agarwalVelocityXDf = self.readOutput(self.getAgarwalVelocityVertPath)
+        # agarwalVelocityYDf = self.readOutput(self.getAgarwalVelocityHoritPath)
+
+        nx = self.nodeNumberX
+        ny = self.nodeNumberY
+        axisX = self.axisX
+        axisY = self.axisY
+        coordinatesX, coordinatesY = np.meshgrid(axisX, axisY)
+
+        velocityX = velocityXDf['velocityX'].to_numpy().reshape((ny, nx))
+        velocityY = velocityYDf['velocityY'].to_numpy().reshape((ny, nx))
+
+        # the nodes around the center lines, which are the widest ones on
+        # the stretched meshes
+        windowX, windowY = self.deltaX, self.deltaY
+
+        if self.meshStretching != ct.UNIFORM:
+            windowX, windowY = self.spacingX.max(), self.spacingY.max()
+
+        positionX = \
+            (coordinatesX[0,:] > 0.5 - windowX) & \
+            (coordinatesX[0,:] < 0.5 + windowX)
+
+        positionY = \
+            (coordinatesY[:, 0] > 0.5 - windowY) & \
+            (coordinatesY[:, 0] < 0.5 + windowY)
+
+        axisY = coordinatesY[:, positionX].mean(axis=1)
+        axisX = coordinatesX[positionY, :].mean(axis=0)
+        velocityX= velocityX[:, positionX].mean(axis=1)
+        velocityY = velocityY[positionY, :].mean(axis=0)
+
+        ghiaAxisY = ghiaVelocityXDf['y'].to_numpy()
+        ghiaAxisX = ghiaVelocityYDf['x'].to_numpy()
+        # agarwalAxisY = agarwalVelocityXDf['y'].to_numpy()
+        # agarwalAxisX = agarwalVelocityYDf['x'].to_numpy()
+
+        ghiaVelocityY = ghiaVelocityYDf['velocity'].to_numpy()
+        ghiaVelocityX = ghiaVelocityXDf['velocity'].to_numpy()
+
+        # center line profiles at the points of Ghia et al.
+        print("Ghia-Error: {}".format(np.sqrt(np.mean(np.concatenate((
+            np.interp(ghiaAxisY, axisY, velocityX) - ghiaVelocityX,
+            np.interp(ghiaAxisX, axisX, velocityY) - ghiaVelocityY)) ** 2))))
+        # agarwalVelocityY = agarwalVelocityYDf['velocity'].to_numpy()
+        # agarwalVelocityX = agarwalVelocityXDf['velocity'].to_numpy()
+
+        Agarwal = 'Agarwal(1981)'
+        NallasamyPrasad = "Nallasamy & Prasad (1977)"
+
+        plt.figure(num=1, figsize=(14,14))
+        pyplot.style.use('classic')
+        plt.plot(velocityX, axisY, color='black', linestyle='-',
+            linewidth=2, label='FVM')
+        plt.plot(ghiaVelocityX, ghiaAxisY, color='red', linestyle='',
+            marker="o", markersize=8, markeredgecolor='red',
+            label='Ghia (1982)')
+        # plt.plot(agarwalVelocityX, agarwalAxisY, color='magenta', linestyle='',
+        #          marker="s", linewidth=2, markersize=8,
+        #          markeredgecolor='magenta', label=Agarwal)
+        plt.xlabel(r"$u$ / $U_{lid}$ (-)", fontsize=40)
+        plt.ylabel(r"$y$ / $L$ (-)", fontsize=40)
+        plt.tick_params(axis='both', labelsize=40)
+        plt.legend(loc='lower right', frameon=False, ncol=1, fontsize=40)
+        plt.grid()
+        pyplot.savefig(filenameCompY + "." + fileFormat, dpi=fileDpi,
+            format=fileFormat)
+        # plt.show()
+
+        plt.figure(num=2, figsize=(17, 14))
+        pyplot.style.use('classic')
+        plt.plot(axisX, velocityY, color='black', linestyle='-', linewidth=2,
+                 label='FVM')
+        plt.plot(ghiaAxisX, ghiaVelocityY, color='red', linestyle='',
+                 marker="o", markersize=8, markeredgecolor='red',
+                 label='Ghia (1982)')
+        # plt.plot(agarwalAxisX, agarwalVelocityY, color='magenta',
+        #            linestyle='',
+        #          marker="s", linewidth=2, markersize=8,
+        #          markeredgecolor='magenta', label=NallasamyPrasad)
+        plt.ylabel(r"$v$ / $U_{lid}$ (-)", fontsize=40)
+        plt.xlabel(r"$x$ / $L$ (-)", fontsize=40)
+        plt.tick_params(axis='both', labelsize=40)
+        plt.legend(loc='lower left', frameon=False, ncol=1, fontsize=40)
+        plt.grid()
+        pyplot.savefig(filenameCompX + "." + fileFormat, dpi=fileDpi,
+            format=fileFormat)
+        #plt.show()
+
+    def readSnapshots(self) -> SnapshotStore:
+
+        snapshots: SnapshotStore
+
+        # the frames are read lazily, by getFrames or getTimeRange
+        snapshots = SnapshotStore(self.getSnapshotPath)
+        snapshots.open()
+
+        return snapshots
+
+    def makeVideo(self, initialTime: float = None, finalTime: float = None):
+
+        k: int
+        nx: int
+        ny: int
+        axisX: np.array
+        axisY: np.array
+        times: np.array
+        velocity: np.array
+        velocityX: np.array
+        velocityY: np.array
+        coordinatesX: np.array
+        coordinatesY: np.array
+        snapshots: SnapshotStore
+
+        snapshots = self.readSnapshots()
+
+        initialTime = self.initialTime if initialTime is None else initialTime
+        finalTime = np.inf if finalTime is None else finalTime
+
+        times, velocityX = snapshots.getTimeRange(
+            ct.VELOCITYX_OUTPUT, initialTime, finalTime)
+        velocityY = snapshots.getTimeRange(
+            ct.VELOCITYY_OUTPUT, initialTime, finalTime)[1]
+
+        nx = self.nodeNumberX
+        ny = self.nodeNumberY
+        axisX = self.axisX
+        axisY = self.axisY
+        coordinatesX, coordinatesY = np.meshgrid(axisX, axisY)
+
+        fig = pyplot.figure(6, (10, 10))
+        metadata = dict(title="Cavity", artist="Almerio")
+        writer = PillowWriter(fps=60, metadata=metadata)
+
+        # one frame in memory at a time, read from the memory maps
+        with writer.saving(fig, "video.gif", 100):
+            for k in range(times.shape[0]):
+                pyplot.style.use('classic')
+                velocity = np.sqrt(velocityX[k]**2 + velocityY[k]**2)
+                pyplot.contourf(
+                    coordinatesX, coordinatesY, velocity, alpha=0.5,
+                    cmap=cm.jet)
+                pyplot.streamplot(
+                    coordinatesX, coordinatesY, velocityX[k], velocityY[k],
+                    color='k')
+                pyplot.xlabel('X')
+                pyplot.ylabel('Y')
+                pyplot.tick_params(axis='both', labelsize=24)
+                pyplot.axis([0.0, 1, 0.0, 1.0])
+                writer.grab_frame()
+                pyplot.cla()
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(
+        description="Converts the CSV outputs of the reports to NPZ.")
+    parser.add_argument(
+        "--remove", action="store_true", help="removes the converted CSVs")
+
+    arguments = parser.parse_args()
+
+    for path in PostProcess().convertOutputs(arguments.remove):
+        print("Converted {}".format(path))
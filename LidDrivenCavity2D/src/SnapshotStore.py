@@ -0,0 +1,241 @@
+# *****************************************************************************
+# *                       SNAPSHOT STORE - LID CAVITY                         *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: history of a transient run on disk. Every snapshotStride     *
+# * time steps, the interior pressure and collocated velocities are appended  *
+# * to .npy files preallocated for the whole run and written through memory   *
+# * maps, so the history never stays in memory. A small .json index keeps the *
+# * fields, the shape and the number of frames, and a .npy file keeps their   *
+# * instants. The readers map the files and slice a range of frames or        *
+# * instants without loading the other ones, e.g. to animate the run.         *
+# *****************************************************************************
+import os
+import json
+import numpy as np
+import Constants as ct
+from DirectoryManager import DirectoryManager
+
+# frames written between two flushes of the memory maps and the index
+SNAPSHOT_CHUNK = 64
+
+
+class SnapshotStore:
+
+    def __init__(self, path: str):
+
+        self.__path: str
+        self.__index: dict
+        self.__times: np.memmap
+        self.__frames: dict
+
+        self.__path = path
+        self.__index = None
+        self.__times = None
+        self.__frames = None
+
+    # ======================================================================== #
+    # PRIVATE METHODS                                                          #
+    # ======================================================================== #
+    def __getFramesPath(self, name: str) -> str:
+        return self.__path + "_{}.npy".format(name)
+
+    def __readIndex(self) -> dict:
+
+        with open(self.__path + ".json", "r") as file:
+            return json.load(file)
+
+    def __writeIndex(self) -> None:
+
+        temporaryPath: str
+
+        temporaryPath = self.__path + ".json.tmp"
+
+        with open(temporaryPath, "w") as file:
+            json.dump(self.__index, file)
+
+        os.replace(temporaryPath, self.__path + ".json")
+
+    def __openFrames(self, mode: str) -> None:
+
+        name: str
+
+        self.__times = np.lib.format.open_memmap(
+            self.__getFramesPath(ct.SNAPSHOT_TIME), mode=mode)
+        self.__frames = {
+            name: np.lib.format.open_memmap(
+                self.__getFramesPath(name), mode=mode)
+            for name in self.__index["fields"]}
+
+    # ======================================================================== #
+    #   PUBLIC METHODS
+    # ======================================================================== #
+    def create(
+            self, fieldNames: tuple, shape: tuple, dtype: np.dtype,
+            capacity: int, stride: int, frameNumber: int = 0) -> None:
+
+        name: str
+        index: dict
+
+        index = {
+            "fields": list(fieldNames), "shape": list(shape),
+            "dtype": np.dtype(dtype).str, "capacity": max(capacity, 1),
+            "stride": stride, "frames": frameNumber}
+
+        # a resumed run keeps the frames before its checkpoint
+        if frameNumber > 0 and os.path.exists(self.__path + ".json"):
+            self.__index = self.__readIndex()
+
+            if {name: value for name, value in self.__index.items()
+                    if name != "frames"} == \
+                    {name: value for name, value in index.items()
+                     if name != "frames"}:
+                self.__index["frames"] = frameNumber
+                self.__openFrames("r+")
+                self.__writeIndex()
+                return
+
+            print("WARNING:: The snapshots of {} do not match this run, they "
+                  "are written again!".format(self.__path))
+            index["frames"] = 0
+
+        self.__index = index
+
+        self.__times = np.lib.format.open_memmap(
+            self.__getFramesPath(ct.SNAPSHOT_TIME), mode="w+",
+            dtype=np.float64, shape=(index["capacity"],))
+        self.__frames = {
+            name: np.lib.format.open_memmap(
+                self.__getFramesPath(name), mode="w+", dtype=dtype,
+                shape=(index["capacity"],) + tuple(shape))
+            for name in fieldNames}
+
+        self.__writeIndex()
+
+    def open(self) -> None:
+
+        if not os.path.exists(self.__path + ".json"):
+            print("ERROR:: There are no snapshots in {}!".format(self.__path))
+            exit()
+
+        self.__index = self.__readIndex()
+        self.__openFrames("r")
+
+    def append(self, time: float, fields: tuple) -> None:
+
+        frame: int
+
+        frame = self.__index["frames"]
+
+        if frame >= self.__index["capacity"]:
+            print("WARNING:: The snapshots of {} are full!".format(
+                self.__path))
+            return
+
+        self.__times[frame] = time
+
+        for name, field in zip(self.__index["fields"], fields):
+            self.__frames[name][frame] = field
+
+        self.__index["frames"] = frame + 1
+
+        if self.__index["frames"] % SNAPSHOT_CHUNK == 0:
+            self.flush()
+
+    def flush(self) -> None:
+
+        self.__times.flush()
+
+        for frames in self.__frames.values():
+            frames.flush()
+
+        self.__writeIndex()
+
+    def close(self) -> None:
+
+        self.flush()
+
+        self.__times = None
+        self.__frames = None
+
+    def getFrameNumber(self) -> int:
+        return self.__index["frames"]
+
+    def getTimes(self, start: int = None, end: int = None) -> np.array:
+        return self.__times[:self.__index["frames"]][start:end]
+
+    def getFrames(
+            self, name: str, start: int = None, end: int = None) -> np.array:
+
+        # a view of the memory map, only the frames read are loaded
+        return self.__frames[name][:self.__index["frames"]][start:end]
+
+    def getTimeRange(
+            self, name: str, initialTime: float, finalTime: float) -> tuple:
+
+        start: int
+        end: int
+        times: np.array
+
+        times = self.getTimes()
+
+        # frames with initialTime <= time <= finalTime
+        start = int(np.searchsorted(times, initialTime, side="left"))
+        end = int(np.searchsorted(times, finalTime, side="right"))
+
+        return times[start:end], self.getFrames(name, start, end)
+
+
+class SnapshotWriter(DirectoryManager):
+
+    def __init__(self):
+
+        super().__init__()
+
+        self.__snapshots: SnapshotStore
+
+        self.__snapshots = None
+
+    def startSnapshots(self, fluid) -> None:
+
+        if not self.snapshotStride:
+            return
+
+        self.__snapshots = SnapshotStore(self.getSnapshotPath)
+        self.__snapshots.create(
+            (ct.PRESSURE_OUTPUT, ct.VELOCITYX_OUTPUT, ct.VELOCITYY_OUTPUT),
+            (self.maxNodeNumberY - 2, self.maxNodeNumberX - 2),
+            fluid.pressure.dtype, self.timeSize // self.snapshotStride,
+            self.snapshotStride)
+
+    def saveSnapshot(self, fluid, t: int) -> None:
+
+        mnx: int
+        mny: int
+        velocityX: np.array
+        velocityY: np.array
+
+        if self.__snapshots is None or (t + 1) % self.snapshotStride != 0:
+            return
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        velocityX, velocityY = \
+            fluid.getCollocatedVelocities(fluid.velocityX, fluid.velocityY)
+
+        self.__snapshots.append(
+            self.initialTime + (t + 1) * self.deltaT, (
+                fluid.pressure[1:mny - 1, 1:mnx - 1],
+                velocityX[1:mny - 1, 1:mnx - 1],
+                velocityY[1:mny - 1, 1:mnx - 1]))
+
+    def stopSnapshots(self) -> None:
+
+        if self.__snapshots is None:
+            return
+
+        self.__snapshots.close()
+        self.__snapshots = None
@@ -0,0 +1,162 @@
+# *****************************************************************************
+# *                        TILED KERNEL - LID CAVITY                          *
+# *****************************************************************************
+# * Author: Almerio Jose Venancio Pains Soares Pamplona                       *
+# * E-mail: almeriopamplona@gmail.com                                         *
+# *****************************************************************************
+# * Description: thread backend of the momentum and pressure stencils. The   *
+# * interior rows are split into tiles small enough for their temporaries to *
+# * stay in the L2 cache, and each thread of a pool updates a block of       *
+# * tiles. The NumPy ufuncs release the GIL, so the threads run in parallel *
+# * without the cost of processes. Each tile has the same operations and     *
+# * order as the NumPy path, so the results are the same.                    *
+# *****************************************************************************
+import os
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from MeshGenerator import MeshGenerator
+
+# working set of one tile, about the size of a L2 cache
+TILE_BYTES = 1024 * 1024
+# arrays of the working set of a tile: fields and temporaries of the momentum
+TILE_ROW_ARRAYS = 16
+
+
+class TiledKernel(MeshGenerator):
+
+    def __init__(self):
+
+        super().__init__()
+
+        self.__threadPool: ThreadPoolExecutor
+        self.__threadTiles: list
+        self.__threadNumber: int
+        self.__pressureSweep: np.array
+
+        self.__threadPool = None
+        self.__threadTiles = None
+        self.__threadNumber = self.threadWorkers or os.cpu_count()
+        self.__pressureSweep = None
+
+    # ======================================================================== #
+    # PRIVATE METHODS                                                          #
+    # ======================================================================== #
+    def __getThreadPool(self) -> ThreadPoolExecutor:
+
+        if self.__threadPool is None:
+            self.__threadPool = ThreadPoolExecutor(
+                max_workers=self.__threadNumber)
+
+        return self.__threadPool
+
+    def __getThreadTiles(self) -> list:
+
+        tileRows: int
+        itemSize: int
+        tiles: np.array
+
+        if self.__threadTiles is not None:
+            return self.__threadTiles
+
+        itemSize = np.dtype(self.floatType).itemsize
+        tileRows = max(TILE_BYTES // (
+            TILE_ROW_ARRAYS * itemSize * self.maxNodeNumberX), 1)
+
+        tiles = np.append(
+            np.arange(1, self.maxNodeNumberY - 1, tileRows),
+            self.maxNodeNumberY - 1)
+
+        # one block of consecutive tiles for each thread
+        self.__threadTiles = [
+            block for block in np.array_split(
+                np.stack((tiles[:-1], tiles[1:]), axis=1),
+                self.__threadNumber) if block.size > 0]
+
+        return self.__threadTiles
+
+    def __solveTiles(
+            self, rowsSolver, result: np.array, arguments: tuple,
+            tiles: np.array) -> None:
+
+        mnx: int
+
+        mnx = self.maxNodeNumberX
+
+        # each tile is written while its temporaries are still in the cache
+        for rowStart, rowEnd in tiles:
+            result[rowStart:rowEnd, 1:mnx - 1] = rowsSolver(
+                *arguments, rowStart, rowEnd)
+
+    def __solveThreads(
+            self, rowsSolver, result: np.array, arguments: tuple) -> None:
+
+        # list() waits for all the blocks and raises their errors
+        list(self.__getThreadPool().map(
+            lambda tiles: self.__solveTiles(
+                rowsSolver, result, arguments, tiles),
+            self.__getThreadTiles()))
+
+    # ======================================================================== #
+    #   PUBLIC METHODS
+    # ======================================================================== #
+    def solveMomentumAxisXTiled(
+            self, pressure: np.array, velocityX: np.array, velocityY: np.array,
+            estimateVelocityX: np.array, coefficientPressureX: float,
+            coefficientDiffusionX: float, coefficientDiffusionY: float,
+            coefficientConvectionX: float, coefficientConvectionY: float) -> \
+            np.array:
+
+        velocityTempX: np.array
+
+        velocityTempX = estimateVelocityX.copy()
+
+        self.__solveThreads(
+            self.solveMomentumAxisXRows, velocityTempX, (
+                pressure, velocityX, velocityY, coefficientPressureX,
+                coefficientDiffusionX, coefficientDiffusionY,
+                coefficientConvectionX, coefficientConvectionY))
+
+        return velocityTempX
+
+    def solveMomentumAxisYTiled(
+            self, pressure: np.array, velocityX: np.array, velocityY: np.array,
+            estimateVelocityY: np.array, coefficientPressureY: float,
+            coefficientDiffusionX: float, coefficientDiffusionY: float,
+            coefficientConvectionX: float, coefficientConvectionY: float) -> \
+            np.array:
+
+        velocityTempY: np.array
+
+        velocityTempY = estimateVelocityY.copy()
+
+        self.__solveThreads(
+            self.solveMomentumAxisYRows, velocityTempY, (
+                pressure, velocityX, velocityY, coefficientPressureY,
+                coefficientDiffusionX, coefficientDiffusionY,
+                coefficientConvectionX, coefficientConvectionY))
+
+        return velocityTempY
+
+    def getPressureSweepTiled(
+            self, temporaryPressure: np.array, poissonSolution: np.array,
+            coefficientCenter: float, coefficientEast: float,
+            coefficientWest: float, coefficientNorth: float,
+            coefficientSouth: float) -> np.array:
+
+        mnx: int
+        mny: int
+
+        mnx = self.maxNodeNumberX
+        mny = self.maxNodeNumberY
+
+        # a buffer of its own, the sweep may be written over its input
+        if self.__pressureSweep is None:
+            self.__pressureSweep = np.zeros((mny, mnx), dtype=self.floatType)
+
+        self.__solveThreads(
+            self.getPressureSweepRows, self.__pressureSweep, (
+                temporaryPressure, poissonSolution, coefficientCenter,
+                coefficientEast, coefficientWest, coefficientNorth,
+                coefficientSouth))
+
+        return self.__pressureSweep[1:mny - 1, 1:mnx - 1]